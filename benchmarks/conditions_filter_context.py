@@ -0,0 +1,149 @@
+"""Benchmark of condition queries in query context and in filter context.
+
+Each condition query of `CONDITIONS` is sent `--repeat` times in every
+variant below, and the latency percentiles of each variant are printed.
+
+- must: every clause under `bool.must`, as before filter context.
+- filter: every clause under `bool.filter`.
+- filter+cache: `bool.filter` with `request_cache` and `preference`,
+  as sent by the /pokemon/conditions endpoint.
+
+The caches of the index are cleared before each variant, so every variant
+starts cold. Run it against an index loaded with the data of
+`docker/elasticdump`:
+
+    ES_INDEX=pokemon ES_CONNECTION_URL=http://localhost:9200 \\
+        python -m benchmarks.conditions_filter_context --repeat 200
+"""
+
+import argparse
+import statistics
+import time
+from typing import Any
+
+from pokeapi.search import async_accessor, client, config
+from pokeapi.search.param import (
+    CreateAbilityParam,
+    CreateFormParam,
+    CreateGenderTypeParam,
+    CreateLegendaryParam,
+    CreatePageParam,
+    CreatePokemonTypeParam,
+    CreateRegionalVariantParam,
+)
+from pokeapi.search.query import (
+    CreateConditionalSearchQuery,
+    CreatePaginatedQuery,
+)
+
+CONDITIONS = (
+    (CreateLegendaryParam(True),),
+    (CreateGenderTypeParam((False, None)),),
+    (CreatePokemonTypeParam(("でんき", None)),),
+    (CreateAbilityParam(("ばけのかわ", None, None)),),
+    (CreateFormParam("アローラのすがた"), CreateRegionalVariantParam(None)),
+    (CreateLegendaryParam(False), CreatePokemonTypeParam(("ほのお", None))),
+)
+
+
+def create_queries() -> list[dict[str, Any]]:
+    """Method to create the condition queries sent by the benchmark.
+
+    Returns:
+        list[dict[str, Any]]: First pages of the condition queries.
+
+    """
+
+    page = CreatePageParam(10)
+
+    return [
+        CreatePaginatedQuery().create_query(
+            (CreateConditionalSearchQuery().create_query(conditions), page)
+        )
+        for conditions in CONDITIONS
+    ]
+
+
+def to_query_context(query: dict[str, Any]) -> dict[str, Any]:
+    """Method to move the clauses of a query from `filter` to `must`.
+
+    Args:
+        query (dict): Query created by `CreateConditionalSearchQuery`.
+
+    Returns:
+        dict[str, Any]: Query scoring every clause.
+
+    """
+
+    return {
+        **query,
+        "query": {"bool": {"must": query["query"]["bool"]["filter"]}},
+    }
+
+
+def run(
+    queries: list[dict[str, Any]], repeat: int, cache: bool
+) -> list[float]:
+    """Method to send every query `repeat` times.
+
+    Args:
+        queries (list[dict]): Queries to send.
+        repeat (int): Number of times each query is sent.
+        cache (bool): Whether to send the queries with `request_cache`
+        and `preference`.
+
+    Returns:
+        list[float]: Latency of each request in milliseconds.
+
+    """
+
+    conf = config.get_config()
+    es = client.get_client()
+    es.indices.clear_cache(index=conf.ES_INDEX, query=True, request=True)
+
+    latencies: list[float] = []
+    for _ in range(repeat):
+        for query in queries:
+            params = async_accessor._cache_params(query) if cache else {}
+            start = time.perf_counter()
+            es.search(index=conf.ES_INDEX, body=query, **params)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    return latencies
+
+
+def report(name: str, latencies: list[float]) -> None:
+    """Method to print the latency percentiles of a variant.
+
+    Args:
+        name (str): Name of the variant.
+        latencies (list[float]): Latency of each request in milliseconds.
+    """
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<14} n={len(latencies):<6} "
+        f"mean={statistics.fmean(latencies):7.2f}ms "
+        f"p50={percentiles[49]:7.2f}ms "
+        f"p95={percentiles[94]:7.2f}ms "
+        f"p99={percentiles[98]:7.2f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    queries = create_queries()
+    must_queries = [to_query_context(query) for query in queries]
+
+    report("must", run(must_queries, args.repeat, cache=False))
+    report("filter", run(queries, args.repeat, cache=False))
+    report("filter+cache", run(queries, args.repeat, cache=True))
+
+    client.close_client()
+
+
+if __name__ == "__main__":
+    main()
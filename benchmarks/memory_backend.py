@@ -0,0 +1,107 @@
+"""Benchmark of searches answered by the in-memory backend.
+
+The queries of the endpoints below are searched `--repeat` times in the
+backend loaded from `--dump`, and the latency percentiles of each query
+are printed.
+
+- name: /pokemon/name/{name}.
+- pokedex_number: /pokemon/pokedex_number/{pokedex_number}.
+- conditions: a page of /pokemon/conditions.
+- keyword: a page of /pokemon/keyword/{keyword}.
+- mget: the lookup by `_id` of /pokemon/pokedex_number/{pokedex_number}.
+
+It needs no elasticsearch:
+
+    python -m benchmarks.memory_backend --repeat 10000
+"""
+
+import argparse
+import functools
+import statistics
+import time
+from typing import Callable
+
+from pokeapi.search import memory
+from pokeapi.search.param import (
+    CreateGenderTypeParam,
+    CreateLegendaryParam,
+    CreatePageParam,
+)
+from pokeapi.search.query import (
+    CreateKeywordQuery,
+    CreatePaginatedQuery,
+    CreatePokedexNumberQuery,
+    CreatePokemonNameQuery,
+    compile_conditions,
+)
+
+
+def run(repeat: int, search: Callable[[], object]) -> list[float]:
+    """Method to search `repeat` times.
+
+    Args:
+        repeat (int): Number of searches.
+        search (Callable): Function searching once.
+
+    Returns:
+        list[float]: Latency of each search in microseconds.
+
+    """
+
+    latencies: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        search()
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+
+    return latencies
+
+
+def report(name: str, latencies: list[float]) -> None:
+    """Method to print the latency percentiles of a query.
+
+    Args:
+        name (str): Name of the query.
+        latencies (list[float]): Latency of each search in microseconds.
+    """
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<16} n={len(latencies):<7} "
+        f"mean={statistics.fmean(latencies):8.2f}us "
+        f"p50={percentiles[49]:8.2f}us "
+        f"p99={percentiles[98]:8.2f}us"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--dump", default="docker/elasticdump/src/pokemon_data.json"
+    )
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    es = memory.MemoryBackend(memory.load_index(args.dump, "pokemon"))
+    page = CreatePageParam(10)
+    conditions = compile_conditions(
+        (CreateLegendaryParam(False), CreateGenderTypeParam((True, True)))
+    ).query
+    queries = {
+        "name": CreatePokemonNameQuery().create_query("ピカチュウ"),
+        "pokedex_number": CreatePokedexNumberQuery().create_query(25),
+        "conditions": CreatePaginatedQuery().create_query((conditions, page)),
+        "keyword": CreatePaginatedQuery().create_query(
+            (CreateKeywordQuery().create_query("ほのお"), page)
+        ),
+    }
+
+    for name, query in queries.items():
+        report(
+            name, run(args.repeat, functools.partial(es.search, body=query))
+        )
+    report("mget", run(args.repeat, lambda: es.mget(body={"ids": ["25"]})))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Benchmark of building condition queries with and without query plans.
+
+The conditions of /pokemon/conditions are built `--repeat` times in every
+variant below, and the latency percentiles of each variant are printed.
+
+- build: `build_conditional_query` and `canonical_key` of the page
+  on every request, as before query plans.
+- compile: `compile_conditions`, which builds each shape once.
+- compile+page: `compile_conditions` with the query and key of a page,
+  as done by the /pokemon/conditions endpoint.
+
+It needs no elasticsearch:
+
+    python -m benchmarks.query_plan --repeat 10000
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable
+
+from pokeapi.routers.pokemon_router import condition_params
+from pokeapi.search.param import CreatePageParam, Param
+from pokeapi.search.query import (
+    CreatePaginatedQuery,
+    build_conditional_query,
+    compile_conditions,
+    create_paginated_key,
+)
+from pokeapi.search.singleflight import canonical_key
+
+CONDITIONS = (
+    condition_params(is_legendary=True),
+    condition_params(type_1="でんき"),
+    condition_params(ability_1="ばけのかわ", has_male=True, has_female=True),
+    condition_params(
+        type_1="ほのお",
+        type_2="ひこう",
+        ability_1="もうか",
+        hidden_ability="サンパワー",
+        is_mega_evolution=False,
+        regional_variant="アローラのすがた",
+    ),
+)
+
+
+def run(repeat: int, build: Callable[[], object]) -> list[float]:
+    """Method to build the conditions `repeat` times.
+
+    Args:
+        repeat (int): Number of times the conditions are built.
+        build (Callable): Function building the conditions.
+
+    Returns:
+        list[float]: Latency of each build in microseconds.
+
+    """
+
+    latencies: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build()
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+
+    return latencies
+
+
+def report(name: str, latencies: list[float]) -> None:
+    """Method to print the latency percentiles of a variant.
+
+    Args:
+        name (str): Name of the variant.
+        latencies (list[float]): Latency of each build in microseconds.
+    """
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<14} n={len(latencies):<7} "
+        f"mean={statistics.fmean(latencies):8.2f}us "
+        f"p50={percentiles[49]:8.2f}us "
+        f"p99={percentiles[98]:8.2f}us"
+    )
+
+
+def benchmark(
+    conditions: tuple[Param, ...], page: CreatePageParam, repeat: int
+) -> None:
+    def build() -> None:
+        query = build_conditional_query(conditions)
+        canonical_key(CreatePaginatedQuery().create_query((query, page)))
+
+    def compile_page() -> None:
+        plan = compile_conditions(conditions)
+        paginated = CreatePaginatedQuery().create_query((plan.query, page))
+        create_paginated_key(plan.key, paginated)
+
+    report("build", run(repeat, build))
+    report("compile", run(repeat, lambda: compile_conditions(conditions)))
+    report("compile+page", run(repeat, compile_page))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+    page = CreatePageParam(10, [25, "35"])
+
+    for conditions in CONDITIONS:
+        count = sum(c.create_param() is not None for c in conditions)
+        print(f"{count} conditions")
+        benchmark(conditions, page, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
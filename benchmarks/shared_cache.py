@@ -0,0 +1,122 @@
+"""Benchmark of reads from the cache shared by workers.
+
+A batch of `--keys` cached results is read `--repeat` times in every
+variant below, and the latency percentiles of each variant are printed.
+
+- get: one GET per key, one round trip each.
+- pipeline: every GET written at once by `RedisCache.get_many`.
+- l1+l2: `async_accessor._get_many`, which serves the keys from the cache
+  of the process after the first read.
+
+It runs against a server faked in the process unless `--url` is given:
+
+    python -m benchmarks.shared_cache --keys 20 --repeat 200
+    python -m benchmarks.shared_cache --url redis://localhost:6379/0
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable
+from unittest import mock
+
+from pokeapi.search import async_accessor, cache, redis_cache
+from tests.fake_redis import FakeRedis
+
+DOC = {
+    "national_pokedex_number": 25,
+    "name": "ピカチュウ",
+    "types": ["でんき"],
+    "abilities": ["せいでんき"],
+    "hidden_ability": "ひらいしん",
+}
+
+
+async def run(
+    repeat: int, read: Callable[[], Awaitable[object]]
+) -> list[float]:
+    """Method to read the batch of keys `repeat` times.
+
+    Args:
+        repeat (int): Number of times the batch is read.
+        read (Callable): Function reading the batch.
+
+    Returns:
+        list[float]: Latency of each read in milliseconds.
+
+    """
+
+    latencies: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await read()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    return latencies
+
+
+def report(name: str, latencies: list[float]) -> None:
+    """Method to print the latency percentiles of a variant.
+
+    Args:
+        name (str): Name of the variant.
+        latencies (list[float]): Latency of each read in milliseconds.
+    """
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<10} n={len(latencies):<6} "
+        f"mean={statistics.fmean(latencies):7.3f}ms "
+        f"p50={percentiles[49]:7.3f}ms "
+        f"p95={percentiles[94]:7.3f}ms "
+        f"p99={percentiles[98]:7.3f}ms"
+    )
+
+
+async def benchmark(url: str, keys: int, repeat: int) -> None:
+    client = redis_cache.RedisClient(url, 1.0)
+    shared_cache = redis_cache.RedisCache(client, "benchmark:")
+    names = [f"pokedex_number:{n}" for n in range(keys)]
+    await shared_cache.put_many([(name, [DOC]) for name in names], 60)
+
+    async def get() -> None:
+        for name in names:
+            await shared_cache.get(name)
+
+    report("get", await run(repeat, get))
+    report("pipeline", await run(repeat, lambda: shared_cache.get_many(names)))
+
+    with mock.patch.object(
+        redis_cache, "get_redis_cache", return_value=shared_cache
+    ), mock.patch.object(
+        cache, "get_cache", return_value=cache.ResponseCache(keys)
+    ):
+        report(
+            "l1+l2",
+            await run(repeat, lambda: async_accessor._get_many(names, 60)),
+        )
+
+    await client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url")
+    parser.add_argument("--keys", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    if args.url:
+        asyncio.run(benchmark(args.url, args.keys, args.repeat))
+        return
+
+    fake = FakeRedis()
+    try:
+        asyncio.run(benchmark(fake.url, args.keys, args.repeat))
+    finally:
+        fake.stop()
+
+
+if __name__ == "__main__":
+    main()
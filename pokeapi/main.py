@@ -1,10 +1,109 @@
-from fastapi import FastAPI
+import math
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
-from .routers import pokemon_router
+import elasticsearch
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from .routers import pokemon_router, stats_router
 from .schemas.message_schema import RootMessageSchema
+from .search import client, config, generation, redis_cache
+from .search.breaker import CircuitOpenError
+from .warmup import warm_up
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Lifespan of the application.
+
+    Opens the process-wide clients of elasticsearch, starts polling
+    the generation of the index and, when `ES_WARMUP_ENABLED` is set,
+    warms the worker up on startup. Stops them and closes the connections
+    of the shared cache on shutdown.
+
+    Args:
+        app (FastAPI): Application.
+
+    """
+
+    client.open_client()
+    await client.open_async_client()
+    generation.start_polling()
+    if config.get_config().ES_WARMUP_ENABLED:
+        await warm_up(app)
+    yield
+    await generation.stop_polling()
+    await redis_cache.close_redis_cache()
+    await client.close_async_client()
+    client.close_client()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 app.include_router(pokemon_router.router)
+app.include_router(stats_router.router)
+
+
+@app.exception_handler(CircuitOpenError)
+async def circuit_open_handler(
+    request: Request, exc: CircuitOpenError
+) -> JSONResponse:
+    """Exception handler failing fast while the circuit breaker is open.
+
+    Args:
+        request (Request): Request rejected by the circuit breaker.
+        exc (CircuitOpenError): Error raised by the circuit breaker.
+
+    Returns:
+        JSONResponse: Response of 503 with `Retry-After`.
+
+    """
+
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "elasticsearch is unavailable"},
+        headers={"Retry-After": str(math.ceil(exc.retry_after))},
+    )
+
+
+@app.exception_handler(elasticsearch.ConnectionTimeout)
+async def deadline_exceeded_handler(
+    request: Request, exc: elasticsearch.ConnectionTimeout
+) -> JSONResponse:
+    """Exception handler for searches that exceeded the deadline of a route.
+
+    Args:
+        request (Request): Request that exceeded the deadline.
+        exc (ConnectionTimeout): Error raised by the client of elasticsearch.
+
+    Returns:
+        JSONResponse: Response of 504.
+
+    """
+
+    return JSONResponse(
+        status_code=504, content={"detail": "elasticsearch timed out"}
+    )
+
+
+@app.exception_handler(elasticsearch.ConnectionError)
+async def connection_error_handler(
+    request: Request, exc: elasticsearch.ConnectionError
+) -> JSONResponse:
+    """Exception handler for searches that could not reach elasticsearch.
+
+    Args:
+        request (Request): Request that could not reach elasticsearch.
+        exc (ConnectionError): Error raised by the client of elasticsearch.
+
+    Returns:
+        JSONResponse: Response of 503.
+
+    """
+
+    return JSONResponse(
+        status_code=503, content={"detail": "elasticsearch is unavailable"}
+    )
 
 
 @app.get("/", response_model=RootMessageSchema)
@@ -1,35 +1,398 @@
+import hashlib
+import json
 import random
-from typing import Annotated
-
-from fastapi import APIRouter, Path, Query
-
-from pokeapi.schemas.pokemon_schema import PokemonSchema
-from pokeapi.search import accessor
+from typing import Annotated, Any, AsyncIterator, Awaitable, Callable
+
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Path,
+    Query,
+    Response,
+)
+from fastapi.responses import StreamingResponse
+
+from pokeapi.schemas.pokemon_schema import (
+    NameLookupSchema,
+    PokedexNumberLookupSchema,
+    PokemonBatchRequestSchema,
+    PokemonBatchResponseSchema,
+    PokemonSchema,
+)
+from pokeapi.search import (
+    accessor,
+    async_accessor,
+    config,
+    expression,
+    generation,
+    membership,
+    prerender,
+)
+from pokeapi.search.cursor import decode_cursor, encode_cursor
 from pokeapi.search.param import (
     CreateAbilityParam,
+    CreateExpressionParam,
     CreateFormParam,
     CreateGenderTypeParam,
     CreateLegendaryParam,
     CreateMegaEvolutionParam,
     CreateMythicalParam,
+    CreatePageParam,
     CreatePokemonTypeParam,
     CreatePrimalReversionParam,
+    CreateRangeParam,
     CreateRegionalVariantParam,
+    Param,
 )
 from pokeapi.search.query import (
-    CreateConditionalSearchQuery,
     CreateKeywordQuery,
+    CreatePaginatedQuery,
     CreatePokedexNumberQuery,
     CreatePokemonNameQuery,
+    compile_conditions,
+    create_paginated_key,
 )
+from pokeapi.search.singleflight import canonical_key
 
 router = APIRouter()
 
+JSON_MEDIA_TYPE = "application/json"
+
+
+def page_param(
+    limit: int = Query(10, title="Number of Pokémon in a page", ge=1, le=1000),
+    cursor: str | None = Query(None, title="Cursor of the page to get"),
+    track_total_hits: bool = Query(
+        False, title="Whether to count all matching Pokémon"
+    ),
+) -> CreatePageParam:
+    """Dependency to create parameters of a page from query parameters.
+
+    Args:
+        limit (int): Number of Pokémon in a page.
+        cursor (str): Value of `X-Next-Cursor` of the previous page.
+        track_total_hits (bool): Whether to count all matching Pokémon.
+
+    Raises:
+        HTTPException: If the cursor is invalid.
+
+    Returns:
+        CreatePageParam: Parameters of the page.
+
+    """
+
+    search_after = None
+    if cursor is not None:
+        try:
+            search_after = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e)) from e
+
+    return CreatePageParam(limit, search_after, track_total_hits)
+
+
+def set_page_headers(
+    response: Response,
+    page: CreatePageParam,
+    count: int,
+    last_sort: list[Any] | None,
+    total: int | None,
+) -> None:
+    """Method to set the headers of a page to a response.
+
+    Args:
+        response (Response): Response to set the headers of the page to.
+        page (CreatePageParam): Parameters of the page.
+        count (int): Number of Pokémon in the page.
+        last_sort (list[Any] | None): Sort values of the last Pokémon.
+        total (int | None): Number of all matching Pokémon if counted.
+    """
+
+    if last_sort is not None and count == page.limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(last_sort)
+    if total is not None:
+        response.headers["X-Total-Count"] = str(total)
+
+
+def create_etag(
+    index_generation: str,
+    route: str,
+    query: dict[str, Any],
+    is_raw: bool,
+    query_key: str | None = None,
+) -> str:
+    """Method to create a strong ETag of a response.
+
+    Args:
+        index_generation (str): Generation of the index.
+        route (str): Name of the route, such as "conditions".
+        query (dict[str, Any]): Query, or other parameters,
+        the response is created from.
+        is_raw (bool): Whether the response is the JSON sent
+        by elasticsearch, whose bytes differ from the ones of the model.
+        query_key (str | None): Canonical key of the query if known.
+
+    Returns:
+        str: Quoted ETag.
+
+    """
+
+    if query_key is None:
+        query_key = canonical_key(query)
+    digest = hashlib.sha256(
+        f"{index_generation}\n{route}\n{int(is_raw)}\n{query_key}".encode()
+    ).hexdigest()
+
+    return f'"{digest[:32]}"'
+
+
+async def create_cache_headers(
+    route: str, query: dict[str, Any], query_key: str | None = None
+) -> dict[str, str]:
+    """Method to create the headers of caching of a response.
+
+    `Cache-Control` lets clients and proxies reuse the response for the
+    `max-age` of the route, or makes them revalidate it every time.
+    `ETag` changes when the index does, so that a revalidated response
+    is answered by `is_not_modified` without searching elasticsearch.
+
+    Args:
+        route (str): Name of the route, such as "conditions".
+        query (dict[str, Any]): Query, or other parameters,
+        the response is created from.
+        query_key (str | None): Canonical key of the query if known.
+
+    Returns:
+        dict[str, str]: `Cache-Control` and `ETag`, without `ETag` when
+        the generation of the index is unknown, or no header while
+        `ES_ETAG_ENABLED` is unset.
+
+    """
+
+    conf = config.get_config()
+    if not conf.ES_ETAG_ENABLED:
+        return {}
+
+    max_age = conf.get_max_age(route)
+    headers = {
+        "Cache-Control": f"public, max-age={max_age}"
+        if max_age > 0
+        else "no-cache"
+    }
+
+    index_generation = await generation.get_generation()
+    if index_generation is not None:
+        headers["ETag"] = create_etag(
+            index_generation,
+            route,
+            query,
+            conf.ES_RAW_PASSTHROUGH,
+            query_key,
+        )
+
+    return headers
+
+
+def is_not_modified(
+    if_none_match: str | None, headers: dict[str, str]
+) -> bool:
+    """Method to decide whether a response can be answered with 304.
+
+    Args:
+        if_none_match (str | None): `If-None-Match` of the request.
+        headers (dict[str, str]): Headers created by `create_cache_headers`.
+
+    Returns:
+        bool: Whether the client has the response already.
+
+    """
+
+    etag = headers.get("ETag")
+    if if_none_match is None or etag is None:
+        return False
+
+    # `If-None-Match` is compared weakly, so tags marked as weak
+    # by a proxy compressing the response still match.
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def create_not_modified_response(headers: dict[str, str]) -> Response:
+    """Method to create a response telling the client to reuse its own.
+
+    Args:
+        headers (dict[str, str]): Headers created by `create_cache_headers`.
+
+    Returns:
+        Response: Response with status 304 and the headers.
+
+    """
+
+    return Response(status_code=304, headers=headers)
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """Method to decide whether a client accepts a gzip response.
+
+    Args:
+        accept_encoding (str | None): `Accept-Encoding` of the request.
+
+    Returns:
+        bool: Whether gzip, or any encoding, is accepted
+        with a non-zero quality.
+
+    """
+
+    if accept_encoding is None:
+        return False
+
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() not in ("gzip", "*"):
+            continue
+        quality = params.strip().removeprefix("q=")
+        try:
+            if not quality or float(quality) > 0:
+                return True
+        except ValueError:
+            continue
+
+    return False
+
+
+async def create_rendered_response(
+    kind: str,
+    value: int | str,
+    load: Callable[[], Awaitable[list[dict]]],
+    headers: dict[str, str],
+    accept_encoding: str | None,
+) -> Response:
+    """Method to answer a lookup with the body rendered in advance.
+
+    The Pokémon are loaded and rendered only when the lookup has not
+    been rendered under the current generation, and the body skips
+    `response_model` in any case. The gzip variant is sent to clients
+    accepting it, with a weak `ETag` as the bytes differ.
+
+    Args:
+        kind (str): "pokedex_number" or "name".
+        value (int | str): Target of the lookup.
+        load (Callable[[], Awaitable[list[dict]]]): Function
+        loading the Pokémon of the lookup.
+        headers (dict[str, str]): Headers created by `create_cache_headers`.
+        accept_encoding (str | None): `Accept-Encoding` of the request.
+
+    Returns:
+        Response: Response with the rendered body.
+
+    """
+
+    rendered = prerender.get(kind, value)
+    if rendered is None:
+        index_generation = prerender.stats.generation
+        rendered = prerender.put(kind, value, await load(), index_generation)
+
+    body = rendered.body
+    headers = dict(headers)
+    if rendered.gzip_body is not None:
+        headers["Vary"] = "Accept-Encoding"
+        if accepts_gzip(accept_encoding):
+            body = rendered.gzip_body
+            headers["Content-Encoding"] = "gzip"
+            if "ETag" in headers:
+                headers["ETag"] = f"W/{headers['ETag']}"
+
+    return Response(body, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+async def create_page_response(
+    query: dict,
+    page: CreatePageParam,
+    response: Response,
+    route: str,
+    if_none_match: str | None = None,
+    cache: bool = False,
+    query_key: str | None = None,
+) -> list[PokemonSchema] | Response:
+    """Method to search for a page of Pokémon and set the headers of the page.
+
+    `X-Next-Cursor` is set when there may be a next page, and
+    `X-Total-Count` is set when `track_total_hits` is requested.
+    When `ES_RAW_PASSTHROUGH` is set, the page is returned as the JSON
+    sent by elasticsearch in a response of its own. When the client
+    has the page already, it is answered with 304 without a search.
+
+    Args:
+        query (dict): Query to search for Pokémon.
+        page (CreatePageParam): Parameters of the page.
+        response (Response): Response to set the headers of the page to.
+        route (str): Name of the route, whose deadline, TTL of caching
+        and `max-age` are used.
+        if_none_match (str | None): `If-None-Match` of the request.
+        cache (bool): Whether to use the shard request cache
+        of elasticsearch for the page.
+        query_key (str | None): Canonical key of the query if known,
+        such as the one of a `QueryPlan`.
+
+    Returns:
+        list[PokemonSchema] | Response: List containing Pokémon data,
+        or the response with the page.
+
+    """
+
+    conf = config.get_config()
+    deadline = conf.get_deadline(route)
+    ttl = conf.get_cache_ttl(route)
+    paginated_query = CreatePaginatedQuery().create_query((query, page))
+
+    paginated_key = None
+    if query_key is not None:
+        paginated_key = create_paginated_key(query_key, paginated_query)
+
+    headers = await create_cache_headers(route, paginated_query, paginated_key)
+    if is_not_modified(if_none_match, headers):
+        return create_not_modified_response(headers)
+
+    if conf.ES_RAW_PASSTHROUGH:
+        raw_page = await async_accessor.search_pokemon_raw(
+            paginated_query, cache, deadline, ttl, query_key
+        )
+        raw_response = Response(
+            raw_page.content, media_type=JSON_MEDIA_TYPE, headers=headers
+        )
+        set_page_headers(
+            raw_response,
+            page,
+            raw_page.count,
+            raw_page.last_sort,
+            raw_page.total,
+        )
+        return raw_response
+
+    es_page = await async_accessor.search_pokemon_page(
+        paginated_query, cache, deadline, ttl, query_key
+    )
+    response.headers.update(headers)
+    set_page_headers(
+        response, page, len(es_page.docs), es_page.last_sort, es_page.total
+    )
+
+    return accessor.create_pokemon_response(es_page.docs)
+
 
 @router.get("/pokemon", response_model=list[PokemonSchema])
-async def read_pokemon() -> list[PokemonSchema]:
+async def read_pokemon(response: Response) -> list[PokemonSchema]:
     """Path operation function for /pokemon endpoint.
 
+    The Pokémon is chosen at random, so the response is not to be reused.
+
+    Args:
+        response (Response): Response to set `Cache-Control` to.
+
     Returns:
         list[PokemonSchema]: List containing Pokémon data..
 
@@ -38,7 +401,9 @@ async def read_pokemon() -> list[PokemonSchema]:
     # Numbers for all ranges of National Pokédex Number.
     # But not supported by data for testing.
 
-    # query = CreatePokedexNumberQuery().create_query(random.randint(1, 1014))
+    # es_response = await async_accessor.search_pokemon_by_pokedex_number(
+    #     random.randint(1, 1014)
+    # )
 
     # Numbers corresponding to the data for testing.
     test_numbers = [
@@ -62,30 +427,80 @@ async def read_pokemon() -> list[PokemonSchema]:
         778,
     ]
 
-    query = CreatePokedexNumberQuery().create_query(
-        random.choice(test_numbers)
+    conf = config.get_config()
+    es_response = await async_accessor.search_pokemon_by_pokedex_number(
+        random.choice(test_numbers),
+        conf.get_deadline("pokemon"),
+        conf.get_cache_ttl("pokemon"),
     )
-    es_response = accessor.search_pokemon(query)
+    if conf.ES_ETAG_ENABLED:
+        response.headers["Cache-Control"] = "no-store"
 
     return accessor.create_pokemon_response(es_response)
 
 
 @router.get("/pokemon/name/{name}", response_model=list[PokemonSchema])
 async def read_pokemon_by_name(
-    name: Annotated[str, Query(title="Pokémon Name of Pokémon to get")]
-) -> list[PokemonSchema]:
+    name: Annotated[str, Query(title="Pokémon Name of Pokémon to get")],
+    response: Response,
+    if_none_match: str | None = Header(None),
+    accept_encoding: str | None = Header(None),
+) -> list[PokemonSchema] | Response:
     """Path operation function for /pokemon/name endpoint.
 
+    Names that `membership` knows to be missing are not searched for.
+
     Args:
         name (str): Target of `name`.
+        response (Response): Response to set the headers of caching to.
+        if_none_match (str | None): ETag of the response of the client.
+        accept_encoding (str | None): Encodings accepted by the client.
 
     Returns:
-        list[PokemonSchema]: List containing Pokémon data.
+        list[PokemonSchema] | Response: List containing Pokémon data,
+        the body rendered in advance when `ES_PRERENDER_ENABLED` is set,
+        the JSON sent by elasticsearch when `ES_RAW_PASSTHROUGH` is set,
+        or 304 when the client has the response already.
 
     """
 
+    conf = config.get_config()
     query = CreatePokemonNameQuery().create_query(name)
-    es_response = accessor.search_pokemon(query)
+
+    headers = await create_cache_headers("name", query)
+    if is_not_modified(if_none_match, headers):
+        return create_not_modified_response(headers)
+
+    if membership.is_missing(membership.NAME, name):
+        return Response(b"[]", media_type=JSON_MEDIA_TYPE, headers=headers)
+
+    async def search() -> list[dict]:
+        docs = await async_accessor.search_pokemon(
+            query, conf.get_deadline("name"), conf.get_cache_ttl("name")
+        )
+        if not docs:
+            membership.record_missing(membership.NAME, name)
+        return docs
+
+    if conf.ES_PRERENDER_ENABLED:
+        return await create_rendered_response(
+            prerender.NAME, name, search, headers, accept_encoding
+        )
+
+    if conf.ES_RAW_PASSTHROUGH:
+        raw_page = await async_accessor.search_pokemon_raw(
+            query,
+            deadline=conf.get_deadline("name"),
+            ttl=conf.get_cache_ttl("name"),
+        )
+        if raw_page.count == 0:
+            membership.record_missing(membership.NAME, name)
+        return Response(
+            raw_page.content, media_type=JSON_MEDIA_TYPE, headers=headers
+        )
+
+    es_response = await search()
+    response.headers.update(headers)
 
     return accessor.create_pokemon_response(es_response)
 
@@ -98,26 +513,125 @@ async def read_pokemon_by_pokedex_number(
     pokedex_number: Annotated[
         int,
         Path(title="National Pokédex Number of Pokémon to get", gt=1, le=1015),
-    ]
-) -> list[PokemonSchema]:
+    ],
+    response: Response,
+    if_none_match: str | None = Header(None),
+    accept_encoding: str | None = Header(None),
+) -> list[PokemonSchema] | Response:
     """Path operation function for /pokemon/pokedex_number endpoint.
 
     Args:
         pokedex_number (int): Target of `national_pokédex_number`.
+        response (Response): Response to set the headers of caching to.
+        if_none_match (str | None): ETag of the response of the client.
+        accept_encoding (str | None): Encodings accepted by the client.
 
     Returns:
-        list[PokemonSchema]: List containing Pokémon data.
+        list[PokemonSchema] | Response: List containing Pokémon data,
+        the body rendered in advance when `ES_PRERENDER_ENABLED` is set,
+        the JSON sent by elasticsearch when `ES_RAW_PASSTHROUGH` is set,
+        or 304 when the client has the response already.
 
     """
 
-    query = CreatePokedexNumberQuery().create_query(pokedex_number)
-    es_response = accessor.search_pokemon(query)
+    conf = config.get_config()
+    headers = await create_cache_headers(
+        "pokedex_number", {"national_pokedex_number": pokedex_number}
+    )
+    if is_not_modified(if_none_match, headers):
+        return create_not_modified_response(headers)
+
+    def search() -> Awaitable[list[dict]]:
+        return async_accessor.search_pokemon_by_pokedex_number(
+            pokedex_number,
+            conf.get_deadline("pokedex_number"),
+            conf.get_cache_ttl("pokedex_number"),
+        )
+
+    if conf.ES_PRERENDER_ENABLED:
+        return await create_rendered_response(
+            prerender.POKEDEX_NUMBER,
+            pokedex_number,
+            search,
+            headers,
+            accept_encoding,
+        )
+
+    if conf.ES_RAW_PASSTHROUGH:
+        if membership.is_missing(membership.POKEDEX_NUMBER, pokedex_number):
+            return Response(b"[]", media_type=JSON_MEDIA_TYPE, headers=headers)
+
+        raw_page = await async_accessor.search_pokemon_raw(
+            CreatePokedexNumberQuery().create_query(pokedex_number),
+            deadline=conf.get_deadline("pokedex_number"),
+            ttl=conf.get_cache_ttl("pokedex_number"),
+        )
+        if raw_page.count == 0:
+            membership.record_missing(
+                membership.POKEDEX_NUMBER, pokedex_number
+            )
+        return Response(
+            raw_page.content, media_type=JSON_MEDIA_TYPE, headers=headers
+        )
+
+    es_response = await search()
+    response.headers.update(headers)
 
     return accessor.create_pokemon_response(es_response)
 
 
-@router.get("/pokemon/conditions", response_model=list[PokemonSchema])
-async def read_pokemon_by_conditions(
+@router.post("/pokemon/batch", response_model=PokemonBatchResponseSchema)
+async def read_pokemon_batch(
+    targets: Annotated[
+        PokemonBatchRequestSchema,
+        Body(title="National Pokédex Numbers and names of Pokémon to get"),
+    ]
+) -> PokemonBatchResponseSchema:
+    """Path operation function for /pokemon/batch endpoint.
+
+    Args:
+        targets (PokemonBatchRequestSchema): Targets of
+        `national_pokédex_number` and `name`.
+
+    Returns:
+        PokemonBatchResponseSchema: Pokémon data for each target
+        in the order of the request.
+
+    """
+
+    conf = config.get_config()
+    by_pokedex_number, by_name = await async_accessor.lookup_pokemon(
+        tuple(targets.pokedex_numbers),
+        tuple(targets.names),
+        conf.get_deadline("batch"),
+        conf.get_cache_ttl("batch"),
+    )
+
+    return PokemonBatchResponseSchema(
+        pokedex_numbers=[
+            PokedexNumberLookupSchema(
+                pokedex_number=pokedex_number,
+                found=pokedex_number in by_pokedex_number,
+                pokemon=accessor.create_pokemon_response(
+                    by_pokedex_number.get(pokedex_number, [])
+                ),
+            )
+            for pokedex_number in targets.pokedex_numbers
+        ],
+        names=[
+            NameLookupSchema(
+                name=name,
+                found=name in by_name,
+                pokemon=accessor.create_pokemon_response(
+                    by_name.get(name, [])
+                ),
+            )
+            for name in targets.names
+        ],
+    )
+
+
+def condition_params(
     ability_1: str | None = None,
     ability_2: str | None = None,
     hidden_ability: str | None = None,
@@ -131,8 +645,36 @@ async def read_pokemon_by_conditions(
     type_2: str | None = None,
     is_primal_reversion: bool | None = None,
     regional_variant: str | None = None,
-) -> list[PokemonSchema]:
-    """Path operation function for /pokemon/conditions endpoint.
+    min_hp: int | None = None,
+    max_hp: int | None = None,
+    min_attack: int | None = None,
+    max_attack: int | None = None,
+    min_defense: int | None = None,
+    max_defense: int | None = None,
+    min_special_attack: int | None = None,
+    max_special_attack: int | None = None,
+    min_special_defense: int | None = None,
+    max_special_defense: int | None = None,
+    min_speed: int | None = None,
+    max_speed: int | None = None,
+    min_base_total: int | None = None,
+    max_base_total: int | None = None,
+    min_height: float | None = None,
+    max_height: float | None = None,
+    min_weight: float | None = None,
+    max_weight: float | None = None,
+    filter_expression: str
+    | None = Query(
+        None, alias="filter", title="Filter expression of Pokémon to get"
+    ),
+) -> tuple[Param, ...]:
+    """Dependency to create search parameters from conditions
+        in query parameters.
+
+    `filter` combines conditions with AND, OR and NOT, such as
+    "(type:ほのお OR type:ドラゴン) AND NOT is_legendary:true",
+    and is ANDed with the other conditions. The bounds of `min_*`
+    and `max_*` are inclusive.
 
     Args:
         ability_1 (str): Target of `ability_1`.
@@ -148,13 +690,41 @@ async def read_pokemon_by_conditions(
         type_2 (str): Target of `type_2`.
         is_primal_reversion (bool): Target of `is_primal_reversion`.
         regional_variant (bool): Target of `regional_variant`.
+        min_hp (int): Lower bound of `base_stats.hp`.
+        max_hp (int): Upper bound of `base_stats.hp`.
+        min_attack (int): Lower bound of `base_stats.attack`.
+        max_attack (int): Upper bound of `base_stats.attack`.
+        min_defense (int): Lower bound of `base_stats.defense`.
+        max_defense (int): Upper bound of `base_stats.defense`.
+        min_special_attack (int): Lower bound of `base_stats.special_attack`.
+        max_special_attack (int): Upper bound of `base_stats.special_attack`.
+        min_special_defense (int): Lower bound of `base_stats.special_defense`.
+        max_special_defense (int): Upper bound of `base_stats.special_defense`.
+        min_speed (int): Lower bound of `base_stats.speed`.
+        max_speed (int): Upper bound of `base_stats.speed`.
+        min_base_total (int): Lower bound of `base_stats.base_total`.
+        max_base_total (int): Upper bound of `base_stats.base_total`.
+        min_height (float): Lower bound of `height`.
+        max_height (float): Upper bound of `height`.
+        min_weight (float): Lower bound of `weight`.
+        max_weight (float): Upper bound of `weight`.
+        filter_expression (str): Filter expression.
+
+    Raises:
+        HTTPException: If the filter expression is invalid.
 
     Returns:
-        list[PokemonSchema]: List containing Pokémon data.
+        tuple[Param, ...]: Search parameters of the conditions.
 
     """
 
-    request_params = (
+    if filter_expression is not None:
+        try:
+            expression.parse(filter_expression)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e)) from e
+
+    return (
         CreateAbilityParam((ability_1, ability_2, hidden_ability)),
         CreateFormParam(form),
         CreateGenderTypeParam((has_male, has_female)),
@@ -164,29 +734,128 @@ async def read_pokemon_by_conditions(
         CreatePokemonTypeParam((type_1, type_2)),
         CreatePrimalReversionParam(is_primal_reversion),
         CreateRegionalVariantParam(regional_variant),
+        CreateRangeParam("base_stats.hp", (min_hp, max_hp)),
+        CreateRangeParam("base_stats.attack", (min_attack, max_attack)),
+        CreateRangeParam("base_stats.defense", (min_defense, max_defense)),
+        CreateRangeParam(
+            "base_stats.special_attack",
+            (min_special_attack, max_special_attack),
+        ),
+        CreateRangeParam(
+            "base_stats.special_defense",
+            (min_special_defense, max_special_defense),
+        ),
+        CreateRangeParam("base_stats.speed", (min_speed, max_speed)),
+        CreateRangeParam(
+            "base_stats.base_total", (min_base_total, max_base_total)
+        ),
+        CreateRangeParam("height", (min_height, max_height)),
+        CreateRangeParam("weight", (min_weight, max_weight)),
+        CreateExpressionParam(filter_expression),
     )
 
-    query = CreateConditionalSearchQuery().create_query(request_params)
-    es_response = accessor.search_pokemon(query)
 
-    return accessor.create_pokemon_response(es_response)
+@router.get("/pokemon/conditions", response_model=list[PokemonSchema])
+async def read_pokemon_by_conditions(
+    response: Response,
+    request_params: tuple[Param, ...] = Depends(condition_params),
+    page: CreatePageParam = Depends(page_param),
+    if_none_match: str | None = Header(None),
+) -> list[PokemonSchema] | Response:
+    """Path operation function for /pokemon/conditions endpoint.
+
+    Args:
+        response (Response): Response to set the headers of the page to.
+        request_params (tuple[Param, ...]): Search parameters
+        of the conditions.
+        page (CreatePageParam): Parameters of the page.
+        if_none_match (str | None): ETag of the page of the client.
+
+    Returns:
+        list[PokemonSchema] | Response: List containing Pokémon data,
+        the page when `ES_RAW_PASSTHROUGH` is set, or 304 when
+        the client has the page already.
+
+    """
+
+    plan = compile_conditions(request_params)
+
+    return await create_page_response(
+        plan.query,
+        page,
+        response,
+        "conditions",
+        if_none_match,
+        cache=True,
+        query_key=plan.key,
+    )
+
+
+@router.get("/pokemon/export", response_class=StreamingResponse)
+async def export_pokemon(
+    request_params: tuple[Param, ...] = Depends(condition_params),
+    if_none_match: str | None = Header(None),
+) -> Response:
+    """Path operation function for /pokemon/export endpoint.
+
+    Every Pokémon matching the conditions is streamed as NDJSON,
+    one page of a point-in-time search at a time.
+
+    Args:
+        request_params (tuple[Param, ...]): Search parameters
+        of the conditions.
+        if_none_match (str | None): ETag of the export of the client.
+
+    Returns:
+        Response: NDJSON with one Pokémon per line, or 304 when
+        the client has the export already.
+
+    """
+
+    plan = compile_conditions(request_params)
+    query = plan.query
+    deadline = config.get_config().get_deadline("export")
+
+    headers = await create_cache_headers("export", query, plan.key)
+    if is_not_modified(if_none_match, headers):
+        return create_not_modified_response(headers)
+
+    async def generate() -> AsyncIterator[bytes]:
+        async for docs in async_accessor.export_pokemon(query, deadline):
+            yield b"".join(
+                json.dumps(doc, ensure_ascii=False).encode() + b"\n"
+                for doc in docs
+            )
+
+    return StreamingResponse(
+        generate(), media_type="application/x-ndjson", headers=headers
+    )
 
 
 @router.get("/pokemon/keyword/{keyword}", response_model=list[PokemonSchema])
 async def read_pokemon_by_keyword(
-    keyword: Annotated[str, Query(title="Keyword of Pokémon to get")]
-) -> list[PokemonSchema]:
+    keyword: Annotated[str, Query(title="Keyword of Pokémon to get")],
+    response: Response,
+    page: CreatePageParam = Depends(page_param),
+    if_none_match: str | None = Header(None),
+) -> list[PokemonSchema] | Response:
     """Path operation function for /pokemon/keyword endpoint.
 
     Args:
         keyword (str): Keyword for searching Pokémon.
+        page (CreatePageParam): Parameters of the page.
+        response (Response): Response to set the headers of the page to.
+        if_none_match (str | None): ETag of the page of the client.
 
     Returns:
-        list[PokemonSchema]: List containing Pokémon data.
+        list[PokemonSchema] | Response: List containing Pokémon data,
+        the page when `ES_RAW_PASSTHROUGH` is set, or 304 when
+        the client has the page already.
 
     """
 
     query = CreateKeywordQuery().create_query(keyword)
-    es_response = accessor.search_pokemon(query)
 
-    return accessor.create_pokemon_response(es_response)
+    return await create_page_response(
+        query, page, response, "keyword", if_none_match
+    )
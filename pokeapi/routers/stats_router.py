@@ -0,0 +1,249 @@
+from fastapi import APIRouter
+
+from pokeapi import warmup
+from pokeapi.schemas.stats_schema import (
+    BatchStatsSchema,
+    BitmapStatsSchema,
+    BreakerStatsSchema,
+    CacheStatsSchema,
+    ExpressionStatsSchema,
+    FastPathStatsSchema,
+    GenerationStatsSchema,
+    HedgeStatsSchema,
+    MembershipStatsSchema,
+    MemoryStatsSchema,
+    PoolStatsSchema,
+    PrerenderStatsSchema,
+    QueryPlanStatsSchema,
+    RedisCacheStatsSchema,
+    SingleFlightStatsSchema,
+    WarmupStatsSchema,
+)
+from pokeapi.search import (
+    batch,
+    bitmap,
+    breaker,
+    cache,
+    client,
+    docmap,
+    expression,
+    generation,
+    hedge,
+    membership,
+    memory,
+    prerender,
+    query,
+    redis_cache,
+    singleflight,
+)
+
+router = APIRouter()
+
+
+@router.get("/stats/pool", response_model=list[PoolStatsSchema])
+async def read_pool_stats() -> list[PoolStatsSchema]:
+    """Path operation function for /stats/pool endpoint.
+
+    Returns:
+        list[PoolStatsSchema]: List containing usage of the connection pool
+        of each node.
+
+    """
+
+    return [PoolStatsSchema(**stats) for stats in client.get_pool_stats()]
+
+
+@router.get("/stats/batch", response_model=BatchStatsSchema)
+async def read_batch_stats() -> BatchStatsSchema:
+    """Path operation function for /stats/batch endpoint.
+
+    Returns:
+        BatchStatsSchema: Size and wait time of the batches of searches.
+
+    """
+
+    return BatchStatsSchema(**batch.get_batch_stats())
+
+
+@router.get("/stats/singleflight", response_model=SingleFlightStatsSchema)
+async def read_singleflight_stats() -> SingleFlightStatsSchema:
+    """Path operation function for /stats/singleflight endpoint.
+
+    Returns:
+        SingleFlightStatsSchema: Number of searches and of searches
+        that shared an in-flight request.
+
+    """
+
+    return SingleFlightStatsSchema(**singleflight.get_singleflight_stats())
+
+
+@router.get("/stats/fast_path", response_model=FastPathStatsSchema)
+async def read_fast_path_stats() -> FastPathStatsSchema:
+    """Path operation function for /stats/fast_path endpoint.
+
+    Returns:
+        FastPathStatsSchema: Number of lookups by National Pokédex Number
+        served by `_mget` and by search.
+
+    """
+
+    return FastPathStatsSchema(**docmap.get_fast_path_stats())
+
+
+@router.get("/stats/breaker", response_model=BreakerStatsSchema)
+async def read_breaker_stats() -> BreakerStatsSchema:
+    """Path operation function for /stats/breaker endpoint.
+
+    Returns:
+        BreakerStatsSchema: State of the circuit breaker and number
+        of trips, rejected calls, failures and slow calls.
+
+    """
+
+    return BreakerStatsSchema(**breaker.get_breaker_stats())
+
+
+@router.get("/stats/hedge", response_model=HedgeStatsSchema)
+async def read_hedge_stats() -> HedgeStatsSchema:
+    """Path operation function for /stats/hedge endpoint.
+
+    Returns:
+        HedgeStatsSchema: Number of searches and of hedged requests
+        fired, won and denied, with the current delay before hedging.
+
+    """
+
+    return HedgeStatsSchema(**hedge.get_hedge_stats())
+
+
+@router.get("/stats/cache", response_model=CacheStatsSchema)
+async def read_cache_stats() -> CacheStatsSchema:
+    """Path operation function for /stats/cache endpoint.
+
+    Returns:
+        CacheStatsSchema: Number of hits, misses, evictions and expirations
+        of the cache of responses, with the number and size of entries.
+
+    """
+
+    return CacheStatsSchema(**cache.get_cache_stats())
+
+
+@router.get("/stats/redis_cache", response_model=RedisCacheStatsSchema)
+async def read_redis_cache_stats() -> RedisCacheStatsSchema:
+    """Path operation function for /stats/redis_cache endpoint.
+
+    Returns:
+        RedisCacheStatsSchema: Number of hits, misses, writes, errors
+        and round trips of the cache shared by workers.
+
+    """
+
+    return RedisCacheStatsSchema(**redis_cache.get_redis_cache_stats())
+
+
+@router.get("/stats/generation", response_model=GenerationStatsSchema)
+async def read_generation_stats() -> GenerationStatsSchema:
+    """Path operation function for /stats/generation endpoint.
+
+    Returns:
+        GenerationStatsSchema: Last known generation of the index,
+        and number of checks, of changes seen and of failed checks.
+
+    """
+
+    return GenerationStatsSchema(**generation.get_generation_stats())
+
+
+@router.get("/stats/warmup", response_model=WarmupStatsSchema)
+async def read_warmup_stats() -> WarmupStatsSchema:
+    """Path operation function for /stats/warmup endpoint.
+
+    Returns:
+        WarmupStatsSchema: Work and seconds of each step of the warm-up
+        on startup, and of the whole warm-up.
+
+    """
+
+    return WarmupStatsSchema(**warmup.get_warmup_stats())
+
+
+@router.get("/stats/membership", response_model=MembershipStatsSchema)
+async def read_membership_stats() -> MembershipStatsSchema:
+    """Path operation function for /stats/membership endpoint.
+
+    Returns:
+        MembershipStatsSchema: Generation and size of the filter,
+        number of its rebuilds, of lookups answered by the filter
+        and by the negative cache, and of calls to elasticsearch saved.
+
+    """
+
+    return MembershipStatsSchema(**membership.get_membership_stats())
+
+
+@router.get("/stats/prerender", response_model=PrerenderStatsSchema)
+async def read_prerender_stats() -> PrerenderStatsSchema:
+    """Path operation function for /stats/prerender endpoint.
+
+    Returns:
+        PrerenderStatsSchema: Generation and number of the responses
+        rendered in advance, and numbers of renders, of hits and of misses.
+
+    """
+
+    return PrerenderStatsSchema(**prerender.get_prerender_stats())
+
+
+@router.get("/stats/query_plans", response_model=QueryPlanStatsSchema)
+async def read_query_plan_stats() -> QueryPlanStatsSchema:
+    """Path operation function for /stats/query_plans endpoint.
+
+    Returns:
+        QueryPlanStatsSchema: Numbers of hits and misses of the compiled
+        query plans, and the number and limit of the kept plans.
+
+    """
+
+    return QueryPlanStatsSchema(**query.get_plan_stats())
+
+
+@router.get("/stats/expressions", response_model=ExpressionStatsSchema)
+async def read_expression_stats() -> ExpressionStatsSchema:
+    """Path operation function for /stats/expressions endpoint.
+
+    Returns:
+        ExpressionStatsSchema: Numbers of hits and misses of the parsed
+        filter expressions, and the number and limit of the kept ones.
+
+    """
+
+    return ExpressionStatsSchema(**expression.get_parse_stats())
+
+
+@router.get("/stats/memory", response_model=MemoryStatsSchema)
+async def read_memory_stats() -> MemoryStatsSchema:
+    """Path operation function for /stats/memory endpoint.
+
+    Returns:
+        MemoryStatsSchema: Number of documents in the in-memory backend,
+        and numbers of loads of the dump, of searches and of multi-gets.
+
+    """
+
+    return MemoryStatsSchema(**memory.get_memory_stats())
+
+
+@router.get("/stats/bitmap", response_model=BitmapStatsSchema)
+async def read_bitmap_stats() -> BitmapStatsSchema:
+    """Path operation function for /stats/bitmap endpoint.
+
+    Returns:
+        BitmapStatsSchema: Generation and numbers of documents and bitsets
+        of the index, and numbers of rebuilds, of pages answered from
+        the bitsets and of queries left to elasticsearch.
+
+    """
+
+    return BitmapStatsSchema(**bitmap.get_bitmap_stats())
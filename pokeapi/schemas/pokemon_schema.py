@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, root_validator
+
+MAX_BATCH_LOOKUP = 300
 
 
 class PokemonSchema(BaseModel):
@@ -18,3 +20,54 @@ class PokemonSchema(BaseModel):
     pokemon_type: dict
     abilities: dict
     base_stats: dict
+
+
+class PokemonBatchRequestSchema(BaseModel):
+    """Request schema class for looking up some Pokémon at once."""
+
+    pokedex_numbers: list[int] = []
+    names: list[str] = []
+
+    @root_validator(skip_on_failure=True)
+    def check_size(cls, values: dict) -> dict:  # noqa: N805
+        """Method to limit the number of targets in one request.
+
+        Args:
+            values (dict): Values of the fields.
+
+        Returns:
+            dict: Values of the fields.
+
+        """
+
+        size = len(values["pokedex_numbers"]) + len(values["names"])
+        if size > MAX_BATCH_LOOKUP:
+            raise ValueError(
+                f"at most {MAX_BATCH_LOOKUP} pokedex_numbers and names"
+                " can be looked up at once"
+            )
+
+        return values
+
+
+class PokedexNumberLookupSchema(BaseModel):
+    """Response schema class for looking up a National Pokédex Number."""
+
+    pokedex_number: int
+    found: bool
+    pokemon: list[PokemonSchema]
+
+
+class NameLookupSchema(BaseModel):
+    """Response schema class for looking up a name of Pokémon."""
+
+    name: str
+    found: bool
+    pokemon: list[PokemonSchema]
+
+
+class PokemonBatchResponseSchema(BaseModel):
+    """Response schema class for looking up some Pokémon at once."""
+
+    pokedex_numbers: list[PokedexNumberLookupSchema]
+    names: list[NameLookupSchema]
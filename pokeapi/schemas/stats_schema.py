@@ -0,0 +1,171 @@
+from pydantic import BaseModel
+
+
+class PoolStatsSchema(BaseModel):
+    """Response schema class for usage of a connection pool."""
+
+    client: str
+    host: str
+    maxsize: int
+    num_requests: int
+    num_connections: int | None
+    idle_connections: int | None
+    in_flight: int | None
+    peak_in_flight: int | None
+    alive: bool
+    latency_ms: float | None
+    error_rate: float
+    errors: int
+
+
+class BatchStatsSchema(BaseModel):
+    """Response schema class for batches of `_msearch` requests."""
+
+    batches: int
+    searches: int
+    mean_batch_size: float
+    max_batch_size: int
+    mean_wait_ms: float
+    max_wait_ms: float
+
+
+class SingleFlightStatsSchema(BaseModel):
+    """Response schema class for deduplication of in-flight searches."""
+
+    calls: int
+    deduplicated: int
+
+
+class FastPathStatsSchema(BaseModel):
+    """Response schema class for lookups by National Pokédex Number."""
+
+    mget: int
+    search: int
+    stale: int
+
+
+class BreakerStatsSchema(BaseModel):
+    """Response schema class for the circuit breaker of elasticsearch."""
+
+    state: str
+    trips: int
+    rejected: int
+    failures: int
+    slow_calls: int
+    consecutive_failures: int
+
+
+class HedgeStatsSchema(BaseModel):
+    """Response schema class for hedged requests to elasticsearch."""
+
+    requests: int
+    fired: int
+    won: int
+    denied: int
+    delay_ms: float | None
+
+
+class CacheStatsSchema(BaseModel):
+    """Response schema class for the in-process cache of responses."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    size: int
+
+
+class RedisCacheStatsSchema(BaseModel):
+    """Response schema class for the cache shared by workers."""
+
+    hits: int
+    misses: int
+    writes: int
+    errors: int
+    round_trips: int
+
+
+class GenerationStatsSchema(BaseModel):
+    """Response schema class for the generation of the index."""
+
+    generation: str | None
+    checks: int
+    changes: int
+    errors: int
+
+
+class WarmupStatsSchema(BaseModel):
+    """Response schema class for the warm-up on startup."""
+
+    completed: bool
+    connections: int
+    documents: int
+    queries: int
+    failures: int
+    pool_seconds: float
+    preload_seconds: float
+    validation_seconds: float
+    queries_seconds: float
+    seconds: float
+
+
+class MembershipStatsSchema(BaseModel):
+    """Response schema class for the lookups answered
+    without elasticsearch."""
+
+    generation: str | None
+    pokedex_numbers: int
+    names: int
+    rebuilds: int
+    filtered: int
+    negative_hits: int
+    saved: int
+
+
+class PrerenderStatsSchema(BaseModel):
+    """Response schema class for the responses rendered in advance."""
+
+    generation: str | None
+    entries: int
+    renders: int
+    hits: int
+    misses: int
+
+
+class QueryPlanStatsSchema(BaseModel):
+    """Response schema class for the compiled query plans."""
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class ExpressionStatsSchema(BaseModel):
+    """Response schema class for the parsed filter expressions."""
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class MemoryStatsSchema(BaseModel):
+    """Response schema class for the in-memory backend."""
+
+    documents: int
+    loads: int
+    searches: int
+    mgets: int
+
+
+class BitmapStatsSchema(BaseModel):
+    """Response schema class for the pages answered from bitsets."""
+
+    generation: str | None
+    documents: int
+    bitsets: int
+    rebuilds: int
+    hits: int
+    fallbacks: int
@@ -1,19 +1,28 @@
-from typing import Any, Generator
-
-from elasticsearch import Elasticsearch
+from typing import Any, Generator, Iterable
 
 from pokeapi.schemas.pokemon_schema import PokemonSchema
 
-from . import config
+from . import breaker, cache, client, config, generation, singleflight
 
 
 def search_pokemon(
-    query: dict[str, dict[str, dict[str, list[Any]]]]
+    query: dict[str, dict[str, dict[str, list[Any]]]],
+    deadline: float | None = None,
+    ttl: float = 0.0,
 ) -> Generator[dict, None, None]:
-    """Method to connect to elasticsearch and search for Pokémon.
+    """Method to search for Pokémon with the process-wide client.
+
+    Concurrent searches with the same query share one request
+    unless `ES_SINGLEFLIGHT_ENABLED` is disabled. Searches fail fast
+    with `CircuitOpenError` while the circuit breaker is open.
 
     Args:
         query (dict): Query to search for Pokémon.
+        deadline (float | None): Seconds to wait for elasticsearch.
+        `ES_TIMEOUT` is used when it is None.
+        ttl (float): Seconds to cache the response for,
+        or 0 not to cache it. The response is cached under the last
+        known generation of the index.
 
     Yields:
         dict[str, Any]: Dict with Pokémon information.
@@ -21,22 +30,47 @@ def search_pokemon(
     """
 
     conf = config.get_config()
-    with Elasticsearch(
-        conf.ES_CONNECTION_URL, http_compress=True, timeout=10
-    ) as es:
-        response = es.search(index=conf.ES_INDEX, body=query)
+    es = client.get_client()
+
+    def search() -> Any:
+        def request() -> Any:
+            return es.search(
+                index=conf.ES_INDEX,
+                body=query,
+                request_timeout=deadline or conf.ES_TIMEOUT,
+            )
+
+        if conf.ES_BREAKER_ENABLED:
+            return breaker.get_breaker().call(request)
+
+        return request()
+
+    key = singleflight.canonical_key(query)
+
+    def load() -> Any:
+        if conf.ES_SINGLEFLIGHT_ENABLED:
+            return singleflight.sync_singleflight.do(key, search)
+
+        return search()
+
+    if ttl > 0:
+        response = cache.get_cache().get_or_load(
+            generation.get_key_prefix() + "search:" + key, ttl, load
+        )
+    else:
+        response = load()
 
     for doc in response["hits"]["hits"]:
         yield doc["_source"]
 
 
 def create_pokemon_response(
-    es_response: Generator[dict, None, None]
+    es_response: Iterable[dict],
 ) -> list[PokemonSchema]:
     """Method to create a response to Pokémon schema.
 
     Args:
-        es_response (Generator): Generator of Pokémon data
+        es_response (Iterable): Iterable of Pokémon data
         read from elasticsearch.
 
     Returns:
@@ -0,0 +1,707 @@
+import asyncio
+import functools
+import hashlib
+import json
+import uuid
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, TypeVar, cast
+
+from elasticsearch import ConnectionTimeout
+
+from . import (
+    batch,
+    bitmap,
+    breaker,
+    cache,
+    client,
+    config,
+    docmap,
+    generation,
+    hedge,
+    membership,
+    nodes,
+    raw,
+    redis_cache,
+    singleflight,
+)
+from .param import CreatePageParam
+from .query import (
+    CreateBatchLookupQuery,
+    CreatePaginatedQuery,
+    CreatePokedexNumberQuery,
+    CreatePokemonNameQuery,
+    create_paginated_key,
+)
+
+T = TypeVar("T")
+
+
+@dataclass
+class PokemonPage:
+    """Dataclass with a page of Pokémon found by a search."""
+
+    docs: list[dict]
+    last_sort: list[Any] | None
+    total: int | None
+
+
+@dataclass
+class RawPokemonPage:
+    """Dataclass with a page of Pokémon found by a search
+    as the JSON array sent by elasticsearch."""
+
+    content: bytes
+    count: int
+    last_sort: list[Any] | None
+    total: int | None
+
+
+async def search_pokemon(
+    query: dict[str, dict[str, dict[str, list[Any]]]],
+    deadline: float | None = None,
+    ttl: float = 0.0,
+) -> list[dict]:
+    """Method to search for Pokémon with the async client
+        without blocking the event loop.
+
+    Concurrent searches with the same query share one request
+    unless `ES_SINGLEFLIGHT_ENABLED` is disabled. When `ES_BATCH_ENABLED`
+    is set, the search is sent together with other concurrent searches
+    in one `_msearch` request.
+
+    Args:
+        query (dict): Query to search for Pokémon.
+        deadline (float | None): Seconds to wait for elasticsearch.
+        `ES_TIMEOUT` is used when it is None.
+        ttl (float): Seconds to cache the response for,
+        or 0 not to cache it.
+
+    Returns:
+        list[dict[str, Any]]: List with Pokémon information.
+
+    """
+
+    response = await _search_shared(query, None, deadline, ttl=ttl)
+
+    return [doc["_source"] for doc in response["hits"]["hits"]]
+
+
+async def search_pokemon_page(
+    query: dict[str, Any],
+    cache: bool = False,
+    deadline: float | None = None,
+    ttl: float = 0.0,
+    query_key: str | None = None,
+) -> PokemonPage:
+    """Method to search for a page of Pokémon.
+
+    The page is answered from the bitsets of `bitmap` without
+    elasticsearch when they have been built and support the query.
+
+    Args:
+        query (dict): Query created by `CreatePaginatedQuery`.
+        cache (bool): Whether to use the shard request cache
+        of elasticsearch for the page.
+        deadline (float | None): Seconds to wait for elasticsearch.
+        `ES_TIMEOUT` is used when it is None.
+        ttl (float): Seconds to cache the response for,
+        or 0 not to cache it.
+        query_key (str | None): Canonical key of the query before
+        pagination if known, such as the one of a `QueryPlan`.
+
+    Returns:
+        PokemonPage: Pokémon information with the sort values of the last hit
+        and the number of all hits if `track_total_hits` is set.
+
+    """
+
+    bitmap_page = bitmap.search_page(query)
+    if bitmap_page is not None:
+        return PokemonPage(*bitmap_page)
+
+    params = _cache_params(query, query_key) if cache else None
+    response = await _search_shared(
+        query, params, deadline, ttl=ttl, query_key=query_key
+    )
+    hits = response["hits"]["hits"]
+    total = response["hits"].get("total")
+
+    return PokemonPage(
+        docs=[hit["_source"] for hit in hits],
+        last_sort=hits[-1]["sort"] if hits else None,
+        total=total["value"] if total is not None else None,
+    )
+
+
+async def search_pokemon_raw(
+    query: dict[str, Any],
+    cache: bool = False,
+    deadline: float | None = None,
+    ttl: float = 0.0,
+    query_key: str | None = None,
+) -> RawPokemonPage:
+    """Method to search for Pokémon without decoding their information.
+
+    Only the parts of the response named by `raw.FILTER_PATH` are
+    requested, and the `_source` of the hits are passed on as the bytes
+    sent by elasticsearch. The search is not batched with others.
+    A page answered from the bitsets of `bitmap` is encoded instead.
+
+    Args:
+        query (dict): Query to search for Pokémon.
+        cache (bool): Whether to use the shard request cache
+        of elasticsearch for the search.
+        deadline (float | None): Seconds to wait for elasticsearch.
+        `ES_TIMEOUT` is used when it is None.
+        ttl (float): Seconds to cache the response for,
+        or 0 not to cache it.
+        query_key (str | None): Canonical key of the query before
+        pagination if known, such as the one of a `QueryPlan`.
+
+    Returns:
+        RawPokemonPage: Pokémon information as a JSON array with
+        the number of hits, the sort values of the last hit and
+        the number of all hits if `track_total_hits` is set.
+
+    """
+
+    bitmap_page = bitmap.search_page(query)
+    if bitmap_page is not None:
+        docs = [json.dumps(doc, ensure_ascii=False) for doc in bitmap_page[0]]
+        return RawPokemonPage(
+            content=raw.to_json_array(docs),
+            count=len(docs),
+            last_sort=bitmap_page[1],
+            total=bitmap_page[2],
+        )
+
+    params = _cache_params(query, query_key) if cache else None
+    text = await _search_shared(query, params, deadline, True, ttl, query_key)
+    sources, response = raw.split_sources(text)
+    hits = response.get("hits", {})
+    total = hits.get("total")
+    last_sort = hits["hits"][-1].get("sort") if sources else None
+
+    return RawPokemonPage(
+        content=raw.to_json_array(sources),
+        count=len(sources),
+        last_sort=last_sort,
+        total=total["value"] if total is not None else None,
+    )
+
+
+async def search_pokemon_by_pokedex_number(
+    pokedex_number: int, deadline: float | None = None, ttl: float = 0.0
+) -> list[dict]:
+    """Method to look up Pokémon by National Pokédex Number.
+
+    Once a number has been searched, the `_id` of its documents are
+    fetched with a realtime `_mget`, which skips the query phase
+    of a search. The lookup falls back to a search when the number
+    has not been searched yet or its documents have changed.
+    Numbers that `membership` knows to be missing are not looked up.
+
+    Args:
+        pokedex_number (int): Target of `national_pokedex_number`.
+        deadline (float | None): Seconds to wait for elasticsearch.
+        `ES_TIMEOUT` is used when it is None.
+        ttl (float): Seconds to cache the response for,
+        or 0 not to cache it.
+
+    Returns:
+        list[dict[str, Any]]: List with Pokémon information.
+
+    """
+
+    if membership.is_missing(membership.POKEDEX_NUMBER, pokedex_number):
+        return []
+
+    if ttl > 0:
+        docs = await _cached(
+            f"pokedex_number:{pokedex_number}",
+            ttl,
+            lambda: _lookup_pokedex_number(pokedex_number, deadline),
+        )
+    else:
+        docs = await _lookup_pokedex_number(pokedex_number, deadline)
+
+    if not docs:
+        membership.record_missing(membership.POKEDEX_NUMBER, pokedex_number)
+
+    return docs
+
+
+async def _lookup_pokedex_number(
+    pokedex_number: int, deadline: float | None
+) -> list[dict]:
+    conf = config.get_config()
+    ids = docmap.pokedex_ids.get(pokedex_number)
+
+    if conf.ES_GET_FAST_PATH and ids is not None:
+        es = client.get_async_client()
+        response = await _guarded(
+            functools.partial(
+                es.mget,
+                index=conf.ES_INDEX,
+                body={"ids": list(ids)},
+                realtime=True,
+                request_timeout=deadline or conf.ES_TIMEOUT,
+            )
+        )
+        docs = response["docs"]
+        if all(
+            doc.get("found")
+            and doc["_source"]["national_pokedex_number"] == pokedex_number
+            for doc in docs
+        ):
+            docmap.stats.mget += 1
+            return [doc["_source"] for doc in docs]
+
+        docmap.stats.stale += 1
+        docmap.pokedex_ids.discard(pokedex_number)
+
+    docmap.stats.search += 1
+    query = CreatePokedexNumberQuery().create_query(pokedex_number)
+    hits = (await _search_shared(query, None, deadline))["hits"]["hits"]
+    if hits:
+        docmap.pokedex_ids.learn(
+            pokedex_number, tuple(hit["_id"] for hit in hits)
+        )
+
+    return [hit["_source"] for hit in hits]
+
+
+async def lookup_pokemon(
+    pokedex_numbers: tuple[int, ...],
+    names: tuple[str, ...],
+    deadline: float | None = None,
+    ttl: float = 0.0,
+) -> tuple[dict[int, list[dict]], dict[str, list[dict]]]:
+    """Method to look up Pokémon by some National Pokédex Numbers
+        and names in one request.
+
+    When `ttl` is set, each number and name is cached on its own,
+    and only the targets missing from the caches are searched for.
+    The caches are read and written in one round trip each.
+    Targets that `membership` knows to be missing are not searched for.
+
+    Args:
+        pokedex_numbers (tuple[int, ...]): Targets of
+        `national_pokédex_number`.
+        names (tuple[str, ...]): Targets of `name`.
+        deadline (float | None): Seconds to wait for elasticsearch.
+        `ES_TIMEOUT` is used when it is None.
+        ttl (float): Seconds to cache the Pokémon of each target for,
+        or 0 not to cache them.
+
+    Returns:
+        tuple[dict[int, list[dict]], dict[str, list[dict]]]:
+        Pokémon information grouped by National Pokédex Number and by name.
+        Numbers and names without Pokémon are not included.
+
+    """
+
+    by_pokedex_number: dict[int, list[dict]] = {}
+    by_name: dict[str, list[dict]] = {}
+    if not pokedex_numbers and not names:
+        return by_pokedex_number, by_name
+
+    wanted_pokedex_numbers = {
+        n
+        for n in pokedex_numbers
+        if not membership.is_missing(membership.POKEDEX_NUMBER, n)
+    }
+    wanted_names = {
+        name
+        for name in names
+        if not membership.is_missing(membership.NAME_KEYWORD, name)
+    }
+    if not wanted_pokedex_numbers and not wanted_names:
+        return by_pokedex_number, by_name
+
+    if ttl > 0:
+        cached_numbers = sorted(wanted_pokedex_numbers)
+        cached_names = sorted(wanted_names)
+        values = await _get_many(
+            [f"pokedex_number:{n}" for n in cached_numbers]
+            + [f"name:{name}" for name in cached_names],
+            ttl,
+        )
+        for pokedex_number, docs in zip(cached_numbers, values):
+            if docs is not None:
+                by_pokedex_number[pokedex_number] = docs
+        offset = len(cached_numbers)
+        for name, docs in zip(cached_names, values[offset:]):
+            if docs is not None:
+                by_name[name] = docs
+
+        wanted_pokedex_numbers -= by_pokedex_number.keys()
+        wanted_names -= by_name.keys()
+        if not wanted_pokedex_numbers and not wanted_names:
+            return by_pokedex_number, by_name
+
+    query = CreateBatchLookupQuery().create_query(
+        (
+            tuple(n for n in pokedex_numbers if n in wanted_pokedex_numbers),
+            tuple(name for name in names if name in wanted_names),
+        )
+    )
+    found_numbers: dict[int, list[dict]] = {}
+    found_names: dict[str, list[dict]] = {}
+
+    for doc in await search_pokemon(query, deadline):
+        if doc["national_pokedex_number"] in wanted_pokedex_numbers:
+            found_numbers.setdefault(
+                doc["national_pokedex_number"], []
+            ).append(doc)
+        if doc["name"] in wanted_names:
+            found_names.setdefault(doc["name"], []).append(doc)
+
+    if ttl > 0:
+        await _put_many(
+            [
+                (f"pokedex_number:{n}", docs)
+                for n, docs in found_numbers.items()
+            ]
+            + [(f"name:{name}", docs) for name, docs in found_names.items()],
+            ttl,
+        )
+
+    for pokedex_number in wanted_pokedex_numbers - found_numbers.keys():
+        membership.record_missing(membership.POKEDEX_NUMBER, pokedex_number)
+    for name in wanted_names - found_names.keys():
+        membership.record_missing(membership.NAME_KEYWORD, name)
+
+    by_pokedex_number.update(found_numbers)
+    by_name.update(found_names)
+
+    return by_pokedex_number, by_name
+
+
+async def export_pokemon(
+    query: dict[str, Any], deadline: float | None = None
+) -> AsyncIterator[list[dict]]:
+    """Method to iterate over every Pokémon matching a query
+        with a point-in-time search.
+
+    Pages of `ES_EXPORT_PAGE_SIZE` hits are read with `search_after`
+    on a point in time, so the pages are consistent with each other
+    and only one page is held in memory.
+
+    Args:
+        query (dict): Query to search for Pokémon.
+        deadline (float | None): Seconds to wait for each request
+        to elasticsearch. `ES_TIMEOUT` is used when it is None.
+
+    Yields:
+        list[dict[str, Any]]: Page of Pokémon information.
+
+    """
+
+    conf = config.get_config()
+    timeout = deadline or conf.ES_TIMEOUT
+    es = client.get_async_client()
+    pit = await _guarded(
+        lambda: es.open_point_in_time(
+            index=conf.ES_INDEX,
+            keep_alive=conf.ES_PIT_KEEP_ALIVE,
+            request_timeout=timeout,
+        )
+    )
+    pit_id = pit["id"]
+    search_after = None
+
+    try:
+        while True:
+            page = CreatePageParam(conf.ES_EXPORT_PAGE_SIZE, search_after)
+            body = CreatePaginatedQuery().create_query((query, page))
+            body["pit"] = {"id": pit_id, "keep_alive": conf.ES_PIT_KEEP_ALIVE}
+
+            response = await _guarded(
+                functools.partial(
+                    es.search, body=body, request_timeout=timeout
+                )
+            )
+            pit_id = response.get("pit_id", pit_id)
+            hits = response["hits"]["hits"]
+            if hits:
+                yield [hit["_source"] for hit in hits]
+            if len(hits) < conf.ES_EXPORT_PAGE_SIZE:
+                break
+
+            search_after = hits[-1]["sort"]
+    finally:
+        await es.close_point_in_time(
+            body={"id": pit_id}, ignore=404, request_timeout=timeout
+        )
+
+
+async def preload_pokemon(deadline: float | None = None) -> list[dict]:
+    """Method to cache every Pokémon of the index for the lookups
+        by National Pokédex Number and by name.
+
+    The entries are the ones `search_pokemon_by_pokedex_number`,
+    `lookup_pokemon` and the search by `CreatePokemonNameQuery` read,
+    cached for the TTL of the "pokedex_number", "batch" and "name"
+    routes. The Pokémon of a number or a name are in the order of
+    National Pokédex Number and `_id`. Nothing is read when none
+    of them is cached, such as while `ES_CACHE_ENABLED` is disabled.
+
+    Args:
+        deadline (float | None): Seconds to wait for each request
+        to elasticsearch. `ES_TIMEOUT` is used when it is None.
+
+    Returns:
+        list[dict[str, Any]]: Every Pokémon read and cached,
+        or an empty list when nothing is cached.
+
+    """
+
+    conf = config.get_config()
+    pokedex_number_ttl = conf.get_cache_ttl("pokedex_number")
+    batch_ttl = conf.get_cache_ttl("batch")
+    name_ttl = conf.get_cache_ttl("name")
+    if max(pokedex_number_ttl, batch_ttl, name_ttl) <= 0:
+        return []
+
+    by_pokedex_number: dict[int, list[dict]] = {}
+    by_name: dict[str, list[dict]] = {}
+    pokemon: list[dict] = []
+
+    async for docs in export_pokemon({"query": {"match_all": {}}}, deadline):
+        for doc in docs:
+            by_pokedex_number.setdefault(
+                doc["national_pokedex_number"], []
+            ).append(doc)
+            by_name.setdefault(doc["name"], []).append(doc)
+        pokemon.extend(docs)
+
+    if max(pokedex_number_ttl, batch_ttl) > 0:
+        await _put_many(
+            [
+                (f"pokedex_number:{n}", docs)
+                for n, docs in by_pokedex_number.items()
+            ],
+            max(pokedex_number_ttl, batch_ttl),
+        )
+    if batch_ttl > 0:
+        await _put_many(
+            [(f"name:{name}", docs) for name, docs in by_name.items()],
+            batch_ttl,
+        )
+    if name_ttl > 0:
+        await _put_many(
+            [
+                (
+                    "search:"
+                    + _search_key(CreatePokemonNameQuery().create_query(name)),
+                    {"hits": {"hits": [{"_source": doc} for doc in docs]}},
+                )
+                for name, docs in by_name.items()
+            ],
+            name_ttl,
+        )
+
+    return pokemon
+
+
+def _cache_params(
+    query: dict[str, Any], query_key: str | None = None
+) -> dict[str, Any]:
+    """Method to create search parameters that use the shard request cache.
+
+    The preference is derived from the filters of the query, so every
+    page of the same query is routed to the same shard copies and finds
+    their caches warm.
+
+    Args:
+        query (dict): Query to search for Pokémon.
+        query_key (str | None): Canonical key of the query before
+        pagination if known, which is used instead of its filters.
+
+    Returns:
+        dict[str, Any]: Search parameters of the request. Empty when
+        `ES_REQUEST_CACHE` is disabled.
+
+    """
+
+    if not config.get_config().ES_REQUEST_CACHE:
+        return {}
+
+    key = query_key
+    if key is None:
+        key = singleflight.canonical_key(query.get("query", {}))
+    preference = hashlib.sha1(key.encode()).hexdigest()[:16]
+
+    return {"request_cache": True, "preference": preference}
+
+
+async def _search_shared(
+    query: dict[str, Any],
+    params: dict[str, Any] | None = None,
+    deadline: float | None = None,
+    is_raw: bool = False,
+    ttl: float = 0.0,
+    query_key: str | None = None,
+) -> Any:
+    conf = config.get_config()
+    key = _search_key(query, params, is_raw, query_key)
+
+    def load() -> Awaitable[Any]:
+        if conf.ES_SINGLEFLIGHT_ENABLED:
+            return singleflight.get_async_singleflight().do(
+                key, lambda: _search(query, params, deadline, is_raw)
+            )
+
+        return _search(query, params, deadline, is_raw)
+
+    if ttl > 0:
+        return await _cached("search:" + key, ttl, load)
+
+    return await load()
+
+
+def _search_key(
+    query: dict[str, Any],
+    params: dict[str, Any] | None = None,
+    is_raw: bool = False,
+    query_key: str | None = None,
+) -> str:
+    if query_key is not None:
+        key = create_paginated_key(query_key, query)
+    else:
+        key = singleflight.canonical_key(query)
+    if params:
+        key += singleflight.canonical_key(params)
+    if is_raw:
+        key += raw.FILTER_PATH
+
+    return key
+
+
+async def _search(
+    query: dict[str, Any],
+    params: dict[str, Any] | None = None,
+    deadline: float | None = None,
+    is_raw: bool = False,
+) -> Any:
+    conf = config.get_config()
+    timeout = deadline or conf.ES_TIMEOUT
+    if conf.ES_BATCH_ENABLED and not is_raw:
+        batcher = batch.get_batcher()
+        return await _guarded(
+            lambda: _wait_for(batcher.search(query, params), timeout)
+        )
+
+    es = client.get_async_client()
+    primary = nodes.NodeHint()
+
+    def attempt(hedged: bool) -> Awaitable[Any]:
+        attempt_params = dict(params or {})
+        hint = primary
+        if is_raw:
+            attempt_params["filter_path"] = raw.FILTER_PATH
+            attempt_params["headers"] = {raw.RAW_HEADER: "1"}
+        if hedged:
+            # Another preference makes elasticsearch pick another copy
+            # of the shards, and the hint another node than the slow one.
+            attempt_params["preference"] = uuid.uuid4().hex[:16]
+            hint = nodes.NodeHint(avoid=primary.picked)
+
+        return nodes.with_hint(
+            hint,
+            es.search(
+                index=conf.ES_INDEX,
+                body=query,
+                request_timeout=timeout,
+                **attempt_params,
+            ),
+        )
+
+    if conf.ES_HEDGE_ENABLED:
+        return await _guarded(lambda: hedge.get_hedger().run(attempt))
+
+    return await _guarded(lambda: attempt(False))
+
+
+async def _cached(key: str, ttl: float, load: Callable[[], Awaitable[T]]) -> T:
+    value = (await _get_many([key], ttl))[0]
+    if value is not None:
+        return cast(T, value)
+
+    loaded = await load()
+    await _put_many([(key, loaded)], ttl)
+
+    return loaded
+
+
+async def _get_many(keys: list[str], ttl: float) -> list[Any | None]:
+    """Method to get cached values from the cache of the process,
+        and the missing ones from the cache shared by workers.
+
+    Keys are prefixed with the generation of the index, so that values
+    cached before elasticsearch was reloaded are not read. Values found
+    in the shared cache are kept in the cache of the process for at most
+    `ES_CACHE_L1_TTL` seconds.
+
+    Args:
+        keys (list[str]): Keys of the values.
+        ttl (float): Seconds the values are cached for.
+
+    Returns:
+        list[Any | None]: Value of each key, or None if it is missing.
+
+    """
+
+    prefix = generation.get_key_prefix()
+    keys = [prefix + key for key in keys]
+    response_cache = cache.get_cache()
+    values = [response_cache.get(key) for key in keys]
+    shared_cache = redis_cache.get_redis_cache()
+    missing = [i for i, value in enumerate(values) if value is None]
+
+    if shared_cache is not None and missing:
+        l1_ttl = min(ttl, config.get_config().ES_CACHE_L1_TTL)
+        found = await shared_cache.get_many([keys[i] for i in missing])
+        for i, value in zip(missing, found):
+            if value is not None:
+                values[i] = value
+                response_cache.put(keys[i], value, l1_ttl)
+
+    return values
+
+
+async def _put_many(items: list[tuple[str, Any]], ttl: float) -> None:
+    """Method to cache values in the cache of the process
+        and in the cache shared by workers.
+
+    Args:
+        items (list[tuple[str, Any]]): Key and value of each item.
+        ttl (float): Seconds to cache the values for.
+    """
+
+    prefix = generation.get_key_prefix()
+    items = [(prefix + key, value) for key, value in items]
+    response_cache = cache.get_cache()
+    shared_cache = redis_cache.get_redis_cache()
+    l1_ttl = ttl
+    if shared_cache is not None:
+        l1_ttl = min(ttl, config.get_config().ES_CACHE_L1_TTL)
+        await shared_cache.put_many(items, ttl)
+
+    for key, value in items:
+        response_cache.put(key, value, l1_ttl)
+
+
+async def _guarded(fn: Callable[[], Awaitable[T]]) -> T:
+    if not config.get_config().ES_BREAKER_ENABLED:
+        return await fn()
+
+    return await breaker.get_breaker().call_async(fn)
+
+
+async def _wait_for(awaitable: Awaitable[T], timeout: float) -> T:
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError as e:
+        raise ConnectionTimeout("TIMEOUT", str(e), e) from e
@@ -0,0 +1,99 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from elasticsearch import AsyncElasticsearch, Elasticsearch
+
+ELASTICSEARCH = "elasticsearch"
+MEMORY = "memory"
+
+
+class SearchBackend(ABC):
+    """Abstract class for the backend the accessors search with.
+
+    The methods take the keyword arguments of the same methods
+    of `Elasticsearch`, which is registered as an implementation,
+    and return responses in the same format.
+    """
+
+    # Namespace with `stats` and `analyze` of the indices API.
+    indices: Any
+
+    @abstractmethod
+    def search(self, *, body: Any = None, **kwargs: Any) -> Any:
+        """Method to search an index."""
+
+    @abstractmethod
+    def msearch(self, *, body: Any, **kwargs: Any) -> Any:
+        """Method to run some searches in one request."""
+
+    @abstractmethod
+    def mget(self, *, body: Any, **kwargs: Any) -> Any:
+        """Method to get documents by `_id`."""
+
+    @abstractmethod
+    def open_point_in_time(self, **kwargs: Any) -> Any:
+        """Method to open a point in time of an index."""
+
+    @abstractmethod
+    def close_point_in_time(self, *, body: Any, **kwargs: Any) -> Any:
+        """Method to close a point in time."""
+
+    @abstractmethod
+    def ping(self, **kwargs: Any) -> bool:
+        """Method to check whether the backend is available."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Method to release the resources of the backend."""
+
+
+class AsyncSearchBackend(ABC):
+    """Abstract class for the backend the async accessors search with.
+
+    The methods take the keyword arguments of the same methods
+    of `AsyncElasticsearch`, which is registered as an implementation,
+    and return responses in the same format.
+    """
+
+    # Namespace with `stats` and `analyze` of the indices API.
+    indices: Any
+
+    @abstractmethod
+    async def search(self, *, body: Any = None, **kwargs: Any) -> Any:
+        """Method to search an index."""
+
+    @abstractmethod
+    async def msearch(self, *, body: Any, **kwargs: Any) -> Any:
+        """Method to run some searches in one request."""
+
+    @abstractmethod
+    async def mget(self, *, body: Any, **kwargs: Any) -> Any:
+        """Method to get documents by `_id`."""
+
+    @abstractmethod
+    async def open_point_in_time(self, **kwargs: Any) -> Any:
+        """Method to open a point in time of an index."""
+
+    @abstractmethod
+    async def close_point_in_time(self, *, body: Any, **kwargs: Any) -> Any:
+        """Method to close a point in time."""
+
+    @abstractmethod
+    async def ping(self, **kwargs: Any) -> bool:
+        """Method to check whether the backend is available."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Method to release the resources of the backend."""
+
+    @abstractmethod
+    async def __aenter__(self) -> "AsyncSearchBackend":
+        """Method to open the resources of the backend."""
+
+    @abstractmethod
+    async def __aexit__(self, *args: Any) -> None:
+        """Method to release the resources of the backend."""
+
+
+SearchBackend.register(Elasticsearch)
+AsyncSearchBackend.register(AsyncElasticsearch)
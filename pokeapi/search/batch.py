@@ -0,0 +1,192 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from elasticsearch import TransportError
+
+from . import client, config
+
+
+@dataclass
+class BatchStats:
+    """Dataclass with counters of the batches sent by `SearchBatcher`."""
+
+    batches: int = 0
+    searches: int = 0
+    max_batch_size: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    def record(self, size: int, wait: float) -> None:
+        """Method to record a batch that has been sent.
+
+        Args:
+            size (int): Number of searches in the batch.
+            wait (float): Seconds the oldest search waited for the batch.
+        """
+
+        self.batches += 1
+        self.searches += size
+        self.max_batch_size = max(self.max_batch_size, size)
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Method to convert the counters to a dict.
+
+        Returns:
+            dict[str, Any]: Counters with the mean size and wait of batches.
+        """
+
+        return {
+            "batches": self.batches,
+            "searches": self.searches,
+            "mean_batch_size": (
+                self.searches / self.batches if self.batches else 0.0
+            ),
+            "max_batch_size": self.max_batch_size,
+            "mean_wait_ms": (
+                self.total_wait / self.batches * 1000 if self.batches else 0.0
+            ),
+            "max_wait_ms": self.max_wait * 1000,
+        }
+
+
+@dataclass
+class _PendingSearch:
+    query: dict[str, Any]
+    future: asyncio.Future[dict[str, Any]]
+    params: dict[str, Any] = field(default_factory=dict)
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class SearchBatcher:
+    """Class that coalesces concurrent searches into one `_msearch` request.
+
+    Searches arriving within `window` seconds of the first pending search
+    are sent together, or as soon as `max_size` searches are pending.
+
+    Args:
+        window (float): Seconds to wait for more searches before sending.
+        max_size (int): Maximum number of searches in one batch.
+    """
+
+    def __init__(self, window: float, max_size: int) -> None:
+        self.window = window
+        self.max_size = max_size
+        self.stats = BatchStats()
+        self._pending: list[_PendingSearch] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def search(
+        self, query: dict[str, Any], params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Method to search for Pokémon as a part of the next batch.
+
+        Args:
+            query (dict): Query to search for Pokémon.
+            params (dict | None): Search parameters of the request,
+            such as `request_cache` and `preference`.
+
+        Returns:
+            dict[str, Any]: Response of elasticsearch for `query`.
+
+        """
+
+        loop = asyncio.get_running_loop()
+        pending = _PendingSearch(query, loop.create_future(), params or {})
+        self._pending.append(pending)
+
+        if len(self._pending) >= self.max_size:
+            self._send()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._send)
+
+        return await pending.future
+
+    def _send(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._msearch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _msearch(self, batch: list[_PendingSearch]) -> None:
+        self.stats.record(len(batch), time.monotonic() - batch[0].enqueued_at)
+
+        conf = config.get_config()
+        body: list[dict[str, Any]] = []
+        for pending in batch:
+            body.append({"index": conf.ES_INDEX, **pending.params})
+            body.append(pending.query)
+
+        try:
+            response = await client.get_async_client().msearch(body=body)
+        except Exception as e:
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+            return
+
+        for pending, result in zip(batch, response["responses"]):
+            if pending.future.done():
+                continue
+
+            if "error" in result:
+                pending.future.set_exception(
+                    TransportError(
+                        result.get("status", "N/A"),
+                        result["error"].get("type", "msearch_error"),
+                        result["error"],
+                    )
+                )
+            else:
+                pending.future.set_result(result)
+
+
+_batcher: SearchBatcher | None = None
+_batcher_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_batcher() -> SearchBatcher:
+    """Method to get the batcher of searches for the running event loop.
+
+    Returns:
+        SearchBatcher: Batcher configured by `ES_BATCH_WINDOW_MS`
+        and `ES_BATCH_MAX_SIZE`.
+
+    """
+
+    global _batcher, _batcher_loop
+
+    loop = asyncio.get_running_loop()
+    if _batcher is None or _batcher_loop is not loop:
+        conf = config.get_config()
+        _batcher = SearchBatcher(
+            conf.ES_BATCH_WINDOW_MS / 1000, conf.ES_BATCH_MAX_SIZE
+        )
+        _batcher_loop = loop
+
+    return _batcher
+
+
+def get_batch_stats() -> dict[str, Any]:
+    """Method to get counters of the batches sent so far.
+
+    Returns:
+        dict[str, Any]: Counters of the batches.
+
+    """
+
+    if _batcher is None:
+        return BatchStats().to_dict()
+
+    return _batcher.stats.to_dict()
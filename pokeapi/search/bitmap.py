@@ -0,0 +1,220 @@
+import asyncio
+import bisect
+import itertools
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from elasticsearch import TransportError
+
+from . import client, config
+from .bitset import BitmapIndex, UnsupportedQueryError
+from .param import CreatePageParam
+
+# Upper bound of the documents read to build the index,
+# which is `index.max_result_window` by default.
+MAX_DOCS = 10000
+# Sort of the pages of `CreatePaginatedQuery`, the order of the bits
+# of `PageIndex`.
+PAGE_SORT = CreatePageParam(1).create_param()["sort"]
+# Keys of the pages of `CreatePaginatedQuery` besides `query`.
+_PAGE_KEYS = {"size", "sort", "search_after", "track_total_hits"}
+
+
+@dataclass
+class BitmapStats:
+    """Dataclass with counters of the pages answered from bitsets."""
+
+    generation: str | None = None
+    documents: int = 0
+    bitsets: int = 0
+    rebuilds: int = 0
+    hits: int = 0
+    fallbacks: int = 0
+
+
+stats = BitmapStats()
+_index: "PageIndex | None" = None
+_rebuild: "asyncio.Task[None] | None" = None
+
+
+class PageIndex(BitmapIndex):
+    """Index of bitsets whose bits are in the order of the pages
+        of `CreatePaginatedQuery`.
+
+    A page is the first bits set after the sort values of its
+    `search_after`, so it is answered without sorting.
+
+    Args:
+        docs (list[tuple[str, dict[str, Any]]]): `_id` and `_source`
+        of each document, in any order.
+    """
+
+    def __init__(self, docs: list[tuple[str, dict[str, Any]]]) -> None:
+        docs = sorted(
+            docs, key=lambda doc: (doc[1]["national_pokedex_number"], doc[0])
+        )
+        super().__init__(docs)
+        self.sort_keys = [
+            (source["national_pokedex_number"], doc_id)
+            for doc_id, source in docs
+        ]
+
+    def page(
+        self, bits: int, size: int, search_after: list[Any] | None = None
+    ) -> list[int]:
+        """Method to get the positions of the documents of a page.
+
+        Args:
+            bits (int): Bitset of the matching documents.
+            size (int): Number of documents of the page.
+            search_after (list[Any] | None): Sort values of the last
+            document of the previous page.
+
+        Returns:
+            list[int]: Positions of the documents of the page.
+
+        """
+
+        start = 0
+        if search_after is not None:
+            after = (int(search_after[0]), str(search_after[1]))
+            start = bisect.bisect_right(self.sort_keys, after)
+
+        return list(itertools.islice(self.positions(bits, start), size))
+
+
+def search_page(
+    query: dict[str, Any]
+) -> tuple[list[dict[str, Any]], list[Any] | None, int | None] | None:
+    """Method to answer a page of a search from the bitsets
+        of the current generation of the index.
+
+    Args:
+        query (dict[str, Any]): Query created by `CreatePaginatedQuery`.
+
+    Returns:
+        tuple[list[dict[str, Any]], list[Any] | None, int | None] | None:
+        Pokémon information with the sort values of the last hit and
+        the number of all hits if `track_total_hits` is set, or None
+        when the page is to be searched in elasticsearch.
+
+    """
+
+    index = _index
+    if (
+        index is None
+        or query.get("sort") != PAGE_SORT
+        or not set(query) - {"query"} <= _PAGE_KEYS
+    ):
+        return None
+
+    try:
+        bits = index.evaluate(query.get("query", {"match_all": {}}))
+    except UnsupportedQueryError:
+        stats.fallbacks += 1
+        return None
+
+    positions = index.page(bits, query["size"], query.get("search_after"))
+    stats.hits += 1
+
+    return (
+        [index.sources[position] for position in positions],
+        list(index.sort_keys[positions[-1]]) if positions else None,
+        index.count(bits) if query.get("track_total_hits") else None,
+    )
+
+
+async def build_index() -> PageIndex | None:
+    """Method to read every document of the index into bitsets.
+
+    Returns:
+        PageIndex | None: Bitsets of the index, or None when the index
+        has more documents than one search returns.
+
+    """
+
+    conf = config.get_config()
+    response = await client.get_async_client().search(
+        index=conf.ES_INDEX,
+        body={
+            "query": {"match_all": {}},
+            "size": MAX_DOCS,
+            "sort": PAGE_SORT,
+            "track_total_hits": True,
+        },
+        request_timeout=conf.ES_TIMEOUT,
+    )
+
+    hits = response["hits"]["hits"]
+    if response["hits"]["total"]["value"] > len(hits):
+        return None
+
+    return PageIndex([(hit["_id"], hit["_source"]) for hit in hits])
+
+
+async def rebuild(index_generation: str) -> None:
+    """Method to replace the bitsets with those of a generation.
+
+    The bitsets are built aside and replace the previous ones at once,
+    only if the generation is still the current one when they have
+    been read.
+
+    Args:
+        index_generation (str): Generation of the index.
+    """
+
+    global _index
+
+    try:
+        index = await build_index()
+    except TransportError:
+        return
+
+    if index is None or stats.generation != index_generation:
+        return
+
+    _index = index
+    stats.documents = len(index)
+    stats.bitsets = index.count_bitsets()
+    stats.rebuilds += 1
+
+
+def on_generation(index_generation: str) -> None:
+    """Method to drop the bitsets of the previous generation,
+        and to build those of a new one in the background.
+
+    Args:
+        index_generation (str): New generation of the index.
+    """
+
+    global _index, _rebuild
+
+    _index = None
+    stats.generation = index_generation
+    stats.documents = stats.bitsets = 0
+
+    if config.get_config().ES_BITMAP_ENABLED:
+        _rebuild = asyncio.create_task(rebuild(index_generation))
+
+
+def reset_bitmap() -> None:
+    """Method to drop the bitsets."""
+
+    global _index
+
+    _index = None
+    stats.generation = None
+    stats.documents = stats.bitsets = 0
+
+
+def get_bitmap_stats() -> dict[str, Any]:
+    """Method to get counters of the pages answered from bitsets.
+
+    Returns:
+        dict[str, Any]: Generation and numbers of documents and bitsets
+        of the index, and numbers of rebuilds, of pages answered
+        and of queries left to elasticsearch.
+
+    """
+
+    return asdict(stats)
@@ -0,0 +1,322 @@
+from typing import Any, Callable, Iterator
+
+from .columns import RANGE_OPERATORS, ColumnStore
+
+# Longest string indexed by the keyword subfields of the mapping,
+# which is their `ignore_above`.
+IGNORE_ABOVE = 256
+
+
+class UnsupportedQueryError(ValueError):
+    """Error raised for a query clause that a `BitmapIndex`
+    cannot evaluate."""
+
+
+def flatten(
+    source: dict[str, Any], prefix: str = ""
+) -> Iterator[tuple[str, Any]]:
+    """Method to list the values of a document by their dotted paths.
+
+    Args:
+        source (dict[str, Any]): `_source` of a document.
+        prefix (str): Path of `source` inside the document.
+
+    Yields:
+        tuple[str, Any]: Path and value of each field that is not an object.
+
+    """
+
+    for key, value in source.items():
+        if isinstance(value, dict):
+            yield from flatten(value, f"{prefix}{key}.")
+        else:
+            yield f"{prefix}{key}", value
+
+
+def _clauses(value: Any) -> list[Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _minimum_should_match(value: Any, count: int, default: int) -> int:
+    if value is None:
+        return default
+
+    text = str(value)
+    if text.endswith("%"):
+        number = int(count * int(text[:-1]) / 100)
+    else:
+        number = int(text)
+    if number < 0:
+        number += count
+
+    return max(0, min(number, count))
+
+
+class BitmapIndex:
+    """Class keeping one bitset for each value of each field
+        of some documents.
+
+    Bit i of a bitset is set when the i-th document has the value, and
+    query clauses are evaluated with AND, OR and AND NOT of the bitsets.
+    The bitsets are ints, which take one bit per document up to the
+    last one set. String fields are indexed in their keyword subfield,
+    as `pokemon_mapping.json` maps them, and in the text field when
+    an analyzer is given. Other fields are indexed with their values,
+    and numeric fields are also kept in a `ColumnStore` for ranges.
+
+    Args:
+        docs (list[tuple[str, dict[str, Any]]]): `_id` and `_source`
+        of each document, in the order of the bits.
+        analyzer (Callable[[str], list[str]] | None): Function splitting
+        text into the tokens of text fields, or None to leave queries
+        on text fields unsupported.
+    """
+
+    def __init__(
+        self,
+        docs: list[tuple[str, dict[str, Any]]],
+        analyzer: Callable[[str], list[str]] | None = None,
+    ) -> None:
+        self.ids = [doc_id for doc_id, _ in docs]
+        self.sources = [source for _, source in docs]
+        self.values = [dict(flatten(source)) for source in self.sources]
+        self.all = (1 << len(docs)) - 1
+        self.text_fields: set[str] = set()
+        self.analyzer = analyzer
+
+        bitsets: dict[str, dict[Any, int]] = {"_id": {}}
+        for position, (doc_id, values) in enumerate(
+            zip(self.ids, self.values)
+        ):
+            bit = 1 << position
+            bitsets["_id"][doc_id] = bitsets["_id"].get(doc_id, 0) | bit
+            for path, value in values.items():
+                if value is None:
+                    continue
+
+                indexed: list[tuple[str, Any]] = [(path, value)]
+                if isinstance(value, str):
+                    self.text_fields.add(path)
+                    tokens = analyzer(value) if analyzer is not None else []
+                    indexed = [(path, token) for token in tokens]
+                    if len(value) <= IGNORE_ABOVE:
+                        indexed.append((f"{path}.keyword", value))
+
+                for field, term in indexed:
+                    field_bitsets = bitsets.setdefault(field, {})
+                    field_bitsets[term] = field_bitsets.get(term, 0) | bit
+
+        self.bitsets = bitsets
+        self.columns = ColumnStore(self.values)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def count_bitsets(self) -> int:
+        """Method to count the bitsets of the index.
+
+        Returns:
+            int: Number of pairs of a field and a value.
+
+        """
+
+        return sum(len(values) for values in self.bitsets.values())
+
+    def lookup(self, field: str, value: Any) -> int:
+        """Method to get the bitset of a value of a field.
+
+        Args:
+            field (str): Path of the field, such as "form.keyword".
+            value (Any): Value of a keyword or other field,
+            or token of a text field.
+
+        Raises:
+            UnsupportedQueryError: If the value is an object or an array,
+            or the field is a text field without an analyzer.
+
+        Returns:
+            int: Bitset of the documents having the value.
+
+        """
+
+        if isinstance(value, (dict, list)):
+            raise UnsupportedQueryError(f"[{field}] must be a value")
+        if field in self.text_fields and self.analyzer is None:
+            raise UnsupportedQueryError(f"text field [{field}] is not indexed")
+
+        return self.bitsets.get(field, {}).get(value, 0)
+
+    def evaluate(self, clause: Any) -> int:
+        """Method to evaluate a query clause of elasticsearch.
+
+        `match_all`, `match_none`, `term`, `terms`, `range`,
+        `multi_match` and `bool` are supported, which are the clauses
+        created by `pokeapi.search.query`.
+
+        Args:
+            clause (Any): Query clause, such as
+            {"term": {"is_legendary": True}}.
+
+        Raises:
+            UnsupportedQueryError: If the clause is not supported.
+
+        Returns:
+            int: Bitset of the matching documents.
+
+        """
+
+        if not isinstance(clause, dict) or len(clause) != 1:
+            raise UnsupportedQueryError(
+                f"query must be an object with one key: {clause}"
+            )
+
+        ((kind, spec),) = clause.items()
+        if not isinstance(spec, dict):
+            raise UnsupportedQueryError(f"[{kind}] must be an object")
+        options = {k: v for k, v in spec.items() if k != "boost"}
+        match kind:
+            case "match_all":
+                return self.all
+            case "match_none":
+                return 0
+            case "term" if len(options) == 1:
+                ((field, value),) = options.items()
+                if isinstance(value, dict):
+                    value = value.get("value")
+                return self.lookup(field, value)
+            case "terms" if len(options) == 1:
+                ((field, values),) = options.items()
+                bits = 0
+                for value in values:
+                    bits |= self.lookup(field, value)
+                return bits
+            case "range" if len(options) == 1:
+                ((field, bounds),) = options.items()
+                return self._evaluate_range(field, bounds)
+            case "multi_match":
+                return self._evaluate_multi_match(spec)
+            case "bool":
+                return self._evaluate_bool(spec)
+
+        raise UnsupportedQueryError(f"unsupported query: {kind}")
+
+    def _evaluate_range(self, field: str, bounds: Any) -> int:
+        if not isinstance(bounds, dict) or not set(bounds) <= set(
+            RANGE_OPERATORS
+        ):
+            raise UnsupportedQueryError(f"unsupported range of [{field}]")
+        if field not in self.columns and (
+            field in self.bitsets or field in self.text_fields
+        ):
+            raise UnsupportedQueryError(f"[{field}] is not numeric")
+
+        try:
+            return self.columns.to_bits(self.columns.mask(field, bounds))
+        except (TypeError, ValueError) as e:
+            raise UnsupportedQueryError(str(e)) from e
+
+    def _evaluate_multi_match(self, spec: dict[str, Any]) -> int:
+        query = spec.get("query")
+        conjunction = str(spec.get("operator", "or")).lower() == "and"
+        bits = 0
+
+        for field in spec.get("fields", []):
+            field = field.split("^")[0]
+            if field not in self.text_fields or self.analyzer is None:
+                bits |= self.lookup(field, query)
+                continue
+
+            tokens = [self.lookup(field, t) for t in self.analyze(str(query))]
+            if not tokens:
+                continue
+            matched = tokens[0]
+            for token in tokens[1:]:
+                matched = matched & token if conjunction else matched | token
+            bits |= matched
+
+        return bits
+
+    def analyze(self, text: str) -> list[str]:
+        """Method to split text into the tokens of the text fields.
+
+        Args:
+            text (str): Text of a query.
+
+        Returns:
+            list[str]: Tokens of the text, or the text as one token
+            when the index has no analyzer.
+
+        """
+
+        return self.analyzer(text) if self.analyzer is not None else [text]
+
+    def _evaluate_bool(self, spec: dict[str, Any]) -> int:
+        required = _clauses(spec.get("must")) + _clauses(spec.get("filter"))
+        should = _clauses(spec.get("should"))
+
+        bits = self.all
+        for clause in required:
+            bits &= self.evaluate(clause)
+
+        if should:
+            minimum = _minimum_should_match(
+                spec.get("minimum_should_match"),
+                len(should),
+                0 if required else 1,
+            )
+            if minimum == 1:
+                any_bits = 0
+                for clause in should:
+                    any_bits |= self.evaluate(clause)
+                bits &= any_bits
+            elif minimum > 1:
+                counts: dict[int, int] = {}
+                for clause in should:
+                    for position in self.positions(
+                        self.evaluate(clause) & bits
+                    ):
+                        counts[position] = counts.get(position, 0) + 1
+                bits = 0
+                for position, count in counts.items():
+                    if count >= minimum:
+                        bits |= 1 << position
+
+        for clause in _clauses(spec.get("must_not")):
+            bits &= ~self.evaluate(clause)
+
+        return bits
+
+    @staticmethod
+    def positions(bits: int, start: int = 0) -> Iterator[int]:
+        """Method to list the positions of the bits set in a bitset.
+
+        Args:
+            bits (int): Bitset.
+            start (int): Position of the first bit to look at.
+
+        Yields:
+            int: Position of each bit set, in ascending order.
+
+        """
+
+        bits &= ~((1 << start) - 1)
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    @staticmethod
+    def count(bits: int) -> int:
+        """Method to count the documents of a bitset.
+
+        Args:
+            bits (int): Bitset.
+
+        Returns:
+            int: Number of bits set.
+
+        """
+
+        return bits.bit_count()
@@ -0,0 +1,256 @@
+import asyncio
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, TypeVar
+
+import elasticsearch
+
+from . import config
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Exception raised while the circuit breaker rejects calls.
+
+    Args:
+        retry_after (float): Seconds until the breaker lets a probe through.
+    """
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__("circuit breaker of elasticsearch is open")
+        self.retry_after = retry_after
+
+
+@dataclass
+class BreakerStats:
+    """Dataclass with the state and counters of `CircuitBreaker`."""
+
+    state: str = CLOSED
+    trips: int = 0
+    rejected: int = 0
+    failures: int = 0
+    slow_calls: int = 0
+    consecutive_failures: int = 0
+
+
+def is_failure(error: BaseException) -> bool:
+    """Method to decide whether an error means elasticsearch is degraded.
+
+    Errors of connection, timeouts and errors with a status of 5xx are
+    failures. Other errors, such as a bad query, are answers from a healthy
+    cluster.
+
+    Args:
+        error (BaseException): Error raised by a call to elasticsearch.
+
+    Returns:
+        bool: Whether the error counts as a failure of the breaker.
+
+    """
+
+    if isinstance(
+        error, (elasticsearch.ConnectionError, asyncio.TimeoutError)
+    ):
+        return True
+
+    if isinstance(error, elasticsearch.TransportError):
+        status = error.status_code
+        return not isinstance(status, int) or status >= 500
+
+    return False
+
+
+class CircuitBreaker:
+    """Class that stops calls to elasticsearch while it is degraded.
+
+    The breaker opens after `failure_threshold` consecutive failures,
+    where a call slower than `slow_call` seconds is a failure too.
+    While open, calls are rejected with `CircuitOpenError`. After
+    `reset_timeout` seconds one probe call is let through, which closes
+    the breaker when it succeeds and opens it again when it fails.
+
+    Args:
+        failure_threshold (int): Consecutive failures that open the breaker.
+        slow_call (float): Seconds after which a call is a failure.
+        reset_timeout (float): Seconds to stay open before a probe.
+    """
+
+    def __init__(
+        self, failure_threshold: int, slow_call: float, reset_timeout: float
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.slow_call = slow_call
+        self.reset_timeout = reset_timeout
+        self.stats = BreakerStats()
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """Method to ask the breaker for a call.
+
+        Raises:
+            CircuitOpenError: The breaker is open, or half-open
+            with a probe in flight.
+        """
+
+        with self._lock:
+            if self.stats.state == CLOSED:
+                return
+
+            retry_after = (
+                self._opened_at + self.reset_timeout - time.monotonic()
+            )
+            if self.stats.state == OPEN and retry_after <= 0:
+                self.stats.state = HALF_OPEN
+
+            if self.stats.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+
+            self.stats.rejected += 1
+            raise CircuitOpenError(max(retry_after, 0.0))
+
+    def record(self, elapsed: float, failed: bool) -> None:
+        """Method to record the result of a call let through the breaker.
+
+        Args:
+            elapsed (float): Seconds the call took.
+            failed (bool): Whether the call failed.
+        """
+
+        with self._lock:
+            if not failed and elapsed > self.slow_call:
+                self.stats.slow_calls += 1
+                failed = True
+
+            if failed:
+                self.stats.failures += 1
+                self.stats.consecutive_failures += 1
+            else:
+                self.stats.consecutive_failures = 0
+
+            if self.stats.state == HALF_OPEN:
+                self._probing = False
+                if failed:
+                    self._open()
+                else:
+                    self.stats.state = CLOSED
+            elif (
+                self.stats.state == CLOSED
+                and self.stats.consecutive_failures >= self.failure_threshold
+            ):
+                self._open()
+
+    def release(self) -> None:
+        """Method to give back a call that ended without a result,
+        such as a cancelled call."""
+
+        with self._lock:
+            if self.stats.state == HALF_OPEN:
+                self._probing = False
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """Method to call `fn` through the breaker.
+
+        Args:
+            fn (Callable): Function calling elasticsearch.
+
+        Returns:
+            T: Result of `fn`.
+
+        """
+
+        self.before_call()
+        start = time.monotonic()
+        try:
+            result = fn()
+        except Exception as e:
+            self.record(time.monotonic() - start, is_failure(e))
+            raise
+        except BaseException:
+            self.release()
+            raise
+
+        self.record(time.monotonic() - start, False)
+        return result
+
+    async def call_async(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Method to await `fn` through the breaker.
+
+        Args:
+            fn (Callable): Function returning the awaitable
+            calling elasticsearch.
+
+        Returns:
+            T: Result of `fn`.
+
+        """
+
+        self.before_call()
+        start = time.monotonic()
+        try:
+            result = await fn()
+        except Exception as e:
+            self.record(time.monotonic() - start, is_failure(e))
+            raise
+        except BaseException:
+            self.release()
+            raise
+
+        self.record(time.monotonic() - start, False)
+        return result
+
+    def _open(self) -> None:
+        self.stats.state = OPEN
+        self.stats.trips += 1
+        self._opened_at = time.monotonic()
+
+
+_breaker: CircuitBreaker | None = None
+_breaker_lock = threading.Lock()
+
+
+def get_breaker() -> CircuitBreaker:
+    """Method to get the process-wide circuit breaker of elasticsearch.
+
+    Returns:
+        CircuitBreaker: Breaker configured by `ES_BREAKER_FAILURES`,
+        `ES_BREAKER_SLOW_CALL_MS` and `ES_BREAKER_RESET_TIMEOUT`.
+
+    """
+
+    global _breaker
+
+    with _breaker_lock:
+        if _breaker is None:
+            conf = config.get_config()
+            _breaker = CircuitBreaker(
+                conf.ES_BREAKER_FAILURES,
+                conf.ES_BREAKER_SLOW_CALL_MS / 1000,
+                conf.ES_BREAKER_RESET_TIMEOUT,
+            )
+
+        return _breaker
+
+
+def get_breaker_stats() -> dict[str, Any]:
+    """Method to get the state and counters of the circuit breaker.
+
+    Returns:
+        dict[str, Any]: State, number of trips, rejected calls,
+        failures and slow calls.
+
+    """
+
+    if _breaker is None:
+        return asdict(BreakerStats())
+
+    with _breaker._lock:
+        return asdict(_breaker.stats)
@@ -0,0 +1,474 @@
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, TypeVar
+
+from . import config
+
+T = TypeVar("T")
+
+LRU = "lru"
+TINYLFU = "tinylfu"
+
+# Share of the capacity of `TinyLFUPolicy` given to the window
+# of new entries, and share of the rest given to protected entries.
+WINDOW_RATIO = 0.01
+PROTECTED_RATIO = 0.8
+# Counters of a row of `CountMinSketch` per entry of the cache,
+# and largest count of a counter.
+SKETCH_WIDTH_RATIO = 4
+MAX_COUNT = 15
+# Odd multipliers hashing a key independently for each row of the sketch.
+_SEEDS = (
+    0xC3A5C85C97CB3127,
+    0xB492B66FBE98F273,
+    0x9AE16A3B2F90404F,
+    0xCBF29CE484222325,
+)
+_MASK = (1 << 64) - 1
+_HALVE = bytes(count >> 1 for count in range(256))
+
+
+@dataclass
+class CacheStats:
+    """Dataclass with counters of `ResponseCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    size: int = 0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: float
+
+
+class EvictionPolicy(ABC):
+    """Abstract class for the order in which `ResponseCache`
+    evicts entries."""
+
+    @abstractmethod
+    def insert(self, key: str) -> list[str]:
+        """Method to add a key to the policy.
+
+        Args:
+            key (str): Key of the new entry.
+
+        Returns:
+            list[str]: Keys to evict to keep the number of entries.
+
+        """
+
+    @abstractmethod
+    def touch(self, key: str) -> None:
+        """Method to record a hit of a key.
+
+        Args:
+            key (str): Key of the entry.
+        """
+
+    @abstractmethod
+    def remove(self, key: str) -> None:
+        """Method to forget a key.
+
+        Args:
+            key (str): Key of the removed entry.
+        """
+
+    @abstractmethod
+    def victim(self) -> str | None:
+        """Method to pick the key to evict next.
+
+        Returns:
+            str | None: Key to evict, or None without any key.
+
+        """
+
+
+class LRUPolicy(EvictionPolicy):
+    """Policy that evicts the least recently used entry.
+
+    Args:
+        capacity (int): Number of entries to keep.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._keys: OrderedDict[str, None] = OrderedDict()
+
+    def insert(self, key: str) -> list[str]:
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+
+        evicted: list[str] = []
+        while len(self._keys) > self.capacity:
+            evicted.append(self._keys.popitem(last=False)[0])
+
+        return evicted
+
+    def touch(self, key: str) -> None:
+        if key in self._keys:
+            self._keys.move_to_end(key)
+
+    def remove(self, key: str) -> None:
+        self._keys.pop(key, None)
+
+    def victim(self) -> str | None:
+        return next(iter(self._keys), None)
+
+
+class CountMinSketch:
+    """Class estimating how often keys have been seen in small counters.
+
+    Counters are halved after `10 * capacity` additions, so that keys
+    that were popular long ago lose their advantage.
+
+    Args:
+        capacity (int): Number of entries of the cache.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        width = max(capacity * SKETCH_WIDTH_RATIO, 16)
+        self.bits = (width - 1).bit_length()
+        self.width = 1 << self.bits
+        self.sample_size = 10 * capacity
+        self._rows = [bytearray(self.width) for _ in _SEEDS]
+        self._additions = 0
+
+    def _indexes(self, key: str) -> list[int]:
+        # The high bits of a multiplication depend on every bit of the hash,
+        # so that keys sharing a counter in one row rarely share another.
+        h = hash(key) & _MASK
+        h ^= h >> 32
+        shift = 64 - self.bits
+
+        return [((h * seed) & _MASK) >> shift for seed in _SEEDS]
+
+    def add(self, key: str) -> None:
+        """Method to count a key.
+
+        Args:
+            key (str): Key seen by the cache.
+        """
+
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < MAX_COUNT:
+                row[index] += 1
+
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            for row in self._rows:
+                row[:] = row.translate(_HALVE)
+            self._additions //= 2
+
+    def estimate(self, key: str) -> int:
+        """Method to estimate how often a key has been seen.
+
+        Args:
+            key (str): Key seen by the cache.
+
+        Returns:
+            int: Upper bound of the recent count of the key.
+
+        """
+
+        return min(
+            row[index] for row, index in zip(self._rows, self._indexes(key))
+        )
+
+
+class TinyLFUPolicy(EvictionPolicy):
+    """Policy of W-TinyLFU, which keeps frequently used entries
+    over recently used ones.
+
+    New entries go to a small LRU window. An entry leaving the window
+    is admitted to the main segment only when it has been seen more
+    often than the entry the main segment would evict, according to
+    `CountMinSketch`. The main segment is a segmented LRU, where entries
+    hit again are protected from eviction.
+
+    Args:
+        capacity (int): Number of entries to keep.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.window_capacity = max(1, int(capacity * WINDOW_RATIO))
+        main_capacity = max(capacity - self.window_capacity, 0)
+        self.protected_capacity = int(main_capacity * PROTECTED_RATIO)
+        self.main_capacity = main_capacity
+        self.sketch = CountMinSketch(capacity)
+        self._window: OrderedDict[str, None] = OrderedDict()
+        self._probation: OrderedDict[str, None] = OrderedDict()
+        self._protected: OrderedDict[str, None] = OrderedDict()
+
+    def insert(self, key: str) -> list[str]:
+        self.sketch.add(key)
+        self.remove(key)
+        self._window[key] = None
+        if len(self._window) <= self.window_capacity:
+            return []
+
+        candidate = self._window.popitem(last=False)[0]
+        if len(self._probation) + len(self._protected) < self.main_capacity:
+            self._probation[candidate] = None
+            return []
+
+        victim = next(iter(self._probation), None) or next(
+            iter(self._protected), None
+        )
+        if victim is None:
+            return [candidate]
+
+        if self.sketch.estimate(candidate) <= self.sketch.estimate(victim):
+            return [candidate]
+
+        self.remove(victim)
+        self._probation[candidate] = None
+
+        return [victim]
+
+    def touch(self, key: str) -> None:
+        self.sketch.add(key)
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+        elif key in self._probation:
+            del self._probation[key]
+            self._protected[key] = None
+            if len(self._protected) > self.protected_capacity:
+                demoted = self._protected.popitem(last=False)[0]
+                self._probation[demoted] = None
+
+    def remove(self, key: str) -> None:
+        self._window.pop(key, None)
+        self._probation.pop(key, None)
+        self._protected.pop(key, None)
+
+    def victim(self) -> str | None:
+        for keys in (self._probation, self._window, self._protected):
+            if keys:
+                return next(iter(keys))
+
+        return None
+
+
+def create_policy(name: str, capacity: int) -> EvictionPolicy:
+    """Method to create an eviction policy by name.
+
+    Args:
+        name (str): "lru" or "tinylfu".
+        capacity (int): Number of entries to keep.
+
+    Raises:
+        ValueError: The name is not a known policy.
+
+    Returns:
+        EvictionPolicy: Eviction policy.
+
+    """
+
+    if name == LRU:
+        return LRUPolicy(capacity)
+    if name == TINYLFU:
+        return TinyLFUPolicy(capacity)
+
+    raise ValueError(f"unknown cache policy: {name!r}")
+
+
+def sizeof(value: Any) -> int:
+    """Method to estimate the size of a cached value.
+
+    Args:
+        value (Any): Text, bytes or response decoded from JSON.
+
+    Returns:
+        int: Length of the value as JSON.
+
+    """
+
+    if isinstance(value, (str, bytes)):
+        return len(value)
+
+    return len(
+        json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+    )
+
+
+class ResponseCache:
+    """Class caching responses of elasticsearch in the process.
+
+    Entries expire after their TTL, and the cache is bounded by
+    `max_entries` and, unless it is 0, by `max_bytes`. Every operation
+    holds a lock without awaiting anything, so the cache is safe to use
+    from threads and from tasks of event loops.
+
+    Args:
+        max_entries (int): Number of entries to keep.
+        max_bytes (int): Size of entries to keep, or 0 for no bound.
+        policy (str): Eviction policy, "lru" or "tinylfu".
+    """
+
+    def __init__(
+        self, max_entries: int, max_bytes: int = 0, policy: str = TINYLFU
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.policy = create_policy(policy, max_entries)
+        self.stats = CacheStats()
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        """Method to get a cached value.
+
+        Args:
+            key (str): Key of the value.
+
+        Returns:
+            Any | None: Cached value, or None if it is missing or expired.
+
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self.stats.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            self.stats.hits += 1
+            self.policy.touch(key)
+
+            return entry.value
+
+    def put(self, key: str, value: Any, ttl: float) -> None:
+        """Method to cache a value.
+
+        Args:
+            key (str): Key of the value.
+            value (Any): Value to cache, which must not be changed later.
+            ttl (float): Seconds to keep the value.
+        """
+
+        size = sizeof(value) if self.max_bytes else 0
+        if self.max_bytes and size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = _Entry(value, size, time.monotonic() + ttl)
+            self.stats.size += size
+
+            for evicted in self.policy.insert(key):
+                self._evict(evicted)
+
+            while self.max_bytes and self.stats.size > self.max_bytes:
+                victim = self.policy.victim()
+                if victim is None:
+                    break
+                self._evict(victim)
+
+            self.stats.entries = len(self._entries)
+
+    def clear(self) -> None:
+        """Method to remove every entry."""
+
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def get_or_load(self, key: str, ttl: float, load: Callable[[], T]) -> T:
+        """Method to get a cached value, loading and caching it when missing.
+
+        Args:
+            key (str): Key of the value.
+            ttl (float): Seconds to keep a loaded value.
+            load (Callable): Function loading the value.
+
+        Returns:
+            T: Cached or loaded value.
+
+        """
+
+        value = self.get(key)
+        if value is None:
+            value = load()
+            self.put(key, value, ttl)
+
+        return value
+
+    def _evict(self, key: str) -> None:
+        if key in self._entries:
+            self._remove(key)
+            self.stats.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.stats.size -= entry.size
+            self.policy.remove(key)
+        self.stats.entries = len(self._entries)
+
+
+_cache: ResponseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> ResponseCache:
+    """Method to get the process-wide cache of responses.
+
+    Returns:
+        ResponseCache: Cache configured by `ES_CACHE_MAX_ENTRIES`,
+        `ES_CACHE_MAX_BYTES` and `ES_CACHE_POLICY`.
+
+    """
+
+    global _cache
+
+    with _cache_lock:
+        if _cache is None:
+            conf = config.get_config()
+            _cache = ResponseCache(
+                conf.ES_CACHE_MAX_ENTRIES,
+                conf.ES_CACHE_MAX_BYTES,
+                conf.ES_CACHE_POLICY,
+            )
+
+        return _cache
+
+
+def clear_cache() -> None:
+    """Method to remove every entry of the process-wide cache of responses,
+    if it has been created."""
+
+    if _cache is not None:
+        _cache.clear()
+
+
+def get_cache_stats() -> dict[str, Any]:
+    """Method to get counters of the cache of responses.
+
+    Returns:
+        dict[str, Any]: Number of hits, misses, evictions and expirations,
+        and the number and size in bytes of entries.
+
+    """
+
+    if _cache is None:
+        return asdict(CacheStats())
+
+    with _cache._lock:
+        return asdict(_cache.stats)
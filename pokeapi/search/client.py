@@ -0,0 +1,410 @@
+import asyncio
+import contextlib
+import threading
+import time
+from typing import Any, cast
+
+from elasticsearch import (
+    AIOHttpConnection,
+    AsyncElasticsearch,
+    Elasticsearch,
+    Urllib3HttpConnection,
+)
+
+from . import backend, breaker, config, memory, raw
+from .nodes import (
+    AsyncRetryingTransport,
+    HealthAwareSelector,
+    NodeHealth,
+    RetryingTransport,
+)
+
+_client: backend.SearchBackend | None = None
+_async_client: backend.AsyncSearchBackend | None = None
+_async_loop: asyncio.AbstractEventLoop | None = None
+# Closing of the async clients replaced by one of another event loop.
+_closing: "set[asyncio.Task[None]]" = set()
+_lock = threading.Lock()
+
+
+class TrackingUrllib3HttpConnection(Urllib3HttpConnection):
+    """Connection class of urllib3 that tracks the health of its node.
+
+    Responses of requests with `raw.RAW_HEADER` are marked to be
+    left as text.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.health = NodeHealth()
+
+    def perform_request(self, *args: Any, **kwargs: Any) -> Any:
+        is_raw = raw.pop_raw_header(kwargs)
+        start = time.monotonic()
+        try:
+            response = super().perform_request(*args, **kwargs)
+        except Exception as e:
+            self.health.record(time.monotonic() - start, breaker.is_failure(e))
+            raise
+
+        self.health.record(time.monotonic() - start, False)
+        return raw.mark_raw(response) if is_raw else response
+
+
+class CountingAIOHttpConnection(AIOHttpConnection):
+    """Connection class of aiohttp that counts the requests it performs.
+
+    aiohttp does not expose usage of its connector, so the counters are
+    kept here to size the pool of the async client. The health of the node
+    is tracked as well, and responses of requests with `raw.RAW_HEADER`
+    are marked to be left as text.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.maxsize: int = kwargs.get("maxsize", 10)
+        self.num_requests = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.health = NodeHealth()
+
+    async def perform_request(  # type: ignore[override]
+        self, *args: Any, **kwargs: Any
+    ) -> Any:
+        is_raw = raw.pop_raw_header(kwargs)
+        self.num_requests += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        start = time.monotonic()
+        try:
+            response = await super().perform_request(*args, **kwargs)
+        except Exception as e:
+            self.health.record(time.monotonic() - start, breaker.is_failure(e))
+            raise
+        finally:
+            self.in_flight -= 1
+
+        self.health.record(time.monotonic() - start, False)
+        return raw.mark_raw(response) if is_raw else response
+
+
+def _client_kwargs() -> dict[str, Any]:
+    """Method to create keyword arguments shared by the clients.
+
+    Returns:
+        dict[str, Any]: Keyword arguments for the clients of elasticsearch.
+
+    """
+
+    conf = config.get_config()
+    headers = {"Connection": "keep-alive" if conf.ES_KEEP_ALIVE else "close"}
+
+    return {
+        "hosts": get_hosts(),
+        "maxsize": conf.ES_POOL_MAXSIZE,
+        "http_compress": conf.ES_HTTP_COMPRESS,
+        "timeout": conf.ES_TIMEOUT,
+        "headers": headers,
+        "serializers": {raw.RAW_MIMETYPE: raw.RawSerializer()},
+        "selector_class": HealthAwareSelector,
+        "sniff_on_start": conf.ES_SNIFF_ON_START,
+        "sniff_on_connection_fail": conf.ES_SNIFF_ON_CONNECTION_FAIL,
+        "sniffer_timeout": conf.ES_SNIFFER_TIMEOUT or None,
+        "max_retries": conf.ES_MAX_RETRIES,
+        "retry_backoff": conf.ES_RETRY_BACKOFF_MS / 1000,
+        "retry_backoff_max": conf.ES_RETRY_BACKOFF_MAX_MS / 1000,
+    }
+
+
+def get_hosts() -> list[str] | None:
+    """Method to get the hosts of elasticsearch from the configuration.
+
+    Returns:
+        list[str] | None: URLs of `ES_CONNECTION_URL` separated by commas,
+        or None to connect to the default `localhost:9200` of
+        elasticsearch-py when it is not set.
+
+    """
+
+    url = config.get_config().ES_CONNECTION_URL or ""
+    hosts = [host.strip() for host in url.split(",") if host.strip()]
+
+    return hosts or None
+
+
+def create_client() -> backend.SearchBackend:
+    """Method to create a client of the backend from the configuration.
+
+    Raises:
+        ValueError: `ES_BACKEND` is not a known backend.
+
+    Returns:
+        SearchBackend: Client with a pool of connections to elasticsearch,
+        or the in-memory backend when `ES_BACKEND` is "memory".
+
+    """
+
+    name = config.get_config().ES_BACKEND
+    if name == backend.MEMORY:
+        return memory.MemoryBackend(memory.get_index())
+    if name != backend.ELASTICSEARCH:
+        raise ValueError(f"unknown backend: {name!r}")
+
+    return cast(
+        backend.SearchBackend,
+        Elasticsearch(
+            connection_class=TrackingUrllib3HttpConnection,
+            transport_class=RetryingTransport,
+            **_client_kwargs(),
+        ),
+    )
+
+
+def create_async_client() -> backend.AsyncSearchBackend:
+    """Method to create an async client of the backend
+        from the configuration.
+
+    Raises:
+        ValueError: `ES_BACKEND` is not a known backend.
+
+    Returns:
+        AsyncSearchBackend: Async client with a pool of connections
+        to elasticsearch, or the in-memory backend when `ES_BACKEND`
+        is "memory".
+
+    """
+
+    name = config.get_config().ES_BACKEND
+    if name == backend.MEMORY:
+        return memory.AsyncMemoryBackend(memory.get_index())
+    if name != backend.ELASTICSEARCH:
+        raise ValueError(f"unknown backend: {name!r}")
+
+    return cast(
+        backend.AsyncSearchBackend,
+        AsyncElasticsearch(
+            connection_class=CountingAIOHttpConnection,
+            transport_class=AsyncRetryingTransport,
+            **_client_kwargs(),
+        ),
+    )
+
+
+def open_client() -> backend.SearchBackend:
+    """Method to open the process-wide client of elasticsearch.
+
+    Calling it while the client is already open returns the same client.
+
+    Returns:
+        SearchBackend: Process-wide client of the backend.
+
+    """
+
+    global _client
+
+    with _lock:
+        if _client is None:
+            _client = create_client()
+
+        return _client
+
+
+def get_client() -> backend.SearchBackend:
+    """Method to get the process-wide client of elasticsearch.
+
+    The client is opened on first use when the application lifespan
+    has not opened it yet.
+
+    Returns:
+        SearchBackend: Process-wide client of the backend.
+
+    """
+
+    if _client is not None:
+        return _client
+
+    return open_client()
+
+
+def close_client() -> None:
+    """Method to close the process-wide client of elasticsearch."""
+
+    global _client
+
+    with _lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def get_async_client() -> backend.AsyncSearchBackend:
+    """Method to get the async client of elasticsearch
+        for the running event loop.
+
+    The connections of the async client are bound to the event loop
+    that opened them, so a new client is created when it is used
+    from another event loop, and the previous one is closed.
+
+    Returns:
+        AsyncSearchBackend: Async client of the backend.
+
+    """
+
+    global _async_client, _async_loop
+
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_loop is not loop:
+        if _async_client is not None:
+            _close_replaced(_async_client, _async_loop, loop)
+        _async_client = create_async_client()
+        _async_loop = loop
+
+    return _async_client
+
+
+def _close_replaced(
+    es: backend.AsyncSearchBackend,
+    es_loop: asyncio.AbstractEventLoop | None,
+    loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Method to close an async client replaced by one of another loop.
+
+    The client is closed in its own event loop while that loop runs
+    in another thread, and in the running event loop otherwise,
+    such as when its loop has been closed by `asyncio.run`.
+
+    Args:
+        es (AsyncSearchBackend): Replaced async client.
+        es_loop (asyncio.AbstractEventLoop | None): Event loop
+        the client was created in.
+        loop (asyncio.AbstractEventLoop): Running event loop.
+    """
+
+    async def close() -> None:
+        with contextlib.suppress(Exception):
+            await es.close()
+
+    if es_loop is not None and es_loop.is_running():
+        asyncio.run_coroutine_threadsafe(close(), es_loop)
+        return
+
+    task = loop.create_task(close())
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+
+async def open_async_client() -> backend.AsyncSearchBackend:
+    """Method to open the async client of elasticsearch
+        for the running event loop.
+
+    The connections of the async client are created here instead of
+    on the first request.
+
+    Returns:
+        AsyncSearchBackend: Async client of the backend.
+
+    """
+
+    return await get_async_client().__aenter__()
+
+
+async def close_async_client() -> None:
+    """Method to close the async client of elasticsearch,
+    waiting for the replaced ones still being closed."""
+
+    global _async_client, _async_loop
+
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(
+        *(task for task in _closing if task.get_loop() is loop)
+    )
+    if _async_client is not None:
+        await _async_client.close()
+        _async_client = None
+        _async_loop = None
+
+
+def _node_stats(connection_pool: Any, connection: Any) -> dict[str, Any]:
+    """Method to get the health of the node of a connection.
+
+    Args:
+        connection_pool (ConnectionPool): Pool holding the connection.
+        connection (Connection): Connection to the node.
+
+    Returns:
+        dict[str, Any]: Whether the node is alive, its moving averages
+        of latency and error rate, and its number of errors.
+
+    """
+
+    health: NodeHealth = connection.health
+
+    return {
+        "alive": connection in connection_pool.connections,
+        "latency_ms": (
+            health.latency * 1000 if health.latency is not None else None
+        ),
+        "error_rate": health.error_rate,
+        "errors": health.errors,
+    }
+
+
+def get_pool_stats() -> list[dict[str, Any]]:
+    """Method to get usage counters of the connection pools.
+
+    Nodes marked dead by the transport are included with `alive` unset.
+
+    Returns:
+        list[dict[str, Any]]: Counters of the connection pool of each node.
+        Empty while no client of elasticsearch is open.
+
+    """
+
+    stats: list[dict[str, Any]] = []
+
+    if isinstance(_client, Elasticsearch):
+        connection_pool = _client.transport.connection_pool
+        for connection in getattr(
+            connection_pool, "orig_connections", connection_pool.connections
+        ):
+            if not isinstance(connection, TrackingUrllib3HttpConnection):
+                continue
+
+            pool = connection.pool
+            if pool.pool is None:
+                continue
+
+            idle_connections = sum(1 for conn in pool.pool.queue if conn)
+            stats.append(
+                {
+                    "client": "sync",
+                    "host": connection.host,
+                    "maxsize": pool.pool.maxsize,
+                    "num_requests": pool.num_requests,
+                    "num_connections": pool.num_connections,
+                    "idle_connections": idle_connections,
+                    **_node_stats(connection_pool, connection),
+                }
+            )
+
+    if isinstance(_async_client, AsyncElasticsearch):
+        connection_pool = _async_client.transport.connection_pool
+        for connection in getattr(
+            connection_pool, "orig_connections", connection_pool.connections
+        ):
+            if not isinstance(connection, CountingAIOHttpConnection):
+                continue
+
+            stats.append(
+                {
+                    "client": "async",
+                    "host": connection.host,
+                    "maxsize": connection.maxsize,
+                    "num_requests": connection.num_requests,
+                    "in_flight": connection.in_flight,
+                    "peak_in_flight": connection.peak_in_flight,
+                    **_node_stats(connection_pool, connection),
+                }
+            )
+
+    return stats
@@ -0,0 +1,114 @@
+import operator
+from typing import Any, Callable
+
+import numpy as np
+import numpy.typing as npt
+
+# Bounds of a range query, and the comparison of each with the values.
+RANGE_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "gte": operator.ge,
+    "gt": operator.gt,
+    "lte": operator.le,
+    "lt": operator.lt,
+}
+
+Mask = npt.NDArray[np.bool_]
+
+
+def is_number(value: Any) -> bool:
+    """Method to check whether a value is indexed in a column.
+
+    Args:
+        value (Any): Value of a field.
+
+    Returns:
+        bool: Whether the value is an int or a float, but not a bool.
+
+    """
+
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class ColumnStore:
+    """Class keeping the numeric fields of some documents in columns,
+        one contiguous array per field.
+
+    Range queries are answered with a vectorized comparison of
+    a whole column. Missing values are NaN, which no comparison
+    matches. Columns with a fractional value are `float32`, as
+    `pokemon_mapping.json` maps them to `float`, and bounds are
+    rounded to `float32` too, as elasticsearch does. Other columns
+    are `float64`, which holds the values of `long` fields exactly.
+
+    Args:
+        values (list[dict[str, Any]]): Values of each document
+        by their dotted paths, in the order of the rows.
+    """
+
+    def __init__(self, values: list[dict[str, Any]]) -> None:
+        self.size = len(values)
+        self.columns: dict[str, npt.NDArray[Any]] = {}
+
+        fields = {
+            path
+            for doc in values
+            for path, value in doc.items()
+            if is_number(value)
+        }
+        for field in sorted(fields):
+            column = [doc.get(field) for doc in values]
+            if not all(v is None or is_number(v) for v in column):
+                continue
+
+            fractional = any(isinstance(v, float) for v in column)
+            self.columns[field] = np.array(
+                [np.nan if v is None else v for v in column],
+                dtype=np.float32 if fractional else np.float64,
+            )
+
+    def __contains__(self, field: object) -> bool:
+        return field in self.columns
+
+    def mask(self, field: str, bounds: dict[str, Any]) -> Mask:
+        """Method to compare the values of a field with some bounds.
+
+        Args:
+            field (str): Path of the field, such as "base_stats.speed".
+            bounds (dict[str, Any]): Bounds of a range query by their
+            names in `RANGE_OPERATORS`, such as {"gte": 100}.
+
+        Raises:
+            KeyError: If a bound is not in `RANGE_OPERATORS`.
+
+        Returns:
+            Mask: Whether each row has a value within every bound.
+            No row matches when the field has no column.
+
+        """
+
+        column = self.columns.get(field)
+        if column is None:
+            return np.zeros(self.size, dtype=np.bool_)
+
+        mask: Mask = ~np.isnan(column)
+        for name, bound in bounds.items():
+            compare = RANGE_OPERATORS[name]
+            mask &= compare(column, np.asarray(bound, dtype=column.dtype))
+
+        return mask
+
+    @staticmethod
+    def to_bits(mask: Mask) -> int:
+        """Method to convert a mask to a bitset.
+
+        Args:
+            mask (Mask): Whether each row matches.
+
+        Returns:
+            int: Bitset with bit i set when row i matches.
+
+        """
+
+        packed = np.packbits(mask, bitorder="little")
+
+        return int.from_bytes(packed.tobytes(), "little")
@@ -1,7 +1,37 @@
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
+# Seconds each route may wait for elasticsearch unless `ES_DEADLINES`
+# overrides it. Routes that are not listed wait for `ES_TIMEOUT`.
+DEFAULT_DEADLINES = {
+    "pokemon": 1.0,
+    "pokedex_number": 1.0,
+    "name": 1.0,
+    "batch": 2.0,
+    "conditions": 2.0,
+    "keyword": 2.0,
+}
+# Seconds each route caches responses for unless `ES_CACHE_TTLS`
+# overrides it. Routes that are not listed are not cached.
+DEFAULT_CACHE_TTLS = {
+    "pokemon": 300.0,
+    "pokedex_number": 300.0,
+    "name": 300.0,
+    "batch": 300.0,
+    "conditions": 60.0,
+    "keyword": 60.0,
+}
+# Seconds clients and proxies may reuse responses of each route for
+# unless `ES_MAX_AGES` overrides it. Routes that are not listed are
+# revalidated with `If-None-Match` on every request.
+DEFAULT_MAX_AGES = {
+    "pokedex_number": 300.0,
+    "name": 300.0,
+    "conditions": 60.0,
+    "keyword": 60.0,
+}
+
 
 class Singleton(type):
     """Metaclass to make the configuration class singleton."""
@@ -20,16 +50,311 @@ class _ElasticsearchConfig(metaclass=Singleton):
 
     ES_INDEX: str | None
     ES_CONNECTION_URL: str | None
+    ES_TIMEOUT: float = 10.0
+    ES_SNIFF_ON_START: bool = False
+    ES_SNIFF_ON_CONNECTION_FAIL: bool = False
+    ES_SNIFFER_TIMEOUT: float = 0.0
+    ES_MAX_RETRIES: int = 2
+    ES_RETRY_BACKOFF_MS: float = 25.0
+    ES_RETRY_BACKOFF_MAX_MS: float = 500.0
+    ES_POOL_MAXSIZE: int = 10
+    ES_HTTP_COMPRESS: bool = True
+    ES_KEEP_ALIVE: bool = True
+    ES_BATCH_ENABLED: bool = False
+    ES_BATCH_WINDOW_MS: float = 2.0
+    ES_BATCH_MAX_SIZE: int = 50
+    ES_SINGLEFLIGHT_ENABLED: bool = True
+    ES_GET_FAST_PATH: bool = True
+    ES_EXPORT_PAGE_SIZE: int = 500
+    ES_PIT_KEEP_ALIVE: str = "1m"
+    ES_REQUEST_CACHE: bool = True
+    ES_RAW_PASSTHROUGH: bool = False
+    ES_DEADLINES: dict[str, float] = field(
+        default_factory=lambda: dict(DEFAULT_DEADLINES)
+    )
+    ES_BREAKER_ENABLED: bool = True
+    ES_BREAKER_FAILURES: int = 5
+    ES_BREAKER_SLOW_CALL_MS: float = 2000.0
+    ES_BREAKER_RESET_TIMEOUT: float = 10.0
+    ES_HEDGE_ENABLED: bool = False
+    ES_HEDGE_PERCENTILE: float = 95.0
+    ES_HEDGE_BUDGET: float = 0.05
+    ES_HEDGE_MIN_DELAY_MS: float = 5.0
+    ES_HEDGE_MIN_SAMPLES: int = 20
+    ES_CACHE_ENABLED: bool = False
+    ES_CACHE_POLICY: str = "tinylfu"
+    ES_CACHE_MAX_ENTRIES: int = 10000
+    ES_CACHE_MAX_BYTES: int = 0
+    ES_CACHE_TTLS: dict[str, float] = field(
+        default_factory=lambda: dict(DEFAULT_CACHE_TTLS)
+    )
+    ES_CACHE_REDIS_URL: str | None = None
+    ES_CACHE_REDIS_TIMEOUT: float = 0.05
+    ES_CACHE_REDIS_PREFIX: str = "pokeapi:"
+    ES_CACHE_L1_TTL: float = 5.0
+    ES_ETAG_ENABLED: bool = True
+    ES_GENERATION_TTL: float = 5.0
+    ES_GENERATION_POLL_INTERVAL: float = 5.0
+    ES_GENERATION_TIMEOUT: float = 1.0
+    ES_MEMBERSHIP_ENABLED: bool = False
+    ES_NEGATIVE_CACHE_TTL: float = 0.0
+    ES_NEGATIVE_CACHE_MAX_ENTRIES: int = 10000
+    ES_PRERENDER_ENABLED: bool = False
+    ES_PRERENDER_GZIP: bool = False
+    ES_PRERENDER_MAX_ENTRIES: int = 4096
+    ES_BITMAP_ENABLED: bool = False
+    ES_BACKEND: str = "elasticsearch"
+    ES_MEMORY_PATH: str = "docker/elasticdump/src/pokemon_data.json"
+    ES_WARMUP_ENABLED: bool = False
+    ES_WARMUP_PRELOAD: bool = True
+    ES_WARMUP_PATHS: tuple[str, ...] = ()
+    ES_MAX_AGES: dict[str, float] = field(
+        default_factory=lambda: dict(DEFAULT_MAX_AGES)
+    )
+
+    def get_deadline(self, route: str) -> float:
+        """Method to get the seconds a route may wait for elasticsearch.
+
+        Args:
+            route (str): Name of the route, such as "conditions".
+
+        Returns:
+            float: Deadline of the route, or `ES_TIMEOUT`
+            for routes without one.
+        """
+
+        return self.ES_DEADLINES.get(route, self.ES_TIMEOUT)
+
+    def get_cache_ttl(self, route: str) -> float:
+        """Method to get the seconds a route caches responses for.
+
+        Args:
+            route (str): Name of the route, such as "conditions".
+
+        Returns:
+            float: TTL of the route, or 0.0 while `ES_CACHE_ENABLED`
+            is unset and for routes without one.
+        """
+
+        if not self.ES_CACHE_ENABLED:
+            return 0.0
+
+        return self.ES_CACHE_TTLS.get(route, 0.0)
+
+    def get_max_age(self, route: str) -> int:
+        """Method to get the seconds responses of a route may be reused for.
+
+        Args:
+            route (str): Name of the route, such as "conditions".
+
+        Returns:
+            int: `max-age` of the route, or 0 for routes without one.
+        """
+
+        return int(self.ES_MAX_AGES.get(route, 0.0))
+
+
+def _getenv_bool(key: str, default: bool) -> bool:
+    """Method to read a boolean from an environment variable.
+
+    Args:
+        key (str): Name of the environment variable.
+        default (bool): Value used when the variable is not set.
+
+    Returns:
+        bool: `True` for "1", "true", "yes" and "on" (case-insensitive).
+    """
+
+    value = os.getenv(key)
+    if value is None:
+        return default
+
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _getenv_int(key: str, default: int) -> int:
+    """Method to read an integer from an environment variable.
+
+    Args:
+        key (str): Name of the environment variable.
+        default (int): Value used when the variable is not set.
+
+    Returns:
+        int: Value of the environment variable.
+    """
+
+    value = os.getenv(key)
+    if value is None:
+        return default
+
+    return int(value)
+
+
+def _getenv_float(key: str, default: float) -> float:
+    """Method to read a float from an environment variable.
+
+    Args:
+        key (str): Name of the environment variable.
+        default (float): Value used when the variable is not set.
+
+    Returns:
+        float: Value of the environment variable.
+    """
+
+    value = os.getenv(key)
+    if value is None:
+        return default
+
+    return float(value)
+
+
+def _getenv_route_seconds(
+    key: str, default: dict[str, float]
+) -> dict[str, float]:
+    """Method to read seconds of routes from an environment variable.
+
+    The variable is a comma-separated list of `route=seconds`, such as
+    "conditions=3,keyword=2.5", and overrides the seconds of the routes
+    it lists.
+
+    Args:
+        key (str): Name of the environment variable.
+        default (dict[str, float]): Seconds used for routes
+        that are not listed.
+
+    Returns:
+        dict[str, float]: Seconds of each route.
+
+    Raises:
+        ValueError: An item is not `route=seconds`.
+    """
+
+    seconds_of_routes = dict(default)
+    value = os.getenv(key)
+    if not value:
+        return seconds_of_routes
+
+    for item in value.split(","):
+        route, sep, seconds = item.partition("=")
+        if not sep:
+            raise ValueError(f"invalid item of {key}: {item!r}")
+
+        seconds_of_routes[route.strip()] = float(seconds)
+
+    return seconds_of_routes
+
+
+def _getenv_list(key: str) -> tuple[str, ...]:
+    """Method to read a comma-separated list from an environment variable.
+
+    Args:
+        key (str): Name of the environment variable.
+
+    Returns:
+        tuple[str, ...]: Non-empty items of the list, or an empty tuple
+        when the variable is not set.
+    """
+
+    value = os.getenv(key, "")
+
+    return tuple(item.strip() for item in value.split(",") if item.strip())
 
 
 def get_config() -> _ElasticsearchConfig:
     """Method that return configuration class.
 
+    The environment variables are read by the first call only,
+    and later calls return the same instance until `reset_config`.
+
     Returns:
         _ElasticsearchConfig: Datalass with configuration information
         to connect to elasticsearch
     """
+    instance: _ElasticsearchConfig | None = Singleton._instances.get(
+        _ElasticsearchConfig
+    )
+    if instance is not None:
+        return instance
+
     return _ElasticsearchConfig(
         ES_INDEX=os.getenv("ES_INDEX"),
         ES_CONNECTION_URL=os.getenv("ES_CONNECTION_URL"),
+        ES_TIMEOUT=_getenv_float("ES_TIMEOUT", 10.0),
+        ES_SNIFF_ON_START=_getenv_bool("ES_SNIFF_ON_START", False),
+        ES_SNIFF_ON_CONNECTION_FAIL=_getenv_bool(
+            "ES_SNIFF_ON_CONNECTION_FAIL", False
+        ),
+        ES_SNIFFER_TIMEOUT=_getenv_float("ES_SNIFFER_TIMEOUT", 0.0),
+        ES_MAX_RETRIES=_getenv_int("ES_MAX_RETRIES", 2),
+        ES_RETRY_BACKOFF_MS=_getenv_float("ES_RETRY_BACKOFF_MS", 25.0),
+        ES_RETRY_BACKOFF_MAX_MS=_getenv_float(
+            "ES_RETRY_BACKOFF_MAX_MS", 500.0
+        ),
+        ES_POOL_MAXSIZE=_getenv_int("ES_POOL_MAXSIZE", 10),
+        ES_HTTP_COMPRESS=_getenv_bool("ES_HTTP_COMPRESS", True),
+        ES_KEEP_ALIVE=_getenv_bool("ES_KEEP_ALIVE", True),
+        ES_BATCH_ENABLED=_getenv_bool("ES_BATCH_ENABLED", False),
+        ES_BATCH_WINDOW_MS=_getenv_float("ES_BATCH_WINDOW_MS", 2.0),
+        ES_BATCH_MAX_SIZE=_getenv_int("ES_BATCH_MAX_SIZE", 50),
+        ES_SINGLEFLIGHT_ENABLED=_getenv_bool("ES_SINGLEFLIGHT_ENABLED", True),
+        ES_GET_FAST_PATH=_getenv_bool("ES_GET_FAST_PATH", True),
+        ES_EXPORT_PAGE_SIZE=_getenv_int("ES_EXPORT_PAGE_SIZE", 500),
+        ES_PIT_KEEP_ALIVE=os.getenv("ES_PIT_KEEP_ALIVE", "1m"),
+        ES_REQUEST_CACHE=_getenv_bool("ES_REQUEST_CACHE", True),
+        ES_RAW_PASSTHROUGH=_getenv_bool("ES_RAW_PASSTHROUGH", False),
+        ES_DEADLINES=_getenv_route_seconds("ES_DEADLINES", DEFAULT_DEADLINES),
+        ES_BREAKER_ENABLED=_getenv_bool("ES_BREAKER_ENABLED", True),
+        ES_BREAKER_FAILURES=_getenv_int("ES_BREAKER_FAILURES", 5),
+        ES_BREAKER_SLOW_CALL_MS=_getenv_float(
+            "ES_BREAKER_SLOW_CALL_MS", 2000.0
+        ),
+        ES_BREAKER_RESET_TIMEOUT=_getenv_float(
+            "ES_BREAKER_RESET_TIMEOUT", 10.0
+        ),
+        ES_HEDGE_ENABLED=_getenv_bool("ES_HEDGE_ENABLED", False),
+        ES_HEDGE_PERCENTILE=_getenv_float("ES_HEDGE_PERCENTILE", 95.0),
+        ES_HEDGE_BUDGET=_getenv_float("ES_HEDGE_BUDGET", 0.05),
+        ES_HEDGE_MIN_DELAY_MS=_getenv_float("ES_HEDGE_MIN_DELAY_MS", 5.0),
+        ES_HEDGE_MIN_SAMPLES=_getenv_int("ES_HEDGE_MIN_SAMPLES", 20),
+        ES_CACHE_ENABLED=_getenv_bool("ES_CACHE_ENABLED", False),
+        ES_CACHE_POLICY=os.getenv("ES_CACHE_POLICY", "tinylfu"),
+        ES_CACHE_MAX_ENTRIES=_getenv_int("ES_CACHE_MAX_ENTRIES", 10000),
+        ES_CACHE_MAX_BYTES=_getenv_int("ES_CACHE_MAX_BYTES", 0),
+        ES_CACHE_TTLS=_getenv_route_seconds(
+            "ES_CACHE_TTLS", DEFAULT_CACHE_TTLS
+        ),
+        ES_CACHE_REDIS_URL=os.getenv("ES_CACHE_REDIS_URL"),
+        ES_CACHE_REDIS_TIMEOUT=_getenv_float("ES_CACHE_REDIS_TIMEOUT", 0.05),
+        ES_CACHE_REDIS_PREFIX=os.getenv("ES_CACHE_REDIS_PREFIX", "pokeapi:"),
+        ES_CACHE_L1_TTL=_getenv_float("ES_CACHE_L1_TTL", 5.0),
+        ES_ETAG_ENABLED=_getenv_bool("ES_ETAG_ENABLED", True),
+        ES_GENERATION_TTL=_getenv_float("ES_GENERATION_TTL", 5.0),
+        ES_GENERATION_POLL_INTERVAL=_getenv_float(
+            "ES_GENERATION_POLL_INTERVAL", 5.0
+        ),
+        ES_GENERATION_TIMEOUT=_getenv_float("ES_GENERATION_TIMEOUT", 1.0),
+        ES_MEMBERSHIP_ENABLED=_getenv_bool("ES_MEMBERSHIP_ENABLED", False),
+        ES_NEGATIVE_CACHE_TTL=_getenv_float("ES_NEGATIVE_CACHE_TTL", 0.0),
+        ES_NEGATIVE_CACHE_MAX_ENTRIES=_getenv_int(
+            "ES_NEGATIVE_CACHE_MAX_ENTRIES", 10000
+        ),
+        ES_PRERENDER_ENABLED=_getenv_bool("ES_PRERENDER_ENABLED", False),
+        ES_PRERENDER_GZIP=_getenv_bool("ES_PRERENDER_GZIP", False),
+        ES_PRERENDER_MAX_ENTRIES=_getenv_int("ES_PRERENDER_MAX_ENTRIES", 4096),
+        ES_BITMAP_ENABLED=_getenv_bool("ES_BITMAP_ENABLED", False),
+        ES_BACKEND=os.getenv("ES_BACKEND", "elasticsearch"),
+        ES_MEMORY_PATH=os.getenv(
+            "ES_MEMORY_PATH", "docker/elasticdump/src/pokemon_data.json"
+        ),
+        ES_WARMUP_ENABLED=_getenv_bool("ES_WARMUP_ENABLED", False),
+        ES_WARMUP_PRELOAD=_getenv_bool("ES_WARMUP_PRELOAD", True),
+        ES_WARMUP_PATHS=_getenv_list("ES_WARMUP_PATHS"),
+        ES_MAX_AGES=_getenv_route_seconds("ES_MAX_AGES", DEFAULT_MAX_AGES),
     )
+
+
+def reset_config() -> None:
+    """Method to forget the configuration, so that the environment
+    variables are read again by the next `get_config`."""
+
+    Singleton._instances.pop(_ElasticsearchConfig, None)
@@ -0,0 +1,45 @@
+import base64
+import json
+from typing import Any
+
+
+def encode_cursor(sort_values: list[Any]) -> str:
+    """Method to encode the sort values of the last hit into a cursor.
+
+    Args:
+        sort_values (list[Any]): Sort values of the last hit of a page.
+
+    Returns:
+        str: Opaque cursor pointing after the last hit.
+
+    """
+
+    data = json.dumps(sort_values, ensure_ascii=False, separators=(",", ":"))
+
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """Method to decode a cursor into sort values for `search_after`.
+
+    Args:
+        cursor (str): Cursor created by `encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor was not created by `encode_cursor`.
+
+    Returns:
+        list[Any]: Sort values of the last hit of the previous page.
+
+    """
+
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_values = json.loads(data)
+    except ValueError as e:
+        raise ValueError("invalid cursor") from e
+
+    if not isinstance(sort_values, list):
+        raise ValueError("invalid cursor")
+
+    return sort_values
@@ -0,0 +1,83 @@
+import threading
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class FastPathStats:
+    """Dataclass with counters of lookups by National Pokédex Number."""
+
+    mget: int = 0
+    search: int = 0
+    stale: int = 0
+
+
+class PokedexIdMap:
+    """Class mapping National Pokédex Numbers to the `_id` of documents.
+
+    The `_id` of a document is not its National Pokédex Number, and
+    several forms share one number, so the map is learned from the hits
+    of searches and used to fetch the same documents with `_mget` later.
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[int, tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, pokedex_number: int) -> tuple[str, ...] | None:
+        """Method to get the `_id` of documents of a National Pokédex Number.
+
+        Args:
+            pokedex_number (int): Target of `national_pokedex_number`.
+
+        Returns:
+            tuple[str, ...] | None: `_id` of documents in the order
+            of the search, or None if the number has not been learned.
+        """
+
+        with self._lock:
+            return self._ids.get(pokedex_number)
+
+    def learn(self, pokedex_number: int, ids: tuple[str, ...]) -> None:
+        """Method to learn the `_id` of documents of a National Pokédex Number.
+
+        Args:
+            pokedex_number (int): Target of `national_pokedex_number`.
+            ids (tuple[str, ...]): `_id` of documents in the order
+            of the search.
+        """
+
+        with self._lock:
+            self._ids[pokedex_number] = ids
+
+    def discard(self, pokedex_number: int) -> None:
+        """Method to forget the `_id` of documents
+            of a National Pokédex Number.
+
+        Args:
+            pokedex_number (int): Target of `national_pokedex_number`.
+        """
+
+        with self._lock:
+            self._ids.pop(pokedex_number, None)
+
+    def clear(self) -> None:
+        """Method to forget every learned `_id`."""
+
+        with self._lock:
+            self._ids.clear()
+
+
+pokedex_ids = PokedexIdMap()
+stats = FastPathStats()
+
+
+def get_fast_path_stats() -> dict[str, int]:
+    """Method to get counters of lookups by National Pokédex Number.
+
+    Returns:
+        dict[str, int]: Number of lookups served by `_mget`, by search,
+        and of learned `_id` found to be stale.
+
+    """
+
+    return asdict(stats)
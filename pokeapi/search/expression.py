@@ -0,0 +1,301 @@
+import functools
+import re
+from dataclasses import dataclass
+from typing import Any
+
+# Number of parsed expressions kept by `parse`.
+PARSE_CACHE_SIZE = 1024
+MAX_LENGTH = 1000
+MAX_DEPTH = 32
+
+# Fields compared with one keyword field.
+KEYWORD_FIELDS = {
+    "type_1": "pokemon_type.type_1.keyword",
+    "type_2": "pokemon_type.type_2.keyword",
+    "ability_1": "abilities.ability_1.keyword",
+    "ability_2": "abilities.ability_2.keyword",
+    "hidden_ability": "abilities.hidden_ability.keyword",
+    "form": "form.keyword",
+    "regional_variant": "regional_variant.keyword",
+}
+# Fields compared with any of some keyword fields.
+MULTI_FIELDS = {
+    "type": ["pokemon_type.type_1.keyword", "pokemon_type.type_2.keyword"],
+    "ability": [
+        "abilities.ability_1.keyword",
+        "abilities.ability_2.keyword",
+        "abilities.hidden_ability.keyword",
+    ],
+}
+BOOLEAN_FIELDS = {
+    "is_legendary": "is_legendary",
+    "is_mythical": "is_mythical",
+    "is_mega_evolution": "is_mega_evolution",
+    "is_primal_reversion": "is_primal_reversion",
+    "has_male": "gender_type.has_male",
+    "has_female": "gender_type.has_female",
+}
+INTEGER_FIELDS = {"pokedex_number": "national_pokedex_number"}
+TEXT_FIELDS = {"name": "name"}
+
+_TOKEN = re.compile(
+    r"\s*(?:(?P<paren>[()])"
+    r'|(?P<field>\w+):(?:"(?P<quoted>(?:[^"\\]|\\.)*)"|(?P<value>[^\s()"]+))'
+    r"|(?P<word>[^\s()\"]+))"
+)
+
+
+@dataclass(frozen=True)
+class Term:
+    """Dataclass with a comparison of a field with a value."""
+
+    field: str
+    value: str | int | bool
+
+
+@dataclass(frozen=True)
+class And:
+    """Dataclass with expressions that must all match."""
+
+    operands: tuple["Node", ...]
+
+
+@dataclass(frozen=True)
+class Or:
+    """Dataclass with expressions of which at least one must match."""
+
+    operands: tuple["Node", ...]
+
+
+@dataclass(frozen=True)
+class Not:
+    """Dataclass with an expression that must not match."""
+
+    operand: "Node"
+
+
+Node = Term | And | Or | Not
+
+
+def _convert(field: str, value: str) -> str | int | bool:
+    if field in BOOLEAN_FIELDS:
+        if value.lower() not in ("true", "false"):
+            raise ValueError(f"{field} must be true or false")
+        return value.lower() == "true"
+    if field in INTEGER_FIELDS:
+        if not value.isdecimal():
+            raise ValueError(f"{field} must be an integer")
+        return int(value)
+    if (
+        field in KEYWORD_FIELDS
+        or field in MULTI_FIELDS
+        or field in TEXT_FIELDS
+    ):
+        return value
+
+    raise ValueError(f"unknown field: {field}")
+
+
+def tokenize(text: str) -> list[tuple[str, Any]]:
+    """Method to split an expression into tokens.
+
+    Args:
+        text (str): Expression, such as
+        "(type:ほのお OR type:ドラゴン) AND NOT is_legendary:true".
+
+    Raises:
+        ValueError: If the expression has a character out of place.
+
+    Returns:
+        list[tuple[str, Any]]: Kind and value of each token, which is
+        "(" or ")", a `Term`, or "AND", "OR" or "NOT".
+
+    """
+
+    tokens: list[tuple[str, Any]] = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None:
+            raise ValueError(f"unexpected character at {position}")
+        position = match.end()
+
+        if match["paren"] is not None:
+            tokens.append((match["paren"], None))
+        elif match["field"] is not None:
+            field = match["field"]
+            if match["quoted"] is not None:
+                value = re.sub(r"\\(.)", r"\1", match["quoted"])
+            else:
+                value = match["value"]
+            tokens.append(("term", Term(field, _convert(field, value))))
+        elif match["word"].upper() in ("AND", "OR", "NOT"):
+            tokens.append((match["word"].upper(), None))
+        else:
+            raise ValueError(f"expected field:value, got {match['word']}")
+
+    return tokens
+
+
+class _Parser:
+    def __init__(self, tokens: list[tuple[str, Any]]) -> None:
+        self.tokens = tokens
+        self.position = 0
+        self.depth = 0
+
+    def peek(self) -> str | None:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position][0]
+        return None
+
+    def take(self) -> tuple[str, Any]:
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def enter(self) -> None:
+        # Both parentheses and NOT nest the clause, so both count
+        # towards the depth.
+        self.depth += 1
+        if self.depth > MAX_DEPTH:
+            raise ValueError(f"expression is nested deeper than {MAX_DEPTH}")
+
+    def parse_or(self) -> Node:
+        operands = [self.parse_and()]
+        while self.peek() == "OR":
+            self.take()
+            operands.append(self.parse_and())
+
+        return operands[0] if len(operands) == 1 else Or(tuple(operands))
+
+    def parse_and(self) -> Node:
+        # Operands next to each other without an operator are ANDed.
+        operands = [self.parse_not()]
+        while self.peek() not in (None, "OR", ")"):
+            if self.peek() == "AND":
+                self.take()
+            operands.append(self.parse_not())
+
+        return operands[0] if len(operands) == 1 else And(tuple(operands))
+
+    def parse_not(self) -> Node:
+        if self.peek() == "NOT":
+            self.take()
+            self.enter()
+            node = Not(self.parse_not())
+            self.depth -= 1
+            return node
+
+        return self.parse_atom()
+
+    def parse_atom(self) -> Node:
+        kind = self.peek()
+        if kind == "term":
+            term: Term = self.take()[1]
+            return term
+        if kind != "(":
+            raise ValueError(f"expected field:value or (, got {kind or 'end'}")
+
+        self.take()
+        self.enter()
+        node = self.parse_or()
+        if self.peek() != ")":
+            raise ValueError("expected )")
+        self.take()
+        self.depth -= 1
+
+        return node
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse(text: str) -> Node:
+    """Method to parse a filter expression.
+
+    Terms are `field:value`, with the value in double quotes when it
+    has spaces or parentheses. They are combined with NOT, AND and OR,
+    in order of precedence, and grouped with parentheses. Terms without
+    an operator between them are ANDed. The last `PARSE_CACHE_SIZE`
+    expressions are kept, so that repeated ones are parsed once.
+
+    Args:
+        text (str): Expression, such as
+        "(type:ほのお OR type:ドラゴン) AND NOT is_legendary:true".
+
+    Raises:
+        ValueError: If the expression is invalid or too long.
+
+    Returns:
+        Node: Parsed expression.
+
+    """
+
+    if len(text) > MAX_LENGTH:
+        raise ValueError(f"expression is longer than {MAX_LENGTH}")
+
+    parser = _Parser(tokenize(text))
+    node = parser.parse_or()
+    if parser.peek() is not None:
+        raise ValueError(f"unexpected {parser.peek()}")
+
+    return node
+
+
+def create_clause(node: Node) -> dict[str, Any]:
+    """Method to compile a parsed expression to a query clause
+        for elasticsearch.
+
+    AND, OR and NOT are compiled to `filter`, `should` and `must_not`
+    of nested bool queries, so that the expression is answered in one
+    search in filter context.
+
+    Args:
+        node (Node): Parsed expression.
+
+    Returns:
+        dict[str, Any]: Query clause for elasticsearch.
+
+    """
+
+    match node:
+        case Term(field, value) if field in MULTI_FIELDS:
+            return {
+                "multi_match": {"query": value, "fields": MULTI_FIELDS[field]}
+            }
+        case Term(field, value):
+            target = (
+                KEYWORD_FIELDS | BOOLEAN_FIELDS | INTEGER_FIELDS | TEXT_FIELDS
+            )[field]
+            return {"term": {target: value}}
+        case And(operands):
+            return {"bool": {"filter": [create_clause(o) for o in operands]}}
+        case Or(operands):
+            return {
+                "bool": {
+                    "should": [create_clause(o) for o in operands],
+                    "minimum_should_match": 1,
+                }
+            }
+        case Not(operand):
+            return {"bool": {"must_not": [create_clause(operand)]}}
+
+    raise TypeError(f"unknown node: {node!r}")
+
+
+def get_parse_stats() -> dict[str, Any]:
+    """Method to get counters of the parsed expressions.
+
+    Returns:
+        dict[str, Any]: Numbers of hits and misses of the parsed
+        expressions, and the number and limit of the kept expressions.
+
+    """
+
+    info = parse.cache_info()
+
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+    }
@@ -0,0 +1,236 @@
+import asyncio
+import contextlib
+import functools
+import hashlib
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from elasticsearch import TransportError
+
+from . import (
+    bitmap,
+    breaker,
+    cache,
+    client,
+    config,
+    docmap,
+    membership,
+    singleflight,
+)
+
+# Key of the single-flight call reading the generation.
+_SINGLEFLIGHT_KEY = "generation"
+
+
+@dataclass
+class GenerationStats:
+    """Dataclass with the generation of the index and counters
+    of its checks."""
+
+    generation: str | None = None
+    checks: int = 0
+    changes: int = 0
+    errors: int = 0
+
+
+stats = GenerationStats()
+_checked_at = float("-inf")
+_poller: asyncio.Task | None = None
+
+
+def create_generation(index_stats: dict[str, Any]) -> str:
+    """Method to create the generation of the index from its stats.
+
+    The generation changes whenever a document is indexed or deleted,
+    or the index is recreated, and stays the same while the index
+    is only searched.
+
+    Args:
+        index_stats (dict[str, Any]): Response of the index stats API
+        with the `docs` and `indexing` metrics.
+
+    Returns:
+        str: Generation of the index.
+
+    """
+
+    parts: list[str] = []
+    for name, index in sorted(index_stats["indices"].items()):
+        docs = index["primaries"]["docs"]
+        indexing = index["primaries"].get("indexing", {})
+        parts.append(
+            f"{name}:{index.get('uuid', '')}:{docs['count']}"
+            f":{indexing.get('index_total', 0)}"
+            f":{indexing.get('delete_total', 0)}"
+        )
+
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()[:16]
+
+
+async def get_generation() -> str | None:
+    """Method to get the generation of the index.
+
+    While `poll_generation` is running, the last generation it read
+    is returned without waiting for elasticsearch. Otherwise the
+    generation is read at most once every `ES_GENERATION_TTL` seconds.
+
+    Returns:
+        str | None: Generation of the index, or None when
+        elasticsearch has not told it yet.
+
+    """
+
+    conf = config.get_config()
+    if (_poller is not None and not _poller.done()) or (
+        time.monotonic() - _checked_at < conf.ES_GENERATION_TTL
+    ):
+        return stats.generation
+
+    return await refresh_generation()
+
+
+async def refresh_generation() -> str | None:
+    """Method to read the generation of the index from elasticsearch.
+
+    Concurrent reads share one request, which waits at most
+    `ES_GENERATION_TIMEOUT` seconds and goes through the circuit breaker
+    when `ES_BREAKER_ENABLED` is set. When the generation has changed,
+    the cached responses and learned `_id` are dropped, and the filter
+    of `membership` and the bitsets of `bitmap` are rebuilt.
+    When it cannot be read, the last known generation is kept.
+
+    Returns:
+        str | None: Generation of the index, or None when
+        elasticsearch has not told it yet.
+
+    """
+
+    global _checked_at
+
+    conf = config.get_config()
+
+    async def fetch() -> str | None:
+        read_stats = functools.partial(
+            client.get_async_client().indices.stats,
+            index=conf.ES_INDEX,
+            metric="docs,indexing",
+            request_timeout=conf.ES_GENERATION_TIMEOUT,
+        )
+        try:
+            if conf.ES_BREAKER_ENABLED:
+                index_stats = await breaker.get_breaker().call_async(
+                    read_stats
+                )
+            else:
+                index_stats = await read_stats()
+        except (TransportError, breaker.CircuitOpenError):
+            stats.errors += 1
+            return None
+
+        return create_generation(index_stats)
+
+    generation = await singleflight.get_async_singleflight().do(
+        _SINGLEFLIGHT_KEY, fetch
+    )
+    _checked_at = time.monotonic()
+    stats.checks += 1
+
+    if generation is not None and generation != stats.generation:
+        if stats.generation is not None:
+            stats.changes += 1
+            invalidate()
+        stats.generation = generation
+        membership.on_generation(generation)
+        bitmap.on_generation(generation)
+
+    return stats.generation
+
+
+def get_key_prefix() -> str:
+    """Method to get the prefix of the keys of cached responses.
+
+    Responses cached under another generation are never read again,
+    including ones loaded while the generation changed and ones
+    in the cache shared by workers that have not seen the change yet.
+
+    Returns:
+        str: Last known generation followed by a colon,
+        or an empty string when it is unknown.
+
+    """
+
+    generation = stats.generation
+
+    return f"{generation}:" if generation is not None else ""
+
+
+def invalidate() -> None:
+    """Method to drop every response cached in the process
+    and every learned `_id`."""
+
+    cache.clear_cache()
+    docmap.pokedex_ids.clear()
+
+
+async def poll_generation(interval: float) -> None:
+    """Method to read the generation of the index periodically.
+
+    A read that fails for any reason is counted in `errors`,
+    and the next one is made after `interval` as usual.
+
+    Args:
+        interval (float): Seconds between reads.
+    """
+
+    while True:
+        try:
+            await refresh_generation()
+        except Exception:
+            stats.errors += 1
+        await asyncio.sleep(interval)
+
+
+def start_polling() -> None:
+    """Method to start reading the generation every
+    `ES_GENERATION_POLL_INTERVAL` seconds in the running event loop,
+    unless it is 0."""
+
+    global _poller
+
+    interval = config.get_config().ES_GENERATION_POLL_INTERVAL
+    if interval > 0 and _poller is None:
+        _poller = asyncio.create_task(poll_generation(interval))
+
+
+async def stop_polling() -> None:
+    """Method to stop reading the generation periodically."""
+
+    global _poller
+
+    if _poller is not None:
+        _poller.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _poller
+        _poller = None
+
+
+def reset_generation() -> None:
+    """Method to forget the generation, so that it is read again."""
+
+    global _checked_at
+
+    stats.generation = None
+    _checked_at = float("-inf")
+
+
+def get_generation_stats() -> dict[str, Any]:
+    """Method to get the generation of the index and counters of its checks.
+
+    Returns:
+        dict[str, Any]: Last known generation, and number of checks,
+        of changes seen and of failed checks.
+
+    """
+
+    return asdict(stats)
@@ -0,0 +1,253 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, TypeVar
+
+from . import config
+
+T = TypeVar("T")
+
+# Upper bound of unused hedges, so that a long quiet period
+# does not allow a burst of hedges.
+MAX_TOKENS = 10.0
+
+
+@dataclass
+class HedgeStats:
+    """Dataclass with counters of the hedged requests of `Hedger`."""
+
+    requests: int = 0
+    fired: int = 0
+    won: int = 0
+    denied: int = 0
+
+
+class LatencyTracker:
+    """Class that keeps the latency of the most recent requests.
+
+    Percentiles are read from a sorted copy of the latencies, which is
+    sorted again only after `refresh` latencies have been recorded,
+    or fewer while there are fewer than `refresh` of them.
+
+    Args:
+        size (int): Number of latencies to keep.
+        refresh (int): Number of latencies recorded between sorts.
+    """
+
+    def __init__(self, size: int, refresh: int = 100) -> None:
+        self._latencies: deque[float] = deque(maxlen=size)
+        self._refresh = refresh
+        self._sorted: list[float] = []
+        self._recorded = 0
+
+    def __len__(self) -> int:
+        return len(self._latencies)
+
+    def record(self, latency: float) -> None:
+        """Method to record the latency of a request.
+
+        Args:
+            latency (float): Seconds the request took.
+        """
+
+        self._latencies.append(latency)
+        self._recorded += 1
+
+    def percentile(self, percentile: float) -> float:
+        """Method to get a percentile of the recorded latencies.
+
+        Args:
+            percentile (float): Percentile between 0 and 100.
+
+        Returns:
+            float: Latency in seconds, or 0.0 without any latency.
+
+        """
+
+        if self._recorded >= min(self._refresh, max(len(self._sorted), 1)):
+            self._sorted = sorted(self._latencies)
+            self._recorded = 0
+
+        latencies = self._sorted
+        if not latencies:
+            return 0.0
+
+        index = round(percentile / 100 * (len(latencies) - 1))
+
+        return latencies[index]
+
+
+class Hedger:
+    """Class that sends a duplicate request when the first one is slow.
+
+    When a request has not been answered after the `percentile` of recent
+    latencies, a hedged request is sent and the first successful response
+    wins. Each request earns `budget` of a hedge, so that hedges add
+    at most `budget` of extra requests. A first request cancelled for
+    a hedge records the seconds it waited, so that the latencies keep
+    the slow requests that were hedged.
+
+    Args:
+        percentile (float): Percentile of latencies to wait before hedging.
+        budget (float): Ratio of hedges to requests.
+        min_delay (float): Minimum seconds to wait before hedging.
+        min_samples (int): Number of latencies needed before hedging.
+        window (int): Number of recent latencies to keep.
+    """
+
+    def __init__(
+        self,
+        percentile: float,
+        budget: float,
+        min_delay: float,
+        min_samples: int,
+        window: int = 1000,
+    ) -> None:
+        self.percentile = percentile
+        self.budget = budget
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.latencies = LatencyTracker(window)
+        self.stats = HedgeStats()
+        self._tokens = 0.0
+
+    def delay(self) -> float | None:
+        """Method to get the seconds to wait before hedging a request.
+
+        Returns:
+            float | None: Delay before hedging, or None while there are
+            not enough latencies to estimate it.
+
+        """
+
+        if len(self.latencies) < self.min_samples:
+            return None
+
+        return max(self.latencies.percentile(self.percentile), self.min_delay)
+
+    async def run(self, fn: Callable[[bool], Awaitable[T]]) -> T:
+        """Method to await `fn`, hedging it when it is slow.
+
+        Args:
+            fn (Callable): Function returning the awaitable of a request.
+            It is called with True for the hedged request.
+
+        Returns:
+            T: First successful result of the requests.
+
+        """
+
+        self.stats.requests += 1
+        self._tokens = min(self._tokens + self.budget, MAX_TOKENS)
+
+        primary = asyncio.ensure_future(self._timed(fn(False), True))
+        tasks = [primary]
+        try:
+            delay = self.delay()
+            if delay is None:
+                return await primary
+
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return primary.result()
+
+            if self._tokens < 1.0:
+                self.stats.denied += 1
+                return await primary
+
+            self._tokens -= 1.0
+            self.stats.fired += 1
+            hedge = asyncio.ensure_future(self._timed(fn(True)))
+            tasks.append(hedge)
+
+            return await self._first(primary, hedge)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _first(
+        self, primary: asyncio.Future[T], hedge: asyncio.Future[T]
+    ) -> T:
+        pending = {primary, hedge}
+        errors: list[BaseException] = []
+
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                error = task.exception()
+                if error is not None:
+                    errors.append(error)
+                    continue
+
+                if task is hedge:
+                    self.stats.won += 1
+                return task.result()
+
+        raise errors[0]
+
+    async def _timed(
+        self, awaitable: Awaitable[T], record_cancelled: bool = False
+    ) -> T:
+        start = time.monotonic()
+        try:
+            result = await awaitable
+        except asyncio.CancelledError:
+            if record_cancelled:
+                self.latencies.record(time.monotonic() - start)
+            raise
+        self.latencies.record(time.monotonic() - start)
+
+        return result
+
+
+_hedger: Hedger | None = None
+
+
+def get_hedger() -> Hedger:
+    """Method to get the process-wide hedger of searches.
+
+    Returns:
+        Hedger: Hedger configured by `ES_HEDGE_PERCENTILE`,
+        `ES_HEDGE_BUDGET`, `ES_HEDGE_MIN_DELAY_MS`
+        and `ES_HEDGE_MIN_SAMPLES`.
+
+    """
+
+    global _hedger
+
+    if _hedger is None:
+        conf = config.get_config()
+        _hedger = Hedger(
+            conf.ES_HEDGE_PERCENTILE,
+            conf.ES_HEDGE_BUDGET,
+            conf.ES_HEDGE_MIN_DELAY_MS / 1000,
+            conf.ES_HEDGE_MIN_SAMPLES,
+        )
+
+    return _hedger
+
+
+def get_hedge_stats() -> dict[str, Any]:
+    """Method to get counters of the hedged requests.
+
+    Returns:
+        dict[str, Any]: Number of requests, of hedges fired, won and denied
+        by the budget, and the current delay before hedging.
+
+    """
+
+    hedger = _hedger
+    stats = hedger.stats if hedger is not None else HedgeStats()
+    delay = hedger.delay() if hedger is not None else None
+
+    return {
+        "requests": stats.requests,
+        "fired": stats.fired,
+        "won": stats.won,
+        "denied": stats.denied,
+        "delay_ms": delay * 1000 if delay is not None else None,
+    }
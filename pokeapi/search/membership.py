@@ -0,0 +1,267 @@
+import asyncio
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from elasticsearch import TransportError
+
+from . import cache, client, config
+
+POKEDEX_NUMBER = "pokedex_number"
+NAME = "name"
+# Whole names of `name.keyword`, which the batch lookup is compared with.
+NAME_KEYWORD = "name_keyword"
+# Upper bound of the buckets of the aggregations building the filter,
+# which is `search.max_buckets` by default.
+MAX_TERMS = 10000
+
+
+@dataclass
+class MembershipStats:
+    """Dataclass with counters of the lookups answered without
+    elasticsearch."""
+
+    generation: str | None = None
+    pokedex_numbers: int = 0
+    names: int = 0
+    rebuilds: int = 0
+    filtered: int = 0
+    negative_hits: int = 0
+    saved: int = 0
+
+
+@dataclass(frozen=True)
+class MembershipFilter:
+    """Dataclass with every National Pokédex Number, every term
+    of `name` and every whole name in the index at a generation.
+
+    Terms of `name` are the tokens elasticsearch indexed, which are
+    what the `term` query of `CreateNameParam` is compared with,
+    so a name that is not one of them matches no Pokémon.
+    Whole names are the values of `name.keyword`, which the batch
+    lookup of `CreateNamesParam` is compared with.
+    """
+
+    generation: str
+    pokedex_numbers: frozenset[int]
+    names: frozenset[str]
+    name_keywords: frozenset[str] = frozenset()
+
+    def may_contain(self, kind: str, value: int | str) -> bool:
+        """Method to decide whether a lookup may find Pokémon.
+
+        Args:
+            kind (str): "pokedex_number", "name" or "name_keyword".
+            value (int | str): Target of the lookup.
+
+        Returns:
+            bool: False when the lookup finds no Pokémon for sure.
+
+        """
+
+        if kind == POKEDEX_NUMBER:
+            return value in self.pokedex_numbers
+        if kind == NAME:
+            return value in self.names
+        if kind == NAME_KEYWORD:
+            return value in self.name_keywords
+
+        return True
+
+
+stats = MembershipStats()
+_filter: MembershipFilter | None = None
+_negative_cache: cache.ResponseCache | None = None
+_rebuild: asyncio.Task | None = None
+
+
+async def build_filter(index_generation: str) -> MembershipFilter | None:
+    """Method to read the National Pokédex Numbers and terms of `name`
+        of the index.
+
+    The numbers and names are read with terms aggregations, and the
+    names are kept whole as well as split into terms by the analyzer
+    of `name`.
+
+    Args:
+        index_generation (str): Generation of the index being read.
+
+    Returns:
+        MembershipFilter | None: Filter of the index, or None when
+        the index has more values than the aggregations return.
+
+    """
+
+    conf = config.get_config()
+    es = client.get_async_client()
+    response = await es.search(
+        index=conf.ES_INDEX,
+        body={
+            "size": 0,
+            "track_total_hits": True,
+            "aggs": {
+                POKEDEX_NUMBER: {
+                    "terms": {
+                        "field": "national_pokedex_number",
+                        "size": MAX_TERMS,
+                    }
+                },
+                NAME: {"terms": {"field": "name.keyword", "size": MAX_TERMS}},
+            },
+        },
+        request_timeout=conf.ES_TIMEOUT,
+    )
+
+    aggregations = response["aggregations"]
+    total = response["hits"]["total"]["value"]
+    name_buckets = aggregations[NAME]["buckets"]
+    # Names longer than `ignore_above` of `name.keyword` are not counted,
+    # and those Pokémon could not be told apart from missing ones.
+    if any(agg["sum_other_doc_count"] for agg in aggregations.values()) or (
+        sum(bucket["doc_count"] for bucket in name_buckets) != total
+    ):
+        return None
+
+    names: set[str] = set()
+    if name_buckets:
+        analyzed = await es.indices.analyze(
+            index=conf.ES_INDEX,
+            body={
+                "field": "name",
+                "text": [bucket["key"] for bucket in name_buckets],
+            },
+            request_timeout=conf.ES_TIMEOUT,
+        )
+        names = {token["token"] for token in analyzed["tokens"]}
+
+    return MembershipFilter(
+        index_generation,
+        frozenset(
+            bucket["key"] for bucket in aggregations[POKEDEX_NUMBER]["buckets"]
+        ),
+        frozenset(names),
+        frozenset(bucket["key"] for bucket in name_buckets),
+    )
+
+
+async def rebuild(index_generation: str) -> None:
+    """Method to replace the filter with one of a generation.
+
+    The filter is kept only if the generation is still the current one
+    when it has been read.
+
+    Args:
+        index_generation (str): Generation of the index.
+    """
+
+    global _filter
+
+    try:
+        membership_filter = await build_filter(index_generation)
+    except TransportError:
+        return
+
+    if membership_filter is None or stats.generation != index_generation:
+        return
+
+    _filter = membership_filter
+    stats.pokedex_numbers = len(membership_filter.pokedex_numbers)
+    stats.names = len(membership_filter.names)
+    stats.rebuilds += 1
+
+
+def on_generation(index_generation: str) -> None:
+    """Method to drop the filter and negative results of the previous
+        generation, and to build the filter of a new one in the background.
+
+    Args:
+        index_generation (str): New generation of the index.
+    """
+
+    global _filter, _rebuild
+
+    _filter = None
+    stats.generation = index_generation
+    stats.pokedex_numbers = stats.names = 0
+    if _negative_cache is not None:
+        _negative_cache.clear()
+
+    if config.get_config().ES_MEMBERSHIP_ENABLED:
+        _rebuild = asyncio.create_task(rebuild(index_generation))
+
+
+def is_missing(kind: str, value: int | str) -> bool:
+    """Method to decide whether a lookup finds no Pokémon
+        without asking elasticsearch.
+
+    Args:
+        kind (str): "pokedex_number", "name" or "name_keyword".
+        value (int | str): Target of the lookup.
+
+    Returns:
+        bool: True when the filter or the negative cache tells
+        that the lookup finds no Pokémon.
+
+    """
+
+    membership_filter = _filter
+    if membership_filter is not None and not membership_filter.may_contain(
+        kind, value
+    ):
+        stats.filtered += 1
+        stats.saved += 1
+        return True
+
+    if (
+        _negative_cache is not None
+        and _negative_cache.get(f"{kind}:{value}") is not None
+    ):
+        stats.negative_hits += 1
+        stats.saved += 1
+        return True
+
+    return False
+
+
+def record_missing(kind: str, value: int | str) -> None:
+    """Method to remember for `ES_NEGATIVE_CACHE_TTL` seconds
+        that a lookup found no Pokémon.
+
+    Args:
+        kind (str): "pokedex_number", "name" or "name_keyword".
+        value (int | str): Target of the lookup.
+    """
+
+    global _negative_cache
+
+    conf = config.get_config()
+    if conf.ES_NEGATIVE_CACHE_TTL <= 0:
+        return
+
+    if _negative_cache is None:
+        _negative_cache = cache.ResponseCache(
+            conf.ES_NEGATIVE_CACHE_MAX_ENTRIES, policy=cache.LRU
+        )
+    _negative_cache.put(f"{kind}:{value}", True, conf.ES_NEGATIVE_CACHE_TTL)
+
+
+def reset_membership() -> None:
+    """Method to forget the filter and the negative results."""
+
+    global _filter, _negative_cache
+
+    _filter = None
+    _negative_cache = None
+    stats.generation = None
+
+
+def get_membership_stats() -> dict[str, Any]:
+    """Method to get counters of the lookups answered without elasticsearch.
+
+    Returns:
+        dict[str, Any]: Generation and size of the filter, number of its
+        rebuilds, of lookups answered by the filter and by the negative
+        cache, and of calls to elasticsearch saved by them.
+
+    """
+
+    return asdict(stats)
@@ -0,0 +1,680 @@
+import bisect
+import functools
+import hashlib
+import json
+import re
+import threading
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from elasticsearch import NotFoundError, RequestError
+
+from . import backend, config, raw
+from .bitset import BitmapIndex, UnsupportedQueryError
+
+# Number of hits of a search without `size`, as in elasticsearch.
+DEFAULT_SIZE = 10
+
+_KANA_OR_HAN = (
+    "\u3041-\u30ff\u31f0-\u31ff\u3400-\u4dbf\u4e00-\u9fff"
+    "\uf900-\ufaff\uff66-\uff9f"
+)
+# Tokens of the standard tokenizer of elasticsearch: a run of katakana,
+# a single hiragana or ideograph, or a run of other letters and digits.
+_TOKEN = re.compile(
+    "[\u30a0-\u30fa\u30fc-\u30ff\u31f0-\u31ff\uff66-\uff9f]+"
+    "|[\u3041-\u309f\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]"
+    f"|(?:(?![{_KANA_OR_HAN}])[^\\W_])+"
+)
+
+# Fields to sort by, and whether each is sorted in descending order.
+_Sort = tuple[tuple[str, bool], ...]
+
+
+@dataclass
+class MemoryStats:
+    """Dataclass with counters of the in-memory backend."""
+
+    documents: int = 0
+    loads: int = 0
+    searches: int = 0
+    mgets: int = 0
+
+
+stats = MemoryStats()
+_index: "MemoryIndex | None" = None
+_lock = threading.Lock()
+
+
+def analyze(text: str) -> list[str]:
+    """Method to split text into tokens as the standard analyzer
+        of elasticsearch does.
+
+    Args:
+        text (str): Text of a field or of a query.
+
+    Returns:
+        list[str]: Lowercased tokens of the text.
+
+    """
+
+    return [token.lower() for token in _TOKEN.findall(text)]
+
+
+def _bad_query(reason: str) -> RequestError:
+    return RequestError(
+        400,
+        "parsing_exception",
+        {"error": {"type": "parsing_exception", "reason": reason}},
+    )
+
+
+def _missing_pit() -> NotFoundError:
+    return NotFoundError(
+        404,
+        "search_context_missing_exception",
+        {"error": {"type": "search_context_missing_exception"}},
+    )
+
+
+def _clauses(value: Any) -> list[Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _compare(a: list[Any], b: list[Any], descending: list[bool]) -> int:
+    # Missing values are sorted last in either order, as in elasticsearch.
+    for x, y, desc in zip(a, b, descending):
+        if x == y:
+            continue
+        if x is None:
+            return 1
+        if y is None:
+            return -1
+        result = -1 if x < y else 1
+        return -result if desc else result
+
+    return 0
+
+
+def _parse_sort(value: Any) -> _Sort:
+    sort: list[tuple[str, bool]] = []
+    for item in _clauses(value):
+        if not isinstance(item, dict):
+            item = {item: "asc"}
+        for field, order in item.items():
+            if isinstance(order, dict):
+                order = order.get("order", "asc")
+            sort.append((field, order == "desc"))
+
+    return tuple(sort)
+
+
+def _coerce(value: Any, like: Any) -> Any:
+    # Values of `search_after` may come back as strings from a cursor.
+    if isinstance(like, (int, float)) and isinstance(value, str):
+        return float(value)
+    if isinstance(like, str) and not isinstance(value, (str, type(None))):
+        return str(value)
+    return value
+
+
+def _filter_path(value: Any, paths: list[list[str]]) -> Any:
+    if isinstance(value, list):
+        return [_filter_path(item, paths) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    filtered: dict[str, Any] = {}
+    for key, item in value.items():
+        rest = [p[1:] for p in paths if p[0] in (key, "*")]
+        if not rest:
+            continue
+        if any(not p for p in rest):
+            filtered[key] = item
+        else:
+            item = _filter_path(item, rest)
+            if item or item == 0 or item is False:
+                filtered[key] = item
+
+    return filtered
+
+
+class MemoryIndex(BitmapIndex):
+    """Class holding the documents of an index in memory,
+        with a bitset of the documents having each value of each field.
+
+    String fields are analyzed by `analyze` into their text field,
+    as well as indexed in their keyword subfield. Documents are not
+    scored, so searches without `sort` return them in the order
+    of the dump.
+
+    Args:
+        name (str): Name of the index.
+        docs (list[tuple[str, dict[str, Any]]]): `_id` and `_source`
+        of each document.
+        uuid (str): Identifier of the contents of the index.
+    """
+
+    def __init__(
+        self, name: str, docs: list[tuple[str, dict[str, Any]]], uuid: str
+    ) -> None:
+        super().__init__(docs, analyze)
+        self.name = name
+        self.uuid = uuid
+        self.positions_of_ids = {
+            doc_id: i for i, doc_id in enumerate(self.ids)
+        }
+        self._orders: dict[_Sort, tuple[list[int], list[int]]] = {}
+
+    def sort_value(self, position: int, field: str) -> Any:
+        """Method to get the value a document is sorted by.
+
+        Args:
+            position (int): Position of the document.
+            field (str): Path of the field, "_id", or the keyword
+            subfield of a text field.
+
+        Returns:
+            Any: Value of the field, or None when it is missing.
+
+        """
+
+        if field == "_id":
+            return self.ids[position]
+        if field.endswith(".keyword") and field not in self.values[position]:
+            field = field[: -len(".keyword")]
+
+        return self.values[position].get(field)
+
+    def _order(self, sort: _Sort) -> tuple[list[int], list[int]]:
+        # Every document is sorted once for each `sort`, and hits are
+        # sorted by their rank in that order.
+        order = self._orders.get(sort)
+        if order is None:
+            fields = [field for field, _ in sort]
+            descending = [desc for _, desc in sort]
+
+            def compare(a: int, b: int) -> int:
+                return _compare(
+                    [self.sort_value(a, f) for f in fields],
+                    [self.sort_value(b, f) for f in fields],
+                    descending,
+                )
+
+            positions = sorted(
+                range(len(self)), key=functools.cmp_to_key(compare)
+            )
+            ranks = [0] * len(positions)
+            for rank, position in enumerate(positions):
+                ranks[position] = rank
+            order = self._orders[sort] = (positions, ranks)
+
+        return order
+
+    def _search_after(
+        self, positions: list[int], sort: _Sort, after: list[Any]
+    ) -> list[int]:
+        fields = [field for field, _ in sort]
+        descending = [desc for _, desc in sort]
+
+        def compare_after(position: int) -> int:
+            values = [self.sort_value(position, f) for f in fields]
+            return _compare(
+                values,
+                [_coerce(a, v) for a, v in zip(after, values)],
+                descending,
+            )
+
+        # Positions are sorted, so those after `after` are a suffix.
+        start = bisect.bisect_right(positions, 0, key=compare_after)
+
+        return positions[start:]
+
+    def search(self, body: dict[str, Any]) -> dict[str, Any]:
+        """Method to answer a search request of elasticsearch.
+
+        Args:
+            body (dict[str, Any]): Body of the search request, with
+            `query`, `size`, `from`, `sort`, `search_after`,
+            `track_total_hits` and terms aggregations in `aggs`.
+
+        Raises:
+            RequestError: If the body has an unsupported query.
+
+        Returns:
+            dict[str, Any]: Search response of elasticsearch.
+
+        """
+
+        try:
+            matched = self.evaluate(body.get("query", {"match_all": {}}))
+        except UnsupportedQueryError as e:
+            raise _bad_query(str(e)) from e
+        total = self.count(matched)
+        sort = _parse_sort(body.get("sort"))
+
+        fields = [field for field, _ in sort]
+        if sort:
+            order, ranks = self._order(sort)
+            if total * 8 < len(order):
+                positions = sorted(
+                    self.positions(matched), key=ranks.__getitem__
+                )
+            else:
+                positions = [p for p in order if matched >> p & 1]
+
+            if body.get("search_after") is not None:
+                positions = self._search_after(
+                    positions, sort, body["search_after"]
+                )
+        else:
+            positions = list(self.positions(matched))
+
+        offset = body.get("from", 0)
+        end = offset + body.get("size", DEFAULT_SIZE)
+        hits: list[dict[str, Any]] = []
+        for position in positions[offset:end]:
+            hit: dict[str, Any] = {
+                "_index": self.name,
+                "_type": "_doc",
+                "_id": self.ids[position],
+                "_score": None if sort else 0.0,
+                "_source": self.sources[position],
+            }
+            if sort:
+                hit["sort"] = [self.sort_value(position, f) for f in fields]
+            hits.append(hit)
+
+        response_hits: dict[str, Any] = {}
+        track_total_hits = body.get("track_total_hits", True)
+        if track_total_hits is True or (
+            track_total_hits is not False and total <= int(track_total_hits)
+        ):
+            response_hits["total"] = {"value": total, "relation": "eq"}
+        elif track_total_hits is not False:
+            response_hits["total"] = {
+                "value": int(track_total_hits),
+                "relation": "gte",
+            }
+        response_hits["max_score"] = None if sort else 0.0
+        response_hits["hits"] = hits
+
+        response: dict[str, Any] = {
+            "took": 0,
+            "timed_out": False,
+            "_shards": {
+                "total": 1,
+                "successful": 1,
+                "skipped": 0,
+                "failed": 0,
+            },
+            "hits": response_hits,
+        }
+        aggs = body.get("aggs", body.get("aggregations"))
+        if aggs:
+            response["aggregations"] = {
+                name: self._aggregate(agg, matched)
+                for name, agg in aggs.items()
+            }
+
+        return response
+
+    def _aggregate(self, agg: dict[str, Any], matched: int) -> dict[str, Any]:
+        terms = agg.get("terms")
+        if len(agg) != 1 or terms is None:
+            raise _bad_query(f"unsupported aggregation: {list(agg)}")
+
+        field = terms["field"]
+        if field in self.text_fields:
+            raise _bad_query(f"text field [{field}] cannot be aggregated")
+
+        counts = [
+            (value, self.count(bits & matched))
+            for value, bits in self.bitsets.get(field, {}).items()
+        ]
+        counts = sorted(
+            ((value, count) for value, count in counts if count),
+            key=lambda item: (-item[1], item[0]),
+        )
+        size = terms.get("size", DEFAULT_SIZE)
+
+        buckets: list[dict[str, Any]] = []
+        for value, count in counts[:size]:
+            if isinstance(value, bool):
+                buckets.append(
+                    {
+                        "key": int(value),
+                        "key_as_string": str(value).lower(),
+                        "doc_count": count,
+                    }
+                )
+            else:
+                buckets.append({"key": value, "doc_count": count})
+
+        return {
+            "doc_count_error_upper_bound": 0,
+            "sum_other_doc_count": sum(count for _, count in counts[size:]),
+            "buckets": buckets,
+        }
+
+    def get(self, doc_id: str) -> dict[str, Any]:
+        """Method to answer a document of a get request of elasticsearch.
+
+        Args:
+            doc_id (str): `_id` of the document.
+
+        Returns:
+            dict[str, Any]: Document with `found` set,
+            or `found` unset when it is not in the index.
+
+        """
+
+        position = self.positions_of_ids.get(str(doc_id))
+        if position is None:
+            return {
+                "_index": self.name,
+                "_type": "_doc",
+                "_id": doc_id,
+                "found": False,
+            }
+
+        return {
+            "_index": self.name,
+            "_type": "_doc",
+            "_id": self.ids[position],
+            "_version": 1,
+            "_seq_no": position,
+            "_primary_term": 1,
+            "found": True,
+            "_source": self.sources[position],
+        }
+
+    def analyze_field(
+        self, field: str | None, text: str | list[str]
+    ) -> list[str]:
+        """Method to analyze text with the analyzer of a field.
+
+        Args:
+            field (str | None): Path of the field. Text fields and
+            requests without a field use the standard analyzer,
+            and other fields keep the text as one token.
+            text (str | list[str]): Text to analyze.
+
+        Returns:
+            list[str]: Tokens of the text.
+
+        """
+
+        texts = text if isinstance(text, list) else [text]
+        if field is not None and field not in self.text_fields:
+            return texts
+
+        return [token for t in texts for token in analyze(t)]
+
+
+class MemoryBackend(backend.SearchBackend):
+    """Backend answering the requests of the accessors from a `MemoryIndex`
+        in the process, without elasticsearch.
+
+    The backend holds one index, so the index of requests is not checked.
+    A point in time keeps the `MemoryIndex` it was opened on.
+
+    Args:
+        index (MemoryIndex): Index to search.
+    """
+
+    def __init__(self, index: MemoryIndex) -> None:
+        self.index = index
+        self.indices = _MemoryIndices(self)
+        self._pits: dict[str, MemoryIndex] = {}
+
+    def search(
+        self,
+        body: dict[str, Any] | None = None,
+        filter_path: str | None = None,
+        headers: dict[str, str] | None = None,
+        **params: Any,
+    ) -> Any:
+        stats.searches += 1
+        body = body or {}
+        target = self.index
+        pit = body.get("pit")
+        if pit is not None:
+            if pit["id"] not in self._pits:
+                raise _missing_pit()
+            target = self._pits[pit["id"]]
+
+        response = target.search(body)
+        if pit is not None:
+            response["pit_id"] = pit["id"]
+
+        return self._respond(response, filter_path, headers)
+
+    def msearch(self, body: list[dict[str, Any]], **params: Any) -> Any:
+        responses: list[dict[str, Any]] = []
+        for query in body[1::2]:
+            try:
+                responses.append({**self.search(body=query), "status": 200})
+            except RequestError as e:
+                error = (
+                    e.info.get("error") if isinstance(e.info, dict) else None
+                )
+                responses.append({"error": error, "status": e.status_code})
+
+        return {"took": 0, "responses": responses}
+
+    def mget(self, body: dict[str, Any], **params: Any) -> Any:
+        stats.mgets += 1
+        ids = body.get("ids") or [doc["_id"] for doc in body.get("docs", [])]
+
+        return {"docs": [self.index.get(doc_id) for doc_id in ids]}
+
+    def open_point_in_time(self, **params: Any) -> Any:
+        pit_id = uuid.uuid4().hex
+        self._pits[pit_id] = self.index
+
+        return {"id": pit_id}
+
+    def close_point_in_time(
+        self,
+        body: dict[str, Any],
+        ignore: int | tuple[int, ...] = (),
+        **params: Any,
+    ) -> Any:
+        if self._pits.pop(body["id"], None) is not None:
+            return {"succeeded": True, "num_freed": 1}
+        if 404 not in _clauses(ignore):
+            raise _missing_pit()
+
+        return {"succeeded": True, "num_freed": 0}
+
+    def ping(self, **params: Any) -> bool:
+        return True
+
+    def close(self) -> None:
+        self._pits.clear()
+
+    def _respond(
+        self,
+        response: dict[str, Any],
+        filter_path: str | None,
+        headers: dict[str, str] | None,
+    ) -> Any:
+        if filter_path:
+            response = _filter_path(
+                response, [path.split(".") for path in filter_path.split(",")]
+            )
+        if headers and raw.RAW_HEADER in headers:
+            return json.dumps(response, ensure_ascii=False)
+
+        return response
+
+
+class _MemoryIndices:
+    def __init__(self, memory_backend: MemoryBackend) -> None:
+        self._backend = memory_backend
+
+    def stats(self, index: str | None = None, **params: Any) -> Any:
+        memory_index = self._backend.index
+        count = len(memory_index.ids)
+
+        return {
+            "indices": {
+                index
+                or memory_index.name: {
+                    "uuid": memory_index.uuid,
+                    "primaries": {
+                        "docs": {"count": count, "deleted": 0},
+                        "indexing": {"index_total": count, "delete_total": 0},
+                    },
+                }
+            }
+        }
+
+    def analyze(self, body: dict[str, Any], **params: Any) -> Any:
+        tokens = self._backend.index.analyze_field(
+            body.get("field"), body["text"]
+        )
+
+        return {
+            "tokens": [
+                {"token": token, "type": "<ALPHANUM>", "position": position}
+                for position, token in enumerate(tokens)
+            ]
+        }
+
+
+class AsyncMemoryBackend(backend.AsyncSearchBackend):
+    """Async variant of `MemoryBackend`.
+
+    Requests are answered without awaiting anything, as the index
+    is in the process.
+
+    Args:
+        index (MemoryIndex): Index to search.
+    """
+
+    def __init__(self, index: MemoryIndex) -> None:
+        self.sync = MemoryBackend(index)
+        self.indices = _AsyncMemoryIndices(self.sync.indices)
+
+    async def search(self, **kwargs: Any) -> Any:
+        return self.sync.search(**kwargs)
+
+    async def msearch(self, **kwargs: Any) -> Any:
+        return self.sync.msearch(**kwargs)
+
+    async def mget(self, **kwargs: Any) -> Any:
+        return self.sync.mget(**kwargs)
+
+    async def open_point_in_time(self, **kwargs: Any) -> Any:
+        return self.sync.open_point_in_time(**kwargs)
+
+    async def close_point_in_time(self, **kwargs: Any) -> Any:
+        return self.sync.close_point_in_time(**kwargs)
+
+    async def ping(self, **kwargs: Any) -> bool:
+        return self.sync.ping(**kwargs)
+
+    async def close(self) -> None:
+        self.sync.close()
+
+    async def __aenter__(self) -> "AsyncMemoryBackend":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+
+class _AsyncMemoryIndices:
+    def __init__(self, indices: _MemoryIndices) -> None:
+        self._indices = indices
+
+    async def stats(self, **kwargs: Any) -> Any:
+        return self._indices.stats(**kwargs)
+
+    async def analyze(self, **kwargs: Any) -> Any:
+        return self._indices.analyze(**kwargs)
+
+
+def load_index(path: str, name: str | None = None) -> MemoryIndex:
+    """Method to load a dump of elasticdump into memory.
+
+    Each line of the dump is a document with `_index`, `_id`
+    and `_source`, as in `docker/elasticdump/src/pokemon_data.json`.
+    A document replaces an earlier one with the same `_id`.
+
+    Args:
+        path (str): Path of the dump.
+        name (str | None): Name of the index. `_index` of the first
+        document is used when it is None.
+
+    Returns:
+        MemoryIndex: Index with the documents of the dump.
+
+    """
+
+    with open(path, "rb") as f:
+        data = f.read()
+
+    docs: dict[str, dict[str, Any]] = {}
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+
+        doc = json.loads(line)
+        name = name or doc.get("_index")
+        docs[str(doc["_id"])] = doc["_source"]
+
+    return MemoryIndex(
+        name or "", list(docs.items()), hashlib.sha256(data).hexdigest()[:22]
+    )
+
+
+def get_index() -> MemoryIndex:
+    """Method to get the process-wide index loaded from `ES_MEMORY_PATH`.
+
+    The dump is loaded on first use, which is on startup
+    when the application lifespan opens the clients.
+
+    Returns:
+        MemoryIndex: Process-wide index.
+
+    """
+
+    global _index
+
+    with _lock:
+        if _index is None:
+            conf = config.get_config()
+            _index = load_index(conf.ES_MEMORY_PATH, conf.ES_INDEX)
+            stats.documents = len(_index.ids)
+            stats.loads += 1
+
+        return _index
+
+
+def reset_index() -> None:
+    """Method to drop the process-wide index, so that the dump
+    is loaded again on next use."""
+
+    global _index
+
+    with _lock:
+        _index = None
+        stats.documents = 0
+
+
+def get_memory_stats() -> dict[str, Any]:
+    """Method to get counters of the in-memory backend.
+
+    Returns:
+        dict[str, Any]: Number of documents in memory, and numbers
+        of loads of the dump, of searches and of multi-gets.
+
+    """
+
+    return asdict(stats)
@@ -0,0 +1,264 @@
+import asyncio
+import contextvars
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Sequence, TypeVar
+
+import elasticsearch
+from elasticsearch import AsyncTransport, Transport, TransportError
+from elasticsearch.connection_pool import ConnectionSelector
+
+# Weight of the latest sample in the moving averages of `NodeHealth`.
+ALPHA = 0.2
+# How much slower than its latency a node that always fails is considered.
+ERROR_PENALTY = 10.0
+# Latency below which nodes are considered equally fast.
+MIN_LATENCY = 0.001
+
+T = TypeVar("T")
+
+
+class NodeHealth:
+    """Class with moving averages of the latency and errors of a node."""
+
+    def __init__(self) -> None:
+        self.latency: float | None = None
+        self.error_rate = 0.0
+        self.requests = 0
+        self.errors = 0
+
+    def record(self, elapsed: float, failed: bool) -> None:
+        """Method to record a request to the node.
+
+        Args:
+            elapsed (float): Seconds the request took.
+            failed (bool): Whether the request failed.
+        """
+
+        self.requests += 1
+        self.errors += failed
+        self.error_rate = ALPHA * failed + (1 - ALPHA) * self.error_rate
+        if self.latency is None:
+            self.latency = elapsed
+        else:
+            self.latency = ALPHA * elapsed + (1 - ALPHA) * self.latency
+
+    def score(self, default_latency: float) -> float:
+        """Method to score the node, where a lower score is healthier.
+
+        Args:
+            default_latency (float): Latency assumed for a node
+            without requests.
+
+        Returns:
+            float: Expected seconds of a request penalised by errors.
+
+        """
+
+        latency = self.latency if self.latency is not None else default_latency
+
+        return max(latency, MIN_LATENCY) * (
+            1 + ERROR_PENALTY * self.error_rate
+        )
+
+
+def get_health(connection: Any) -> NodeHealth:
+    """Method to get the health of the node of a connection.
+
+    Args:
+        connection (Connection): Connection of the client of elasticsearch.
+
+    Returns:
+        NodeHealth: Health of the node, created on first use.
+
+    """
+
+    health = getattr(connection, "health", None)
+    if health is None:
+        health = connection.health = NodeHealth()
+
+    return health
+
+
+@dataclass
+class NodeHint:
+    """Dataclass with the connection `HealthAwareSelector` picked
+    for a request, and the one it avoids for it."""
+
+    avoid: Any = None
+    picked: Any = None
+
+
+_hint: "contextvars.ContextVar[NodeHint | None]" = contextvars.ContextVar(
+    "node_hint", default=None
+)
+
+
+async def with_hint(hint: NodeHint, awaitable: Awaitable[T]) -> T:
+    """Method to await a request with a hint for `HealthAwareSelector`.
+
+    Args:
+        hint (NodeHint): Hint that the connections picked for the request
+        are written to.
+        awaitable (Awaitable): Request to elasticsearch.
+
+    Returns:
+        T: Result of the request.
+
+    """
+
+    token = _hint.set(hint)
+    try:
+        return await awaitable
+    finally:
+        _hint.reset(token)
+
+
+class HealthAwareSelector(ConnectionSelector):
+    """Selector of connections weighted by the health of their nodes.
+
+    A node is picked with a probability inversely proportional to its
+    score, so slow and failing nodes get less load but are still sampled.
+    Nodes without requests are scored as the fastest known node, so new
+    nodes are tried. Within `with_hint`, the connection to avoid is
+    not picked while there are others, and the picked one is written
+    to the hint.
+    """
+
+    def select(self, connections: Sequence[Any]) -> Any:
+        hint = _hint.get()
+        if hint is not None and hint.avoid is not None:
+            connections = [
+                c for c in connections if c is not hint.avoid
+            ] or connections
+
+        healths = [get_health(connection) for connection in connections]
+        latencies = [h.latency for h in healths if h.latency is not None]
+        default_latency = min(latencies, default=MIN_LATENCY)
+        weights = [1 / h.score(default_latency) for h in healths]
+        connection = random.choices(connections, weights)[0]
+        if hint is not None:
+            hint.picked = connection
+
+        return connection
+
+
+def backoff(attempt: int, base: float, cap: float) -> float:
+    """Method to get the seconds to wait before retrying a request.
+
+    The delay is drawn between 0 and an exponential bound, so clients
+    retrying at the same time spread out.
+
+    Args:
+        attempt (int): Number of the failed attempt from 0.
+        base (float): Bound of the delay after the first attempt.
+        cap (float): Upper bound of the delay.
+
+    Returns:
+        float: Seconds to wait.
+
+    """
+
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+def is_retriable(error: TransportError) -> bool:
+    """Method to decide whether a request may be retried on another node.
+
+    Args:
+        error (TransportError): Error raised by the transport.
+
+    Returns:
+        bool: Whether the node failed rather than the request.
+
+    """
+
+    if isinstance(error, elasticsearch.ConnectionTimeout):
+        return False
+
+    return isinstance(
+        error, elasticsearch.ConnectionError
+    ) or error.status_code in (502, 503, 504)
+
+
+class RetryingTransport(Transport):
+    """Transport that retries failed requests on another node
+        after a jittered backoff.
+
+    The transport of elasticsearch retries at once, so each attempt is
+    made by the base class without retries, which marks the failed node
+    dead, and the retries are made here.
+
+    Args:
+        hosts (list): Hosts of elasticsearch.
+        max_retries (int): Number of retries after the first attempt.
+        retry_backoff (float): Bound of the delay after the first attempt.
+        retry_backoff_max (float): Upper bound of the delay.
+    """
+
+    def __init__(
+        self,
+        hosts: Any,
+        max_retries: int = 3,
+        retry_backoff: float = 0.025,
+        retry_backoff_max: float = 0.5,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(hosts, max_retries=0, **kwargs)
+        self.retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+
+    def perform_request(self, *args: Any, **kwargs: Any) -> Any:
+        attempt = 0
+        while True:
+            try:
+                return super().perform_request(*args, **kwargs)
+            except TransportError as e:
+                if attempt >= self.retries or not is_retriable(e):
+                    raise
+
+            time.sleep(
+                backoff(attempt, self.retry_backoff, self.retry_backoff_max)
+            )
+            attempt += 1
+
+
+class AsyncRetryingTransport(AsyncTransport):
+    """Async transport that retries failed requests on another node
+        after a jittered backoff.
+
+    Args:
+        hosts (list): Hosts of elasticsearch.
+        max_retries (int): Number of retries after the first attempt.
+        retry_backoff (float): Bound of the delay after the first attempt.
+        retry_backoff_max (float): Upper bound of the delay.
+    """
+
+    def __init__(
+        self,
+        hosts: Any,
+        max_retries: int = 3,
+        retry_backoff: float = 0.025,
+        retry_backoff_max: float = 0.5,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(hosts, max_retries=0, **kwargs)
+        self.retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+
+    async def perform_request(self, *args: Any, **kwargs: Any) -> Any:
+        attempt = 0
+        while True:
+            try:
+                return await super().perform_request(*args, **kwargs)
+            except TransportError as e:
+                if attempt >= self.retries or not is_retriable(e):
+                    raise
+
+            await asyncio.sleep(
+                backoff(attempt, self.retry_backoff, self.retry_backoff_max)
+            )
+            attempt += 1
@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any
 
+from . import expression
+
 
 class Param(ABC):
     """Abstract class for parameter creation"""
@@ -59,6 +61,64 @@ class CreateNameParam(Param):
         return [{"term": {"name": self.name}}]
 
 
+@dataclass
+class CreatePokedexNumbersParam(Param):
+    """Dataclass to create search parameters for some `National Pokédex Number`
+        for elasticsearch.
+
+    Args:
+        Param (object): Abstract class for search parameter creation.
+    """
+
+    pokedex_numbers: tuple[int, ...]
+
+    def create_param(self) -> dict[str, dict[str, list[int]]] | None:
+        """Method to create search parameters of some `National Pokédex Number`
+            for elasticsearch.
+
+        Returns:
+            dict[str, dict[str, list[int]]] | None:
+            Dict with search parameters of some `National Pokémon Number`
+            for elasticsearch
+        """
+
+        if not self.pokedex_numbers:
+            return None
+
+        return {
+            "terms": {
+                "national_pokedex_number": sorted(set(self.pokedex_numbers))
+            }
+        }
+
+
+@dataclass
+class CreateNamesParam(Param):
+    """Dataclass to create search parameters for some `Name of Pokémon`
+        for elasticsearch.
+
+    Args:
+        Param (object): Abstract class for search parameter creation.
+    """
+
+    names: tuple[str, ...]
+
+    def create_param(self) -> dict[str, dict[str, list[str]]] | None:
+        """Method to create search parameters of some `Name of Pokémon`
+            for elasticsearch.
+
+        Returns:
+            dict[str, dict[str, list[str]]] | None:
+            Dict with search parameters of some `Name of Pokémon`
+            for elasticsearch.
+        """
+
+        if not self.names:
+            return None
+
+        return {"terms": {"name.keyword": sorted(set(self.names))}}
+
+
 @dataclass
 class CreateFormParam(Param):
     """Dataclass to create search parameters of `Form of Pokémon`
@@ -368,6 +428,40 @@ class CreateAbilityParam(Param):
         return ability_param_list
 
 
+@dataclass
+class CreateRangeParam(Param):
+    """Dataclass to create search parameters of a range of a numeric field
+        for elasticsearch.
+
+    Args:
+        Param (object): Abstract class for search parameter creation.
+    """
+
+    field: str
+    bounds: tuple[float | None, float | None]
+
+    def create_param(self) -> dict[str, dict[str, dict[str, float]]] | None:
+        """Method to create search parameters of a range of a numeric field
+            for elasticsearch.
+
+        Returns:
+            dict[str, dict[str, dict[str, float]]] | None:
+            Dict with search parameters of the range of the field,
+            inclusive of both bounds, for elasticsearch
+        """
+
+        if self.bounds == (None, None):
+            return None
+
+        range_param: dict[str, float] = {}
+
+        for k, v in zip(("gte", "lte"), self.bounds):
+            if v is not None:
+                range_param[k] = v
+
+        return {"range": {self.field: range_param}}
+
+
 @dataclass
 class CreateKeywordParam(Param):
     """Dataclass to create search parameters of `keyword`
@@ -409,3 +503,71 @@ class CreateKeywordParam(Param):
                 }
             }
         ]
+
+
+@dataclass
+class CreateExpressionParam(Param):
+    """Dataclass to create search parameters of a filter expression
+        for elasticsearch.
+
+    Args:
+        Param (object): Abstract class for search parameter creation.
+    """
+
+    expression: str | None
+
+    def create_param(self) -> dict[str, Any] | None:
+        """Method to create search parameters of a filter expression
+            for elasticsearch.
+
+        Raises:
+            ValueError: If the expression is invalid.
+
+        Returns:
+            dict[str, Any] | None:
+            Dict with a bool query of the expression for elasticsearch.
+        """
+
+        if self.expression is None:
+            return None
+
+        return expression.create_clause(expression.parse(self.expression))
+
+
+@dataclass
+class CreatePageParam(Param):
+    """Dataclass to create parameters of a page of search results
+        for elasticsearch.
+
+    Pages are sorted by `National Pokédex Number` with `_id` as a tiebreaker,
+    and the next page starts after the sort values of the last hit
+    with `search_after`.
+
+    Args:
+        Param (object): Abstract class for search parameter creation.
+    """
+
+    limit: int
+    search_after: list[Any] | None = None
+    track_total_hits: bool = False
+
+    def create_param(self) -> dict[str, Any]:
+        """Method to create parameters of a page of search results
+            for elasticsearch.
+
+        Returns:
+            dict[str, Any]:
+            Dict with `size`, `sort`, `track_total_hits` and `search_after`
+            for elasticsearch.
+        """
+
+        page_param: dict[str, Any] = {
+            "size": self.limit,
+            "sort": [{"national_pokedex_number": "asc"}, {"_id": "asc"}],
+            "track_total_hits": self.track_total_hits,
+        }
+
+        if self.search_after is not None:
+            page_param["search_after"] = self.search_after
+
+        return page_param
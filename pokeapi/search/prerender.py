@@ -0,0 +1,162 @@
+import gzip
+import json
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from . import accessor, config, generation
+
+POKEDEX_NUMBER = "pokedex_number"
+NAME = "name"
+
+
+@dataclass(frozen=True)
+class RenderedResponse:
+    """Dataclass with the body of a response rendered to JSON,
+    and its gzip variant when `ES_PRERENDER_GZIP` is set."""
+
+    body: bytes
+    gzip_body: bytes | None = None
+
+
+@dataclass
+class PrerenderStats:
+    """Dataclass with counters of the responses rendered in advance."""
+
+    generation: str | None = None
+    entries: int = 0
+    renders: int = 0
+    hits: int = 0
+    misses: int = 0
+
+
+stats = PrerenderStats()
+_rendered: OrderedDict[str, RenderedResponse] = OrderedDict()
+
+
+def render(docs: list[dict[str, Any]]) -> RenderedResponse:
+    """Method to render Pokémon to the body of a response.
+
+    The body is the same as the one FastAPI renders for
+    `list[PokemonSchema]`, so that the documents are validated
+    and encoded once.
+
+    Args:
+        docs (list[dict[str, Any]]): Pokémon information.
+
+    Returns:
+        RenderedResponse: Body of the response, and its gzip variant
+        when `ES_PRERENDER_GZIP` is set.
+
+    """
+
+    body = json.dumps(
+        [pokemon.dict() for pokemon in accessor.create_pokemon_response(docs)],
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    gzip_body = None
+    if config.get_config().ES_PRERENDER_GZIP:
+        gzip_body = gzip.compress(body, compresslevel=9, mtime=0)
+
+    return RenderedResponse(body, gzip_body)
+
+
+def _check_generation() -> None:
+    """Method to drop the rendered responses when the generation
+    of the index has changed since they were rendered."""
+
+    current = generation.stats.generation
+    if current != stats.generation:
+        _rendered.clear()
+        stats.generation = current
+        stats.entries = 0
+
+
+def get(kind: str, value: int | str) -> RenderedResponse | None:
+    """Method to get a response rendered under the current generation.
+
+    Args:
+        kind (str): "pokedex_number" or "name".
+        value (int | str): Target of the lookup.
+
+    Returns:
+        RenderedResponse | None: Rendered response, or None when
+        it has not been rendered under the current generation.
+
+    """
+
+    _check_generation()
+    key = f"{kind}:{value}"
+    rendered = _rendered.get(key)
+    if rendered is None:
+        stats.misses += 1
+    else:
+        stats.hits += 1
+        _rendered.move_to_end(key)
+
+    return rendered
+
+
+def put(
+    kind: str,
+    value: int | str,
+    docs: list[dict[str, Any]],
+    index_generation: str | None,
+) -> RenderedResponse:
+    """Method to render the response of a lookup, and to keep it
+        until the generation changes.
+
+    The response is kept only if the lookup found some Pokémon and
+    the generation has not changed since the lookup started, as misses
+    are answered by `membership` and the negative cache instead.
+    At most `ES_PRERENDER_MAX_ENTRIES` responses are kept, and the least
+    recently used one is dropped for a further one.
+
+    Args:
+        kind (str): "pokedex_number" or "name".
+        value (int | str): Target of the lookup.
+        docs (list[dict[str, Any]]): Pokémon found by the lookup.
+        index_generation (str | None): Generation of the index
+        when the lookup started.
+
+    Returns:
+        RenderedResponse: Rendered response.
+
+    """
+
+    rendered = render(docs)
+    stats.renders += 1
+
+    _check_generation()
+    if docs and index_generation == stats.generation:
+        key = f"{kind}:{value}"
+        _rendered[key] = rendered
+        _rendered.move_to_end(key)
+        while len(_rendered) > config.get_config().ES_PRERENDER_MAX_ENTRIES:
+            _rendered.popitem(last=False)
+        stats.entries = len(_rendered)
+
+    return rendered
+
+
+def reset_prerender() -> None:
+    """Method to drop every rendered response."""
+
+    _rendered.clear()
+    stats.generation = None
+    stats.entries = 0
+
+
+def get_prerender_stats() -> dict[str, Any]:
+    """Method to get counters of the responses rendered in advance.
+
+    Returns:
+        dict[str, Any]: Generation and number of the rendered responses,
+        and numbers of renders, of hits and of misses.
+
+    """
+
+    return asdict(stats)
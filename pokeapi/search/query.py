@@ -1,7 +1,24 @@
+import functools
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Any
 
-from . import param
+from . import param, singleflight
+
+# Number of query plans kept by `compile_conditions`.
+PLAN_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """Dataclass with a query compiled from conditions and its canonical key.
+
+    Plans returned by `compile_conditions` own their query, so that
+    changing it does not change the plans of later requests.
+    """
+
+    query: dict[str, Any]
+    key: str
 
 
 class Query(ABC):
@@ -41,7 +58,7 @@ class CreatePokedexNumberQuery(Query):
             pokedex_number
         ).create_param()
 
-        return {"query": {"bool": {"must": pokedex_number_param}}}
+        return {"query": {"bool": {"filter": pokedex_number_param}}}
 
 
 class CreatePokemonNameQuery(Query):
@@ -68,7 +85,61 @@ class CreatePokemonNameQuery(Query):
 
         name_param = param.CreateNameParam(pokemon_name).create_param()
 
-        return {"query": {"bool": {"must": name_param}}}
+        return {"query": {"bool": {"filter": name_param}}}
+
+
+class CreateBatchLookupQuery(Query):
+    """Class with methods to create a query for elasticsearch
+        that search for Pokémon by some National Pokédex Numbers and names.
+
+    Args:
+        Param (object): Abstract class for query creation.
+    """
+
+    # Upper bound of hits, which is `index.max_result_window` by default.
+    size = 10000
+
+    def create_query(
+        self, targets: tuple[tuple[int, ...], tuple[str, ...]]
+    ) -> dict[str, Any]:
+        """Method to create a query for elasticsearch
+            that searches for Pokémon by some National Pokédex Numbers
+            and names in one request.
+
+        Args:
+            targets (tuple): National Pokédex Numbers and names.
+
+        Returns:
+            dict[str, Any]:
+            Dict of query for elasticsearch to search for Pokémon
+            matching any of the National Pokédex Numbers or names.
+        """
+
+        pokedex_numbers, names = targets
+        lookup_params: list[dict] = []
+
+        for lookup_param in (
+            param.CreatePokedexNumbersParam(pokedex_numbers).create_param(),
+            param.CreateNamesParam(names).create_param(),
+        ):
+            if lookup_param is not None:
+                lookup_params.append(lookup_param)
+
+        return {
+            "query": {
+                "bool": {
+                    "filter": [
+                        {
+                            "bool": {
+                                "should": lookup_params,
+                                "minimum_should_match": 1,
+                            }
+                        }
+                    ]
+                }
+            },
+            "size": self.size,
+        }
 
 
 class CreateConditionalSearchQuery(Query):
@@ -85,6 +156,11 @@ class CreateConditionalSearchQuery(Query):
         """Method to create a query for elasticsearch
             that searches for Pokémon by some conditions.
 
+        Every condition is an exact match, so the conditions are put
+        in filter context, where they are not scored and elasticsearch
+        can cache them. The query is compiled once for repeated
+        conditions by `compile_conditions`, and must not be changed.
+
         Args:
             conditions (tuple): Conditions of search.
 
@@ -94,20 +170,7 @@ class CreateConditionalSearchQuery(Query):
             by some conditions.
         """
 
-        condition_params: list[dict] = []
-
-        for condition in conditions:
-            param = condition.create_param()
-
-            if param is None:
-                continue
-
-            if isinstance(param, list):
-                condition_params.extend(param)
-            else:
-                condition_params.append(param)
-
-        return {"query": {"bool": {"must": condition_params}}}
+        return compile_conditions(conditions).query
 
 
 class CreateKeywordQuery(Query):
@@ -137,3 +200,176 @@ class CreateKeywordQuery(Query):
         keyword_param = param.CreateKeywordParam(keyword).create_param()
 
         return {"query": {"bool": {"must": keyword_param}}}
+
+
+class CreatePaginatedQuery(Query):
+    """Class with methods to create a query for elasticsearch
+        that search for a page of Pokémon.
+
+    Args:
+        Param (object): Abstract class for query creation.
+    """
+
+    def create_query(
+        self, target: tuple[dict[str, Any], param.CreatePageParam]
+    ) -> dict[str, Any]:
+        """Method to create a query for elasticsearch
+            that searches for a page of Pokémon.
+
+        Args:
+            target (tuple): Query to paginate and parameters of the page.
+
+        Returns:
+            dict[str, Any]:
+            Dict of query for elasticsearch to search for a page of Pokémon.
+        """
+
+        query, page = target
+
+        return {**query, **page.create_param()}
+
+
+def build_conditional_query(
+    conditions: tuple[Any, ...]
+) -> dict[str, dict[str, dict[str, list[Any]]]]:
+    """Method to build a query for elasticsearch from some conditions
+        without `compile_conditions`.
+
+    Args:
+        conditions (tuple): Conditions of search.
+
+    Returns:
+        dict[str, dict[str, dict[str, list[Any]]]]:
+        Dict of query for elasticsearch to search for Pokémon
+        by some conditions.
+    """
+
+    condition_params: list[dict] = []
+
+    for condition in conditions:
+        condition_param = condition.create_param()
+
+        if condition_param is None:
+            continue
+
+        if isinstance(condition_param, list):
+            condition_params.extend(condition_param)
+        else:
+            condition_params.append(condition_param)
+
+    return {"query": {"bool": {"filter": condition_params}}}
+
+
+def normalize_conditions(conditions: tuple[Any, ...]) -> tuple[Any, ...]:
+    """Method to reduce conditions to the values they are created from.
+
+    Args:
+        conditions (tuple): Conditions of search.
+
+    Returns:
+        tuple: Class and field values of each condition, which are equal
+        for equal conditions.
+
+    """
+
+    return tuple(
+        (type(condition), tuple(vars(condition).values()))
+        for condition in conditions
+    )
+
+
+def copy_query(value: Any) -> Any:
+    """Method to copy a query created by `build_conditional_query`.
+
+    Args:
+        value (Any): Query, or a value in a query.
+
+    Returns:
+        Any: Copy of the value, sharing no dict or list with it.
+
+    """
+
+    if isinstance(value, dict):
+        return {name: copy_query(item) for name, item in value.items()}
+    if isinstance(value, list):
+        return [copy_query(item) for item in value]
+
+    return value
+
+
+@functools.lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _compile(shape: tuple[Any, ...]) -> QueryPlan:
+    query = build_conditional_query(
+        tuple(cls(*values) for cls, values in shape)
+    )
+
+    return QueryPlan(query, singleflight.canonical_key(query))
+
+
+def compile_conditions(conditions: tuple[Any, ...]) -> QueryPlan:
+    """Method to compile conditions to a query and its canonical key.
+
+    Plans are kept for the last `PLAN_CACHE_SIZE` normalized conditions,
+    so that repeated conditions are compiled once, and each call gets
+    a copy of the kept query. Conditions with unhashable values are
+    compiled every time.
+
+    Args:
+        conditions (tuple): Conditions of search.
+
+    Returns:
+        QueryPlan: Query for elasticsearch and its canonical key.
+
+    """
+
+    shape = normalize_conditions(conditions)
+    try:
+        hash(shape)
+    except TypeError:
+        query = build_conditional_query(conditions)
+        return QueryPlan(query, singleflight.canonical_key(query))
+
+    plan = _compile(shape)
+
+    return QueryPlan(copy_query(plan.query), plan.key)
+
+
+def create_paginated_key(query_key: str, query: dict[str, Any]) -> str:
+    """Method to create the canonical key of a paginated query
+        from the canonical key of the query before pagination.
+
+    Only the parameters of the page are made canonical,
+    so that the key is created in time independent of the query.
+
+    Args:
+        query_key (str): Canonical key of the query before pagination,
+        such as the one of a `QueryPlan`.
+        query (dict[str, Any]): Query created by `CreatePaginatedQuery`.
+
+    Returns:
+        str: Canonical key of the paginated query.
+
+    """
+
+    page = {name: value for name, value in query.items() if name != "query"}
+
+    return query_key + singleflight.canonical_key(page)
+
+
+def get_plan_stats() -> dict[str, Any]:
+    """Method to get counters of the compiled query plans.
+
+    Returns:
+        dict[str, Any]: Numbers of hits and misses of the plans,
+        and the number and limit of the kept plans.
+
+    """
+
+    info = _compile.cache_info()
+
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+    }
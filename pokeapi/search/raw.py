@@ -0,0 +1,157 @@
+import json
+import re
+from typing import Any
+
+from elasticsearch.serializer import TextSerializer
+
+# Header of a request whose response is returned as text. It is removed
+# by the connection before the request is sent to elasticsearch.
+RAW_HEADER = "x-pokeapi-raw"
+# Content type given to the responses of such requests, so that the
+# transport hands them to `RawSerializer` instead of decoding them.
+RAW_MIMETYPE = "application/x-pokeapi-raw"
+# Parts of a search response read by `split_sources`.
+FILTER_PATH = "hits.total,hits.hits._source,hits.hits.sort"
+
+# Key of the source of a hit. Quotes inside strings are escaped, so it
+# is found only as a key, and keys inside a source are skipped with it.
+_SOURCE_KEY = re.compile(r'"_source":\s*')
+# Text up to the next bracket outside strings, which are skipped whole
+# as they may hold brackets, and the bracket itself.
+_BRACKET = re.compile(
+    r'[^"{}\[\]]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"{}\[\]]*)*([{}\[\]])'
+)
+
+
+class RawSerializer(TextSerializer):
+    """Serializer that leaves responses of elasticsearch as text."""
+
+    mimetype = RAW_MIMETYPE
+
+
+def pop_raw_header(kwargs: dict[str, Any]) -> bool:
+    """Method to remove `RAW_HEADER` from the arguments of a request.
+
+    Args:
+        kwargs (dict): Keyword arguments of `Connection.perform_request`,
+        which are updated in place.
+
+    Returns:
+        bool: Whether the response of the request is wanted as text.
+
+    """
+
+    headers = kwargs.get("headers")
+    if not headers or RAW_HEADER not in headers:
+        return False
+
+    kwargs["headers"] = {k: v for k, v in headers.items() if k != RAW_HEADER}
+
+    return True
+
+
+def mark_raw(response: tuple[int, Any, Any]) -> tuple[int, Any, Any]:
+    """Method to give a response of a connection the content type
+        of `RawSerializer`.
+
+    Args:
+        response (tuple): Status, headers and body of the response.
+
+    Returns:
+        tuple[int, Any, Any]: Response with the content type replaced.
+
+    """
+
+    status, headers, data = response
+
+    return status, {**headers, "content-type": RAW_MIMETYPE}, data
+
+
+def find_end(text: str, start: int) -> int:
+    """Method to find the end of a JSON object or array without decoding it.
+
+    The text is skipped from one bracket outside strings to the next
+    by a regular expression, so that no Python object is created
+    for the values in between.
+
+    Args:
+        text (str): JSON text.
+        start (int): Index of the opening bracket.
+
+    Raises:
+        ValueError: If the object or array is not closed.
+
+    Returns:
+        int: Index just after the closing bracket.
+
+    """
+
+    depth = 0
+    end = start
+    while True:
+        bracket = _BRACKET.match(text, end)
+        if bracket is None:
+            break
+
+        end = bracket.end()
+        if bracket.group(1) in ("{", "["):
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return end
+
+    raise ValueError(f"Unterminated JSON value at {start}")
+
+
+def split_sources(text: str) -> tuple[list[str], dict[str, Any]]:
+    """Method to cut the `_source` of every hit out of a search response.
+
+    The end of each source is found by `find_end`, and the source
+    is returned as the text sent by elasticsearch without being
+    decoded. The rest of the response, such as `hits.total` and
+    the `sort` of each hit, is small and is decoded with each source
+    replaced by null.
+
+    Args:
+        text (str): Search response of elasticsearch as text.
+
+    Returns:
+        tuple[list[str], dict[str, Any]]: JSON text of each source
+        and the decoded response without them.
+
+    """
+
+    sources: list[str] = []
+    rest: list[str] = []
+    last = 0
+
+    while True:
+        key = _SOURCE_KEY.search(text, last)
+        if key is None:
+            break
+
+        start = key.end()
+        end = find_end(text, start)
+        sources.append(text[start:end])
+        rest.append(text[last:start])
+        rest.append("null")
+        last = end
+
+    rest.append(text[last:])
+
+    return sources, json.loads("".join(rest))
+
+
+def to_json_array(sources: list[str]) -> bytes:
+    """Method to join JSON texts into the bytes of a JSON array.
+
+    Args:
+        sources (list[str]): JSON text of each item.
+
+    Returns:
+        bytes: JSON array encoded in UTF-8.
+
+    """
+
+    return ("[" + ",".join(sources) + "]").encode()
@@ -0,0 +1,388 @@
+import asyncio
+import json
+from dataclasses import asdict, dataclass
+from typing import Any
+from urllib.parse import unquote, urlsplit
+
+from . import config
+
+
+class RespError(Exception):
+    """Exception raised for an error reply of a server of the Redis protocol,
+    or for a reply that cannot be parsed."""
+
+
+# Errors of the server that `RedisCache` treats as misses.
+CACHE_ERRORS = (OSError, EOFError, asyncio.TimeoutError, RespError)
+
+
+@dataclass
+class RedisCacheStats:
+    """Dataclass with counters of `RedisCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    errors: int = 0
+    round_trips: int = 0
+
+
+def encode_command(*args: str | bytes | int | float) -> bytes:
+    """Method to encode a command of the Redis protocol.
+
+    Args:
+        *args (str | bytes | int | float): Name and arguments
+        of the command.
+
+    Returns:
+        bytes: Command as an array of bulk strings.
+
+    """
+
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+
+    return b"".join(parts)
+
+
+def _parse_int(data: bytes) -> int:
+    try:
+        return int(data)
+    except ValueError:
+        raise RespError(f"invalid integer: {data!r}") from None
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Any:
+    """Method to read a reply of the Redis protocol.
+
+    Args:
+        reader (asyncio.StreamReader): Stream of the connection.
+
+    Raises:
+        ConnectionError: The connection was closed.
+        RespError: The reply cannot be parsed.
+
+    Returns:
+        Any: str for a status, `RespError` for an error, int, bytes
+        or None for a bulk string, and list for an array.
+
+    """
+
+    line = await reader.readline()
+    if not line.endswith(b"\r\n"):
+        raise ConnectionError("connection closed by the server")
+
+    kind, rest = line[:1], line[1:-2]
+    if kind == b"+":
+        return rest.decode(errors="replace")
+    if kind == b"-":
+        return RespError(rest.decode(errors="replace"))
+    if kind == b":":
+        return _parse_int(rest)
+    if kind == b"$":
+        length = _parse_int(rest)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if kind == b"*":
+        length = _parse_int(rest)
+        if length < 0:
+            return None
+        return [await read_reply(reader) for _ in range(length)]
+
+    raise RespError(f"invalid reply: {line!r}")
+
+
+class _Connection:
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class RedisClient:
+    """Async client of the Redis protocol with a pool of connections.
+
+    Commands given to `pipeline` are written at once and their replies
+    are read afterwards, so they take one round trip. At most `maxsize`
+    connections are open at once, and pipelines wait for one of them.
+
+    Args:
+        url (str): URL such as "redis://:password@localhost:6379/0".
+        timeout (float): Seconds to wait for a connection or the replies
+        of a pipeline.
+        maxsize (int): Number of connections to open at most.
+    """
+
+    def __init__(self, url: str, timeout: float, maxsize: int = 10) -> None:
+        parts = urlsplit(url)
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or 6379
+        self.password = unquote(parts.password) if parts.password else None
+        self.db = int(parts.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self.maxsize = maxsize
+        self._idle: list[_Connection] = []
+        self._slots = asyncio.Semaphore(maxsize)
+
+    async def pipeline(
+        self, *commands: tuple[str | bytes | int | float, ...]
+    ) -> list[Any]:
+        """Method to send commands in one round trip.
+
+        Args:
+            *commands (tuple): Name and arguments of each command.
+
+        Raises:
+            RespError: A command failed.
+            asyncio.TimeoutError: No connection was free in time.
+
+        Returns:
+            list[Any]: Reply of each command.
+
+        """
+
+        await asyncio.wait_for(self._slots.acquire(), self.timeout)
+        try:
+            connection = await self._acquire()
+            replies = await self._execute(connection, commands)
+            self._release(connection)
+        finally:
+            self._slots.release()
+
+        for reply in replies:
+            if isinstance(reply, RespError):
+                raise reply
+
+        return replies
+
+    async def close(self) -> None:
+        """Method to close the idle connections."""
+
+        while self._idle:
+            self._idle.pop().close()
+
+    async def _execute(
+        self,
+        connection: _Connection,
+        commands: tuple[tuple[str | bytes | int | float, ...], ...],
+    ) -> list[Any]:
+        async def run() -> list[Any]:
+            connection.writer.write(
+                b"".join(encode_command(*command) for command in commands)
+            )
+            await connection.writer.drain()
+
+            return [await read_reply(connection.reader) for _ in commands]
+
+        try:
+            return await asyncio.wait_for(run(), self.timeout)
+        except BaseException:
+            # The replies left unread would be taken for replies
+            # of the next commands.
+            connection.close()
+            raise
+
+    async def _acquire(self) -> _Connection:
+        if self._idle:
+            return self._idle.pop()
+
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.timeout
+        )
+        connection = _Connection(reader, writer)
+
+        setup: list[tuple[str | bytes | int | float, ...]] = []
+        if self.password is not None:
+            setup.append(("AUTH", self.password))
+        if self.db:
+            setup.append(("SELECT", self.db))
+        if setup:
+            for reply in await self._execute(connection, tuple(setup)):
+                if isinstance(reply, RespError):
+                    connection.close()
+                    raise reply
+
+        return connection
+
+    def _release(self, connection: _Connection) -> None:
+        if len(self._idle) < self.maxsize:
+            self._idle.append(connection)
+        else:
+            connection.close()
+
+
+class RedisCache:
+    """Class caching JSON values in a server of the Redis protocol,
+    shared by every worker.
+
+    Errors of the server and values that are not JSON are counted
+    and treated as misses, so that searches go to elasticsearch while
+    the server is unavailable.
+
+    Args:
+        client (RedisClient): Client of the server.
+        prefix (str): Prefix of the keys.
+    """
+
+    def __init__(self, client: RedisClient, prefix: str) -> None:
+        self.client = client
+        self.prefix = prefix
+        self.stats = RedisCacheStats()
+
+    async def get_many(self, keys: list[str]) -> list[Any | None]:
+        """Method to get cached values in one round trip.
+
+        Args:
+            keys (list[str]): Keys of the values.
+
+        Returns:
+            list[Any | None]: Value of each key, or None if it is missing.
+
+        """
+
+        if not keys:
+            return []
+
+        try:
+            self.stats.round_trips += 1
+            replies = await self.client.pipeline(
+                *(("GET", self.prefix + key) for key in keys)
+            )
+        except CACHE_ERRORS:
+            self.stats.errors += 1
+            self.stats.misses += len(keys)
+            return [None] * len(keys)
+
+        values: list[Any | None] = []
+        for reply in replies:
+            try:
+                values.append(json.loads(reply) if reply is not None else None)
+            except ValueError:
+                # Such as a value written under the key by another writer.
+                self.stats.errors += 1
+                values.append(None)
+        hits = sum(value is not None for value in values)
+        self.stats.hits += hits
+        self.stats.misses += len(keys) - hits
+
+        return values
+
+    async def put_many(self, items: list[tuple[str, Any]], ttl: float) -> None:
+        """Method to cache values in one round trip.
+
+        Args:
+            items (list[tuple[str, Any]]): Key and value of each item.
+            ttl (float): Seconds to keep the values.
+        """
+
+        if not items:
+            return
+
+        ttl_ms = max(int(ttl * 1000), 1)
+        try:
+            self.stats.round_trips += 1
+            await self.client.pipeline(
+                *(
+                    (
+                        "SET",
+                        self.prefix + key,
+                        json.dumps(value, ensure_ascii=False).encode(),
+                        "PX",
+                        ttl_ms,
+                    )
+                    for key, value in items
+                )
+            )
+        except CACHE_ERRORS:
+            self.stats.errors += 1
+            return
+
+        self.stats.writes += len(items)
+
+    async def get(self, key: str) -> Any | None:
+        """Method to get a cached value.
+
+        Args:
+            key (str): Key of the value.
+
+        Returns:
+            Any | None: Value, or None if it is missing.
+
+        """
+
+        return (await self.get_many([key]))[0]
+
+    async def put(self, key: str, value: Any, ttl: float) -> None:
+        """Method to cache a value.
+
+        Args:
+            key (str): Key of the value.
+            value (Any): Value encodable to JSON.
+            ttl (float): Seconds to keep the value.
+        """
+
+        await self.put_many([(key, value)], ttl)
+
+
+_stats = RedisCacheStats()
+_redis_cache: RedisCache | None = None
+_redis_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_redis_cache() -> RedisCache | None:
+    """Method to get the cache shared by workers for the running event loop.
+
+    Returns:
+        RedisCache | None: Cache at `ES_CACHE_REDIS_URL`, or None when
+        it is not set.
+
+    """
+
+    global _redis_cache, _redis_loop
+
+    conf = config.get_config()
+    if not conf.ES_CACHE_REDIS_URL:
+        return None
+
+    loop = asyncio.get_running_loop()
+    if _redis_cache is None or _redis_loop is not loop:
+        client = RedisClient(
+            conf.ES_CACHE_REDIS_URL,
+            conf.ES_CACHE_REDIS_TIMEOUT,
+            conf.ES_POOL_MAXSIZE,
+        )
+        _redis_cache = RedisCache(client, conf.ES_CACHE_REDIS_PREFIX)
+        _redis_cache.stats = _stats
+        _redis_loop = loop
+
+    return _redis_cache
+
+
+async def close_redis_cache() -> None:
+    """Method to close the connections of the cache shared by workers."""
+
+    global _redis_cache, _redis_loop
+
+    if _redis_cache is not None:
+        await _redis_cache.client.close()
+        _redis_cache = None
+        _redis_loop = None
+
+
+def get_redis_cache_stats() -> dict[str, int]:
+    """Method to get counters of the cache shared by workers.
+
+    Returns:
+        dict[str, int]: Number of hits, misses, writes, errors
+        and round trips.
+
+    """
+
+    return asdict(_stats)
@@ -0,0 +1,198 @@
+import asyncio
+import json
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+# Clauses of a bool query whose order does not change the hits.
+BOOL_CLAUSES = frozenset(("must", "filter", "should", "must_not"))
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(
+        value, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+    )
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_canonical(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    canonical = {key: _canonical(item) for key, item in value.items()}
+    bool_query = canonical.get("bool")
+    if isinstance(bool_query, dict):
+        for clause in BOOL_CLAUSES & bool_query.keys():
+            if isinstance(bool_query[clause], list):
+                bool_query[clause] = sorted(bool_query[clause], key=_dumps)
+
+    return canonical
+
+
+def canonical_key(query: dict[str, Any]) -> str:
+    """Method to create a canonical key of a query for elasticsearch.
+
+    Queries that differ only in the order of their keys or of the clauses
+    of their bool queries have the same key. Lists elsewhere, such as
+    `sort` and `search_after`, keep their order.
+
+    Args:
+        query (dict): Query created by the classes of `query.py`.
+
+    Returns:
+        str: Canonical key of the query.
+
+    """
+
+    return _dumps(_canonical(query))
+
+
+@dataclass
+class SingleFlightStats:
+    """Dataclass with counters of the calls made through single-flight."""
+
+    calls: int = 0
+    deduplicated: int = 0
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Class that shares one call among threads calling with the same key.
+
+    Args:
+        stats (SingleFlightStats): Counters updated by the calls.
+    """
+
+    def __init__(self, stats: SingleFlightStats) -> None:
+        self.stats = stats
+        self._calls: dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Method to call `fn` unless a call with the same key is in flight.
+
+        Args:
+            key (str): Key of the call.
+            fn (Callable): Function to call.
+
+        Returns:
+            T: Result of `fn`, shared by every caller with the same key.
+
+        """
+
+        with self._lock:
+            self.stats.calls += 1
+            call = self._calls.get(key)
+            if call is not None:
+                self.stats.deduplicated += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[no-any-return]
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+
+class AsyncSingleFlight:
+    """Class that shares one awaitable among tasks awaiting with the same key.
+
+    Args:
+        stats (SingleFlightStats): Counters updated by the calls.
+    """
+
+    def __init__(self, stats: SingleFlightStats) -> None:
+        self.stats = stats
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Method to await `fn` unless a call with the same key is in flight.
+
+        Cancelling one caller does not cancel the shared call for the others.
+
+        Args:
+            key (str): Key of the call.
+            fn (Callable): Function returning the awaitable to await.
+
+        Returns:
+            T: Result of `fn`, shared by every caller with the same key.
+
+        """
+
+        self.stats.calls += 1
+        task = self._tasks.get(key)
+        if task is not None:
+            self.stats.deduplicated += 1
+        else:
+
+            async def run() -> T:
+                return await fn()
+
+            task = self._tasks[key] = asyncio.create_task(run())
+            task.add_done_callback(lambda t: self._forget(key, t))
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+
+stats = SingleFlightStats()
+sync_singleflight = SingleFlight(stats)
+_async_singleflight: AsyncSingleFlight | None = None
+_async_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_async_singleflight() -> AsyncSingleFlight:
+    """Method to get the single-flight of the running event loop.
+
+    Returns:
+        AsyncSingleFlight: Single-flight sharing the counters
+        of the sync one.
+
+    """
+
+    global _async_singleflight, _async_loop
+
+    loop = asyncio.get_running_loop()
+    if _async_singleflight is None or _async_loop is not loop:
+        _async_singleflight = AsyncSingleFlight(stats)
+        _async_loop = loop
+
+    return _async_singleflight
+
+
+def get_singleflight_stats() -> dict[str, int]:
+    """Method to get counters of the calls made through single-flight.
+
+    Returns:
+        dict[str, int]: Number of calls and deduplicated calls.
+
+    """
+
+    return asdict(stats)
@@ -0,0 +1,185 @@
+import asyncio
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+from urllib.parse import quote, unquote, urlsplit
+
+from .search import accessor, async_accessor, client, config, generation
+
+
+@dataclass
+class WarmupStats:
+    """Dataclass with the work and time of the warm-up on startup."""
+
+    completed: bool = False
+    connections: int = 0
+    documents: int = 0
+    queries: int = 0
+    failures: int = 0
+    pool_seconds: float = 0.0
+    preload_seconds: float = 0.0
+    validation_seconds: float = 0.0
+    queries_seconds: float = 0.0
+    seconds: float = 0.0
+
+
+stats = WarmupStats()
+
+
+async def open_pool() -> int:
+    """Method to open the connections of the clients of elasticsearch.
+
+    `ES_POOL_MAXSIZE` requests are sent at once with the async client,
+    so that it opens as many connections as it keeps.
+
+    Returns:
+        int: Number of requests that succeeded.
+
+    """
+
+    conf = config.get_config()
+    es = client.get_async_client()
+    results = await asyncio.gather(
+        *(es.ping() for _ in range(conf.ES_POOL_MAXSIZE))
+    )
+    client.get_client().ping()
+
+    return sum(results)
+
+
+# Search for the Pokémon validated when none has been preloaded.
+SAMPLE_QUERY: dict[str, Any] = {"query": {"match_all": {}}, "size": 1}
+
+
+def validate(docs: list[dict[str, Any]]) -> None:
+    """Method to run documents through `PokemonSchema` and its JSON
+        encoder once, so that the first requests do not pay for it.
+
+    Args:
+        docs (list[dict[str, Any]]): Pokémon information.
+    """
+
+    for pokemon in accessor.create_pokemon_response(docs):
+        pokemon.json()
+
+
+async def replay(app: Any, path: str) -> int:
+    """Method to send a GET request to the application in the process.
+
+    Args:
+        app (Any): ASGI application.
+        path (str): Path and query string of the request,
+        such as "/pokemon/conditions?type_1=でんき".
+
+    Returns:
+        int: Status of the response.
+
+    """
+
+    url = urlsplit(path)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": unquote(url.path),
+        "raw_path": quote(unquote(url.path)).encode(),
+        "query_string": quote(url.query, safe="=&%+").encode(),
+        "root_path": "",
+        "headers": [(b"host", b"warmup")],
+        "client": None,
+        "server": None,
+    }
+    status = 0
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+
+    return status
+
+
+async def warm_up(app: Any) -> WarmupStats:
+    """Method to prepare the worker before it serves requests.
+
+    The connections to elasticsearch are opened and the generation
+    of the index is read, every Pokémon is cached under it when
+    `ES_WARMUP_PRELOAD` is set, the preloaded Pokémon or a sample
+    one read with `SAMPLE_QUERY` are validated, and the requests
+    of `ES_WARMUP_PATHS` are sent to the application, so that their
+    responses are cached. A failed step is counted and skipped,
+    so that the worker starts anyway.
+
+    Args:
+        app (Any): ASGI application serving `ES_WARMUP_PATHS`.
+
+    Returns:
+        WarmupStats: Work and seconds of each step.
+
+    """
+
+    conf = config.get_config()
+    started = time.perf_counter()
+
+    try:
+        stats.connections = await open_pool()
+        await generation.refresh_generation()
+    except Exception:
+        stats.failures += 1
+    stats.pool_seconds = time.perf_counter() - started
+
+    docs: list[dict[str, Any]] = []
+    if conf.ES_WARMUP_PRELOAD:
+        step = time.perf_counter()
+        try:
+            docs = await async_accessor.preload_pokemon()
+            stats.documents = len(docs)
+        except Exception:
+            stats.failures += 1
+        stats.preload_seconds = time.perf_counter() - step
+
+    step = time.perf_counter()
+    try:
+        if not docs:
+            docs = await async_accessor.search_pokemon(SAMPLE_QUERY)
+        validate(docs)
+    except Exception:
+        stats.failures += 1
+    stats.validation_seconds = time.perf_counter() - step
+
+    step = time.perf_counter()
+    for path in conf.ES_WARMUP_PATHS:
+        try:
+            status = await replay(app, path)
+        except Exception:
+            status = 0
+        if status == 200:
+            stats.queries += 1
+        else:
+            stats.failures += 1
+    stats.queries_seconds = time.perf_counter() - step
+
+    stats.seconds = time.perf_counter() - started
+    stats.completed = True
+
+    return stats
+
+
+def get_warmup_stats() -> dict[str, Any]:
+    """Method to get the work and time of the warm-up on startup.
+
+    Returns:
+        dict[str, Any]: Whether the warm-up completed, numbers of opened
+        connections, preloaded Pokémon, replayed requests and failures,
+        and the seconds of each step and of the whole warm-up.
+
+    """
+
+    return asdict(stats)
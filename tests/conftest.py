@@ -36,7 +36,7 @@ def setup_conditions_mimikkyu_res() -> list[dict[str, Any]]:
                 "special_defense": 105,
                 "speed": 96,
             },
-            "form": "ばれたすがた",
+            "form": "ばけたすがた",
             "gender_type": {"has_female": True, "has_male": True},
             "height": 0.2,
             "is_legendary": False,
@@ -64,7 +64,7 @@ def setup_conditions_mimikkyu_res() -> list[dict[str, Any]]:
                 "special_defense": 105,
                 "speed": 96,
             },
-            "form": "ばけたすがた",
+            "form": "ばれたすがた",
             "gender_type": {"has_female": True, "has_male": True},
             "height": 0.2,
             "is_legendary": False,
@@ -85,227 +85,227 @@ def setup_conditions_bool_res() -> list[dict[str, Any]]:
     return [
         {
             "abilities": {
-                "ability_1": "おわりのだいち",
+                "ability_1": "プレッシャー",
                 "ability_2": None,
-                "hidden_ability": None,
+                "hidden_ability": "きんちょうかん",
             },
             "base_stats": {
-                "attack": 180,
-                "base_total": 770,
-                "defense": 160,
-                "hp": 100,
-                "special_attack": 150,
+                "attack": 110,
+                "base_total": 680,
+                "defense": 90,
+                "hp": 106,
+                "special_attack": 154,
                 "special_defense": 90,
-                "speed": 90,
+                "speed": 130,
             },
             "form": None,
             "gender_type": {"has_female": False, "has_male": False},
-            "height": 5.0,
+            "height": 2.0,
             "is_legendary": True,
             "is_mega_evolution": False,
             "is_mythical": False,
-            "is_primal_reversion": True,
-            "name": "ゲンシグラードン",
-            "national_pokedex_number": 383,
-            "pokemon_type": {"type_1": "じめん", "type_2": "ほのお"},
+            "is_primal_reversion": False,
+            "name": "ミュウツー",
+            "national_pokedex_number": 150,
+            "pokemon_type": {"type_1": "エスパー", "type_2": None},
             "regional_variant": None,
-            "weight": 999.7,
+            "weight": 122.0,
         },
         {
             "abilities": {
-                "ability_1": "ひでり",
+                "ability_1": "ふくつのこころ",
                 "ability_2": None,
                 "hidden_ability": None,
             },
             "base_stats": {
-                "attack": 150,
-                "base_total": 670,
-                "defense": 140,
-                "hp": 100,
-                "special_attack": 100,
-                "special_defense": 90,
-                "speed": 90,
+                "attack": 190,
+                "base_total": 780,
+                "defense": 100,
+                "hp": 106,
+                "special_attack": 154,
+                "special_defense": 100,
+                "speed": 130,
             },
             "form": None,
             "gender_type": {"has_female": False, "has_male": False},
-            "height": 3.5,
+            "height": 2.3,
             "is_legendary": True,
-            "is_mega_evolution": False,
+            "is_mega_evolution": True,
             "is_mythical": False,
             "is_primal_reversion": False,
-            "name": "グラードン",
-            "national_pokedex_number": 383,
-            "pokemon_type": {"type_1": "じめん", "type_2": None},
+            "name": "メガミュウツーＸ",
+            "national_pokedex_number": 150,
+            "pokemon_type": {"type_1": "エスパー", "type_2": "かくとう"},
             "regional_variant": None,
-            "weight": 950.0,
+            "weight": 127.0,
         },
         {
             "abilities": {
-                "ability_1": "はじまりのうみ",
+                "ability_1": "ふみん",
                 "ability_2": None,
                 "hidden_ability": None,
             },
             "base_stats": {
                 "attack": 150,
-                "base_total": 770,
-                "defense": 90,
-                "hp": 100,
-                "special_attack": 180,
-                "special_defense": 160,
-                "speed": 90,
+                "base_total": 780,
+                "defense": 70,
+                "hp": 106,
+                "special_attack": 194,
+                "special_defense": 120,
+                "speed": 140,
             },
             "form": None,
             "gender_type": {"has_female": False, "has_male": False},
-            "height": 9.8,
+            "height": 1.5,
             "is_legendary": True,
-            "is_mega_evolution": False,
+            "is_mega_evolution": True,
             "is_mythical": False,
-            "is_primal_reversion": True,
-            "name": "ゲンシカイオーガ",
-            "national_pokedex_number": 382,
-            "pokemon_type": {"type_1": "みず", "type_2": None},
+            "is_primal_reversion": False,
+            "name": "メガミュウツーＹ",
+            "national_pokedex_number": 150,
+            "pokemon_type": {"type_1": "エスパー", "type_2": None},
             "regional_variant": None,
-            "weight": 430.0,
+            "weight": 33.0,
         },
         {
             "abilities": {
-                "ability_1": "あめふらし",
+                "ability_1": "シンクロ",
                 "ability_2": None,
                 "hidden_ability": None,
             },
             "base_stats": {
                 "attack": 100,
-                "base_total": 670,
-                "defense": 90,
+                "base_total": 600,
+                "defense": 100,
                 "hp": 100,
-                "special_attack": 150,
-                "special_defense": 140,
-                "speed": 90,
+                "special_attack": 100,
+                "special_defense": 100,
+                "speed": 100,
             },
             "form": None,
             "gender_type": {"has_female": False, "has_male": False},
-            "height": 4.5,
+            "height": 0.4,
             "is_legendary": True,
             "is_mega_evolution": False,
-            "is_mythical": False,
+            "is_mythical": True,
             "is_primal_reversion": False,
-            "name": "カイオーガ",
-            "national_pokedex_number": 382,
-            "pokemon_type": {"type_1": "みず", "type_2": None},
+            "name": "ミュウ",
+            "national_pokedex_number": 151,
+            "pokemon_type": {"type_1": "エスパー", "type_2": None},
             "regional_variant": None,
-            "weight": 352.0,
+            "weight": 4.0,
         },
         {
             "abilities": {
-                "ability_1": "シンクロ",
+                "ability_1": "あめふらし",
                 "ability_2": None,
                 "hidden_ability": None,
             },
             "base_stats": {
                 "attack": 100,
-                "base_total": 600,
-                "defense": 100,
+                "base_total": 670,
+                "defense": 90,
                 "hp": 100,
-                "special_attack": 100,
-                "special_defense": 100,
-                "speed": 100,
+                "special_attack": 150,
+                "special_defense": 140,
+                "speed": 90,
             },
             "form": None,
             "gender_type": {"has_female": False, "has_male": False},
-            "height": 0.4,
+            "height": 4.5,
             "is_legendary": True,
             "is_mega_evolution": False,
-            "is_mythical": True,
+            "is_mythical": False,
             "is_primal_reversion": False,
-            "name": "ミュウ",
-            "national_pokedex_number": 151,
-            "pokemon_type": {"type_1": "エスパー", "type_2": None},
+            "name": "カイオーガ",
+            "national_pokedex_number": 382,
+            "pokemon_type": {"type_1": "みず", "type_2": None},
             "regional_variant": None,
-            "weight": 4.0,
+            "weight": 352.0,
         },
         {
             "abilities": {
-                "ability_1": "ふみん",
+                "ability_1": "はじまりのうみ",
                 "ability_2": None,
                 "hidden_ability": None,
             },
             "base_stats": {
                 "attack": 150,
-                "base_total": 780,
-                "defense": 70,
-                "hp": 106,
-                "special_attack": 194,
-                "special_defense": 120,
-                "speed": 140,
+                "base_total": 770,
+                "defense": 90,
+                "hp": 100,
+                "special_attack": 180,
+                "special_defense": 160,
+                "speed": 90,
             },
             "form": None,
             "gender_type": {"has_female": False, "has_male": False},
-            "height": 1.5,
+            "height": 9.8,
             "is_legendary": True,
-            "is_mega_evolution": True,
+            "is_mega_evolution": False,
             "is_mythical": False,
-            "is_primal_reversion": False,
-            "name": "メガミュウツーＹ",
-            "national_pokedex_number": 150,
-            "pokemon_type": {"type_1": "エスパー", "type_2": None},
+            "is_primal_reversion": True,
+            "name": "ゲンシカイオーガ",
+            "national_pokedex_number": 382,
+            "pokemon_type": {"type_1": "みず", "type_2": None},
             "regional_variant": None,
-            "weight": 33.0,
+            "weight": 430.0,
         },
         {
             "abilities": {
-                "ability_1": "ふくつのこころ",
+                "ability_1": "ひでり",
                 "ability_2": None,
                 "hidden_ability": None,
             },
             "base_stats": {
-                "attack": 190,
-                "base_total": 780,
-                "defense": 100,
-                "hp": 106,
-                "special_attack": 154,
-                "special_defense": 100,
-                "speed": 130,
+                "attack": 150,
+                "base_total": 670,
+                "defense": 140,
+                "hp": 100,
+                "special_attack": 100,
+                "special_defense": 90,
+                "speed": 90,
             },
             "form": None,
             "gender_type": {"has_female": False, "has_male": False},
-            "height": 2.3,
+            "height": 3.5,
             "is_legendary": True,
-            "is_mega_evolution": True,
+            "is_mega_evolution": False,
             "is_mythical": False,
             "is_primal_reversion": False,
-            "name": "メガミュウツーＸ",
-            "national_pokedex_number": 150,
-            "pokemon_type": {"type_1": "エスパー", "type_2": "かくとう"},
+            "name": "グラードン",
+            "national_pokedex_number": 383,
+            "pokemon_type": {"type_1": "じめん", "type_2": None},
             "regional_variant": None,
-            "weight": 127.0,
+            "weight": 950.0,
         },
         {
             "abilities": {
-                "ability_1": "プレッシャー",
+                "ability_1": "おわりのだいち",
                 "ability_2": None,
-                "hidden_ability": "きんちょうかん",
+                "hidden_ability": None,
             },
             "base_stats": {
-                "attack": 110,
-                "base_total": 680,
-                "defense": 90,
-                "hp": 106,
-                "special_attack": 154,
+                "attack": 180,
+                "base_total": 770,
+                "defense": 160,
+                "hp": 100,
+                "special_attack": 150,
                 "special_defense": 90,
-                "speed": 130,
+                "speed": 90,
             },
             "form": None,
             "gender_type": {"has_female": False, "has_male": False},
-            "height": 2.0,
+            "height": 5.0,
             "is_legendary": True,
             "is_mega_evolution": False,
             "is_mythical": False,
-            "is_primal_reversion": False,
-            "name": "ミュウツー",
-            "national_pokedex_number": 150,
-            "pokemon_type": {"type_1": "エスパー", "type_2": None},
+            "is_primal_reversion": True,
+            "name": "ゲンシグラードン",
+            "national_pokedex_number": 383,
+            "pokemon_type": {"type_1": "じめん", "type_2": "ほのお"},
             "regional_variant": None,
-            "weight": 122.0,
+            "weight": 999.7,
         },
     ]
 
@@ -314,283 +314,283 @@ def setup_conditions_bool_res() -> list[dict[str, Any]]:
 def setup_null_conditions_res() -> list[dict[str, Any]]:
     return [
         {
-            "national_pokedex_number": 778,
-            "name": "ミミッキュ",
-            "form": "ばれたすがた",
+            "national_pokedex_number": 1,
+            "name": "フシギダネ",
+            "form": None,
             "regional_variant": None,
             "is_mega_evolution": False,
             "is_primal_reversion": False,
             "is_legendary": False,
             "is_mythical": False,
-            "height": 0.2,
-            "weight": 0.7,
+            "height": 0.7,
+            "weight": 6.9,
             "gender_type": {"has_male": True, "has_female": True},
-            "pokemon_type": {"type_1": "ゴースト", "type_2": "フェアリー"},
+            "pokemon_type": {"type_1": "くさ", "type_2": "どく"},
             "abilities": {
-                "ability_1": "ばけのかわ",
+                "ability_1": "しんりょく",
                 "ability_2": None,
-                "hidden_ability": None,
+                "hidden_ability": "ようりょくそ",
             },
             "base_stats": {
-                "hp": 55,
-                "attack": 90,
-                "defense": 80,
-                "special_attack": 50,
-                "special_defense": 105,
-                "speed": 96,
-                "base_total": 476,
+                "hp": 45,
+                "attack": 49,
+                "defense": 49,
+                "special_attack": 65,
+                "special_defense": 65,
+                "speed": 45,
+                "base_total": 318,
             },
         },
         {
-            "national_pokedex_number": 778,
-            "name": "ミミッキュ",
-            "form": "ばけたすがた",
+            "national_pokedex_number": 2,
+            "name": "フシギソウ",
+            "form": None,
             "regional_variant": None,
             "is_mega_evolution": False,
             "is_primal_reversion": False,
             "is_legendary": False,
             "is_mythical": False,
-            "height": 0.2,
-            "weight": 0.7,
+            "height": 1,
+            "weight": 13,
             "gender_type": {"has_male": True, "has_female": True},
-            "pokemon_type": {"type_1": "ゴースト", "type_2": "フェアリー"},
+            "pokemon_type": {"type_1": "くさ", "type_2": "どく"},
             "abilities": {
-                "ability_1": "ばけのかわ",
+                "ability_1": "しんりょく",
                 "ability_2": None,
-                "hidden_ability": None,
+                "hidden_ability": "ようりょくそ",
             },
             "base_stats": {
-                "hp": 55,
-                "attack": 90,
-                "defense": 80,
-                "special_attack": 50,
-                "special_defense": 105,
-                "speed": 96,
-                "base_total": 476,
+                "hp": 60,
+                "attack": 62,
+                "defense": 63,
+                "special_attack": 80,
+                "special_defense": 80,
+                "speed": 60,
+                "base_total": 405,
             },
         },
         {
-            "national_pokedex_number": 383,
-            "name": "ゲンシグラードン",
+            "national_pokedex_number": 3,
+            "name": "フシギバナ",
             "form": None,
             "regional_variant": None,
             "is_mega_evolution": False,
-            "is_primal_reversion": True,
-            "is_legendary": True,
+            "is_primal_reversion": False,
+            "is_legendary": False,
             "is_mythical": False,
-            "height": 5,
-            "weight": 999.7,
-            "gender_type": {"has_male": False, "has_female": False},
-            "pokemon_type": {"type_1": "じめん", "type_2": "ほのお"},
+            "height": 2,
+            "weight": 100,
+            "gender_type": {"has_male": True, "has_female": True},
+            "pokemon_type": {"type_1": "くさ", "type_2": "どく"},
             "abilities": {
-                "ability_1": "おわりのだいち",
+                "ability_1": "しんりょく",
                 "ability_2": None,
-                "hidden_ability": None,
+                "hidden_ability": "ようりょくそ",
             },
             "base_stats": {
-                "hp": 100,
-                "attack": 180,
-                "defense": 160,
-                "special_attack": 150,
-                "special_defense": 90,
-                "speed": 90,
-                "base_total": 770,
+                "hp": 80,
+                "attack": 82,
+                "defense": 83,
+                "special_attack": 100,
+                "special_defense": 100,
+                "speed": 80,
+                "base_total": 525,
             },
         },
         {
-            "national_pokedex_number": 383,
-            "name": "グラードン",
+            "national_pokedex_number": 3,
+            "name": "メガフシギバナ",
             "form": None,
             "regional_variant": None,
-            "is_mega_evolution": False,
+            "is_mega_evolution": True,
             "is_primal_reversion": False,
-            "is_legendary": True,
+            "is_legendary": False,
             "is_mythical": False,
-            "height": 3.5,
-            "weight": 950,
-            "gender_type": {"has_male": False, "has_female": False},
-            "pokemon_type": {"type_1": "じめん", "type_2": None},
+            "height": 2.4,
+            "weight": 155.5,
+            "gender_type": {"has_male": True, "has_female": True},
+            "pokemon_type": {"type_1": "くさ", "type_2": "どく"},
             "abilities": {
-                "ability_1": "ひでり",
+                "ability_1": "あついしぼう",
                 "ability_2": None,
                 "hidden_ability": None,
             },
             "base_stats": {
-                "hp": 100,
-                "attack": 150,
-                "defense": 140,
-                "special_attack": 100,
-                "special_defense": 90,
-                "speed": 90,
-                "base_total": 670,
+                "hp": 80,
+                "attack": 100,
+                "defense": 123,
+                "special_attack": 122,
+                "special_defense": 120,
+                "speed": 80,
+                "base_total": 625,
             },
         },
         {
-            "national_pokedex_number": 382,
-            "name": "ゲンシカイオーガ",
+            "national_pokedex_number": 4,
+            "name": "ヒトカゲ",
             "form": None,
             "regional_variant": None,
             "is_mega_evolution": False,
-            "is_primal_reversion": True,
-            "is_legendary": True,
+            "is_primal_reversion": False,
+            "is_legendary": False,
             "is_mythical": False,
-            "height": 9.8,
-            "weight": 430,
-            "gender_type": {"has_male": False, "has_female": False},
-            "pokemon_type": {"type_1": "みず", "type_2": None},
+            "height": 0.6,
+            "weight": 8.5,
+            "gender_type": {"has_male": True, "has_female": True},
+            "pokemon_type": {"type_1": "ほのお", "type_2": None},
             "abilities": {
-                "ability_1": "はじまりのうみ",
+                "ability_1": "もうか",
                 "ability_2": None,
-                "hidden_ability": None,
+                "hidden_ability": "サンパワー",
             },
             "base_stats": {
-                "hp": 100,
-                "attack": 150,
-                "defense": 90,
-                "special_attack": 180,
-                "special_defense": 160,
-                "speed": 90,
-                "base_total": 770,
+                "hp": 39,
+                "attack": 52,
+                "defense": 43,
+                "special_attack": 60,
+                "special_defense": 50,
+                "speed": 65,
+                "base_total": 309,
             },
         },
         {
-            "national_pokedex_number": 382,
-            "name": "カイオーガ",
+            "national_pokedex_number": 5,
+            "name": "リザード",
             "form": None,
             "regional_variant": None,
             "is_mega_evolution": False,
             "is_primal_reversion": False,
-            "is_legendary": True,
+            "is_legendary": False,
             "is_mythical": False,
-            "height": 4.5,
-            "weight": 352,
-            "gender_type": {"has_male": False, "has_female": False},
-            "pokemon_type": {"type_1": "みず", "type_2": None},
+            "height": 1.1,
+            "weight": 19,
+            "gender_type": {"has_male": True, "has_female": True},
+            "pokemon_type": {"type_1": "ほのお", "type_2": None},
             "abilities": {
-                "ability_1": "あめふらし",
+                "ability_1": "もうか",
                 "ability_2": None,
-                "hidden_ability": None,
+                "hidden_ability": "サンパワー",
             },
             "base_stats": {
-                "hp": 100,
-                "attack": 100,
-                "defense": 90,
-                "special_attack": 150,
-                "special_defense": 140,
-                "speed": 90,
-                "base_total": 670,
+                "hp": 58,
+                "attack": 64,
+                "defense": 58,
+                "special_attack": 80,
+                "special_defense": 65,
+                "speed": 80,
+                "base_total": 405,
             },
         },
         {
-            "national_pokedex_number": 151,
-            "name": "ミュウ",
+            "national_pokedex_number": 6,
+            "name": "リザードン",
             "form": None,
             "regional_variant": None,
             "is_mega_evolution": False,
             "is_primal_reversion": False,
-            "is_legendary": True,
-            "is_mythical": True,
-            "height": 0.4,
-            "weight": 4,
-            "gender_type": {"has_male": False, "has_female": False},
-            "pokemon_type": {"type_1": "エスパー", "type_2": None},
+            "is_legendary": False,
+            "is_mythical": False,
+            "height": 1.7,
+            "weight": 90.5,
+            "gender_type": {"has_male": True, "has_female": True},
+            "pokemon_type": {"type_1": "ほのお", "type_2": "ひこう"},
             "abilities": {
-                "ability_1": "シンクロ",
+                "ability_1": "もうか",
                 "ability_2": None,
-                "hidden_ability": None,
+                "hidden_ability": "サンパワー",
             },
             "base_stats": {
-                "hp": 100,
-                "attack": 100,
-                "defense": 100,
-                "special_attack": 100,
-                "special_defense": 100,
+                "hp": 78,
+                "attack": 84,
+                "defense": 78,
+                "special_attack": 109,
+                "special_defense": 85,
                 "speed": 100,
-                "base_total": 600,
+                "base_total": 534,
             },
         },
         {
-            "national_pokedex_number": 150,
-            "name": "メガミュウツーＹ",
+            "national_pokedex_number": 6,
+            "name": "メガリザードンＸ",
             "form": None,
             "regional_variant": None,
             "is_mega_evolution": True,
             "is_primal_reversion": False,
-            "is_legendary": True,
+            "is_legendary": False,
             "is_mythical": False,
-            "height": 1.5,
-            "weight": 33,
-            "gender_type": {"has_male": False, "has_female": False},
-            "pokemon_type": {"type_1": "エスパー", "type_2": None},
+            "height": 1.7,
+            "weight": 110.5,
+            "gender_type": {"has_male": True, "has_female": True},
+            "pokemon_type": {"type_1": "ほのお", "type_2": "ドラゴン"},
             "abilities": {
-                "ability_1": "ふみん",
+                "ability_1": "かたいツメ",
                 "ability_2": None,
                 "hidden_ability": None,
             },
             "base_stats": {
-                "hp": 106,
-                "attack": 150,
-                "defense": 70,
-                "special_attack": 194,
-                "special_defense": 120,
-                "speed": 140,
-                "base_total": 780,
+                "hp": 78,
+                "attack": 130,
+                "defense": 111,
+                "special_attack": 130,
+                "special_defense": 85,
+                "speed": 100,
+                "base_total": 634,
             },
         },
         {
-            "national_pokedex_number": 150,
-            "name": "メガミュウツーＸ",
+            "national_pokedex_number": 6,
+            "name": "メガリザードンＹ",
             "form": None,
             "regional_variant": None,
             "is_mega_evolution": True,
             "is_primal_reversion": False,
-            "is_legendary": True,
+            "is_legendary": False,
             "is_mythical": False,
-            "height": 2.3,
-            "weight": 127,
-            "gender_type": {"has_male": False, "has_female": False},
-            "pokemon_type": {"type_1": "エスパー", "type_2": "かくとう"},
+            "height": 1.7,
+            "weight": 100.5,
+            "gender_type": {"has_male": True, "has_female": True},
+            "pokemon_type": {"type_1": "ほのお", "type_2": "ひこう"},
             "abilities": {
-                "ability_1": "ふくつのこころ",
+                "ability_1": "ひでり",
                 "ability_2": None,
                 "hidden_ability": None,
             },
             "base_stats": {
-                "hp": 106,
-                "attack": 190,
-                "defense": 100,
-                "special_attack": 154,
-                "special_defense": 100,
-                "speed": 130,
-                "base_total": 780,
+                "hp": 78,
+                "attack": 104,
+                "defense": 78,
+                "special_attack": 159,
+                "special_defense": 115,
+                "speed": 100,
+                "base_total": 634,
             },
         },
         {
-            "national_pokedex_number": 150,
-            "name": "ミュウツー",
+            "national_pokedex_number": 7,
+            "name": "ゼニガメ",
             "form": None,
             "regional_variant": None,
             "is_mega_evolution": False,
             "is_primal_reversion": False,
-            "is_legendary": True,
+            "is_legendary": False,
             "is_mythical": False,
-            "height": 2,
-            "weight": 122,
-            "gender_type": {"has_male": False, "has_female": False},
-            "pokemon_type": {"type_1": "エスパー", "type_2": None},
+            "height": 0.5,
+            "weight": 9,
+            "gender_type": {"has_male": True, "has_female": True},
+            "pokemon_type": {"type_1": "みず", "type_2": None},
             "abilities": {
-                "ability_1": "プレッシャー",
+                "ability_1": "げきりゅう",
                 "ability_2": None,
-                "hidden_ability": "きんちょうかん",
+                "hidden_ability": "あめうけざら",
             },
             "base_stats": {
-                "hp": 106,
-                "attack": 110,
-                "defense": 90,
-                "special_attack": 154,
-                "special_defense": 90,
-                "speed": 130,
-                "base_total": 680,
+                "hp": 44,
+                "attack": 48,
+                "defense": 65,
+                "special_attack": 50,
+                "special_defense": 64,
+                "speed": 43,
+                "base_total": 314,
             },
         },
     ]
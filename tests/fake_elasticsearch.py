@@ -0,0 +1,116 @@
+import json
+import multiprocessing
+import socket
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+
+class FakeNode:
+    """Node of elasticsearch faked in its own process.
+
+    Searches are answered with no hits after `delay` seconds, or with
+    `status` when it is not 200. `/_nodes/_all/http` answers the nodes
+    registered with `set_peers`, and `/_fake/counts` the number
+    of searches served.
+
+    Args:
+        delay (float): Seconds to wait before answering a search.
+        status (int): Status of the answers to searches.
+    """
+
+    def __init__(self, delay: float = 0.0, status: int = 200) -> None:
+        ports: Any = multiprocessing.Queue()
+        self.process = multiprocessing.Process(
+            target=_serve, args=(delay, status, ports), daemon=True
+        )
+        self.process.start()
+        self.port: int = ports.get(timeout=10)
+        self.url = f"http://127.0.0.1:{self.port}"
+
+    def request(self, method: str, path: str, body: Any = None) -> Any:
+        data = json.dumps(body).encode() if body is not None else None
+        request = urllib.request.Request(
+            self.url + path, data=data, method=method
+        )
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return json.loads(response.read())
+
+    def set_peers(self, nodes: list["FakeNode"]) -> None:
+        self.request("POST", "/_fake/peers", [node.port for node in nodes])
+
+    def searches(self) -> int:
+        return int(self.request("GET", "/_fake/counts")["search"])
+
+    def stop(self) -> None:
+        self.process.terminate()
+        self.process.join()
+
+
+def _serve(delay: float, status: int, ports: Any) -> None:
+    state: dict[str, Any] = {"search": 0, "peers": []}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self) -> None:
+            super().setup()
+            self.connection.setsockopt(
+                socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+            )
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+        def send(self, code: int, body: Any) -> None:
+            data = json.dumps(body).encode()
+            self.send_response(code)
+            self.send_header("content-type", "application/json")
+            self.send_header("content-length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_HEAD(self) -> None:  # noqa: N802
+            self.send_response(200)
+            self.send_header("content-length", "0")
+            self.end_headers()
+
+        def do_GET(self) -> None:  # noqa: N802
+            self.handle_request()
+
+        def do_POST(self) -> None:  # noqa: N802
+            self.handle_request()
+
+        def handle_request(self) -> None:
+            length = int(self.headers.get("content-length") or 0)
+            body = self.rfile.read(length) if length else b""
+            path = self.path.split("?")[0]
+
+            if path == "/_fake/peers":
+                state["peers"] = json.loads(body)
+                self.send(200, {})
+            elif path == "/_fake/counts":
+                self.send(200, {"search": state["search"]})
+            elif path.startswith("/_nodes"):
+                nodes = {
+                    f"node-{port}": {
+                        "roles": ["data", "master"],
+                        "http": {"publish_address": f"127.0.0.1:{port}"},
+                    }
+                    for port in state["peers"]
+                }
+                self.send(200, {"nodes": nodes})
+            elif path.endswith("/_search"):
+                state["search"] += 1
+                time.sleep(delay)
+                if status != 200:
+                    self.send(status, {"error": "unavailable"})
+                else:
+                    self.send(200, {"hits": {"hits": []}})
+            else:
+                self.send(200, {"version": {"number": "7.10.1"}})
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    ports.put(server.server_address[1])
+    server.serve_forever()
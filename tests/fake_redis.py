@@ -0,0 +1,150 @@
+import socket
+import socketserver
+import threading
+import time
+from typing import Any
+
+
+class FakeRedis:
+    """Server of the Redis protocol faked in a thread.
+
+    It knows GET, MGET, SET with PX or EX, DEL, PING, AUTH, SELECT
+    and FLUSHDB. `rounds` counts the reads of the server that held
+    commands, which is the number of round trips of pipelined clients.
+
+    Args:
+        password (str | None): Password AUTH must be given first.
+    """
+
+    def __init__(self, password: str | None = None) -> None:
+        self.password = password
+        self.data: dict[bytes, tuple[bytes, float | None]] = {}
+        self.commands: list[list[bytes]] = []
+        self.rounds = 0
+        self.lock = threading.Lock()
+
+        fake = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self) -> None:
+                self.request.setsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+                )
+                fake.serve(self.request)
+
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        self.server = socketserver.ThreadingTCPServer(
+            ("127.0.0.1", 0), Handler
+        )
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        self.url = f"redis://127.0.0.1:{self.port}/0"
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, args=(0.01,), daemon=True
+        )
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def serve(self, sock: socket.socket) -> None:
+        buffer = b""
+        authenticated = self.password is None
+        while True:
+            try:
+                chunk = sock.recv(65536)
+            except OSError:
+                return
+            if not chunk:
+                return
+            buffer += chunk
+
+            replies = []
+            while True:
+                parsed = _parse_command(buffer)
+                if parsed is None:
+                    break
+                command, buffer = parsed
+                with self.lock:
+                    self.commands.append(command)
+                    if command[0].upper() == b"AUTH":
+                        authenticated = command[-1].decode() == self.password
+                        replies.append(
+                            b"+OK\r\n"
+                            if authenticated
+                            else b"-WRONGPASS invalid password\r\n"
+                        )
+                    elif not authenticated:
+                        replies.append(b"-NOAUTH Authentication required\r\n")
+                    else:
+                        replies.append(self.execute(command))
+
+            if replies:
+                with self.lock:
+                    self.rounds += 1
+                sock.sendall(b"".join(replies))
+
+    def execute(self, command: list[bytes]) -> bytes:
+        name, args = command[0].upper(), command[1:]
+        if name == b"PING":
+            return b"+PONG\r\n"
+        if name in (b"SELECT", b"FLUSHDB"):
+            if name == b"FLUSHDB":
+                self.data.clear()
+            return b"+OK\r\n"
+        if name == b"GET":
+            return _bulk(self.lookup(args[0]))
+        if name == b"MGET":
+            values = [_bulk(self.lookup(key)) for key in args]
+            return b"*%d\r\n" % len(values) + b"".join(values)
+        if name == b"SET":
+            expires_at = None
+            if len(args) == 4:
+                unit = 1000 if args[2].upper() == b"PX" else 1
+                expires_at = time.monotonic() + int(args[3]) / unit
+            self.data[args[0]] = (args[1], expires_at)
+            return b"+OK\r\n"
+        if name == b"DEL":
+            removed = sum(self.data.pop(key, None) is not None for key in args)
+            return b":%d\r\n" % removed
+
+        return b"-ERR unknown command\r\n"
+
+    def lookup(self, key: bytes) -> bytes | None:
+        value, expires_at = self.data.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+
+def _bulk(value: bytes | None) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+def _parse_command(buffer: bytes) -> tuple[list[bytes], bytes] | None:
+    if not buffer.startswith(b"*"):
+        return None
+
+    end = buffer.find(b"\r\n")
+    if end < 0:
+        return None
+    count = int(buffer[1:end])
+    position = end + 2
+
+    args: list[Any] = []
+    for _ in range(count):
+        end = buffer.find(b"\r\n", position)
+        if end < 0:
+            return None
+        head, start = position + 1, end + 2
+        stop = start + int(buffer[head:end])
+        if len(buffer) < stop + 2:
+            return None
+        args.append(buffer[start:stop])
+        position = stop + 2
+
+    return args, buffer[position:]
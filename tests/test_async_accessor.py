@@ -0,0 +1,551 @@
+import asyncio
+import json
+import time
+from typing import Any, Generator
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pokeapi.search import (
+    async_accessor,
+    bitmap,
+    cache,
+    docmap,
+    generation,
+    membership,
+    memory,
+    redis_cache,
+)
+from pokeapi.search.param import CreateAbilityParam, CreatePageParam
+from pokeapi.search.query import (
+    CreateConditionalSearchQuery,
+    CreatePaginatedQuery,
+)
+
+from .fake_redis import FakeRedis
+
+
+# change ES_CONNECTION_URL in setup when running with devcontainer
+class TestAsyncAccessor:
+    @pytest.mark.usefixtures("_setup_get_config")
+    def test_search_pokemon(self) -> None:
+        query = {
+            "query": {
+                "bool": {"must": [{"term": {"national_pokedex_number": 25}}]}
+            }
+        }
+        actual = asyncio.run(async_accessor.search_pokemon(query))
+
+        assert [doc["name"] for doc in actual] == ["ピカチュウ"]
+
+    @pytest.mark.usefixtures("_setup_get_config")
+    def test_search_pokemon_not_applicable(self) -> None:
+        query = {
+            "query": {
+                "bool": {"must": [{"term": {"national_pokedex_number": 0}}]}
+            }
+        }
+        actual = asyncio.run(async_accessor.search_pokemon(query))
+
+        assert actual == []
+
+    @pytest.mark.usefixtures("_setup_get_config")
+    def test_search_pokemon_raw(self) -> None:
+        conditions = CreateConditionalSearchQuery().create_query(
+            (CreateAbilityParam(("ばけのかわ", None, None)),)
+        )
+        query = CreatePaginatedQuery().create_query(
+            (conditions, CreatePageParam(1, None, True))
+        )
+
+        async def search() -> Any:
+            return (
+                await async_accessor.search_pokemon_raw(query),
+                await async_accessor.search_pokemon_page(query),
+            )
+
+        raw_page, page = asyncio.run(search())
+
+        assert json.loads(raw_page.content) == page.docs
+        assert raw_page.count == 1
+        assert raw_page.last_sort == page.last_sort
+        assert raw_page.total == page.total == 2
+
+
+class FakeAsyncClient:
+    def __init__(self, docs: dict[str, dict[str, Any]]) -> None:
+        self.docs = docs
+        self.calls: list[str] = []
+
+    async def search(
+        self, index: str, body: dict[str, Any], request_timeout: float
+    ) -> Any:
+        self.calls.append("search")
+        number = body["query"]["bool"]["filter"][0]["term"][
+            "national_pokedex_number"
+        ]
+        hits = [
+            {"_id": _id, "_source": doc}
+            for _id, doc in self.docs.items()
+            if doc["national_pokedex_number"] == number
+        ]
+        return {"hits": {"hits": hits}}
+
+    async def mget(
+        self,
+        index: str,
+        body: dict[str, Any],
+        realtime: bool,
+        request_timeout: float,
+    ) -> Any:
+        self.calls.append("mget")
+        docs = [
+            {"_id": _id, "found": True, "_source": self.docs[_id]}
+            if _id in self.docs
+            else {"_id": _id, "found": False}
+            for _id in body["ids"]
+        ]
+        return {"docs": docs}
+
+
+@pytest.fixture()
+def fake_client(
+    mocker: MockerFixture,
+) -> Generator[FakeAsyncClient, None, None]:
+    fake = FakeAsyncClient(
+        {
+            "7": {"national_pokedex_number": 6, "name": "リザードン"},
+            "8": {"national_pokedex_number": 6, "name": "メガリザードンＸ"},
+            "9": {"national_pokedex_number": 6, "name": "メガリザードンＹ"},
+        }
+    )
+    mocker.patch.object(
+        async_accessor.client, "get_async_client", return_value=fake
+    )
+    docmap.pokedex_ids.clear()
+    yield fake
+    docmap.pokedex_ids.clear()
+
+
+@pytest.fixture()
+def response_cache(mocker: MockerFixture) -> cache.ResponseCache:
+    response_cache = cache.ResponseCache(10)
+    mocker.patch.object(cache, "get_cache", return_value=response_cache)
+    generation.reset_generation()
+
+    return response_cache
+
+
+@pytest.mark.usefixtures("_setup_get_config")
+class TestSearchPokemonByPokedexNumber:
+    def test_search_pokemon_by_pokedex_number(
+        self, fake_client: FakeAsyncClient
+    ) -> None:
+        first = asyncio.run(async_accessor.search_pokemon_by_pokedex_number(6))
+        second = asyncio.run(
+            async_accessor.search_pokemon_by_pokedex_number(6)
+        )
+
+        assert [doc["name"] for doc in first] == [
+            "リザードン",
+            "メガリザードンＸ",
+            "メガリザードンＹ",
+        ]
+        assert second == first
+        assert fake_client.calls == ["search", "mget"]
+
+    def test_search_pokemon_by_pokedex_number_stale(
+        self, fake_client: FakeAsyncClient
+    ) -> None:
+        asyncio.run(async_accessor.search_pokemon_by_pokedex_number(6))
+        del fake_client.docs["9"]
+        actual = asyncio.run(
+            async_accessor.search_pokemon_by_pokedex_number(6)
+        )
+
+        assert [doc["name"] for doc in actual] == [
+            "リザードン",
+            "メガリザードンＸ",
+        ]
+        assert fake_client.calls == ["search", "mget", "search"]
+        assert docmap.pokedex_ids.get(6) == ("7", "8")
+
+    def test_search_pokemon_by_pokedex_number_not_applicable(
+        self, fake_client: FakeAsyncClient
+    ) -> None:
+        asyncio.run(async_accessor.search_pokemon_by_pokedex_number(0))
+
+        assert docmap.pokedex_ids.get(0) is None
+
+
+@pytest.fixture()
+def _negative_cache(mocker: MockerFixture) -> Generator[None, None, None]:
+    conf = mocker.patch.object(membership, "config").get_config.return_value
+    conf.ES_NEGATIVE_CACHE_TTL = 60.0
+    conf.ES_NEGATIVE_CACHE_MAX_ENTRIES = 10
+    membership.reset_membership()
+    yield
+    membership.reset_membership()
+
+
+@pytest.mark.usefixtures("_setup_get_config", "_negative_cache")
+class TestMembership:
+    def test_search_pokemon_by_pokedex_number_negative(
+        self, fake_client: FakeAsyncClient
+    ) -> None:
+        saved = membership.stats.saved
+        for _ in range(3):
+            actual = asyncio.run(
+                async_accessor.search_pokemon_by_pokedex_number(151)
+            )
+            assert actual == []
+
+        assert fake_client.calls == ["search"]
+        assert membership.stats.saved == saved + 2
+
+    def test_search_pokemon_by_pokedex_number_filtered(
+        self, mocker: MockerFixture, fake_client: FakeAsyncClient
+    ) -> None:
+        mocker.patch.object(
+            membership,
+            "_filter",
+            membership.MembershipFilter("a", frozenset({6}), frozenset()),
+        )
+
+        assert (
+            asyncio.run(async_accessor.search_pokemon_by_pokedex_number(151))
+            == []
+        )
+        assert asyncio.run(
+            async_accessor.lookup_pokemon((151,), ("ミュウ",))
+        ) == ({}, {})
+        assert (
+            len(
+                asyncio.run(async_accessor.search_pokemon_by_pokedex_number(6))
+            )
+            == 3
+        )
+        assert fake_client.calls == ["search"]
+
+
+@pytest.mark.usefixtures("_setup_get_config")
+class TestResponseCache:
+    def test_search_pokemon_by_pokedex_number(
+        self, fake_client: FakeAsyncClient, response_cache: cache.ResponseCache
+    ) -> None:
+        async def search() -> list[list[dict]]:
+            return [
+                await async_accessor.search_pokemon_by_pokedex_number(
+                    6, ttl=60
+                )
+                for _ in range(3)
+            ]
+
+        first, second, third = asyncio.run(search())
+
+        assert first == second == third
+        assert fake_client.calls == ["search"]
+        assert response_cache.stats.hits == 2
+
+    def test_search_pokemon(
+        self, fake_client: FakeAsyncClient, response_cache: cache.ResponseCache
+    ) -> None:
+        query = {
+            "query": {
+                "bool": {"filter": [{"term": {"national_pokedex_number": 6}}]}
+            }
+        }
+
+        async def search() -> list[list[dict]]:
+            return [
+                await async_accessor.search_pokemon(query, ttl=60),
+                await async_accessor.search_pokemon(query, ttl=60),
+                await async_accessor.search_pokemon(query),
+            ]
+
+        first, second, third = asyncio.run(search())
+
+        assert first == second == third
+        assert fake_client.calls == ["search", "search"]
+        assert response_cache.stats.hits == 1
+
+
+@pytest.fixture()
+def shared_cache(
+    mocker: MockerFixture,
+) -> Generator[FakeRedis, None, None]:
+    fake = FakeRedis()
+    generation.reset_generation()
+    mocker.patch.object(
+        redis_cache,
+        "get_redis_cache",
+        side_effect=lambda: redis_cache.RedisCache(
+            redis_cache.RedisClient(fake.url, 1.0), "test:"
+        ),
+    )
+    yield fake
+    fake.stop()
+
+
+@pytest.mark.usefixtures("_setup_get_config")
+class TestSharedCache:
+    def test_search_pokemon_by_pokedex_number(
+        self,
+        mocker: MockerFixture,
+        fake_client: FakeAsyncClient,
+        shared_cache: FakeRedis,
+    ) -> None:
+        workers = [cache.ResponseCache(10), cache.ResponseCache(10)]
+        get_cache = mocker.patch.object(cache, "get_cache")
+
+        async def search(worker: cache.ResponseCache) -> list[dict]:
+            get_cache.return_value = worker
+            return await async_accessor.search_pokemon_by_pokedex_number(
+                6, ttl=60
+            )
+
+        first = asyncio.run(search(workers[0]))
+        second = asyncio.run(search(workers[1]))
+        third = asyncio.run(search(workers[1]))
+
+        assert first == second == third
+        assert fake_client.calls == ["search"]
+        assert set(shared_cache.data) == {b"test:pokedex_number:6"}
+        assert workers[1].stats.hits == 1
+
+    def test_search_pokemon_by_pokedex_number_l1_ttl(
+        self,
+        fake_client: FakeAsyncClient,
+        response_cache: cache.ResponseCache,
+        shared_cache: FakeRedis,
+    ) -> None:
+        asyncio.run(async_accessor.search_pokemon_by_pokedex_number(6, ttl=60))
+        entry = response_cache._entries["pokedex_number:6"]
+        l1_ttl = async_accessor.config.get_config().ES_CACHE_L1_TTL
+
+        assert entry.expires_at - time.monotonic() <= l1_ttl
+        assert shared_cache.rounds == 2
+
+    def test_lookup_pokemon(
+        self,
+        mocker: MockerFixture,
+        response_cache: cache.ResponseCache,
+        shared_cache: FakeRedis,
+    ) -> None:
+        docs: list[dict[str, Any]] = [
+            {"national_pokedex_number": 25, "name": "ピカチュウ"},
+            {"national_pokedex_number": 6, "name": "リザードン"},
+            {"national_pokedex_number": 1, "name": "フシギダネ"},
+        ]
+        queries: list[dict] = []
+
+        async def search_pokemon(
+            query: dict[str, Any], deadline: float | None
+        ) -> list[dict]:
+            queries.append(query)
+            terms = json.dumps(query, ensure_ascii=False)
+            return [doc for doc in docs if doc["name"] in terms]
+
+        mocker.patch.object(
+            async_accessor, "search_pokemon", side_effect=search_pokemon
+        )
+        mocker.patch.object(
+            async_accessor.CreateBatchLookupQuery,
+            "create_query",
+            side_effect=lambda targets: {
+                "names": [
+                    doc["name"]
+                    for doc in docs
+                    if doc["national_pokedex_number"] in targets[0]
+                    or doc["name"] in targets[1]
+                ]
+            },
+        )
+
+        async def lookup() -> Any:
+            first = await async_accessor.lookup_pokemon(
+                (25, 6), ("フシギダネ",), ttl=60
+            )
+            response_cache.clear()
+            rounds = shared_cache.rounds
+            second = await async_accessor.lookup_pokemon(
+                (25, 6, 1), ("フシギダネ",), ttl=60
+            )
+            return first, second, shared_cache.rounds - rounds
+
+        first, second, rounds = asyncio.run(lookup())
+
+        assert first == (
+            {25: [docs[0]], 6: [docs[1]]},
+            {"フシギダネ": [docs[2]]},
+        )
+        assert second == (
+            {25: [docs[0]], 6: [docs[1]], 1: [docs[2]]},
+            {"フシギダネ": [docs[2]]},
+        )
+        assert queries == [
+            {"names": ["ピカチュウ", "リザードン", "フシギダネ"]},
+            {"names": ["フシギダネ"]},
+        ]
+        assert rounds == 2
+
+
+@pytest.mark.usefixtures("_setup_get_config")
+class TestGenerationKeys:
+    def test_search_pokemon_by_pokedex_number(
+        self, fake_client: FakeAsyncClient, response_cache: cache.ResponseCache
+    ) -> None:
+        async def search() -> None:
+            for index_generation in ("a", "a", "b"):
+                generation.stats.generation = index_generation
+                await async_accessor.search_pokemon_by_pokedex_number(
+                    6, ttl=60
+                )
+
+        asyncio.run(search())
+        generation.reset_generation()
+
+        assert fake_client.calls == ["search", "mget"]
+        assert set(response_cache._entries) == {
+            "a:pokedex_number:6",
+            "b:pokedex_number:6",
+        }
+
+
+@pytest.mark.usefixtures("_setup_get_config")
+class TestBitmap:
+    def test_search_pokemon_page(self, mocker: MockerFixture) -> None:
+        conditions = CreateConditionalSearchQuery().create_query(
+            (CreateAbilityParam(("ばけのかわ", None, None)),)
+        )
+        query = CreatePaginatedQuery().create_query(
+            (conditions, CreatePageParam(1, None, True))
+        )
+
+        async def search() -> Any:
+            try:
+                return await async_accessor.search_pokemon_page(query)
+            finally:
+                await async_accessor.client.close_async_client()
+
+        expected = asyncio.run(search())
+        dump = memory.load_index("docker/elasticdump/src/pokemon_data.json")
+        mocker.patch.object(
+            bitmap,
+            "_index",
+            bitmap.PageIndex(list(zip(dump.ids, dump.sources))),
+        )
+        get_async_client = mocker.patch.object(
+            async_accessor.client, "get_async_client"
+        )
+        raw_page = asyncio.run(async_accessor.search_pokemon_raw(query))
+
+        assert asyncio.run(search()) == expected
+        assert json.loads(raw_page.content) == expected.docs
+        assert raw_page.last_sort == expected.last_sort
+        assert raw_page.total == expected.total == 2
+        assert get_async_client.call_count == 0
+
+
+class TestCacheParams:
+    def test_cache_params(self) -> None:
+        query = {"query": {"bool": {"filter": [{"term": {"form": "a"}}]}}}
+        first = async_accessor._cache_params({**query, "search_after": [1]})
+        second = async_accessor._cache_params({**query, "search_after": [2]})
+
+        assert first["request_cache"] is True
+        assert first == second
+
+    def test_cache_params_other_query(self) -> None:
+        query_a = {"query": {"bool": {"filter": [{"term": {"form": "a"}}]}}}
+        query_b = {"query": {"bool": {"filter": [{"term": {"form": "b"}}]}}}
+
+        assert (
+            async_accessor._cache_params(query_a)["preference"]
+            != async_accessor._cache_params(query_b)["preference"]
+        )
+
+
+class FakePitClient:
+    def __init__(self, numbers: list[int]) -> None:
+        self.numbers = numbers
+        self.bodies: list[dict[str, Any]] = []
+        self.closed: list[str] = []
+
+    async def open_point_in_time(
+        self, index: str, keep_alive: str, request_timeout: float
+    ) -> Any:
+        return {"id": "pit-0"}
+
+    async def search(
+        self, body: dict[str, Any], request_timeout: float
+    ) -> Any:
+        self.bodies.append(body)
+        after = body.get("search_after", [0])[0]
+        numbers = [n for n in self.numbers if n > after][: body["size"]]
+        hits = [
+            {
+                "_source": {"national_pokedex_number": n},
+                "sort": [n, str(n)],
+            }
+            for n in numbers
+        ]
+        return {"pit_id": f"pit-{len(self.bodies)}", "hits": {"hits": hits}}
+
+    async def close_point_in_time(
+        self, body: dict[str, Any], ignore: int, request_timeout: float
+    ) -> Any:
+        self.closed.append(body["id"])
+
+
+@pytest.mark.usefixtures("_setup_get_config")
+class TestExportPokemon:
+    def test_export_pokemon(self, mocker: MockerFixture) -> None:
+        fake = FakePitClient([1, 2, 3, 4, 5])
+        mocker.patch.object(
+            async_accessor.client, "get_async_client", return_value=fake
+        )
+        mocker.patch.object(
+            async_accessor.config,
+            "get_config",
+            return_value=mocker.Mock(
+                ES_INDEX="pokemon",
+                ES_TIMEOUT=10.0,
+                ES_BREAKER_ENABLED=False,
+                ES_EXPORT_PAGE_SIZE=2,
+                ES_PIT_KEEP_ALIVE="1m",
+            ),
+        )
+
+        async def export() -> list[list[dict]]:
+            return [page async for page in async_accessor.export_pokemon({})]
+
+        actual = asyncio.run(export())
+
+        assert [
+            [doc["national_pokedex_number"] for doc in page] for page in actual
+        ] == [[1, 2], [3, 4], [5]]
+        assert [body["pit"]["id"] for body in fake.bodies] == [
+            "pit-0",
+            "pit-1",
+            "pit-2",
+        ]
+        assert "index" not in fake.bodies[0]
+        assert fake.closed == ["pit-3"]
+
+    def test_export_pokemon_closes_pit_on_error(
+        self, mocker: MockerFixture
+    ) -> None:
+        fake = FakePitClient([1])
+        mocker.patch.object(fake, "search", side_effect=RuntimeError)
+        mocker.patch.object(
+            async_accessor.client, "get_async_client", return_value=fake
+        )
+
+        async def export() -> list[list[dict]]:
+            return [page async for page in async_accessor.export_pokemon({})]
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(export())
+
+        assert fake.closed == ["pit-0"]
@@ -0,0 +1,108 @@
+import asyncio
+from typing import Any
+
+import pytest
+from elasticsearch import TransportError
+from pytest_mock import MockerFixture
+
+from pokeapi.search import batch
+
+
+class FakeAsyncClient:
+    def __init__(self) -> None:
+        self.bodies: list[list[dict[str, Any]]] = []
+
+    async def msearch(self, body: list[dict[str, Any]]) -> dict[str, Any]:
+        self.bodies.append(body)
+        responses: list[dict[str, Any]] = []
+        for query in body[1::2]:
+            if query == {"broken": True}:
+                responses.append(
+                    {"error": {"type": "parsing_exception"}, "status": 400}
+                )
+            else:
+                responses.append({"hits": {"hits": [{"_source": query}]}})
+
+        return {"responses": responses}
+
+
+@pytest.fixture()
+def fake_client(mocker: MockerFixture) -> FakeAsyncClient:
+    fake = FakeAsyncClient()
+    mocker.patch.object(batch.client, "get_async_client", return_value=fake)
+    return fake
+
+
+@pytest.mark.usefixtures("_setup_get_config")
+class TestSearchBatcher:
+    def test_search(self, fake_client: FakeAsyncClient) -> None:
+        batcher = batch.SearchBatcher(0.01, 50)
+
+        async def search_all() -> Any:
+            return await asyncio.gather(
+                *(batcher.search({"n": n}) for n in range(3))
+            )
+
+        actual = asyncio.run(search_all())
+
+        assert [r["hits"]["hits"][0]["_source"] for r in actual] == [
+            {"n": 0},
+            {"n": 1},
+            {"n": 2},
+        ]
+        assert len(fake_client.bodies) == 1
+        assert fake_client.bodies[0][0] == {"index": "pokemon"}
+        assert batcher.stats.batches == 1
+        assert batcher.stats.searches == 3
+        assert batcher.stats.max_batch_size == 3
+
+    def test_search_max_size(self, fake_client: FakeAsyncClient) -> None:
+        batcher = batch.SearchBatcher(10.0, 2)
+
+        async def search_all() -> Any:
+            return await asyncio.gather(
+                *(batcher.search({"n": n}) for n in range(4))
+            )
+
+        actual = asyncio.run(asyncio.wait_for(search_all(), 1.0))
+
+        assert len(actual) == 4
+        assert [len(body) for body in fake_client.bodies] == [4, 4]
+
+    def test_search_params(self, fake_client: FakeAsyncClient) -> None:
+        batcher = batch.SearchBatcher(0.01, 50)
+        params: dict[str, Any] = {"request_cache": True, "preference": "abc"}
+
+        asyncio.run(batcher.search({"n": 0}, params))
+
+        assert fake_client.bodies[0][0] == {"index": "pokemon", **params}
+
+    def test_search_error(self, fake_client: FakeAsyncClient) -> None:
+        batcher = batch.SearchBatcher(0.01, 50)
+
+        async def search_all() -> Any:
+            return await asyncio.gather(
+                batcher.search({"n": 0}),
+                batcher.search({"broken": True}),
+                return_exceptions=True,
+            )
+
+        actual = asyncio.run(search_all())
+
+        assert actual[0]["hits"]["hits"][0]["_source"] == {"n": 0}
+        assert isinstance(actual[1], TransportError)
+        assert actual[1].status_code == 400
+
+    def test_stats_to_dict(self) -> None:
+        stats = batch.BatchStats()
+        stats.record(4, 0.002)
+        stats.record(2, 0.004)
+
+        assert stats.to_dict() == {
+            "batches": 2,
+            "searches": 6,
+            "mean_batch_size": 3.0,
+            "max_batch_size": 4,
+            "mean_wait_ms": pytest.approx(3.0),
+            "max_wait_ms": pytest.approx(4.0),
+        }
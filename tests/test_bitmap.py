@@ -0,0 +1,160 @@
+import asyncio
+from typing import Any, Generator
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pokeapi.search import bitmap, client, memory
+from pokeapi.search.param import (
+    CreateExpressionParam,
+    CreateLegendaryParam,
+    CreatePageParam,
+)
+from pokeapi.search.query import CreatePaginatedQuery, compile_conditions
+
+DUMP = "docker/elasticdump/src/pokemon_data.json"
+
+
+def page_query(expression: str, page: CreatePageParam) -> dict[str, Any]:
+    conditions = compile_conditions((CreateExpressionParam(expression),))
+    return CreatePaginatedQuery().create_query((conditions.query, page))
+
+
+@pytest.fixture()
+def docs() -> list[tuple[str, dict[str, Any]]]:
+    dump = memory.load_index(DUMP)
+    return list(zip(dump.ids, dump.sources))
+
+
+@pytest.fixture()
+def es(
+    mocker: MockerFixture, docs: list[tuple[str, dict[str, Any]]]
+) -> Generator[Any, None, None]:
+    es = mocker.Mock()
+    es.search = mocker.AsyncMock(
+        return_value={
+            "hits": {
+                "total": {"value": len(docs)},
+                "hits": [
+                    {"_id": doc_id, "_source": source}
+                    for doc_id, source in docs
+                ],
+            }
+        }
+    )
+    mocker.patch.object(client, "get_async_client", return_value=es)
+    bitmap.reset_bitmap()
+    yield es
+    bitmap.reset_bitmap()
+
+
+@pytest.fixture()
+def conf(mocker: MockerFixture) -> Any:
+    conf = mocker.patch.object(bitmap, "config").get_config.return_value
+    conf.ES_BITMAP_ENABLED = True
+
+    return conf
+
+
+class TestPageIndex:
+    def test_page(self, docs: list[tuple[str, dict[str, Any]]]) -> None:
+        index = bitmap.PageIndex(docs)
+        first = index.page(index.all, 3)
+        second = index.page(index.all, 3, ["3", "3"])
+
+        assert [index.sort_keys[p] for p in first] == [
+            (1, "1"),
+            (2, "2"),
+            (3, "3"),
+        ]
+        assert index.sort_keys[second[0]] == (3, "4")
+        assert index.page(index.all, 3, [1000, "1000"]) == []
+
+
+class TestSearchPage:
+    def test_search_page(
+        self, mocker: MockerFixture, docs: list[tuple[str, dict[str, Any]]]
+    ) -> None:
+        mocker.patch.object(bitmap, "_index", bitmap.PageIndex(docs))
+        hits = bitmap.stats.hits
+        first = bitmap.search_page(
+            page_query("is_legendary:true", CreatePageParam(5, None, True))
+        )
+
+        assert first is not None
+        sources, last_sort, total = first
+        assert len(sources) == 5
+        assert all(doc["is_legendary"] for doc in sources)
+        assert last_sort is not None
+        assert total == 8
+
+        second = bitmap.search_page(
+            page_query(
+                "is_legendary:true",
+                CreatePageParam(5, [str(last_sort[0]), last_sort[1]]),
+            )
+        )
+
+        assert second is not None
+        assert len(second[0]) == 3
+        assert second[2] is None
+        assert bitmap.stats.hits == hits + 2
+
+    def test_search_page_fallback(
+        self, mocker: MockerFixture, docs: list[tuple[str, dict[str, Any]]]
+    ) -> None:
+        mocker.patch.object(bitmap, "_index", bitmap.PageIndex(docs))
+        fallbacks = bitmap.stats.fallbacks
+        conditions = compile_conditions((CreateLegendaryParam(True),)).query
+
+        assert (
+            bitmap.search_page(page_query("name:ピカチュウ", CreatePageParam(5)))
+            is None
+        )
+        assert bitmap.stats.fallbacks == fallbacks + 1
+        assert bitmap.search_page({**conditions, "size": 5}) is None
+
+    def test_search_page_not_built(self) -> None:
+        bitmap.reset_bitmap()
+
+        assert (
+            bitmap.search_page(
+                page_query("is_legendary:true", CreatePageParam(5))
+            )
+            is None
+        )
+
+
+class TestBitmap:
+    def test_on_generation(self, es: Any, conf: Any) -> None:
+        async def change() -> None:
+            bitmap.on_generation("a")
+            assert bitmap._rebuild is not None
+            await bitmap._rebuild
+
+        asyncio.run(change())
+
+        assert bitmap._index is not None
+        assert bitmap.stats.generation == "a"
+        assert bitmap.stats.documents == 28
+        assert bitmap.stats.rebuilds >= 1
+        assert es.search.call_args.kwargs["body"]["sort"] == bitmap.PAGE_SORT
+
+        conf.ES_BITMAP_ENABLED = False
+        bitmap.on_generation("b")
+
+        assert bitmap._index is None
+        assert bitmap.stats.documents == 0
+
+    def test_rebuild_stale(self, es: Any, conf: Any) -> None:
+        bitmap.stats.generation = "b"
+        asyncio.run(bitmap.rebuild("a"))
+
+        assert bitmap._index is None
+
+    def test_rebuild_incomplete(self, es: Any, conf: Any) -> None:
+        es.search.return_value["hits"]["total"]["value"] = 100
+        bitmap.stats.generation = "a"
+        asyncio.run(bitmap.rebuild("a"))
+
+        assert bitmap._index is None
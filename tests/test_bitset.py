@@ -0,0 +1,135 @@
+from typing import Any
+
+import pytest
+
+from pokeapi.search import memory
+from pokeapi.search.bitset import BitmapIndex, UnsupportedQueryError
+from pokeapi.search.param import (
+    CreateAbilityParam,
+    CreateExpressionParam,
+    CreateGenderTypeParam,
+)
+from pokeapi.search.query import compile_conditions
+
+DUMP = "docker/elasticdump/src/pokemon_data.json"
+
+
+@pytest.fixture()
+def index() -> BitmapIndex:
+    dump = memory.load_index(DUMP)
+    return BitmapIndex(list(zip(dump.ids, dump.sources)))
+
+
+def sources(index: BitmapIndex, bits: int) -> list[dict[str, Any]]:
+    return [index.sources[position] for position in index.positions(bits)]
+
+
+class TestBitmapIndex:
+    def test_build(self, index: BitmapIndex) -> None:
+        assert len(index) == 28
+        assert index.count(index.all) == 28
+        assert "name" in index.text_fields
+        assert "name" not in index.bitsets
+        assert index.count(index.lookup("name.keyword", "ミミッキュ")) == 2
+        assert index.count_bitsets() > len(index)
+
+    def test_evaluate_conditions(
+        self,
+        index: BitmapIndex,
+        setup_conditions_mimikkyu_res: list[dict[str, Any]],
+    ) -> None:
+        query = compile_conditions(
+            (
+                CreateAbilityParam(("ばけのかわ", None, None)),
+                CreateGenderTypeParam((True, None)),
+            )
+        ).query
+
+        assert (
+            sources(index, index.evaluate(query["query"]))
+            == setup_conditions_mimikkyu_res
+        )
+
+    def test_evaluate_must_not(self, index: BitmapIndex) -> None:
+        query = compile_conditions(
+            (CreateExpressionParam("NOT is_legendary:true"),)
+        ).query
+        actual = index.evaluate(query["query"])
+
+        assert index.count(actual) == 20
+        assert not any(doc["is_legendary"] for doc in sources(index, actual))
+
+    def test_evaluate_minimum_should_match(self, index: BitmapIndex) -> None:
+        actual = index.evaluate(
+            {
+                "bool": {
+                    "should": [
+                        {"term": {"name.keyword": "ミミッキュ"}},
+                        {"term": {"is_legendary": False}},
+                        {"term": {"form.keyword": "ばけたすがた"}},
+                    ],
+                    "minimum_should_match": 2,
+                }
+            }
+        )
+
+        assert [doc["form"] for doc in sources(index, actual)] == [
+            "ばけたすがた",
+            "ばれたすがた",
+        ]
+
+    def test_evaluate_range(self, index: BitmapIndex) -> None:
+        actual = index.evaluate(
+            {
+                "bool": {
+                    "filter": [
+                        {"range": {"base_stats.speed": {"gte": 100}}},
+                        {"range": {"weight": {"lte": 60.5}}},
+                        {"term": {"gender_type.has_male": True}},
+                    ]
+                }
+            }
+        )
+
+        assert [doc["weight"] for doc in sources(index, actual)] == [30, 21]
+        assert index.evaluate({"range": {"height": {"lt": 0}}}) == 0
+
+    def test_evaluate_analyzed(self) -> None:
+        dump = memory.load_index(DUMP)
+        index = BitmapIndex(list(zip(dump.ids, dump.sources)), memory.analyze)
+        actual = index.evaluate(
+            {
+                "multi_match": {
+                    "query": "ピカチュウ",
+                    "fields": ["name"],
+                    "operator": "and",
+                }
+            }
+        )
+
+        assert [doc["name"] for doc in sources(index, actual)] == ["ピカチュウ"]
+
+    @pytest.mark.parametrize(
+        "clause",
+        [
+            {"term": {"name": "ピカチュウ"}},
+            {"multi_match": {"query": "ピカチュウ", "fields": ["name"]}},
+            {"wildcard": {"name.keyword": "ピカ*"}},
+            {"term": {"form.keyword": ["ばけたすがた"]}},
+            {"range": {"name.keyword": {"gte": "ピ"}}},
+            {"range": {"name": {"gte": "ピ"}}},
+            {"range": {"weight": {"gte": 1, "format": "yyyy"}}},
+            {"range": {"weight": {"gte": "heavy"}}},
+            [{"match_all": {}}],
+        ],
+    )
+    def test_evaluate_unsupported(
+        self, index: BitmapIndex, clause: Any
+    ) -> None:
+        with pytest.raises(UnsupportedQueryError):
+            index.evaluate(clause)
+
+    def test_positions(self) -> None:
+        assert list(BitmapIndex.positions(0b101101)) == [0, 2, 3, 5]
+        assert list(BitmapIndex.positions(0b101101, 3)) == [3, 5]
+        assert BitmapIndex.count(0b101101) == 4
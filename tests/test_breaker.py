@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+from elasticsearch import ConnectionError as ESConnectionError
+from elasticsearch import NotFoundError, TransportError
+
+from pokeapi.search import breaker
+
+
+def fail() -> None:
+    raise ESConnectionError("N/A", "connection refused", None)
+
+
+def trip(circuit_breaker: breaker.CircuitBreaker, times: int) -> None:
+    for _ in range(times):
+        with pytest.raises(ESConnectionError):
+            circuit_breaker.call(fail)
+
+
+class TestIsFailure:
+    def test_is_failure(self) -> None:
+        assert breaker.is_failure(ESConnectionError("N/A", "refused", None))
+        assert breaker.is_failure(asyncio.TimeoutError())
+        assert breaker.is_failure(TransportError(503, "unavailable", {}))
+        assert breaker.is_failure(TransportError("N/A", "unknown", {}))
+
+    def test_is_failure_client_error(self) -> None:
+        assert not breaker.is_failure(NotFoundError(404, "not found", {}))
+        assert not breaker.is_failure(TransportError(400, "bad query", {}))
+        assert not breaker.is_failure(ValueError())
+
+
+class TestCircuitBreaker:
+    def test_call(self) -> None:
+        circuit_breaker = breaker.CircuitBreaker(3, 1.0, 10.0)
+
+        assert circuit_breaker.call(lambda: 1) == 1
+        assert circuit_breaker.stats.state == breaker.CLOSED
+
+    def test_open(self) -> None:
+        circuit_breaker = breaker.CircuitBreaker(3, 1.0, 10.0)
+        trip(circuit_breaker, 3)
+
+        with pytest.raises(breaker.CircuitOpenError, match="is open"):
+            circuit_breaker.call(lambda: 1)
+
+        assert circuit_breaker.stats.state == breaker.OPEN
+        assert circuit_breaker.stats.trips == 1
+        assert circuit_breaker.stats.rejected == 1
+        assert circuit_breaker.stats.failures == 3
+
+    def test_success_resets_failures(self) -> None:
+        circuit_breaker = breaker.CircuitBreaker(3, 1.0, 10.0)
+        trip(circuit_breaker, 2)
+        circuit_breaker.call(lambda: 1)
+        trip(circuit_breaker, 2)
+
+        assert circuit_breaker.stats.state == breaker.CLOSED
+        assert circuit_breaker.stats.consecutive_failures == 2
+
+    def test_slow_call(self) -> None:
+        circuit_breaker = breaker.CircuitBreaker(2, 1.0, 10.0)
+        circuit_breaker.before_call()
+        circuit_breaker.record(1.5, False)
+        circuit_breaker.before_call()
+        circuit_breaker.record(2.0, False)
+
+        assert circuit_breaker.stats.state == breaker.OPEN
+        assert circuit_breaker.stats.slow_calls == 2
+
+    def test_half_open(self) -> None:
+        circuit_breaker = breaker.CircuitBreaker(1, 1.0, 0.0)
+        trip(circuit_breaker, 1)
+        circuit_breaker.before_call()
+
+        assert circuit_breaker.stats.state == breaker.HALF_OPEN
+        with pytest.raises(breaker.CircuitOpenError):
+            circuit_breaker.before_call()
+
+        circuit_breaker.record(0.1, False)
+
+        assert circuit_breaker.stats.state == breaker.CLOSED
+        assert circuit_breaker.call(lambda: 1) == 1
+
+    def test_half_open_probe_fails(self) -> None:
+        circuit_breaker = breaker.CircuitBreaker(1, 1.0, 0.0)
+        trip(circuit_breaker, 2)
+
+        assert circuit_breaker.stats.state == breaker.OPEN
+        assert circuit_breaker.stats.trips == 2
+
+    def test_release_probe(self) -> None:
+        circuit_breaker = breaker.CircuitBreaker(1, 1.0, 0.0)
+        trip(circuit_breaker, 1)
+
+        async def cancelled() -> None:
+            raise asyncio.CancelledError
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(circuit_breaker.call_async(cancelled))
+
+        assert circuit_breaker.stats.state == breaker.HALF_OPEN
+        assert circuit_breaker.call(lambda: 1) == 1
+        assert circuit_breaker.stats.state == breaker.CLOSED
+
+    def test_call_async(self) -> None:
+        circuit_breaker = breaker.CircuitBreaker(1, 1.0, 10.0)
+
+        async def timeout() -> None:
+            raise asyncio.TimeoutError
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(circuit_breaker.call_async(timeout))
+
+        assert circuit_breaker.stats.state == breaker.OPEN
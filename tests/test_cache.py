@@ -0,0 +1,231 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pokeapi.search import cache
+
+
+class TestLRUPolicy:
+    def test_insert(self) -> None:
+        policy = cache.LRUPolicy(2)
+
+        assert policy.insert("a") == []
+        assert policy.insert("b") == []
+        policy.touch("a")
+        assert policy.insert("c") == ["b"]
+        assert policy.victim() == "a"
+
+    def test_remove(self) -> None:
+        policy = cache.LRUPolicy(2)
+        policy.insert("a")
+        policy.remove("a")
+
+        assert policy.victim() is None
+
+
+class TestCountMinSketch:
+    def test_estimate(self) -> None:
+        sketch = cache.CountMinSketch(100)
+        for _ in range(5):
+            sketch.add("a")
+        sketch.add("b")
+
+        assert sketch.estimate("a") >= 5
+        assert sketch.estimate("b") >= 1
+        assert sketch.estimate("a") > sketch.estimate("b")
+
+    def test_estimate_max_count(self) -> None:
+        sketch = cache.CountMinSketch(100)
+        for _ in range(100):
+            sketch.add("a")
+
+        assert sketch.estimate("a") == cache.MAX_COUNT
+
+    def test_reset(self) -> None:
+        sketch = cache.CountMinSketch(1)
+        for _ in range(sketch.sample_size - 1):
+            sketch.add("a")
+        before = sketch.estimate("a")
+        sketch.add("a")
+
+        assert sketch.estimate("a") == (before + 1) // 2
+
+
+class TestTinyLFUPolicy:
+    def test_insert(self) -> None:
+        policy = cache.TinyLFUPolicy(100)
+        evicted = [key for i in range(100) for key in policy.insert(str(i))]
+
+        assert evicted == []
+        assert policy.victim() == "0"
+
+    def test_frequent_keys_survive_scan(self) -> None:
+        policy = cache.TinyLFUPolicy(100)
+        kept = set()
+        for i in range(100):
+            policy.insert(f"hot{i}")
+            kept.add(f"hot{i}")
+        for _ in range(3):
+            for i in range(100):
+                policy.touch(f"hot{i}")
+
+        for i in range(1000):
+            for key in policy.insert(f"scan{i}"):
+                kept.discard(key)
+
+        assert len(kept) >= 80
+
+    def test_lru_loses_frequent_keys_to_scan(self) -> None:
+        policy = cache.LRUPolicy(100)
+        kept = {f"hot{i}" for i in range(100)}
+        for key in kept:
+            policy.insert(key)
+
+        for i in range(1000):
+            for key in policy.insert(f"scan{i}"):
+                kept.discard(key)
+
+        assert kept == set()
+
+    def test_touch_protects(self) -> None:
+        policy = cache.TinyLFUPolicy(10)
+        for i in range(10):
+            policy.insert(str(i))
+        policy.touch("0")
+
+        assert policy.victim() == "1"
+
+
+class TestCreatePolicy:
+    def test_create_policy(self) -> None:
+        assert isinstance(cache.create_policy("lru", 1), cache.LRUPolicy)
+        assert isinstance(
+            cache.create_policy("tinylfu", 1), cache.TinyLFUPolicy
+        )
+
+    def test_create_policy_unknown(self) -> None:
+        with pytest.raises(ValueError, match="unknown cache policy"):
+            cache.create_policy("fifo", 1)
+
+
+class TestResponseCache:
+    def test_get(self) -> None:
+        response_cache = cache.ResponseCache(10)
+        response_cache.put("a", {"hits": []}, 60)
+
+        assert response_cache.get("a") == {"hits": []}
+        assert response_cache.get("b") is None
+        assert response_cache.stats.hits == 1
+        assert response_cache.stats.misses == 1
+        assert response_cache.stats.entries == 1
+
+    def test_get_expired(self, mocker: MockerFixture) -> None:
+        now = time.monotonic()
+        monotonic = mocker.patch.object(
+            cache.time, "monotonic", return_value=now
+        )
+        response_cache = cache.ResponseCache(10)
+        response_cache.put("a", "value", 1.0)
+        monotonic.return_value = now + 1.0
+
+        assert response_cache.get("a") is None
+        assert response_cache.stats.expirations == 1
+        assert response_cache.stats.entries == 0
+
+    @pytest.mark.parametrize("policy", ["lru", "tinylfu"])
+    def test_set_max_entries(self, policy: str) -> None:
+        response_cache = cache.ResponseCache(10, policy=policy)
+        for i in range(20):
+            response_cache.put(str(i), i, 60)
+
+        assert response_cache.stats.entries == 10
+        assert response_cache.stats.evictions == 10
+
+    def test_set_max_bytes(self) -> None:
+        response_cache = cache.ResponseCache(10, max_bytes=10, policy="lru")
+        response_cache.put("a", "aaaa", 60)
+        response_cache.put("b", "bbbb", 60)
+        response_cache.put("c", "cccc", 60)
+
+        assert response_cache.get("a") is None
+        assert response_cache.get("c") == "cccc"
+        assert response_cache.stats.size == 8
+        assert response_cache.stats.evictions == 1
+
+    def test_set_too_large(self) -> None:
+        response_cache = cache.ResponseCache(10, max_bytes=3)
+        response_cache.put("a", "aaaa", 60)
+
+        assert response_cache.get("a") is None
+        assert response_cache.stats.size == 0
+
+    def test_set_replace(self) -> None:
+        response_cache = cache.ResponseCache(10, max_bytes=100)
+        response_cache.put("a", "aaaa", 60)
+        response_cache.put("a", "aa", 60)
+
+        assert response_cache.get("a") == "aa"
+        assert response_cache.stats.size == 2
+        assert response_cache.stats.entries == 1
+
+    def test_clear(self) -> None:
+        response_cache = cache.ResponseCache(10, max_bytes=100)
+        response_cache.put("a", "aaaa", 60)
+        response_cache.clear()
+
+        assert response_cache.get("a") is None
+        assert response_cache.stats.size == 0
+        assert response_cache.stats.entries == 0
+
+    def test_get_or_load(self) -> None:
+        response_cache = cache.ResponseCache(10)
+        calls = []
+
+        def load() -> str:
+            calls.append(1)
+            return "value"
+
+        assert response_cache.get_or_load("a", 60, load) == "value"
+        assert response_cache.get_or_load("a", 60, load) == "value"
+        assert len(calls) == 1
+
+    def test_threads(self) -> None:
+        response_cache = cache.ResponseCache(50, max_bytes=400)
+        barrier = threading.Barrier(8)
+
+        def work(n: int) -> None:
+            barrier.wait()
+            for i in range(500):
+                key = str((n * i) % 80)
+                if response_cache.get(key) is None:
+                    response_cache.put(key, key * 3, 60)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(work, range(8)))
+
+        stats = response_cache.stats
+        assert stats.hits + stats.misses == 8 * 500
+        assert stats.entries <= 50
+        assert stats.size <= 400
+        assert stats.size == sum(
+            entry.size for entry in response_cache._entries.values()
+        )
+
+    def test_clear_cache(self, mocker: MockerFixture) -> None:
+        response_cache = cache.ResponseCache(10)
+        response_cache.put("a", 1, 60)
+        mocker.patch.object(cache, "_cache", response_cache)
+        cache.clear_cache()
+
+        assert response_cache.get("a") is None
+        assert response_cache.stats.entries == 0
+
+
+class TestSizeof:
+    def test_sizeof(self) -> None:
+        assert cache.sizeof("ピカチュウ") == 5
+        assert cache.sizeof(b"abc") == 3
+        assert cache.sizeof({"a": [1, 2]}) == len('{"a":[1,2]}')
@@ -0,0 +1,144 @@
+import asyncio
+import threading
+from typing import Any, Generator
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pokeapi.search import client, memory
+
+
+@pytest.fixture()
+def _close_client() -> Generator[None, None, None]:
+    client.close_client()
+    yield
+    client.close_client()
+    asyncio.run(client.close_async_client())
+
+
+@pytest.mark.usefixtures("_setup_get_config", "_close_client")
+class TestClient:
+    def test_open_client(self) -> None:
+        actual = client.open_client()
+
+        assert client.open_client() is actual
+        assert client.get_client() is actual
+
+    def test_get_client(self) -> None:
+        actual = client.get_client()
+
+        assert client.get_client() is actual
+
+    def test_close_client(self) -> None:
+        actual = client.open_client()
+        client.close_client()
+
+        assert client.get_client() is not actual
+
+    def test_get_pool_stats(self) -> None:
+        client.open_client()
+        actual = client.get_pool_stats()
+
+        assert len(actual) == 1
+        assert actual[0]["client"] == "sync"
+        assert actual[0]["maxsize"] == 10
+        assert actual[0]["num_connections"] == 0
+        assert actual[0]["num_requests"] == 0
+        assert actual[0]["idle_connections"] == 0
+
+    def test_get_pool_stats_closed(self) -> None:
+        assert client.get_pool_stats() == []
+
+    def test_get_async_client(self) -> None:
+        async def get_twice() -> bool:
+            return client.get_async_client() is client.get_async_client()
+
+        assert asyncio.run(get_twice())
+
+    def test_get_async_client_other_loop(self) -> None:
+        async def get() -> object:
+            return client.get_async_client()
+
+        assert asyncio.run(get()) is not asyncio.run(get())
+
+    def test_get_async_client_replaced(self, mocker: MockerFixture) -> None:
+        async def get() -> Any:
+            return client.get_async_client()
+
+        async def replace() -> None:
+            client.get_async_client()
+            await client.close_async_client()
+
+        replaced = asyncio.run(get())
+        close = mocker.patch.object(replaced, "close", mocker.AsyncMock())
+        asyncio.run(replace())
+
+        close.assert_awaited_once()
+
+    def test_get_async_client_replaced_running(
+        self, mocker: MockerFixture
+    ) -> None:
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever)
+        thread.start()
+
+        async def get() -> Any:
+            return client.get_async_client()
+
+        try:
+            replaced = asyncio.run_coroutine_threadsafe(get(), loop).result()
+            close = mocker.patch.object(replaced, "close", mocker.AsyncMock())
+            asyncio.run(get())
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0), loop).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+        close.assert_awaited_once()
+
+    def test_open_async_client(self) -> None:
+        async def open_and_get() -> bool:
+            actual = await client.open_async_client()
+            return actual is client.get_async_client()
+
+        assert asyncio.run(open_and_get())
+
+    def test_get_pool_stats_async(self) -> None:
+        asyncio.run(client.open_async_client())
+        actual = client.get_pool_stats()
+
+        assert len(actual) == 1
+        assert actual[0]["client"] == "async"
+        assert actual[0]["maxsize"] == 10
+        assert actual[0]["num_requests"] == 0
+        assert actual[0]["in_flight"] == 0
+
+    def test_create_client_memory(self, mocker: MockerFixture) -> None:
+        conf = mocker.patch.object(client, "config").get_config.return_value
+        conf.ES_BACKEND = "memory"
+        client.open_client()
+
+        assert isinstance(client.get_client(), memory.MemoryBackend)
+        assert client.get_client().ping()
+        assert client.get_pool_stats() == []
+
+    def test_create_async_client_memory(self, mocker: MockerFixture) -> None:
+        conf = mocker.patch.object(client, "config").get_config.return_value
+        conf.ES_BACKEND = "memory"
+
+        async def open_and_ping() -> object:
+            es = await client.open_async_client()
+            assert await es.ping()
+            return es
+
+        assert isinstance(
+            asyncio.run(open_and_ping()), memory.AsyncMemoryBackend
+        )
+
+    def test_create_client_unknown(self, mocker: MockerFixture) -> None:
+        conf = mocker.patch.object(client, "config").get_config.return_value
+        conf.ES_BACKEND = "solr"
+
+        with pytest.raises(ValueError, match="unknown backend"):
+            client.create_client()
@@ -0,0 +1,60 @@
+from typing import Any
+
+import numpy as np
+import pytest
+
+from pokeapi.search.columns import ColumnStore
+
+
+@pytest.fixture()
+def store() -> ColumnStore:
+    return ColumnStore(
+        [
+            {"base_stats.speed": 45, "weight": 6.9, "name": "フシギダネ"},
+            {"base_stats.speed": 110, "weight": 30, "name": "ライチュウ"},
+            {"base_stats.speed": 130, "name": "ミュウツー"},
+            {"base_stats.speed": None, "weight": 0.1, "name": "ミミッキュ"},
+        ]
+    )
+
+
+class TestColumnStore:
+    def test_columns(self, store: ColumnStore) -> None:
+        assert store.size == 4
+        assert set(store.columns) == {"base_stats.speed", "weight"}
+        assert store.columns["base_stats.speed"].dtype == np.float64
+        assert store.columns["weight"].dtype == np.float32
+        assert "name" not in store
+
+    @pytest.mark.parametrize(
+        ("field", "bounds", "expected"),
+        [
+            ("base_stats.speed", {"gte": 100}, [False, True, True, False]),
+            ("base_stats.speed", {"gt": 45, "lt": 130}, [0, 1, 0, 0]),
+            ("base_stats.speed", {}, [True, True, True, False]),
+            ("weight", {"lte": 6.9}, [True, False, False, True]),
+            ("weight", {"gte": "0.1", "lt": 6.9}, [0, 0, 0, 1]),
+            ("height", {"gte": 0}, [False, False, False, False]),
+        ],
+    )
+    def test_mask(
+        self,
+        store: ColumnStore,
+        field: str,
+        bounds: dict[str, Any],
+        expected: list[bool],
+    ) -> None:
+        assert store.mask(field, bounds).tolist() == [
+            bool(e) for e in expected
+        ]
+
+    def test_mask_invalid(self, store: ColumnStore) -> None:
+        with pytest.raises(KeyError):
+            store.mask("weight", {"format": "yyyy"})
+
+    def test_to_bits(self) -> None:
+        mask = np.zeros(20, dtype=np.bool_)
+        mask[[0, 3, 9, 19]] = True
+
+        assert ColumnStore.to_bits(mask) == 1 | 1 << 3 | 1 << 9 | 1 << 19
+        assert ColumnStore.to_bits(np.zeros(0, dtype=np.bool_)) == 0
@@ -3,6 +3,7 @@ from dataclasses import FrozenInstanceError
 from typing import Generator
 
 import pytest
+from pytest_mock import MockerFixture
 
 from pokeapi.search import config
 from pokeapi.search.config import Singleton
@@ -40,3 +41,106 @@ class TestConfig:
 
         with pytest.raises(FrozenInstanceError):
             actual.ES_CONNECTION_URL = "hoge"  # type: ignore
+
+    @pytest.mark.usefixtures("_setup_get_config")
+    def test_get_config_pool(self) -> None:
+        actual = config.get_config()
+
+        assert actual.ES_TIMEOUT == 10.0
+        assert actual.ES_POOL_MAXSIZE == 10
+        assert actual.ES_HTTP_COMPRESS is True
+        assert actual.ES_KEEP_ALIVE is True
+        assert actual.ES_REQUEST_CACHE is True
+        assert actual.ES_RAW_PASSTHROUGH is False
+        assert actual.ES_CACHE_REDIS_URL is None
+
+    def test_get_config_cached(
+        self, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        mocker.patch.dict(Singleton._instances)
+        config.reset_config()
+        monkeypatch.setenv("ES_TIMEOUT", "3.5")
+        first = config.get_config()
+        getenv = mocker.spy(config.os, "getenv")
+        monkeypatch.setenv("ES_TIMEOUT", "4.5")
+
+        assert config.get_config() is first
+        assert getenv.call_count == 0
+        assert first.ES_TIMEOUT == 3.5
+
+        config.reset_config()
+
+        assert config.get_config().ES_TIMEOUT == 4.5
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("1", True), ("True", True), ("on", True), ("0", False), ("", False)],
+    )
+    def test_getenv_bool(
+        self, monkeypatch: pytest.MonkeyPatch, value: str, expected: bool
+    ) -> None:
+        monkeypatch.setenv("ES_TEST_BOOL", value)
+
+        assert config._getenv_bool("ES_TEST_BOOL", not expected) is expected
+
+    def test_getenv_default(self) -> None:
+        assert config._getenv_bool("ES_TEST_UNSET", True) is True
+        assert config._getenv_int("ES_TEST_UNSET", 3) == 3
+        assert config._getenv_float("ES_TEST_UNSET", 0.5) == 0.5
+
+    def test_get_deadline(self) -> None:
+        conf = config.get_config()
+
+        assert conf.get_deadline("conditions") == 2.0
+        assert conf.get_deadline("export") == conf.ES_TIMEOUT
+
+    def test_get_cache_ttl(self, mocker: MockerFixture) -> None:
+        conf = mocker.Mock(
+            ES_CACHE_ENABLED=True, ES_CACHE_TTLS={"conditions": 60.0}
+        )
+
+        assert config.get_config().get_cache_ttl("conditions") == 0.0
+        assert (
+            config._ElasticsearchConfig.get_cache_ttl(conf, "conditions")
+            == 60.0
+        )
+        assert config._ElasticsearchConfig.get_cache_ttl(conf, "export") == 0
+
+    def test_getenv_list(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("ES_TEST_LIST", " /pokemon/name/a, ,/pokemon ")
+
+        assert config._getenv_list("ES_TEST_LIST") == (
+            "/pokemon/name/a",
+            "/pokemon",
+        )
+        assert config._getenv_list("ES_TEST_UNSET") == ()
+
+    def test_get_max_age(self) -> None:
+        conf = config.get_config()
+
+        assert conf.get_max_age("pokedex_number") == 300
+        assert conf.get_max_age("export") == 0
+
+    def test_getenv_route_seconds(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("ES_TEST_DEADLINES", "name=0.5, export=30")
+        actual = config._getenv_route_seconds(
+            "ES_TEST_DEADLINES", {"name": 1.0}
+        )
+
+        assert actual == {"name": 0.5, "export": 30.0}
+
+    def test_getenv_route_seconds_invalid(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("ES_TEST_DEADLINES", "name")
+
+        with pytest.raises(ValueError, match="invalid item"):
+            config._getenv_route_seconds("ES_TEST_DEADLINES", {})
+
+    def test_getenv_number(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("ES_TEST_NUMBER", "20")
+
+        assert config._getenv_int("ES_TEST_NUMBER", 3) == 20
+        assert config._getenv_float("ES_TEST_NUMBER", 0.5) == 20.0
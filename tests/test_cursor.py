@@ -0,0 +1,16 @@
+import pytest
+
+from pokeapi.search import cursor
+
+
+class TestCursor:
+    def test_encode_cursor(self) -> None:
+        actual = cursor.encode_cursor([778, "28"])
+
+        assert "=" not in actual
+        assert cursor.decode_cursor(actual) == [778, "28"]
+
+    @pytest.mark.parametrize("value", ["hoge", "e30", "!!!"])
+    def test_decode_cursor_invalid(self, value: str) -> None:
+        with pytest.raises(ValueError, match="invalid cursor"):
+            cursor.decode_cursor(value)
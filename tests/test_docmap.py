@@ -0,0 +1,27 @@
+from pokeapi.search import docmap
+
+
+class TestPokedexIdMap:
+    def test_learn(self) -> None:
+        ids = docmap.PokedexIdMap()
+        ids.learn(6, ("7", "8", "9"))
+
+        assert ids.get(6) == ("7", "8", "9")
+        assert ids.get(7) is None
+
+    def test_discard(self) -> None:
+        ids = docmap.PokedexIdMap()
+        ids.learn(6, ("7", "8", "9"))
+        ids.discard(6)
+        ids.discard(7)
+
+        assert ids.get(6) is None
+
+    def test_clear(self) -> None:
+        ids = docmap.PokedexIdMap()
+        ids.learn(1, ("1",))
+        ids.learn(6, ("7", "8", "9"))
+        ids.clear()
+
+        assert ids.get(1) is None
+        assert ids.get(6) is None
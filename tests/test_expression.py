@@ -0,0 +1,134 @@
+import pytest
+
+from pokeapi.search import expression
+from pokeapi.search.expression import And, Not, Or, Term
+
+
+class TestParse:
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("type:ほのお", Term("type", "ほのお")),
+            ("is_legendary:TRUE", Term("is_legendary", True)),
+            ("pokedex_number:25", Term("pokedex_number", 25)),
+            ('form:"れいじゅう フォルム"', Term("form", "れいじゅう フォルム")),
+            (
+                "type:ほのお OR type:ドラゴン",
+                Or((Term("type", "ほのお"), Term("type", "ドラゴン"))),
+            ),
+            (
+                "type:ほのお type:ひこう",
+                And((Term("type", "ほのお"), Term("type", "ひこう"))),
+            ),
+            (
+                "type:ほのお or type:ドラゴン and not is_legendary:true",
+                Or(
+                    (
+                        Term("type", "ほのお"),
+                        And(
+                            (
+                                Term("type", "ドラゴン"),
+                                Not(Term("is_legendary", True)),
+                            )
+                        ),
+                    )
+                ),
+            ),
+            (
+                "(type:ほのお OR type:ドラゴン) AND NOT is_legendary:true",
+                And(
+                    (
+                        Or((Term("type", "ほのお"), Term("type", "ドラゴン"))),
+                        Not(Term("is_legendary", True)),
+                    )
+                ),
+            ),
+        ],
+    )
+    def test_parse(self, text: str, expected: expression.Node) -> None:
+        assert expression.parse(text) == expected
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "type",
+            "color:red",
+            "is_legendary:yes",
+            "pokedex_number:-1",
+            "type:ほのお OR",
+            "(type:ほのお",
+            "type:ほのお)",
+            'form:"unterminated',
+            "NOT",
+            "(" * 40 + "type:ほのお" + ")" * 40,
+            "NOT " * 245 + "is_legendary:true",
+            "(NOT " * 20 + "type:ほのお" + ")" * 20,
+            "type:ほのお OR " * 100,
+        ],
+    )
+    def test_parse_invalid(self, text: str) -> None:
+        with pytest.raises(ValueError):  # noqa: PT011
+            expression.parse(text)
+
+    def test_parse_cached(self) -> None:
+        text = "type:でんき OR type:みず"
+        first = expression.parse(text)
+        hits = expression.get_parse_stats()["hits"]
+
+        assert expression.parse(text) is first
+        assert expression.get_parse_stats()["hits"] == hits + 1
+
+
+class TestCreateClause:
+    def test_create_clause(self) -> None:
+        actual = expression.create_clause(
+            expression.parse(
+                "(type:ほのお OR type_1:ドラゴン) AND NOT is_legendary:true"
+            )
+        )
+
+        assert actual == {
+            "bool": {
+                "filter": [
+                    {
+                        "bool": {
+                            "should": [
+                                {
+                                    "multi_match": {
+                                        "query": "ほのお",
+                                        "fields": [
+                                            "pokemon_type.type_1.keyword",
+                                            "pokemon_type.type_2.keyword",
+                                        ],
+                                    }
+                                },
+                                {
+                                    "term": {
+                                        "pokemon_type.type_1.keyword": "ドラゴン"
+                                    }
+                                },
+                            ],
+                            "minimum_should_match": 1,
+                        }
+                    },
+                    {"bool": {"must_not": [{"term": {"is_legendary": True}}]}},
+                ]
+            }
+        }
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("name:ピカチュウ", {"term": {"name": "ピカチュウ"}}),
+            (
+                "pokedex_number:25",
+                {"term": {"national_pokedex_number": 25}},
+            ),
+            ("has_male:false", {"term": {"gender_type.has_male": False}}),
+        ],
+    )
+    def test_create_clause_term(
+        self, text: str, expected: dict[str, object]
+    ) -> None:
+        assert expression.create_clause(expression.parse(text)) == expected
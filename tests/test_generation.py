@@ -0,0 +1,269 @@
+import asyncio
+from typing import Any, Generator
+
+import pytest
+from elasticsearch import ConnectionError as ESConnectionError
+from pytest_mock import MockerFixture
+
+from pokeapi.search import cache, docmap, generation
+
+
+def index_stats(
+    uuid: str = "abc", count: int = 26, index_total: int = 26
+) -> dict[str, Any]:
+    return {
+        "indices": {
+            "pokemon": {
+                "uuid": uuid,
+                "primaries": {
+                    "docs": {"count": count, "deleted": 0},
+                    "indexing": {"index_total": index_total},
+                },
+            }
+        }
+    }
+
+
+@pytest.fixture()
+def stats(mocker: MockerFixture) -> Generator[Any, None, None]:
+    stats = mocker.AsyncMock(return_value=index_stats())
+    es = mocker.Mock()
+    es.indices.stats = stats
+    mocker.patch.object(generation.client, "get_async_client", return_value=es)
+    generation.reset_generation()
+    generation.stats.changes = 0
+    yield stats
+    generation.reset_generation()
+
+
+class TestCreateGeneration:
+    def test_create_generation(self) -> None:
+        actual = generation.create_generation(index_stats())
+
+        assert actual == generation.create_generation(index_stats())
+        assert len(actual) == 16
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            index_stats(uuid="def"),
+            index_stats(count=27),
+            index_stats(index_total=27),
+        ],
+    )
+    def test_create_generation_changed(self, changed: dict[str, Any]) -> None:
+        assert generation.create_generation(
+            changed
+        ) != generation.create_generation(index_stats())
+
+
+@pytest.mark.usefixtures("_setup_get_config")
+class TestGetGeneration:
+    def test_get_generation(self, stats: Any) -> None:
+        async def get() -> list[str | None]:
+            return await asyncio.gather(
+                *(generation.get_generation() for _ in range(5))
+            )
+
+        first = asyncio.run(get())
+        second = asyncio.run(generation.get_generation())
+
+        assert first == [generation.create_generation(index_stats())] * 5
+        assert second == first[0]
+        assert stats.await_count == 1
+
+    def test_get_generation_expired(
+        self, mocker: MockerFixture, stats: Any
+    ) -> None:
+        asyncio.run(generation.get_generation())
+        stats.return_value = index_stats(index_total=27)
+        mocker.patch.object(
+            generation.time, "monotonic", return_value=float("inf")
+        )
+        actual = asyncio.run(generation.get_generation())
+
+        assert actual == generation.create_generation(
+            index_stats(index_total=27)
+        )
+        assert stats.await_count == 2
+
+    def test_get_generation_error(self, stats: Any) -> None:
+        stats.side_effect = ESConnectionError("N/A", "unavailable", None)
+
+        assert asyncio.run(generation.get_generation()) is None
+
+    def test_get_generation_error_keeps_last(
+        self, mocker: MockerFixture, stats: Any
+    ) -> None:
+        first = asyncio.run(generation.get_generation())
+        stats.side_effect = ESConnectionError("N/A", "unavailable", None)
+        actual = asyncio.run(generation.refresh_generation())
+
+        assert actual == first
+
+    def test_get_generation_timeout(self, stats: Any) -> None:
+        asyncio.run(generation.get_generation())
+
+        assert stats.call_args.kwargs["request_timeout"] == (
+            generation.config.get_config().ES_GENERATION_TIMEOUT
+        )
+
+    def test_get_generation_breaker_open(
+        self, mocker: MockerFixture, stats: Any
+    ) -> None:
+        first = asyncio.run(generation.get_generation())
+        call_async = mocker.patch.object(
+            generation.breaker, "get_breaker"
+        ).return_value.call_async
+        call_async.side_effect = generation.breaker.CircuitOpenError(1.0)
+        errors = generation.stats.errors
+        actual = asyncio.run(generation.refresh_generation())
+
+        assert actual == first
+        assert stats.await_count == 1
+        assert generation.stats.errors == errors + 1
+
+    def test_get_generation_polling(
+        self, mocker: MockerFixture, stats: Any
+    ) -> None:
+        mocker.patch.object(
+            generation.time, "monotonic", return_value=float("inf")
+        )
+
+        async def get() -> str | None:
+            generation.stats.generation = "a"
+            poller = asyncio.create_task(asyncio.sleep(1))
+            mocker.patch.object(generation, "_poller", poller)
+            try:
+                return await generation.get_generation()
+            finally:
+                poller.cancel()
+
+        assert asyncio.run(get()) == "a"
+        assert stats.await_count == 0
+
+
+@pytest.mark.usefixtures("_setup_get_config")
+class TestRefreshGeneration:
+    def test_refresh_generation_changed(
+        self, mocker: MockerFixture, stats: Any
+    ) -> None:
+        response_cache = cache.ResponseCache(10)
+        mocker.patch.object(cache, "_cache", response_cache)
+        asyncio.run(generation.refresh_generation())
+        response_cache.put("search:a", [], 60)
+        docmap.pokedex_ids.learn(6, ("7",))
+        prefix = generation.get_key_prefix()
+
+        stats.return_value = index_stats(index_total=27)
+        asyncio.run(generation.refresh_generation())
+
+        assert response_cache.get("search:a") is None
+        assert docmap.pokedex_ids.get(6) is None
+        assert generation.get_key_prefix() != prefix
+        assert generation.stats.changes == 1
+
+    def test_refresh_generation_unchanged(
+        self, mocker: MockerFixture, stats: Any
+    ) -> None:
+        invalidate = mocker.patch.object(generation, "invalidate")
+        asyncio.run(generation.refresh_generation())
+        asyncio.run(generation.refresh_generation())
+
+        assert stats.await_count == 2
+        assert invalidate.call_count == 0
+
+    def test_refresh_generation_membership(
+        self, mocker: MockerFixture, stats: Any
+    ) -> None:
+        on_generation = mocker.patch.object(
+            generation.membership, "on_generation"
+        )
+        actual = asyncio.run(generation.refresh_generation())
+        asyncio.run(generation.refresh_generation())
+
+        on_generation.assert_called_once_with(actual)
+
+    def test_refresh_generation_bitmap(
+        self, mocker: MockerFixture, stats: Any
+    ) -> None:
+        on_generation = mocker.patch.object(generation.bitmap, "on_generation")
+        actual = asyncio.run(generation.refresh_generation())
+        asyncio.run(generation.refresh_generation())
+
+        on_generation.assert_called_once_with(actual)
+
+    def test_get_key_prefix(self, stats: Any) -> None:
+        assert generation.get_key_prefix() == ""
+
+        actual = asyncio.run(generation.refresh_generation())
+
+        assert generation.get_key_prefix() == f"{actual}:"
+
+
+class TestPolling:
+    def test_polling(self, mocker: MockerFixture, stats: Any) -> None:
+        mocker.patch.object(
+            generation.config,
+            "get_config",
+            return_value=mocker.Mock(
+                ES_INDEX="pokemon",
+                ES_TIMEOUT=1.0,
+                ES_GENERATION_POLL_INTERVAL=0.01,
+                ES_MEMBERSHIP_ENABLED=False,
+                ES_BITMAP_ENABLED=False,
+            ),
+        )
+
+        async def poll() -> None:
+            generation.start_polling()
+            await asyncio.sleep(0.05)
+            await generation.stop_polling()
+
+        asyncio.run(poll())
+
+        assert stats.await_count >= 2
+        assert generation._poller is None
+
+    def test_polling_error(self, mocker: MockerFixture, stats: Any) -> None:
+        mocker.patch.object(
+            generation.config,
+            "get_config",
+            return_value=mocker.Mock(
+                ES_INDEX="pokemon",
+                ES_GENERATION_TIMEOUT=1.0,
+                ES_GENERATION_POLL_INTERVAL=0.01,
+                ES_BREAKER_ENABLED=False,
+            ),
+        )
+        stats.return_value = {"indices": {"pokemon": {}}}
+        errors = generation.stats.errors
+
+        async def poll() -> None:
+            generation.start_polling()
+            for _ in range(100):
+                if generation.stats.errors >= errors + 2:
+                    break
+                await asyncio.sleep(0.01)
+            assert generation._poller is not None
+            assert not generation._poller.done()
+            await generation.stop_polling()
+
+        asyncio.run(poll())
+
+        assert stats.await_count >= 2
+        assert generation.stats.errors >= errors + 2
+
+    def test_polling_disabled(self, mocker: MockerFixture) -> None:
+        mocker.patch.object(
+            generation.config,
+            "get_config",
+            return_value=mocker.Mock(ES_GENERATION_POLL_INTERVAL=0.0),
+        )
+
+        async def poll() -> None:
+            generation.start_polling()
+
+        asyncio.run(poll())
+
+        assert generation._poller is None
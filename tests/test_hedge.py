@@ -0,0 +1,178 @@
+import asyncio
+from typing import Awaitable, Callable
+
+import pytest
+
+from pokeapi.search import hedge
+
+
+def warm(hedger: hedge.Hedger, latency: float, samples: int) -> None:
+    for _ in range(samples):
+        hedger.latencies.record(latency)
+
+
+def request(
+    primary: float, hedged: float, calls: list[bool]
+) -> Callable[[bool], Awaitable[str]]:
+    async def fn(is_hedge: bool) -> str:
+        calls.append(is_hedge)
+        await asyncio.sleep(hedged if is_hedge else primary)
+        return "hedge" if is_hedge else "primary"
+
+    return fn
+
+
+class TestLatencyTracker:
+    def test_percentile(self) -> None:
+        tracker = hedge.LatencyTracker(100)
+        for latency in range(1, 101):
+            tracker.record(latency / 1000)
+
+        assert tracker.percentile(50) == pytest.approx(0.050, abs=0.001)
+        assert tracker.percentile(95) == pytest.approx(0.095, abs=0.001)
+
+    def test_percentile_window(self) -> None:
+        tracker = hedge.LatencyTracker(2)
+        for latency in (9.0, 1.0, 2.0):
+            tracker.record(latency)
+
+        assert len(tracker) == 2
+        assert tracker.percentile(100) == 2.0
+
+    def test_percentile_refresh(self) -> None:
+        tracker = hedge.LatencyTracker(1000, refresh=10)
+        for _ in range(100):
+            tracker.record(0.001)
+
+        assert tracker.percentile(50) == 0.001
+
+        for _ in range(9):
+            tracker.record(1.0)
+
+        assert tracker.percentile(100) == 0.001
+
+        tracker.record(1.0)
+
+        assert tracker.percentile(100) == 1.0
+
+    def test_percentile_refresh_few(self) -> None:
+        tracker = hedge.LatencyTracker(1000, refresh=100)
+        tracker.record(0.001)
+
+        assert tracker.percentile(100) == 0.001
+
+        tracker.record(1.0)
+
+        assert tracker.percentile(100) == 1.0
+
+    def test_percentile_empty(self) -> None:
+        assert hedge.LatencyTracker(2).percentile(99) == 0.0
+
+
+class TestHedger:
+    def test_run_without_samples(self) -> None:
+        hedger = hedge.Hedger(95.0, 1.0, 0.001, 10)
+        calls: list[bool] = []
+        actual = asyncio.run(hedger.run(request(0.02, 0.0, calls)))
+
+        assert actual == "primary"
+        assert calls == [False]
+        assert hedger.delay() is None
+
+    def test_run_fast(self) -> None:
+        hedger = hedge.Hedger(95.0, 1.0, 0.001, 10)
+        warm(hedger, 0.05, 10)
+        calls: list[bool] = []
+        actual = asyncio.run(hedger.run(request(0.0, 0.0, calls)))
+
+        assert actual == "primary"
+        assert calls == [False]
+        assert hedger.stats.fired == 0
+
+    def test_run_hedged(self) -> None:
+        hedger = hedge.Hedger(95.0, 1.0, 0.001, 10)
+        warm(hedger, 0.01, 10)
+        calls: list[bool] = []
+        actual = asyncio.run(hedger.run(request(1.0, 0.0, calls)))
+
+        assert actual == "hedge"
+        assert calls == [False, True]
+        assert hedger.stats.fired == 1
+        assert hedger.stats.won == 1
+
+    def test_run_budget(self) -> None:
+        hedger = hedge.Hedger(95.0, 0.5, 0.001, 10)
+        warm(hedger, 0.01, 100)
+        calls: list[bool] = []
+
+        async def run_twice() -> list[str]:
+            return [
+                await hedger.run(request(0.03, 0.0, calls)),
+                await hedger.run(request(0.03, 0.0, calls)),
+            ]
+
+        actual = asyncio.run(run_twice())
+
+        assert actual == ["primary", "hedge"]
+        assert hedger.stats.denied == 1
+        assert hedger.stats.fired == 1
+
+    def test_run_primary_fails(self) -> None:
+        hedger = hedge.Hedger(95.0, 1.0, 0.001, 10)
+        warm(hedger, 0.01, 10)
+
+        async def fn(is_hedge: bool) -> str:
+            if is_hedge:
+                await asyncio.sleep(0.05)
+                return "hedge"
+
+            await asyncio.sleep(0.02)
+            raise ValueError("primary")
+
+        assert asyncio.run(hedger.run(fn)) == "hedge"
+
+    def test_run_both_fail(self) -> None:
+        hedger = hedge.Hedger(95.0, 1.0, 0.001, 10)
+        warm(hedger, 0.01, 10)
+
+        async def fn(is_hedge: bool) -> str:
+            await asyncio.sleep(0.05 if is_hedge else 0.02)
+            raise ValueError("hedge" if is_hedge else "primary")
+
+        with pytest.raises(ValueError, match="primary"):
+            asyncio.run(hedger.run(fn))
+
+    def test_run_cancels_loser(self) -> None:
+        hedger = hedge.Hedger(95.0, 1.0, 0.001, 10)
+        warm(hedger, 0.01, 10)
+        cancelled: list[bool] = []
+
+        async def fn(is_hedge: bool) -> str:
+            try:
+                await asyncio.sleep(0.0 if is_hedge else 1.0)
+            except asyncio.CancelledError:
+                cancelled.append(is_hedge)
+                raise
+            return "hedge" if is_hedge else "primary"
+
+        async def run() -> str:
+            result = await hedger.run(fn)
+            await asyncio.sleep(0)
+            return result
+
+        assert asyncio.run(run()) == "hedge"
+        assert cancelled == [False]
+
+    def test_run_records_cancelled_primary(self) -> None:
+        hedger = hedge.Hedger(95.0, 1.0, 0.01, 1)
+        warm(hedger, 0.0, 1)
+        calls: list[bool] = []
+
+        async def run() -> str:
+            result = await hedger.run(request(1.0, 0.0, calls))
+            await asyncio.sleep(0)
+            return result
+
+        assert asyncio.run(run()) == "hedge"
+        assert len(hedger.latencies) == 3
+        assert hedger.latencies.percentile(100) >= 0.01
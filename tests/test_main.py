@@ -1,6 +1,10 @@
+import pytest
+from elasticsearch import ConnectionTimeout
 from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
 
 from pokeapi import main
+from pokeapi.search import async_accessor, breaker
 
 
 class TestMain:
@@ -10,3 +14,29 @@ class TestMain:
 
         assert response.status_code == 200
         assert response.json() == {"message": "Welcome to Pokédex!"}
+
+    @pytest.mark.usefixtures("_setup_get_config")
+    def test_circuit_open(self, mocker: MockerFixture) -> None:
+        circuit_breaker = breaker.CircuitBreaker(1, 1.0, 30.0)
+        circuit_breaker.before_call()
+        circuit_breaker.record(0.0, True)
+        mocker.patch.object(
+            breaker, "get_breaker", return_value=circuit_breaker
+        )
+        client = TestClient(main.app)
+        response = client.get("/pokemon/name/ピカチュウ")
+
+        assert response.status_code == 503
+        assert response.json() == {"detail": "elasticsearch is unavailable"}
+        assert response.headers["Retry-After"] == "30"
+
+    def test_deadline_exceeded(self, mocker: MockerFixture) -> None:
+        mocker.patch.object(
+            async_accessor,
+            "search_pokemon",
+            side_effect=ConnectionTimeout("TIMEOUT", "timed out", None),
+        )
+        client = TestClient(main.app)
+        response = client.get("/pokemon/name/ピカチュウ")
+
+        assert response.status_code == 504
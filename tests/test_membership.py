@@ -0,0 +1,178 @@
+import asyncio
+from typing import Any, Generator
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pokeapi.search import client, membership
+
+
+def terms(buckets: list[tuple[Any, int]], other: int = 0) -> dict[str, Any]:
+    return {
+        "sum_other_doc_count": other,
+        "buckets": [{"key": key, "doc_count": n} for key, n in buckets],
+    }
+
+
+@pytest.fixture()
+def es(mocker: MockerFixture) -> Generator[Any, None, None]:
+    es = mocker.Mock()
+    es.search = mocker.AsyncMock(
+        return_value={
+            "hits": {"total": {"value": 2}},
+            "aggregations": {
+                "pokedex_number": terms([(25, 1), (26, 1)]),
+                "name": terms([("ピカチュウ", 1), ("ライチュウ", 1)]),
+            },
+        }
+    )
+    es.indices.analyze = mocker.AsyncMock(
+        return_value={"tokens": [{"token": "ピカチュウ"}, {"token": "ライチュウ"}]}
+    )
+    mocker.patch.object(client, "get_async_client", return_value=es)
+    membership.reset_membership()
+    yield es
+    membership.reset_membership()
+
+
+@pytest.fixture()
+def conf(mocker: MockerFixture) -> Any:
+    conf = mocker.patch.object(membership, "config").get_config.return_value
+    conf.ES_MEMBERSHIP_ENABLED = True
+    conf.ES_NEGATIVE_CACHE_TTL = 60.0
+    conf.ES_NEGATIVE_CACHE_MAX_ENTRIES = 10
+
+    return conf
+
+
+class TestMembershipFilter:
+    def test_may_contain(self) -> None:
+        membership_filter = membership.MembershipFilter(
+            "a", frozenset({25}), frozenset({"ピカチュウ"})
+        )
+
+        assert membership_filter.may_contain(membership.POKEDEX_NUMBER, 25)
+        assert not membership_filter.may_contain(membership.POKEDEX_NUMBER, 26)
+        assert membership_filter.may_contain(membership.NAME, "ピカチュウ")
+        assert not membership_filter.may_contain(membership.NAME, "ライチュウ")
+
+    def test_may_contain_name_keyword(self) -> None:
+        membership_filter = membership.MembershipFilter(
+            "a",
+            frozenset({6}),
+            frozenset({"メガリザードン", "ｘ"}),
+            frozenset({"メガリザードンＸ"}),
+        )
+
+        assert membership_filter.may_contain(
+            membership.NAME_KEYWORD, "メガリザードンＸ"
+        )
+        assert not membership_filter.may_contain(membership.NAME_KEYWORD, "ｘ")
+        assert not membership_filter.may_contain(membership.NAME, "メガリザードンＸ")
+
+
+@pytest.mark.usefixtures("_setup_get_config")
+class TestBuildFilter:
+    def test_build_filter(self) -> None:
+        async def build() -> membership.MembershipFilter | None:
+            try:
+                return await membership.build_filter("a")
+            finally:
+                await client.close_async_client()
+
+        actual = asyncio.run(build())
+
+        assert actual is not None
+        assert actual.generation == "a"
+        assert 25 in actual.pokedex_numbers
+        assert "ピカチュウ" in actual.names
+
+    def test_build_filter_analyzed(self, es: Any) -> None:
+        actual = asyncio.run(membership.build_filter("a"))
+
+        assert actual == membership.MembershipFilter(
+            "a",
+            frozenset({25, 26}),
+            frozenset({"ピカチュウ", "ライチュウ"}),
+            frozenset({"ピカチュウ", "ライチュウ"}),
+        )
+        assert es.indices.analyze.call_args.kwargs["body"] == {
+            "field": "name",
+            "text": ["ピカチュウ", "ライチュウ"],
+        }
+
+    @pytest.mark.parametrize(
+        ("pokedex_numbers", "names", "total"),
+        [
+            (terms([(25, 1)], other=1), terms([("ピカチュウ", 2)]), 2),
+            (terms([(25, 2)]), terms([("ピカチュウ", 1)], other=1), 2),
+            (terms([(25, 2)]), terms([("ピカチュウ", 1)]), 2),
+        ],
+    )
+    def test_build_filter_incomplete(
+        self,
+        es: Any,
+        pokedex_numbers: dict[str, Any],
+        names: dict[str, Any],
+        total: int,
+    ) -> None:
+        es.search.return_value = {
+            "hits": {"total": {"value": total}},
+            "aggregations": {
+                "pokedex_number": pokedex_numbers,
+                "name": names,
+            },
+        }
+
+        assert asyncio.run(membership.build_filter("a")) is None
+        assert es.indices.analyze.await_count == 0
+
+
+class TestMembership:
+    def test_on_generation(self, es: Any, conf: Any) -> None:
+        async def change() -> None:
+            membership.on_generation("a")
+            assert membership._rebuild is not None
+            await membership._rebuild
+
+        asyncio.run(change())
+
+        assert membership.is_missing(membership.POKEDEX_NUMBER, 1)
+        assert membership.is_missing(membership.NAME, "ミュウ")
+        assert not membership.is_missing(membership.NAME, "ピカチュウ")
+        assert membership.stats.rebuilds >= 1
+        assert membership.stats.pokedex_numbers == 2
+
+        asyncio.run(change())
+        conf.ES_MEMBERSHIP_ENABLED = False
+        membership.on_generation("b")
+
+        assert not membership.is_missing(membership.POKEDEX_NUMBER, 1)
+
+    def test_rebuild_stale(self, es: Any, conf: Any) -> None:
+        membership.stats.generation = "b"
+        asyncio.run(membership.rebuild("a"))
+
+        assert membership._filter is None
+
+    def test_record_missing(self, es: Any, conf: Any) -> None:
+        saved = membership.stats.saved
+
+        assert not membership.is_missing(membership.NAME, "ミュウ")
+
+        membership.record_missing(membership.NAME, "ミュウ")
+
+        assert membership.is_missing(membership.NAME, "ミュウ")
+        assert not membership.is_missing(membership.POKEDEX_NUMBER, 151)
+        assert membership.stats.saved == saved + 1
+
+        conf.ES_MEMBERSHIP_ENABLED = False
+        membership.on_generation("b")
+
+        assert not membership.is_missing(membership.NAME, "ミュウ")
+
+    def test_record_missing_disabled(self, es: Any, conf: Any) -> None:
+        conf.ES_NEGATIVE_CACHE_TTL = 0.0
+        membership.record_missing(membership.NAME, "ミュウ")
+
+        assert not membership.is_missing(membership.NAME, "ミュウ")
@@ -0,0 +1,253 @@
+import asyncio
+from typing import Any
+
+import pytest
+from elasticsearch import NotFoundError, RequestError
+
+from pokeapi.search import generation, memory, raw
+from pokeapi.search.param import (
+    CreateAbilityParam,
+    CreateExpressionParam,
+    CreateGenderTypeParam,
+    CreatePageParam,
+)
+from pokeapi.search.query import (
+    CreateBatchLookupQuery,
+    CreateKeywordQuery,
+    CreatePaginatedQuery,
+    CreatePokedexNumberQuery,
+    CreatePokemonNameQuery,
+    compile_conditions,
+)
+
+DUMP = "docker/elasticdump/src/pokemon_data.json"
+
+
+@pytest.fixture()
+def index() -> memory.MemoryIndex:
+    return memory.load_index(DUMP, "pokemon")
+
+
+@pytest.fixture()
+def es(index: memory.MemoryIndex) -> memory.MemoryBackend:
+    return memory.MemoryBackend(index)
+
+
+def sources(response: dict[str, Any]) -> list[dict[str, Any]]:
+    return [hit["_source"] for hit in response["hits"]["hits"]]
+
+
+class TestAnalyze:
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("ピカチュウ", ["ピカチュウ"]),
+            ("メガリザードンＸ", ["メガリザードン", "ｘ"]),
+            ("ほのお", ["ほ", "の", "お"]),
+            ("Mr. Mime 2", ["mr", "mime", "2"]),
+            ("", []),
+        ],
+    )
+    def test_analyze(self, text: str, expected: list[str]) -> None:
+        assert memory.analyze(text) == expected
+
+
+class TestMemoryIndex:
+    def test_load_index(self, index: memory.MemoryIndex) -> None:
+        assert index.name == "pokemon"
+        assert len(index.ids) == 28
+        assert "name" in index.text_fields
+        assert "is_legendary" not in index.text_fields
+
+    def test_search_name(self, index: memory.MemoryIndex) -> None:
+        actual = index.search(CreatePokemonNameQuery().create_query("ピカチュウ"))
+
+        assert [doc["name"] for doc in sources(actual)] == ["ピカチュウ"]
+        assert actual["hits"]["total"] == {"value": 1, "relation": "eq"}
+
+    def test_search_pokedex_number(self, index: memory.MemoryIndex) -> None:
+        actual = index.search(CreatePokedexNumberQuery().create_query(150))
+
+        assert {doc["name"] for doc in sources(actual)} == {
+            "ミュウツー",
+            "メガミュウツーＸ",
+            "メガミュウツーＹ",
+        }
+
+    def test_search_conditions(
+        self,
+        index: memory.MemoryIndex,
+        setup_conditions_mimikkyu_res: list[dict[str, Any]],
+    ) -> None:
+        query = compile_conditions(
+            (
+                CreateAbilityParam(("ばけのかわ", None, None)),
+                CreateGenderTypeParam((True, None)),
+            )
+        ).query
+
+        assert sources(index.search(query)) == setup_conditions_mimikkyu_res
+
+    def test_search_keyword(self, index: memory.MemoryIndex) -> None:
+        query = CreateKeywordQuery().create_query("すがた")
+        actual = index.search(
+            CreatePaginatedQuery().create_query((query, CreatePageParam(10)))
+        )
+
+        assert [
+            (doc["regional_variant"] or doc["form"]) for doc in sources(actual)
+        ] == ["アローラのすがた", "ばけたすがた", "ばれたすがた"]
+        assert not sources(
+            index.search(CreateKeywordQuery().create_query("ゴースト すがた"))
+        )
+
+    def test_search_batch(self, index: memory.MemoryIndex) -> None:
+        query = CreateBatchLookupQuery().create_query(((1, 2), ("ミュウ",)))
+
+        assert [doc["name"] for doc in sources(index.search(query))] == [
+            "フシギダネ",
+            "フシギソウ",
+            "ミュウ",
+        ]
+
+    def test_search_must_not(self, index: memory.MemoryIndex) -> None:
+        query = compile_conditions(
+            (CreateExpressionParam("NOT is_legendary:true"),)
+        ).query
+        actual = index.search({**query, "size": 100})
+
+        assert actual["hits"]["total"]["value"] == 20
+        assert not any(doc["is_legendary"] for doc in sources(actual))
+
+    def test_search_page(self, index: memory.MemoryIndex) -> None:
+        query: dict[str, Any] = {"query": {"match_all": {}}}
+        first = index.search(
+            CreatePaginatedQuery().create_query((query, CreatePageParam(3)))
+        )
+        last_sort = first["hits"]["hits"][-1]["sort"]
+        second = index.search(
+            CreatePaginatedQuery().create_query(
+                (query, CreatePageParam(3, [str(last_sort[0]), last_sort[1]]))
+            )
+        )
+
+        assert [hit["sort"] for hit in first["hits"]["hits"]] == [
+            [1, "1"],
+            [2, "2"],
+            [3, "3"],
+        ]
+        assert second["hits"]["hits"][0]["sort"] == [3, "4"]
+        assert "total" not in first["hits"]
+
+    def test_search_aggregations(self, index: memory.MemoryIndex) -> None:
+        actual = index.search(
+            {
+                "size": 0,
+                "aggs": {
+                    "names": {"terms": {"field": "name.keyword", "size": 1}}
+                },
+            }
+        )
+        names = actual["aggregations"]["names"]
+
+        assert names["buckets"] == [{"key": "ミミッキュ", "doc_count": 2}]
+        assert names["sum_other_doc_count"] == 26
+        assert actual["hits"]["hits"] == []
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            {"query": {"wildcard": {"name": "ピカ*"}}},
+            {"query": {"term": {"name": {"a": 1}, "form": None}}},
+            {"aggs": {"names": {"terms": {"field": "name"}}}},
+        ],
+    )
+    def test_search_unsupported(
+        self, index: memory.MemoryIndex, query: dict[str, Any]
+    ) -> None:
+        with pytest.raises(RequestError):
+            index.search(query)
+
+
+class TestMemoryBackend:
+    def test_search_raw(self, es: memory.MemoryBackend) -> None:
+        text = es.search(
+            body=CreatePokemonNameQuery().create_query("ピカチュウ"),
+            filter_path=raw.FILTER_PATH,
+            headers={raw.RAW_HEADER: "1"},
+        )
+        docs, rest = raw.split_sources(text)
+
+        assert isinstance(text, str)
+        assert "ピカチュウ" in docs[0]
+        assert rest == {
+            "hits": {
+                "total": {"value": 1, "relation": "eq"},
+                "hits": [{"_source": None}],
+            }
+        }
+
+    def test_msearch(self, es: memory.MemoryBackend) -> None:
+        actual = es.msearch(
+            body=[
+                {"index": "pokemon"},
+                CreatePokedexNumberQuery().create_query(25),
+                {"index": "pokemon"},
+                {"query": {"fuzzy": {"name": "ピカチュウ"}}},
+            ]
+        )
+
+        assert actual["responses"][0]["status"] == 200
+        assert sources(actual["responses"][0])[0]["name"] == "ピカチュウ"
+        assert actual["responses"][1]["status"] == 400
+        assert "error" in actual["responses"][1]
+
+    def test_mget(self, es: memory.MemoryBackend) -> None:
+        actual = es.mget(index="pokemon", body={"ids": ["1", "1000"]})
+
+        assert actual["docs"][0]["found"]
+        assert actual["docs"][0]["_source"]["name"] == "フシギダネ"
+        assert not actual["docs"][1]["found"]
+
+    def test_point_in_time(
+        self, index: memory.MemoryIndex, es: memory.MemoryBackend
+    ) -> None:
+        pit_id = es.open_point_in_time(index="pokemon", keep_alive="1m")["id"]
+        es.index = memory.MemoryIndex("pokemon", [], "empty")
+        actual = es.search(body={"pit": {"id": pit_id}, "size": 100})
+
+        assert actual["pit_id"] == pit_id
+        assert len(actual["hits"]["hits"]) == len(index.ids)
+        assert es.close_point_in_time(body={"id": pit_id})["num_freed"] == 1
+        assert es.close_point_in_time(body={"id": pit_id}, ignore=404)
+        with pytest.raises(NotFoundError):
+            es.search(body={"pit": {"id": pit_id}})
+
+    def test_indices_stats(self, es: memory.MemoryBackend) -> None:
+        actual = es.indices.stats(index="pokemon", metric="docs,indexing")
+
+        assert actual["indices"]["pokemon"]["primaries"]["docs"]["count"] == 28
+        assert generation.create_generation(actual) == (
+            generation.create_generation(
+                memory.MemoryBackend(memory.load_index(DUMP)).indices.stats(
+                    index="pokemon"
+                )
+            )
+        )
+
+    def test_indices_analyze(self, es: memory.MemoryBackend) -> None:
+        actual = es.indices.analyze(
+            index="pokemon", body={"field": "name", "text": ["ピカチュウ"]}
+        )
+
+        assert [token["token"] for token in actual["tokens"]] == ["ピカチュウ"]
+
+    def test_async_search(self, index: memory.MemoryIndex) -> None:
+        async def search() -> Any:
+            async with memory.AsyncMemoryBackend(index) as es:
+                return await es.search(
+                    index="pokemon",
+                    body=CreatePokedexNumberQuery().create_query(25),
+                )
+
+        assert sources(asyncio.run(search()))[0]["name"] == "ピカチュウ"
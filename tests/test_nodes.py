@@ -0,0 +1,228 @@
+import asyncio
+import random
+from types import SimpleNamespace
+from typing import Any, Generator
+
+import pytest
+from elasticsearch import AsyncElasticsearch
+from elasticsearch import ConnectionError as ESConnectionError
+from elasticsearch import (
+    ConnectionTimeout,
+    Elasticsearch,
+    NotFoundError,
+    TransportError,
+)
+from pytest_mock import MockerFixture
+
+from pokeapi.search import client, nodes
+
+from .fake_elasticsearch import FakeNode
+
+
+def connection(latency: float | None, error_rate: float) -> Any:
+    health = nodes.NodeHealth()
+    health.latency = latency
+    health.error_rate = error_rate
+    return SimpleNamespace(health=health)
+
+
+def searches(cluster: list[FakeNode]) -> list[int]:
+    return [node.searches() for node in cluster]
+
+
+def client_kwargs(cluster: list[FakeNode]) -> dict[str, Any]:
+    return {
+        "hosts": [node.url for node in cluster],
+        "selector_class": nodes.HealthAwareSelector,
+        "max_retries": 2,
+        "retry_backoff": 0.001,
+        "retry_backoff_max": 0.01,
+    }
+
+
+@pytest.fixture()
+def cluster() -> Generator[list[FakeNode], None, None]:
+    fast, slow, failing = FakeNode(), FakeNode(delay=0.1), FakeNode(status=503)
+    yield [fast, slow, failing]
+    for node in (fast, slow, failing):
+        node.stop()
+
+
+class TestNodeHealth:
+    def test_record(self) -> None:
+        health = nodes.NodeHealth()
+        health.record(0.1, False)
+        health.record(0.2, True)
+
+        assert health.latency == pytest.approx(0.12)
+        assert health.error_rate == pytest.approx(nodes.ALPHA)
+        assert health.requests == 2
+        assert health.errors == 1
+
+    def test_score(self) -> None:
+        health = nodes.NodeHealth()
+
+        assert health.score(0.05) == 0.05
+        health.record(0.1, True)
+        assert health.score(0.05) == pytest.approx(
+            0.1 * (1 + nodes.ERROR_PENALTY * nodes.ALPHA)
+        )
+
+
+class TestHealthAwareSelector:
+    def test_select(self) -> None:
+        random.seed(0)
+        fast, slow, failing, new = (
+            connection(0.01, 0.0),
+            connection(0.1, 0.0),
+            connection(0.01, 1.0),
+            connection(None, 0.0),
+        )
+        selector = nodes.HealthAwareSelector(())
+        picks = [
+            selector.select([fast, slow, failing, new]) for _ in range(2000)
+        ]
+
+        assert picks.count(fast) > 5 * picks.count(slow)
+        assert picks.count(fast) > 5 * picks.count(failing)
+        assert picks.count(new) > 5 * picks.count(slow)
+        assert picks.count(slow) > 0
+
+    def test_select_hint(self) -> None:
+        fast, slow = connection(0.01, 0.0), connection(0.1, 0.0)
+        selector = nodes.HealthAwareSelector(())
+
+        async def select(hint: nodes.NodeHint) -> Any:
+            async def pick() -> Any:
+                return selector.select([fast, slow])
+
+            return await nodes.with_hint(hint, pick())
+
+        for _ in range(20):
+            hint = nodes.NodeHint(avoid=fast)
+
+            assert asyncio.run(select(hint)) is slow
+            assert hint.picked is slow
+
+        assert selector.select([fast]) is fast
+        assert asyncio.run(select(nodes.NodeHint())) in (fast, slow)
+        assert nodes._hint.get() is None
+
+
+class TestRetry:
+    def test_backoff(self) -> None:
+        delays = [nodes.backoff(attempt, 0.01, 0.05) for attempt in range(8)]
+
+        assert all(0 <= delay <= 0.05 for delay in delays)
+        assert nodes.backoff(0, 0.01, 0.05) <= 0.01
+
+    def test_is_retriable(self) -> None:
+        assert nodes.is_retriable(ESConnectionError("N/A", "refused", None))
+        assert nodes.is_retriable(TransportError(503, "unavailable", {}))
+        assert not nodes.is_retriable(ConnectionTimeout("TIMEOUT", "", None))
+        assert not nodes.is_retriable(NotFoundError(404, "not found", {}))
+
+
+class TestClientHosts:
+    def test_get_hosts(self, mocker: MockerFixture) -> None:
+        mocker.patch.object(
+            client.config,
+            "get_config",
+            return_value=mocker.Mock(
+                ES_CONNECTION_URL="http://a:9200, http://b:9200,"
+            ),
+        )
+
+        assert client.get_hosts() == ["http://a:9200", "http://b:9200"]
+
+    @pytest.mark.parametrize("url", [None, "", " , "])
+    def test_get_hosts_default(
+        self, mocker: MockerFixture, url: str | None
+    ) -> None:
+        mocker.patch.object(
+            client.config,
+            "get_config",
+            return_value=mocker.Mock(ES_CONNECTION_URL=url),
+        )
+
+        assert client.get_hosts() is None
+
+
+class TestCluster:
+    def test_search(self, cluster: list[FakeNode]) -> None:
+        es = Elasticsearch(
+            connection_class=client.TrackingUrllib3HttpConnection,
+            transport_class=nodes.RetryingTransport,
+            **client_kwargs(cluster),
+        )
+        for _ in range(20):
+            es.search(index="pokemon", body={})
+        warm = searches(cluster)
+        for _ in range(60):
+            es.search(index="pokemon", body={})
+        fast, slow, failing = (
+            after - before for after, before in zip(searches(cluster), warm)
+        )
+
+        assert fast > 3 * slow
+        assert failing == 0
+        assert warm[2] <= 2
+        es.close()
+
+    def test_search_async(self, cluster: list[FakeNode]) -> None:
+        async def search_all() -> list[int]:
+            es = AsyncElasticsearch(
+                connection_class=client.CountingAIOHttpConnection,
+                transport_class=nodes.AsyncRetryingTransport,
+                **client_kwargs(cluster),
+            )
+            for _ in range(20):
+                await es.search(index="pokemon", body={})
+            warm = searches(cluster)
+            for _ in range(60):
+                await es.search(index="pokemon", body={})
+            await es.close()
+
+            return warm
+
+        warm = asyncio.run(search_all())
+        fast, slow, failing = (
+            after - before for after, before in zip(searches(cluster), warm)
+        )
+
+        assert fast > 3 * slow
+        assert failing == 0
+        assert warm[2] <= 2
+
+    def test_search_all_failing(self) -> None:
+        failing = FakeNode(status=503)
+        es = Elasticsearch(
+            connection_class=client.TrackingUrllib3HttpConnection,
+            transport_class=nodes.RetryingTransport,
+            **client_kwargs([failing]),
+        )
+
+        with pytest.raises(TransportError):
+            es.search(index="pokemon", body={})
+
+        assert failing.searches() == 3
+        es.close()
+        failing.stop()
+
+    def test_sniff_on_start(self) -> None:
+        seed, other = FakeNode(), FakeNode()
+        seed.set_peers([seed, other])
+        es = Elasticsearch(
+            connection_class=client.TrackingUrllib3HttpConnection,
+            transport_class=nodes.RetryingTransport,
+            sniff_on_start=True,
+            **client_kwargs([seed]),
+        )
+        for _ in range(20):
+            es.search(index="pokemon", body={})
+
+        assert len(es.transport.connection_pool.connections) == 2
+        assert other.searches() > 0
+        es.close()
+        seed.stop()
+        other.stop()
@@ -43,6 +43,36 @@ class TestCreateNameParam:
         assert actual == [{"term": {"name": "フシギダネ"}}]
 
 
+@pytest.mark.param()
+class TestCreatePokedexNumbersParam:
+    def test_create_pokedex_numbers_param(self) -> None:
+        p = param.CreatePokedexNumbersParam((25, 1, 25))
+        actual = p.create_param()
+
+        assert actual == {"terms": {"national_pokedex_number": [1, 25]}}
+
+    def test_create_pokedex_numbers_param_empty(self) -> None:
+        p = param.CreatePokedexNumbersParam(())
+        actual = p.create_param()
+
+        assert actual is None
+
+
+@pytest.mark.param()
+class TestCreateNamesParam:
+    def test_create_names_param(self) -> None:
+        p = param.CreateNamesParam(("フシギダネ", "ピカチュウ", "フシギダネ"))
+        actual = p.create_param()
+
+        assert actual == {"terms": {"name.keyword": ["ピカチュウ", "フシギダネ"]}}
+
+    def test_create_names_param_empty(self) -> None:
+        p = param.CreateNamesParam(())
+        actual = p.create_param()
+
+        assert actual is None
+
+
 @pytest.mark.param()
 class TestCreateformParam:
     def test_create_form_param(self) -> None:
@@ -425,6 +455,35 @@ class TestCreateAbilityParam:
         assert actual is None
 
 
+@pytest.mark.param()
+class TestCreateRangeParam:
+    def test_create_range_param_1_1(self) -> None:
+        p = param.CreateRangeParam("base_stats.speed", (100, 130))
+        actual = p.create_param()
+
+        assert actual == {
+            "range": {"base_stats.speed": {"gte": 100, "lte": 130}}
+        }
+
+    def test_create_range_param_1_0(self) -> None:
+        p = param.CreateRangeParam("height", (1.5, None))
+        actual = p.create_param()
+
+        assert actual == {"range": {"height": {"gte": 1.5}}}
+
+    def test_create_range_param_0_1(self) -> None:
+        p = param.CreateRangeParam("weight", (None, 10.0))
+        actual = p.create_param()
+
+        assert actual == {"range": {"weight": {"lte": 10.0}}}
+
+    def test_create_range_param_none(self) -> None:
+        p = param.CreateRangeParam("weight", (None, None))
+        actual = p.create_param()
+
+        assert actual is None
+
+
 @pytest.mark.param()
 class TestCreateKeywordParam:
     def test_create_param(self) -> None:
@@ -449,3 +508,55 @@ class TestCreateKeywordParam:
                 }
             }
         ]
+
+
+@pytest.mark.param()
+class TestCreateExpressionParam:
+    def test_create_param(self) -> None:
+        p = param.CreateExpressionParam("type:ほのお OR NOT is_mythical:true")
+        actual = p.create_param()
+
+        assert actual == {
+            "bool": {
+                "should": [
+                    {
+                        "multi_match": {
+                            "query": "ほのお",
+                            "fields": [
+                                "pokemon_type.type_1.keyword",
+                                "pokemon_type.type_2.keyword",
+                            ],
+                        }
+                    },
+                    {"bool": {"must_not": [{"term": {"is_mythical": True}}]}},
+                ],
+                "minimum_should_match": 1,
+            }
+        }
+
+    def test_create_param_none(self) -> None:
+        assert param.CreateExpressionParam(None).create_param() is None
+
+
+@pytest.mark.param()
+class TestCreatePageParam:
+    def test_create_page_param(self) -> None:
+        p = param.CreatePageParam(10)
+        actual = p.create_param()
+
+        assert actual == {
+            "size": 10,
+            "sort": [{"national_pokedex_number": "asc"}, {"_id": "asc"}],
+            "track_total_hits": False,
+        }
+
+    def test_create_page_param_search_after(self) -> None:
+        p = param.CreatePageParam(20, [25, "14"], True)
+        actual = p.create_param()
+
+        assert actual == {
+            "size": 20,
+            "sort": [{"national_pokedex_number": "asc"}, {"_id": "asc"}],
+            "track_total_hits": True,
+            "search_after": [25, "14"],
+        }
@@ -1,8 +1,13 @@
+import json
 from typing import Any
 
+import pytest
 from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
 
 from pokeapi import main
+from pokeapi.routers import pokemon_router
+from pokeapi.search import config, generation, membership, prerender
 
 
 class TestPokemonRouter:
@@ -185,6 +190,90 @@ class TestPokemonRouter:
         assert response.status_code == 200
         assert response.json() == setup_null_conditions_res
 
+    def test_read_pokemon_by_conditions_filter(self) -> None:
+        client = TestClient(main.app)
+        response = client.get(
+            "/pokemon/conditions",
+            params={
+                "filter": "(type:でんき OR type:ゴースト) AND NOT form:ばけたすがた",
+                "has_male": "1",
+                "limit": "100",
+            },
+        )
+        by_type = [
+            p
+            for type_ in ("でんき", "ゴースト")
+            for p in client.get(
+                "/pokemon/conditions",
+                params={"type_1": type_, "has_male": "1", "limit": "100"},
+            ).json()
+            + client.get(
+                "/pokemon/conditions",
+                params={"type_2": type_, "has_male": "1", "limit": "100"},
+            ).json()
+            if p["form"] != "ばけたすがた"
+        ]
+
+        assert response.status_code == 200
+        assert response.json()
+        assert sorted(
+            json.dumps(p, sort_keys=True) for p in response.json()
+        ) == sorted({json.dumps(p, sort_keys=True) for p in by_type})
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "type:",
+            "color:red",
+            "(type:でんき",
+            "NOT",
+            "NOT " * 245 + "is_legendary:true",
+        ],
+    )
+    def test_read_pokemon_by_conditions_filter_invalid(
+        self, expression: str
+    ) -> None:
+        client = TestClient(main.app)
+        response = client.get(
+            "/pokemon/conditions", params={"filter": expression}
+        )
+
+        assert response.status_code == 422
+
+    def test_read_pokemon_by_conditions_range(self) -> None:
+        client = TestClient(main.app)
+        response = client.get(
+            "/pokemon/conditions",
+            params={
+                "min_speed": "100",
+                "max_weight": "60.5",
+                "has_male": "1",
+                "limit": "100",
+            },
+        )
+        by_range = [
+            p
+            for p in client.get(
+                "/pokemon/conditions", params={"has_male": "1", "limit": "100"}
+            ).json()
+            if p["base_stats"]["speed"] >= 100 and p["weight"] <= 60.5
+        ]
+
+        assert response.status_code == 200
+        assert response.json()
+        assert response.json() == by_range
+
+    @pytest.mark.parametrize(
+        "params", [{"min_speed": "fast"}, {"max_height": "tall"}]
+    )
+    def test_read_pokemon_by_conditions_range_invalid(
+        self, params: dict[str, str]
+    ) -> None:
+        client = TestClient(main.app)
+        response = client.get("/pokemon/conditions", params=params)
+
+        assert response.status_code == 422
+
     def test_read_pokemon_by_keyword(self) -> None:
         client = TestClient(main.app)
         response = client.get("/pokemon/keyword/アローラ")
@@ -227,3 +316,456 @@ class TestPokemonRouter:
 
         assert response.status_code == 404
         assert response.json() == {"detail": "Not Found"}
+
+    def test_read_pokemon_batch(self) -> None:
+        client = TestClient(main.app)
+        response = client.post(
+            "/pokemon/batch",
+            json={"pokedex_numbers": [25, 0, 6], "names": ["ミュウ", "hoge"]},
+        )
+
+        assert response.status_code == 200
+        assert [
+            (
+                r["pokedex_number"],
+                r["found"],
+                [p["name"] for p in r["pokemon"]],
+            )
+            for r in response.json()["pokedex_numbers"]
+        ] == [
+            (25, True, ["ピカチュウ"]),
+            (0, False, []),
+            (6, True, ["リザードン", "メガリザードンＸ", "メガリザードンＹ"]),
+        ]
+        assert [
+            (r["name"], r["found"], len(r["pokemon"]))
+            for r in response.json()["names"]
+        ] == [("ミュウ", True, 1), ("hoge", False, 0)]
+
+    def test_read_pokemon_batch_empty(self) -> None:
+        client = TestClient(main.app)
+        response = client.post("/pokemon/batch", json={})
+
+        assert response.status_code == 200
+        assert response.json() == {"pokedex_numbers": [], "names": []}
+
+    def test_read_pokemon_batch_too_many(self) -> None:
+        client = TestClient(main.app)
+        response = client.post(
+            "/pokemon/batch", json={"pokedex_numbers": list(range(301))}
+        )
+
+        assert response.status_code == 422
+
+    def test_read_pokemon_by_conditions_page(self) -> None:
+        client = TestClient(main.app)
+        response = client.get("/pokemon/conditions?limit=2")
+        first_page = [p["name"] for p in response.json()]
+
+        assert response.status_code == 200
+        assert first_page == ["フシギダネ", "フシギソウ"]
+        assert "X-Total-Count" not in response.headers
+
+        response = client.get(
+            "/pokemon/conditions?limit=2&cursor="
+            + response.headers["X-Next-Cursor"]
+        )
+
+        assert response.status_code == 200
+        assert [p["name"] for p in response.json()] == ["フシギバナ", "メガフシギバナ"]
+
+    def test_read_pokemon_by_conditions_last_page(self) -> None:
+        client = TestClient(main.app)
+        response = client.get(
+            "/pokemon/conditions?ability_1=ばけのかわ&limit=5&track_total_hits=1"
+        )
+
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+        assert "X-Next-Cursor" not in response.headers
+        assert response.headers["X-Total-Count"] == "2"
+
+    def test_read_pokemon_by_conditions_invalid_cursor(self) -> None:
+        client = TestClient(main.app)
+        response = client.get("/pokemon/conditions?cursor=hoge")
+
+        assert response.status_code == 422
+        assert response.json() == {"detail": "invalid cursor"}
+
+    def test_read_pokemon_by_keyword_limit(self) -> None:
+        client = TestClient(main.app)
+        response = client.get("/pokemon/keyword/アローラ?limit=0")
+
+        assert response.status_code == 422
+
+    def test_export_pokemon(
+        self, setup_conditions_mimikkyu_res: list[dict[str, Any]]
+    ) -> None:
+        client = TestClient(main.app)
+        response = client.get("/pokemon/export?ability_1=ばけのかわ")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert [
+            json.loads(line) for line in response.text.splitlines()
+        ] == setup_conditions_mimikkyu_res
+
+    def test_export_pokemon_all(self) -> None:
+        client = TestClient(main.app)
+        response = client.get("/pokemon/export")
+        numbers = [
+            json.loads(line)["national_pokedex_number"]
+            for line in response.text.splitlines()
+        ]
+
+        assert response.status_code == 200
+        assert len(numbers) == 28
+        assert numbers == sorted(numbers)
+
+
+class TestRawPassthrough:
+    @pytest.fixture(autouse=True)
+    def _setup_raw_passthrough(self, mocker: MockerFixture) -> None:
+        conf = mocker.Mock(
+            wraps=config.get_config(),
+            ES_PRERENDER_ENABLED=False,
+            ES_RAW_PASSTHROUGH=True,
+        )
+        router_config = mocker.patch.object(pokemon_router, "config")
+        router_config.get_config.return_value = conf
+
+    def test_read_pokemon_by_name(self) -> None:
+        client = TestClient(main.app)
+        response = client.get("/pokemon/name/ピカチュウ")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert [p["national_pokedex_number"] for p in response.json()] == [25]
+
+    def test_read_pokemon_by_pokedex_number(
+        self, mocker: MockerFixture
+    ) -> None:
+        search = mocker.spy(
+            pokemon_router.async_accessor, "search_pokemon_raw"
+        )
+        client = TestClient(main.app)
+        response = client.get("/pokemon/pokedex_number/25")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert [p["name"] for p in response.json()] == ["ピカチュウ"]
+        assert search.call_count == 1
+
+    def test_read_pokemon_by_conditions(
+        self, setup_conditions_mimikkyu_res: list[dict[str, Any]]
+    ) -> None:
+        client = TestClient(main.app)
+        response = client.get(
+            "/pokemon/conditions?ability_1=ばけのかわ&limit=1&track_total_hits=1"
+        )
+
+        assert response.status_code == 200
+        assert response.json() == setup_conditions_mimikkyu_res[:1]
+        assert response.headers["X-Total-Count"] == "2"
+
+        response = client.get(
+            "/pokemon/conditions?ability_1=ばけのかわ&limit=1&cursor="
+            + response.headers["X-Next-Cursor"]
+        )
+
+        assert response.json() == setup_conditions_mimikkyu_res[1:]
+
+
+class TestConditionalRequests:
+    @pytest.fixture(autouse=True)
+    def get_generation(self, mocker: MockerFixture) -> Any:
+        return mocker.patch.object(
+            pokemon_router.generation, "get_generation", return_value="gen-1"
+        )
+
+    def test_read_pokemon_by_pokedex_number(
+        self, mocker: MockerFixture
+    ) -> None:
+        client = TestClient(main.app)
+        response = client.get("/pokemon/pokedex_number/25")
+        etag = response.headers["ETag"]
+
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == "public, max-age=300"
+
+        search = mocker.spy(
+            pokemon_router.async_accessor, "search_pokemon_by_pokedex_number"
+        )
+        response = client.get(
+            "/pokemon/pokedex_number/25", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+        assert response.headers["Cache-Control"] == "public, max-age=300"
+        assert search.call_count == 0
+
+    def test_read_pokemon_by_pokedex_number_changed(
+        self, get_generation: Any
+    ) -> None:
+        client = TestClient(main.app)
+        etag = client.get("/pokemon/pokedex_number/25").headers["ETag"]
+        get_generation.return_value = "gen-2"
+        response = client.get(
+            "/pokemon/pokedex_number/25", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert [p["name"] for p in response.json()] == ["ピカチュウ"]
+
+    def test_read_pokemon_by_name(self) -> None:
+        client = TestClient(main.app)
+        etag = client.get("/pokemon/name/ピカチュウ").headers["ETag"]
+
+        assert etag != client.get("/pokemon/name/ライチュウ").headers["ETag"]
+        assert (
+            client.get(
+                "/pokemon/name/ピカチュウ",
+                headers={"If-None-Match": f'"other", W/{etag}'},
+            ).status_code
+            == 304
+        )
+
+    def test_read_pokemon_by_conditions(self) -> None:
+        client = TestClient(main.app)
+        first = client.get("/pokemon/conditions?ability_1=ばけのかわ&limit=1")
+        response = client.get(
+            "/pokemon/conditions?limit=1&ability_1=ばけのかわ",
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+        next_page = client.get(
+            "/pokemon/conditions?ability_1=ばけのかわ&limit=1&cursor="
+            + first.headers["X-Next-Cursor"],
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+
+        assert first.headers["Cache-Control"] == "public, max-age=60"
+        assert response.status_code == 304
+        assert next_page.status_code == 200
+        assert next_page.headers["ETag"] != first.headers["ETag"]
+
+    def test_export_pokemon(self) -> None:
+        client = TestClient(main.app)
+        response = client.get("/pokemon/export?ability_1=ばけのかわ")
+
+        assert response.headers["Cache-Control"] == "no-cache"
+        assert (
+            client.get(
+                "/pokemon/export?ability_1=ばけのかわ",
+                headers={"If-None-Match": response.headers["ETag"]},
+            ).status_code
+            == 304
+        )
+
+    def test_read_pokemon(self) -> None:
+        client = TestClient(main.app)
+        response = client.get("/pokemon")
+
+        assert response.headers["Cache-Control"] == "no-store"
+        assert "ETag" not in response.headers
+
+    def test_unknown_generation(self, get_generation: Any) -> None:
+        get_generation.return_value = None
+        client = TestClient(main.app)
+        response = client.get(
+            "/pokemon/pokedex_number/25", headers={"If-None-Match": "*"}
+        )
+
+        assert response.status_code == 200
+        assert "ETag" not in response.headers
+        assert response.headers["Cache-Control"] == "public, max-age=300"
+
+
+class TestMembership:
+    @pytest.fixture(autouse=True)
+    def _setup_membership(self, mocker: MockerFixture) -> Any:
+        conf = mocker.patch.object(membership, "config").get_config
+        conf.return_value.ES_NEGATIVE_CACHE_TTL = 60.0
+        conf.return_value.ES_NEGATIVE_CACHE_MAX_ENTRIES = 10
+        membership.reset_membership()
+        yield
+        membership.reset_membership()
+
+    def test_read_pokemon_by_name_negative(
+        self, mocker: MockerFixture
+    ) -> None:
+        negative_hits = membership.stats.negative_hits
+        search = mocker.spy(pokemon_router.async_accessor, "search_pokemon")
+        client = TestClient(main.app)
+        responses = [client.get("/pokemon/name/ケツバン") for _ in range(2)]
+
+        assert [r.status_code for r in responses] == [200, 200]
+        assert [r.json() for r in responses] == [[], []]
+        assert search.call_count == 1
+        assert membership.stats.negative_hits == negative_hits + 1
+
+    def test_read_pokemon_by_name_filtered(
+        self, mocker: MockerFixture
+    ) -> None:
+        mocker.patch.object(
+            membership,
+            "_filter",
+            membership.MembershipFilter(
+                "a", frozenset({25}), frozenset({"ピカチュウ"})
+            ),
+        )
+        search = mocker.spy(pokemon_router.async_accessor, "search_pokemon")
+        client = TestClient(main.app)
+
+        assert client.get("/pokemon/name/ケツバン").json() == []
+        assert search.call_count == 0
+        assert [
+            p["name"] for p in client.get("/pokemon/name/ピカチュウ").json()
+        ] == ["ピカチュウ"]
+
+    def test_read_pokemon_batch_filtered(self, mocker: MockerFixture) -> None:
+        mocker.patch.object(
+            membership,
+            "_filter",
+            membership.MembershipFilter(
+                "a",
+                frozenset({6}),
+                frozenset({"メガリザードン", "ｘ"}),
+                frozenset({"メガリザードンＸ"}),
+            ),
+        )
+        client = TestClient(main.app)
+        response = client.post(
+            "/pokemon/batch", json={"names": ["メガリザードンＸ", "ｘ"]}
+        )
+
+        assert [(r["name"], r["found"]) for r in response.json()["names"]] == [
+            ("メガリザードンＸ", True),
+            ("ｘ", False),
+        ]
+
+    def test_read_pokemon_batch_negative(self, mocker: MockerFixture) -> None:
+        client = TestClient(main.app)
+        client.post("/pokemon/batch", json={"names": ["ｘ"]})
+
+        assert membership.is_missing(membership.NAME_KEYWORD, "ｘ")
+        assert not membership.is_missing(membership.NAME, "ｘ")
+
+        search = mocker.spy(pokemon_router.async_accessor, "search_pokemon")
+        client.get("/pokemon/name/ｘ")
+
+        assert search.call_count == 1
+
+
+class TestPrerender:
+    @pytest.fixture(autouse=True)
+    def _setup_prerender(self, mocker: MockerFixture) -> Any:
+        conf = mocker.Mock(
+            wraps=config.get_config(),
+            ES_ETAG_ENABLED=True,
+            ES_RAW_PASSTHROUGH=False,
+            ES_PRERENDER_ENABLED=True,
+        )
+        router_config = mocker.patch.object(pokemon_router, "config")
+        router_config.get_config.return_value = conf
+        prerender_config = mocker.patch.object(prerender, "config")
+        prerender_config.get_config.return_value = mocker.Mock(
+            ES_PRERENDER_GZIP=True, ES_PRERENDER_MAX_ENTRIES=10
+        )
+        mocker.patch.object(generation.stats, "generation", "gen-1")
+        prerender.reset_prerender()
+        yield
+        prerender.reset_prerender()
+
+    def test_read_pokemon_by_pokedex_number(
+        self, mocker: MockerFixture
+    ) -> None:
+        search = mocker.spy(
+            pokemon_router.async_accessor, "search_pokemon_by_pokedex_number"
+        )
+        client = TestClient(main.app)
+        first = client.get("/pokemon/pokedex_number/25")
+        second = client.get("/pokemon/pokedex_number/25")
+
+        assert first.status_code == second.status_code == 200
+        assert first.content == second.content
+        assert [p["name"] for p in second.json()] == ["ピカチュウ"]
+        assert search.call_count == 1
+
+    def test_read_pokemon_by_name(self) -> None:
+        hits = prerender.stats.hits
+        client = TestClient(main.app)
+        first = client.get(
+            "/pokemon/name/ピカチュウ", headers={"Accept-Encoding": "identity"}
+        )
+        second = client.get(
+            "/pokemon/name/ピカチュウ", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert "Content-Encoding" not in first.headers
+        assert second.headers["Content-Encoding"] == "gzip"
+        assert second.headers["Vary"] == "Accept-Encoding"
+        assert second.headers["ETag"] == f"W/{first.headers['ETag']}"
+        assert second.content == first.content
+        assert prerender.stats.hits == hits + 1
+
+    def test_read_pokemon_by_name_same_as_model(
+        self, mocker: MockerFixture
+    ) -> None:
+        client = TestClient(main.app)
+        prerendered = client.get("/pokemon/name/ピカチュウ").content
+        mocker.patch.object(pokemon_router, "config", config)
+
+        assert client.get("/pokemon/name/ピカチュウ").content == prerendered
+
+
+class TestAcceptsGzip:
+    @pytest.mark.parametrize(
+        ("accept_encoding", "expected"),
+        [
+            (None, False),
+            ("gzip", True),
+            ("gzip, deflate, br", True),
+            ("br;q=1.0, GZIP;q=0.5", True),
+            ("*", True),
+            ("gzip;q=0", False),
+            ("identity", False),
+        ],
+    )
+    def test_accepts_gzip(
+        self, accept_encoding: str | None, expected: bool
+    ) -> None:
+        assert pokemon_router.accepts_gzip(accept_encoding) is expected
+
+
+class TestIsNotModified:
+    @pytest.mark.parametrize(
+        ("if_none_match", "expected"),
+        [
+            (None, False),
+            ('"a"', True),
+            ('W/"a"', True),
+            ('"b", "a"', True),
+            ("*", True),
+            ('"b"', False),
+        ],
+    )
+    def test_is_not_modified(
+        self, if_none_match: str | None, expected: bool
+    ) -> None:
+        actual = pokemon_router.is_not_modified(if_none_match, {"ETag": '"a"'})
+
+        assert actual is expected
+
+    def test_create_etag(self) -> None:
+        query = {"query": {"bool": {"filter": [{"a": 1}, {"b": 2}]}}}
+        reordered = {"query": {"bool": {"filter": [{"b": 2}, {"a": 1}]}}}
+
+        assert pokemon_router.create_etag(
+            "gen", "conditions", query, False
+        ) == pokemon_router.create_etag("gen", "conditions", reordered, False)
+        assert pokemon_router.create_etag(
+            "gen", "conditions", query, False
+        ) != pokemon_router.create_etag("gen", "conditions", query, True)
@@ -0,0 +1,104 @@
+import gzip
+import json
+from typing import Any, Generator
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pokeapi.search import generation, prerender
+
+DOC = {
+    "national_pokedex_number": 25,
+    "name": "ピカチュウ",
+    "form": None,
+    "regional_variant": None,
+    "is_mega_evolution": False,
+    "is_primal_reversion": False,
+    "is_legendary": False,
+    "is_mythical": False,
+    "height": 0.4,
+    "weight": 6.0,
+    "gender_type": {"has_male": True, "has_female": True},
+    "pokemon_type": {"type_1": "でんき", "type_2": None},
+    "abilities": {
+        "ability_1": "せいでんき",
+        "ability_2": None,
+        "hidden_ability": "ひらいしん",
+    },
+    "base_stats": {"hp": 35, "attack": 55, "base_total": 320},
+}
+
+
+@pytest.fixture()
+def conf(mocker: MockerFixture) -> Generator[Any, None, None]:
+    conf = mocker.patch.object(prerender, "config").get_config.return_value
+    conf.ES_PRERENDER_GZIP = False
+    conf.ES_PRERENDER_MAX_ENTRIES = 10
+    mocker.patch.object(generation.stats, "generation", "gen-1")
+    prerender.reset_prerender()
+    yield conf
+    prerender.reset_prerender()
+
+
+class TestRender:
+    def test_render(self, conf: Any) -> None:
+        actual = prerender.render([DOC])
+
+        assert json.loads(actual.body) == [DOC]
+        assert b" " not in actual.body
+        assert "ピカチュウ".encode() in actual.body
+        assert actual.gzip_body is None
+
+    def test_render_gzip(self, conf: Any) -> None:
+        conf.ES_PRERENDER_GZIP = True
+        actual = prerender.render([DOC])
+
+        assert actual.gzip_body is not None
+        assert gzip.decompress(actual.gzip_body) == actual.body
+        assert prerender.render([DOC]).gzip_body == actual.gzip_body
+
+
+class TestPrerender:
+    def test_get(self, conf: Any) -> None:
+        assert prerender.get(prerender.POKEDEX_NUMBER, 25) is None
+
+        rendered = prerender.put(prerender.POKEDEX_NUMBER, 25, [DOC], "gen-1")
+
+        assert prerender.get(prerender.POKEDEX_NUMBER, 25) is rendered
+        assert prerender.get(prerender.NAME, 25) is None
+        assert prerender.stats.entries == 1
+
+    def test_get_generation_changed(
+        self, mocker: MockerFixture, conf: Any
+    ) -> None:
+        prerender.put(prerender.NAME, "ピカチュウ", [DOC], "gen-1")
+        mocker.patch.object(generation.stats, "generation", "gen-2")
+
+        assert prerender.get(prerender.NAME, "ピカチュウ") is None
+        assert prerender.stats.generation == "gen-2"
+        assert prerender.stats.entries == 0
+
+    def test_put_stale(self, conf: Any) -> None:
+        rendered = prerender.put(prerender.NAME, "ピカチュウ", [DOC], "gen-0")
+
+        assert json.loads(rendered.body) == [DOC]
+        assert prerender.get(prerender.NAME, "ピカチュウ") is None
+
+    def test_put_empty(self, conf: Any) -> None:
+        rendered = prerender.put(prerender.NAME, "ピカチュ", [], "gen-1")
+
+        assert json.loads(rendered.body) == []
+        assert prerender.get(prerender.NAME, "ピカチュ") is None
+        assert prerender.stats.entries == 0
+
+    def test_put_full(self, conf: Any) -> None:
+        conf.ES_PRERENDER_MAX_ENTRIES = 2
+        prerender.put(prerender.POKEDEX_NUMBER, 25, [DOC], "gen-1")
+        prerender.put(prerender.POKEDEX_NUMBER, 26, [DOC], "gen-1")
+        prerender.get(prerender.POKEDEX_NUMBER, 25)
+        prerender.put(prerender.POKEDEX_NUMBER, 27, [DOC], "gen-1")
+
+        assert prerender.get(prerender.POKEDEX_NUMBER, 25) is not None
+        assert prerender.get(prerender.POKEDEX_NUMBER, 26) is None
+        assert prerender.get(prerender.POKEDEX_NUMBER, 27) is not None
+        assert prerender.stats.entries == 2
@@ -1,6 +1,6 @@
 import pytest
 
-from pokeapi.search import param, query
+from pokeapi.search import param, query, singleflight
 
 
 @pytest.mark.query()
@@ -11,7 +11,7 @@ class TestCreateNationalPokedexNumberQuery:
 
         assert actual == {
             "query": {
-                "bool": {"must": [{"term": {"national_pokedex_number": 1}}]}
+                "bool": {"filter": [{"term": {"national_pokedex_number": 1}}]}
             }
         }
 
@@ -23,10 +23,48 @@ class TestCreatePokemonNameQuery:
         actual = q.create_query("フシギダネ")
 
         assert actual == {
-            "query": {"bool": {"must": [{"term": {"name": "フシギダネ"}}]}}
+            "query": {"bool": {"filter": [{"term": {"name": "フシギダネ"}}]}}
         }
 
 
+@pytest.mark.query()
+class TestCreateBatchLookupQuery:
+    def test_create_query(self) -> None:
+        q = query.CreateBatchLookupQuery()
+        actual = q.create_query(((25, 1), ("ミュウ",)))
+
+        assert actual == {
+            "query": {
+                "bool": {
+                    "filter": [
+                        {
+                            "bool": {
+                                "should": [
+                                    {
+                                        "terms": {
+                                            "national_pokedex_number": [1, 25]
+                                        }
+                                    },
+                                    {"terms": {"name.keyword": ["ミュウ"]}},
+                                ],
+                                "minimum_should_match": 1,
+                            }
+                        }
+                    ]
+                }
+            },
+            "size": 10000,
+        }
+
+    def test_create_query_names(self) -> None:
+        q = query.CreateBatchLookupQuery()
+        actual = q.create_query(((), ("ミュウ",)))
+
+        assert actual["query"]["bool"]["filter"][0]["bool"]["should"] == [
+            {"terms": {"name.keyword": ["ミュウ"]}}
+        ]
+
+
 @pytest.mark.query()
 class TestCreateConditionalSearchQuery:
     def test_create_query_form(self) -> None:
@@ -36,7 +74,7 @@ class TestCreateConditionalSearchQuery:
 
         assert actual == {
             "query": {
-                "bool": {"must": [{"term": {"form.keyword": "れいじゅうフォルム"}}]}
+                "bool": {"filter": [{"term": {"form.keyword": "れいじゅうフォルム"}}]}
             }
         }
 
@@ -48,7 +86,7 @@ class TestCreateConditionalSearchQuery:
         assert actual == {
             "query": {
                 "bool": {
-                    "must": [
+                    "filter": [
                         {"term": {"regional_variant.keyword": "アローラのすがた"}}
                     ]
                 }
@@ -62,7 +100,7 @@ class TestCreateConditionalSearchQuery:
 
         assert actual == {
             "query": {
-                "bool": {"must": [{"term": {"is_mega_evolution": True}}]}
+                "bool": {"filter": [{"term": {"is_mega_evolution": True}}]}
             }
         }
 
@@ -73,7 +111,7 @@ class TestCreateConditionalSearchQuery:
 
         assert actual == {
             "query": {
-                "bool": {"must": [{"term": {"is_primal_reversion": True}}]}
+                "bool": {"filter": [{"term": {"is_primal_reversion": True}}]}
             }
         }
 
@@ -83,7 +121,7 @@ class TestCreateConditionalSearchQuery:
         actual = q.create_query(conditions)
 
         assert actual == {
-            "query": {"bool": {"must": [{"term": {"is_legendary": True}}]}}
+            "query": {"bool": {"filter": [{"term": {"is_legendary": True}}]}}
         }
 
     def test_create_query_mythical(self) -> None:
@@ -92,7 +130,7 @@ class TestCreateConditionalSearchQuery:
         actual = q.create_query(conditions)
 
         assert actual == {
-            "query": {"bool": {"must": [{"term": {"is_mythical": True}}]}}
+            "query": {"bool": {"filter": [{"term": {"is_mythical": True}}]}}
         }
 
     def test_create_query_gender_type(self) -> None:
@@ -105,7 +143,7 @@ class TestCreateConditionalSearchQuery:
         assert actual == {
             "query": {
                 "bool": {
-                    "must": [
+                    "filter": [
                         {"term": {"gender_type.has_male": True}},
                     ]
                 }
@@ -120,7 +158,7 @@ class TestCreateConditionalSearchQuery:
         assert actual == {
             "query": {
                 "bool": {
-                    "must": [
+                    "filter": [
                         {
                             "multi_match": {
                                 "query": "ほのお",
@@ -143,7 +181,7 @@ class TestCreateConditionalSearchQuery:
         assert actual == {
             "query": {
                 "bool": {
-                    "must": [
+                    "filter": [
                         {
                             "multi_match": {
                                 "query": "もうか",
@@ -180,7 +218,7 @@ class TestCreateConditionalSearchQuery:
         assert actual == {
             "query": {
                 "bool": {
-                    "must": [
+                    "filter": [
                         {"term": {"form.keyword": "れいじゅうフォルム"}},
                         {
                             "multi_match": {
@@ -204,7 +242,7 @@ class TestCreateConditionalSearchQuery:
         )
         actual = q.create_query(conditions)
 
-        assert actual == {"query": {"bool": {"must": []}}}
+        assert actual == {"query": {"bool": {"filter": []}}}
 
 
 @pytest.mark.query()
@@ -237,3 +275,93 @@ class TestCreateKeywordQuery:
                 }
             }
         }
+
+
+@pytest.mark.query()
+class TestCreatePaginatedQuery:
+    def test_create_query(self) -> None:
+        q = query.CreatePaginatedQuery()
+        target = query.CreateKeywordQuery().create_query("アローラ")
+        actual = q.create_query((target, param.CreatePageParam(5, [1, "1"])))
+
+        assert actual == {
+            **target,
+            "size": 5,
+            "sort": [{"national_pokedex_number": "asc"}, {"_id": "asc"}],
+            "track_total_hits": False,
+            "search_after": [1, "1"],
+        }
+
+
+@pytest.mark.query()
+class TestCompileConditions:
+    def test_compile_conditions(self) -> None:
+        conditions = (
+            param.CreateLegendaryParam(True),
+            param.CreatePokemonTypeParam(("でんき", None)),
+        )
+        actual = query.compile_conditions(conditions)
+
+        assert actual.query == query.build_conditional_query(conditions)
+        assert actual.key == singleflight.canonical_key(actual.query)
+
+    def test_compile_conditions_memoized(self) -> None:
+        first = query.compile_conditions((param.CreateMythicalParam(True),))
+        hits = query.get_plan_stats()["hits"]
+        second = query.compile_conditions((param.CreateMythicalParam(True),))
+
+        assert second == first
+        assert query.get_plan_stats()["hits"] == hits + 1
+        assert (
+            query.compile_conditions((param.CreateMythicalParam(False),))
+            != first
+        )
+
+    def test_compile_conditions_mutated(self) -> None:
+        conditions = (
+            param.CreateLegendaryParam(True),
+            param.CreatePokemonTypeParam(("でんき", None)),
+        )
+        first = query.compile_conditions(conditions)
+        first.query["size"] = 5
+        first.query["query"]["bool"]["filter"].clear()
+        second = query.compile_conditions(conditions)
+
+        assert second.query == query.build_conditional_query(conditions)
+        assert second.key == singleflight.canonical_key(second.query)
+
+    def test_copy_query(self) -> None:
+        value = {"bool": {"filter": [{"term": {"is_legendary": True}}]}}
+        actual = query.copy_query(value)
+
+        assert actual == value
+        assert actual is not value
+        assert actual["bool"]["filter"] is not value["bool"]["filter"]
+        assert actual["bool"]["filter"][0] is not value["bool"]["filter"][0]
+
+    def test_compile_conditions_unhashable(self) -> None:
+        conditions = (param.CreateNamesParam(["ピカチュウ"]),)  # type: ignore
+        actual = query.compile_conditions(conditions)
+
+        assert actual.query == query.build_conditional_query(conditions)
+
+    def test_normalize_conditions(self) -> None:
+        assert query.normalize_conditions(
+            (param.CreateFormParam("アローラのすがた"),)
+        ) == ((param.CreateFormParam, ("アローラのすがた",)),)
+
+    def test_create_paginated_key(self) -> None:
+        plan = query.compile_conditions((param.CreateLegendaryParam(True),))
+        paginated = query.CreatePaginatedQuery().create_query(
+            (plan.query, param.CreatePageParam(5, [1, "1"]))
+        )
+        other = query.CreatePaginatedQuery().create_query(
+            (plan.query, param.CreatePageParam(5, [2, "2"]))
+        )
+
+        assert query.create_paginated_key(
+            plan.key, paginated
+        ) != query.create_paginated_key(plan.key, other)
+        assert query.create_paginated_key(plan.key, paginated).startswith(
+            plan.key
+        )
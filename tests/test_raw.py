@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from pokeapi.search import raw
+
+
+class TestSplitSources:
+    def test_split_sources(self) -> None:
+        text = (
+            '{"hits":{"total":{"value":2,"relation":"eq"},"hits":['
+            '{"_source":{"name":"ミミッキュ","form":"ばけたすがた"},'
+            '"sort":[778,"a"]},'
+            '{"_source":{"name":"ミミッキュ","form":"ばれたすがた"},'
+            '"sort":[778,"b"]}]}}'
+        )
+        sources, response = raw.split_sources(text)
+
+        assert sources == [
+            '{"name":"ミミッキュ","form":"ばけたすがた"}',
+            '{"name":"ミミッキュ","form":"ばれたすがた"}',
+        ]
+        assert response == {
+            "hits": {
+                "total": {"value": 2, "relation": "eq"},
+                "hits": [
+                    {"_source": None, "sort": [778, "a"]},
+                    {"_source": None, "sort": [778, "b"]},
+                ],
+            }
+        }
+
+    def test_split_sources_nested(self) -> None:
+        source = {
+            "name": 'a "}{[" b',
+            "_source": {"_source": ["\\", "]"]},
+            "abilities": {"ability_1": None},
+        }
+        text = json.dumps({"hits": {"hits": [{"_source": source}]}})
+        sources, _ = raw.split_sources(text)
+
+        assert [json.loads(s) for s in sources] == [source]
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ('{"a":[1,{"b":"}"}],"c":"\\\\"} ,', 28),
+            ('[{}, []] {"a":1}', 8),
+        ],
+    )
+    def test_find_end(self, text: str, expected: int) -> None:
+        assert raw.find_end(text, 0) == expected
+
+    @pytest.mark.parametrize("text", ['{"a":[1,2}', '{"a":"}'])
+    def test_find_end_unterminated(self, text: str) -> None:
+        with pytest.raises(ValueError, match="Unterminated"):
+            raw.find_end(text, 0)
+
+    def test_split_sources_without_hits(self) -> None:
+        assert raw.split_sources("{}") == ([], {})
+
+    @pytest.mark.parametrize(
+        ("sources", "expected"),
+        [
+            ([], b"[]"),
+            (['{"a":1}', '{"a":2}'], b'[{"a":1},{"a":2}]'),
+        ],
+    )
+    def test_to_json_array(self, sources: list[str], expected: bytes) -> None:
+        assert raw.to_json_array(sources) == expected
+
+
+class TestRawHeader:
+    def test_pop_raw_header(self) -> None:
+        headers = {raw.RAW_HEADER: "1", "x-opaque-id": "a"}
+        kwargs = {"headers": headers}
+
+        assert raw.pop_raw_header(kwargs)
+        assert kwargs == {"headers": {"x-opaque-id": "a"}}
+        assert raw.RAW_HEADER in headers
+
+    def test_pop_raw_header_without_header(self) -> None:
+        kwargs = {"headers": {"x-opaque-id": "a"}}
+
+        assert not raw.pop_raw_header(kwargs)
+        assert not raw.pop_raw_header({})
+        assert kwargs == {"headers": {"x-opaque-id": "a"}}
+
+    def test_mark_raw(self) -> None:
+        response = (200, {"content-type": "application/json"}, "{}")
+
+        assert raw.mark_raw(response) == (
+            200,
+            {"content-type": raw.RAW_MIMETYPE},
+            "{}",
+        )
@@ -0,0 +1,301 @@
+import asyncio
+import socket
+import time
+from typing import Any, Generator
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pokeapi.search import config, redis_cache
+
+from .fake_redis import FakeRedis
+
+
+@pytest.fixture()
+def fake_redis() -> Generator[FakeRedis, None, None]:
+    fake = FakeRedis()
+    yield fake
+    fake.stop()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+class TestEncodeCommand:
+    def test_encode_command(self) -> None:
+        actual = redis_cache.encode_command("SET", "キー", b"v", "PX", 100)
+
+        assert actual == (
+            b"*5\r\n$3\r\nSET\r\n$6\r\n"
+            + "キー".encode()
+            + b"\r\n$1\r\nv\r\n$2\r\nPX\r\n$3\r\n100\r\n"
+        )
+
+
+class TestReadReply:
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            (b"+OK\r\n", "OK"),
+            (b":42\r\n", 42),
+            (b"$5\r\nhello\r\n", b"hello"),
+            (b"$-1\r\n", None),
+            (b"*2\r\n$1\r\na\r\n$-1\r\n", [b"a", None]),
+        ],
+    )
+    def test_read_reply(self, data: bytes, expected: Any) -> None:
+        async def read() -> Any:
+            reader = asyncio.StreamReader()
+            reader.feed_data(data)
+            return await redis_cache.read_reply(reader)
+
+        assert asyncio.run(read()) == expected
+
+    def test_read_reply_error(self) -> None:
+        async def read() -> Any:
+            reader = asyncio.StreamReader()
+            reader.feed_data(b"-ERR wrong\r\n")
+            return await redis_cache.read_reply(reader)
+
+        actual = asyncio.run(read())
+
+        assert isinstance(actual, redis_cache.RespError)
+        assert str(actual) == "ERR wrong"
+
+    @pytest.mark.parametrize(
+        "data", [b":4x\r\n", b"$five\r\nhello\r\n", b"*\r\n", b"HTTP/1.1\r\n"]
+    )
+    def test_read_reply_invalid(self, data: bytes) -> None:
+        async def read() -> Any:
+            reader = asyncio.StreamReader()
+            reader.feed_data(data)
+            return await redis_cache.read_reply(reader)
+
+        with pytest.raises(redis_cache.RespError):
+            asyncio.run(read())
+
+    def test_read_reply_closed(self) -> None:
+        async def read() -> Any:
+            reader = asyncio.StreamReader()
+            reader.feed_eof()
+            return await redis_cache.read_reply(reader)
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(read())
+
+
+class TestRedisClient:
+    def test_url(self) -> None:
+        client = redis_cache.RedisClient("redis://:p%40ss@cache:6380/2", 0.1)
+
+        assert (client.host, client.port) == ("cache", 6380)
+        assert client.password == "p@ss"
+        assert client.db == 2
+
+    def test_pipeline(self, fake_redis: FakeRedis) -> None:
+        async def run() -> list[Any]:
+            client = redis_cache.RedisClient(fake_redis.url, 1.0)
+            replies = await client.pipeline(
+                ("SET", "a", "1"), ("GET", "a"), ("GET", "b")
+            )
+            await client.close()
+            return replies
+
+        assert asyncio.run(run()) == ["OK", b"1", None]
+        assert fake_redis.rounds == 1
+
+    def test_pipeline_reuses_connection(self, fake_redis: FakeRedis) -> None:
+        async def run() -> redis_cache.RedisClient:
+            client = redis_cache.RedisClient(fake_redis.url, 1.0)
+            await client.pipeline(("PING",))
+            await client.pipeline(("PING",))
+            return client
+
+        client = asyncio.run(run())
+
+        assert len(client._idle) == 1
+
+    def test_pipeline_maxsize(
+        self, mocker: MockerFixture, fake_redis: FakeRedis
+    ) -> None:
+        open_connection = mocker.spy(redis_cache.asyncio, "open_connection")
+
+        async def run() -> redis_cache.RedisClient:
+            client = redis_cache.RedisClient(fake_redis.url, 1.0, maxsize=2)
+            await asyncio.gather(
+                *(client.pipeline(("PING",)) for _ in range(10))
+            )
+            return client
+
+        client = asyncio.run(run())
+
+        assert open_connection.call_count == 2
+        assert len(client._idle) == 2
+
+    def test_pipeline_maxsize_timeout(self, fake_redis: FakeRedis) -> None:
+        async def run() -> None:
+            client = redis_cache.RedisClient(fake_redis.url, 0.01, maxsize=1)
+            await client._slots.acquire()
+            await client.pipeline(("PING",))
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(run())
+
+    def test_pipeline_auth(self) -> None:
+        fake = FakeRedis(password="secret")
+        try:
+
+            async def run(url: str) -> list[Any]:
+                client = redis_cache.RedisClient(url, 1.0)
+                return await client.pipeline(("PING",))
+
+            assert asyncio.run(
+                run(f"redis://:secret@127.0.0.1:{fake.port}")
+            ) == ["PONG"]
+            with pytest.raises(redis_cache.RespError):
+                asyncio.run(run(f"redis://:wrong@127.0.0.1:{fake.port}"))
+        finally:
+            fake.stop()
+
+    def test_pipeline_error(self, fake_redis: FakeRedis) -> None:
+        async def run() -> list[Any]:
+            client = redis_cache.RedisClient(fake_redis.url, 1.0)
+            return await client.pipeline(("PING",), ("UNKNOWN",))
+
+        with pytest.raises(redis_cache.RespError):
+            asyncio.run(run())
+
+
+class TestRedisCache:
+    def test_get_many_put_many(self, fake_redis: FakeRedis) -> None:
+        async def run() -> list[Any]:
+            cache = redis_cache.RedisCache(
+                redis_cache.RedisClient(fake_redis.url, 1.0), "test:"
+            )
+            await cache.put_many([("a", [{"name": "ピカチュウ"}]), ("b", 1)], 60)
+            return await cache.get_many(["a", "b", "c"])
+
+        assert asyncio.run(run()) == [[{"name": "ピカチュウ"}], 1, None]
+        assert set(fake_redis.data) == {b"test:a", b"test:b"}
+        assert fake_redis.rounds == 2
+
+    def test_get_many_not_json(self, fake_redis: FakeRedis) -> None:
+        async def run() -> tuple[list[Any], redis_cache.RedisCacheStats]:
+            client = redis_cache.RedisClient(fake_redis.url, 1.0)
+            await client.pipeline(
+                ("SET", "test:a", b"\xff{"), ("SET", "test:b", "1")
+            )
+            cache = redis_cache.RedisCache(client, "test:")
+            return await cache.get_many(["a", "b"]), cache.stats
+
+        values, stats = asyncio.run(run())
+
+        assert values == [None, 1]
+        assert (stats.hits, stats.misses, stats.errors) == (1, 1, 1)
+
+    def test_ttl(self, fake_redis: FakeRedis) -> None:
+        async def run() -> Any:
+            cache = redis_cache.RedisCache(
+                redis_cache.RedisClient(fake_redis.url, 1.0), ""
+            )
+            await cache.put("a", "value", 0.01)
+            await asyncio.sleep(0.05)
+            return await cache.get("a")
+
+        assert asyncio.run(run()) is None
+
+    def test_stats(self, fake_redis: FakeRedis) -> None:
+        async def run() -> redis_cache.RedisCacheStats:
+            cache = redis_cache.RedisCache(
+                redis_cache.RedisClient(fake_redis.url, 1.0), ""
+            )
+            await cache.put("a", 1, 60)
+            await cache.get_many(["a", "b"])
+            return cache.stats
+
+        assert asyncio.run(run()) == redis_cache.RedisCacheStats(
+            hits=1, misses=1, writes=1, errors=0, round_trips=2
+        )
+
+    def test_not_resp(self) -> None:
+        async def run() -> tuple[Any, redis_cache.RedisCacheStats]:
+            async def reply(
+                reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+            ) -> None:
+                await reader.read(1024)
+                writer.write(b"$five\r\n")
+                await writer.drain()
+                writer.close()
+
+            server = await asyncio.start_server(reply, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                cache = redis_cache.RedisCache(
+                    redis_cache.RedisClient(f"redis://127.0.0.1:{port}", 1.0),
+                    "",
+                )
+                return await cache.get_many(["a"]), cache.stats
+
+        values, stats = asyncio.run(run())
+
+        assert values == [None]
+        assert stats.errors == 1
+        assert stats.misses == 1
+
+    def test_unavailable(self) -> None:
+        async def run() -> tuple[Any, redis_cache.RedisCacheStats]:
+            cache = redis_cache.RedisCache(
+                redis_cache.RedisClient(
+                    f"redis://127.0.0.1:{free_port()}", 0.1
+                ),
+                "",
+            )
+            await cache.put("a", 1, 60)
+            return await cache.get_many(["a", "b"]), cache.stats
+
+        started = time.monotonic()
+        values, stats = asyncio.run(run())
+
+        assert values == [None, None]
+        assert stats.errors == 2
+        assert stats.misses == 2
+        assert stats.writes == 0
+        assert time.monotonic() - started < 1.0
+
+
+class TestGetRedisCache:
+    def test_get_redis_cache(
+        self, mocker: MockerFixture, fake_redis: FakeRedis
+    ) -> None:
+        mocker.patch.object(
+            config,
+            "get_config",
+            return_value=mocker.Mock(
+                ES_CACHE_REDIS_URL=fake_redis.url,
+                ES_CACHE_REDIS_TIMEOUT=1.0,
+                ES_CACHE_REDIS_PREFIX="test:",
+                ES_POOL_MAXSIZE=2,
+            ),
+        )
+
+        async def run() -> tuple[Any, Any]:
+            first = redis_cache.get_redis_cache()
+            second = redis_cache.get_redis_cache()
+            await redis_cache.close_redis_cache()
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first is second
+        assert first.prefix == "test:"
+        assert first.client.maxsize == 2
+
+    @pytest.mark.usefixtures("_setup_get_config")
+    def test_get_redis_cache_unset(self) -> None:
+        async def run() -> Any:
+            return redis_cache.get_redis_cache()
+
+        assert asyncio.run(run()) is None
@@ -0,0 +1,125 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from pokeapi.search import singleflight
+
+
+class TestCanonicalKey:
+    def test_canonical_key(self) -> None:
+        query_a = {"query": {"bool": {"must": [{"term": {"name": "ピカチュウ"}}]}}}
+        query_b = {"query": {"bool": {"must": [{"term": {"name": "ピカチュウ"}}]}}}
+
+        assert singleflight.canonical_key(
+            query_a
+        ) == singleflight.canonical_key(query_b)
+        assert "ピカチュウ" in singleflight.canonical_key(query_a)
+
+    def test_canonical_key_key_order(self) -> None:
+        assert singleflight.canonical_key(
+            {"size": 10, "query": {}}
+        ) == singleflight.canonical_key({"query": {}, "size": 10})
+
+    def test_canonical_key_clause_order(self) -> None:
+        legendary = {"term": {"is_legendary": True}}
+        electric = {"term": {"pokemon_type.type_1.keyword": "でんき"}}
+
+        assert singleflight.canonical_key(
+            {"query": {"bool": {"filter": [legendary, electric]}}}
+        ) == singleflight.canonical_key(
+            {"query": {"bool": {"filter": [electric, legendary]}}}
+        )
+
+    def test_canonical_key_sort_order(self) -> None:
+        assert singleflight.canonical_key(
+            {"sort": ["a", "b"], "search_after": [1, 2]}
+        ) != singleflight.canonical_key(
+            {"sort": ["b", "a"], "search_after": [1, 2]}
+        )
+        assert singleflight.canonical_key(
+            {"search_after": [1, 2]}
+        ) != singleflight.canonical_key({"search_after": [2, 1]})
+
+
+class TestSingleFlight:
+    def test_do(self) -> None:
+        stats = singleflight.SingleFlightStats()
+        flight = singleflight.SingleFlight(stats)
+        release = threading.Event()
+        calls: list[int] = []
+
+        def fn() -> list[int]:
+            calls.append(1)
+            release.wait(1.0)
+            return calls
+
+        with ThreadPoolExecutor(4) as executor:
+            futures = [
+                executor.submit(lambda: flight.do("key", fn)) for _ in range(4)
+            ]
+            while stats.calls < 4:
+                pass
+            release.set()
+            actual = [future.result() for future in futures]
+
+        assert calls == [1]
+        assert all(result is calls for result in actual)
+        assert stats.calls == 4
+        assert stats.deduplicated == 3
+
+    def test_do_error(self) -> None:
+        flight = singleflight.SingleFlight(singleflight.SingleFlightStats())
+
+        def fn() -> None:
+            raise ValueError("hoge")
+
+        with pytest.raises(ValueError, match="hoge"):
+            flight.do("key", fn)
+
+        assert flight.do("key", lambda: 1) == 1
+
+
+class TestAsyncSingleFlight:
+    def test_do(self) -> None:
+        stats = singleflight.SingleFlightStats()
+        flight = singleflight.AsyncSingleFlight(stats)
+        calls: list[int] = []
+
+        async def fn() -> list[int]:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return calls
+
+        async def do_all() -> Any:
+            return await asyncio.gather(
+                *(flight.do("key", fn) for _ in range(4)),
+                flight.do("other", fn),
+            )
+
+        actual = asyncio.run(do_all())
+
+        assert len(calls) == 2
+        assert all(result is calls for result in actual)
+        assert stats.calls == 5
+        assert stats.deduplicated == 3
+
+    def test_do_cancel(self) -> None:
+        flight = singleflight.AsyncSingleFlight(
+            singleflight.SingleFlightStats()
+        )
+
+        async def fn() -> int:
+            await asyncio.sleep(0.01)
+            return 1
+
+        async def do_and_cancel() -> int:
+            leader = asyncio.create_task(flight.do("key", fn))
+            follower = asyncio.create_task(flight.do("key", fn))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await follower
+
+        assert asyncio.run(do_and_cancel()) == 1
@@ -0,0 +1,173 @@
+from fastapi.testclient import TestClient
+
+from pokeapi import main
+
+
+class TestStatsRouter:
+    def test_read_pool_stats(self) -> None:
+        with TestClient(main.app) as client:
+            response = client.get("/stats/pool")
+
+        assert response.status_code == 200
+        assert [stats["client"] for stats in response.json()] == [
+            "sync",
+            "async",
+        ]
+
+    def test_read_batch_stats(self) -> None:
+        with TestClient(main.app) as client:
+            response = client.get("/stats/batch")
+
+        assert response.status_code == 200
+        assert response.json()["batches"] >= 0
+
+    def test_read_singleflight_stats(self) -> None:
+        with TestClient(main.app) as client:
+            response = client.get("/stats/singleflight")
+
+        assert response.status_code == 200
+        assert set(response.json()) == {"calls", "deduplicated"}
+
+    def test_read_fast_path_stats(self) -> None:
+        with TestClient(main.app) as client:
+            response = client.get("/stats/fast_path")
+
+        assert response.status_code == 200
+        assert set(response.json()) == {"mget", "search", "stale"}
+
+    def test_read_breaker_stats(self) -> None:
+        with TestClient(main.app) as client:
+            response = client.get("/stats/breaker")
+
+        assert response.status_code == 200
+        assert response.json()["state"] == "closed"
+
+    def test_read_hedge_stats(self) -> None:
+        with TestClient(main.app) as client:
+            response = client.get("/stats/hedge")
+
+        assert response.status_code == 200
+        assert set(response.json()) == {
+            "requests",
+            "fired",
+            "won",
+            "denied",
+            "delay_ms",
+        }
+
+    def test_read_cache_stats(self) -> None:
+        with TestClient(main.app) as client:
+            response = client.get("/stats/cache")
+
+        assert response.status_code == 200
+        assert set(response.json()) == {
+            "hits",
+            "misses",
+            "evictions",
+            "expirations",
+            "entries",
+            "size",
+        }
+
+    def test_read_redis_cache_stats(self) -> None:
+        with TestClient(main.app) as client:
+            response = client.get("/stats/redis_cache")
+
+        assert response.status_code == 200
+        assert set(response.json()) == {
+            "hits",
+            "misses",
+            "writes",
+            "errors",
+            "round_trips",
+        }
+
+    def test_read_generation_stats(self) -> None:
+        with TestClient(main.app) as client:
+            response = client.get("/stats/generation")
+
+        assert response.status_code == 200
+        assert set(response.json()) == {
+            "generation",
+            "checks",
+            "changes",
+            "errors",
+        }
+
+    def test_read_warmup_stats(self) -> None:
+        with TestClient(main.app) as client:
+            response = client.get("/stats/warmup")
+
+        assert response.status_code == 200
+        assert response.json()["completed"] is False
+
+    def test_read_membership_stats(self) -> None:
+        with TestClient(main.app) as client:
+            response = client.get("/stats/membership")
+
+        assert response.status_code == 200
+        assert set(response.json()) == {
+            "generation",
+            "pokedex_numbers",
+            "names",
+            "rebuilds",
+            "filtered",
+            "negative_hits",
+            "saved",
+        }
+
+    def test_read_prerender_stats(self) -> None:
+        with TestClient(main.app) as client:
+            response = client.get("/stats/prerender")
+
+        assert response.status_code == 200
+        assert set(response.json()) == {
+            "generation",
+            "entries",
+            "renders",
+            "hits",
+            "misses",
+        }
+
+    def test_read_query_plan_stats(self) -> None:
+        with TestClient(main.app) as client:
+            client.get("/pokemon/conditions?is_legendary=true")
+            response = client.get("/stats/query_plans")
+
+        assert response.status_code == 200
+        assert response.json()["size"] >= 1
+        assert response.json()["maxsize"] == 1024
+
+    def test_read_expression_stats(self) -> None:
+        with TestClient(main.app) as client:
+            client.get("/pokemon/conditions?filter=type:でんき")
+            response = client.get("/stats/expressions")
+
+        assert response.status_code == 200
+        assert response.json()["size"] >= 1
+
+    def test_read_memory_stats(self) -> None:
+        with TestClient(main.app) as client:
+            response = client.get("/stats/memory")
+
+        assert response.status_code == 200
+        assert set(response.json()) == {
+            "documents",
+            "loads",
+            "searches",
+            "mgets",
+        }
+
+    def test_read_bitmap_stats(self) -> None:
+        with TestClient(main.app) as client:
+            response = client.get("/stats/bitmap")
+
+        assert response.status_code == 200
+        assert set(response.json()) == {
+            "generation",
+            "documents",
+            "bitsets",
+            "rebuilds",
+            "hits",
+            "fallbacks",
+        }
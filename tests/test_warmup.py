@@ -0,0 +1,118 @@
+import asyncio
+from typing import Any, Generator
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pokeapi import main, warmup
+from pokeapi.search import cache, config, generation
+
+
+@pytest.fixture()
+def response_cache(
+    mocker: MockerFixture,
+) -> Generator[cache.ResponseCache, None, None]:
+    response_cache = cache.ResponseCache(1000)
+    mocker.patch.object(cache, "get_cache", return_value=response_cache)
+    mocker.patch.object(
+        config._ElasticsearchConfig, "get_cache_ttl", return_value=60.0
+    )
+    mocker.patch.object(warmup, "stats", warmup.WarmupStats())
+    generation.reset_generation()
+    yield response_cache
+    generation.reset_generation()
+
+
+def warmup_config(mocker: MockerFixture, **kwargs: Any) -> None:
+    mocker.patch.object(
+        warmup, "config"
+    ).get_config.return_value = mocker.Mock(ES_POOL_MAXSIZE=2, **kwargs)
+
+
+@pytest.mark.usefixtures("_setup_get_config")
+class TestWarmUp:
+    def test_warm_up(
+        self, mocker: MockerFixture, response_cache: cache.ResponseCache
+    ) -> None:
+        warmup_config(
+            mocker,
+            ES_WARMUP_PRELOAD=True,
+            ES_WARMUP_PATHS=(
+                "/pokemon/conditions?ability_1=ばけのかわ",
+                "/pokemon/unknown",
+            ),
+        )
+        actual = asyncio.run(warmup.warm_up(main.app))
+        prefix = generation.get_key_prefix()
+
+        assert actual.completed
+        assert actual.connections == 2
+        assert actual.documents > 0
+        assert actual.queries == 1
+        assert actual.failures == 1
+        assert actual.seconds >= actual.preload_seconds > 0
+        assert prefix != ""
+        assert response_cache.get(prefix + "pokedex_number:25") is not None
+        assert response_cache.get(prefix + "name:ピカチュウ") is not None
+
+    def test_warm_up_without_preload(
+        self, mocker: MockerFixture, response_cache: cache.ResponseCache
+    ) -> None:
+        warmup_config(mocker, ES_WARMUP_PRELOAD=False, ES_WARMUP_PATHS=())
+        validate = mocker.spy(warmup, "validate")
+        actual = asyncio.run(warmup.warm_up(main.app))
+
+        assert actual.completed
+        assert actual.documents == 0
+        assert actual.failures == 0
+        assert response_cache.stats.entries == 0
+        assert len(validate.call_args.args[0]) == 1
+
+    def test_warm_up_without_cache(
+        self, mocker: MockerFixture, response_cache: cache.ResponseCache
+    ) -> None:
+        warmup_config(mocker, ES_WARMUP_PRELOAD=True, ES_WARMUP_PATHS=())
+        mocker.patch.object(
+            config._ElasticsearchConfig, "get_cache_ttl", return_value=0.0
+        )
+        export = mocker.spy(warmup.async_accessor, "export_pokemon")
+        validate = mocker.spy(warmup, "validate")
+        actual = asyncio.run(warmup.warm_up(main.app))
+
+        assert actual.completed
+        assert actual.documents == 0
+        assert actual.failures == 0
+        assert export.call_count == 0
+        assert len(validate.call_args.args[0]) == 1
+
+    def test_warm_up_unavailable(
+        self, mocker: MockerFixture, response_cache: cache.ResponseCache
+    ) -> None:
+        warmup_config(mocker, ES_WARMUP_PRELOAD=True, ES_WARMUP_PATHS=())
+        mocker.patch.object(
+            warmup, "open_pool", side_effect=ConnectionRefusedError()
+        )
+        mocker.patch.object(
+            warmup.async_accessor,
+            "preload_pokemon",
+            side_effect=ConnectionRefusedError(),
+        )
+        actual = asyncio.run(warmup.warm_up(main.app))
+
+        assert actual.completed
+        assert actual.failures == 2
+
+
+@pytest.mark.usefixtures("_setup_get_config")
+class TestReplay:
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("/pokemon/name/ピカチュウ", 200),
+            ("/pokemon/conditions?type_1=でんき&limit=1", 200),
+            ("/pokemon/conditions?limit=0", 422),
+            ("/unknown", 404),
+        ],
+    )
+    def test_replay(self, path: str, expected: int) -> None:
+        assert asyncio.run(warmup.replay(main.app, path)) == expected